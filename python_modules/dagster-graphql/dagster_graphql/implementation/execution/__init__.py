@@ -36,6 +36,7 @@
     create_and_launch_partition_backfill as create_and_launch_partition_backfill,
     resume_partition_backfill as resume_partition_backfill,
 )
+from .run_event_subscriptions import get_run_event_subscriptions, storage_id_from_cursor
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.logs.compute_logs import (
@@ -262,9 +263,13 @@ async def gen_events_for_run(
         after_cursor = None
 
     chunk_size = get_chunk_size()
-    # load the existing events in chunks
-    has_more = True
-    while has_more:
+    loop = asyncio.get_event_loop()
+    subscriptions = get_run_event_subscriptions(instance)
+    subscriber = None
+
+    # load the existing events in chunks, until the subscription can attach to the shared watcher
+    # for the run, which buffers the most recent events
+    while subscriber is None:
         # run the fetch in a thread since its sync
         connection = await run_in_threadpool(
             instance.get_records_for_run,
@@ -282,28 +287,45 @@ async def gen_events_for_run(
                 hasMorePastEvents=connection.has_more,
                 cursor=connection.cursor,
             )
-        has_more = connection.has_more
         after_cursor = connection.cursor
+        if not connection.has_more:
+            subscriber = subscriptions.attach(run_id, loop, after_cursor)
+            if subscriber is None and storage_id_from_cursor(after_cursor) is None:
+                break
 
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[Tuple[Any, Any]] = asyncio.Queue()
+    if subscriber is None:
+        # fall back to a dedicated watcher for cursors that can't be shared
+        queue: asyncio.Queue[Tuple[Any, Any]] = asyncio.Queue()
 
-    def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
+        def _enqueue(event, cursor):
+            loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
+
+        # watch for live events
+        instance.watch_event_logs(run_id, after_cursor, _enqueue)
+        try:
+            while True:
+                event, cursor = await queue.get()
+                yield GraphenePipelineRunLogsSubscriptionSuccess(
+                    run=GrapheneRun(record),
+                    messages=[from_event_record(event, run.job_name)],
+                    hasMorePastEvents=False,
+                    cursor=cursor,
+                )
+        finally:
+            instance.end_watch_event_logs(run_id, _enqueue)
+        return
 
-    # watch for live events
-    instance.watch_event_logs(run_id, after_cursor, _enqueue)
     try:
         while True:
-            event, cursor = await queue.get()
+            entry = await subscriber.queue.get()
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
-                messages=[from_event_record(event, run.job_name)],
+                messages=[from_event_record(entry.event, run.job_name)],
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=entry.cursor,
             )
     finally:
-        instance.end_watch_event_logs(run_id, _enqueue)
+        subscriptions.detach(run_id, subscriber)
 
 
 async def gen_compute_logs(
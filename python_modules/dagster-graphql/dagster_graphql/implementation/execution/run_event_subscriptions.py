@@ -0,0 +1,162 @@
+import asyncio
+import os
+import threading
+import weakref
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional, Set
+
+import dagster._check as check
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.base import EventLogCursor
+
+
+def get_subscription_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_UI_EVENT_SUBSCRIPTION_BUFFER_SIZE", "1000"))
+
+
+def storage_id_from_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Returns the storage id that a run event cursor points at (-1 for the start of the run), or
+    None if the cursor is not a storage id cursor.
+    """
+    if cursor is None:
+        return -1
+    cursor_obj = EventLogCursor.parse(cursor)
+    if not cursor_obj.is_id_cursor():
+        return None
+    return cursor_obj.storage_id()
+
+
+class RunEventEntry(NamedTuple):
+    storage_id: int
+    cursor: str
+    event: EventLogEntry
+
+
+class RunEventSubscriber:
+    """A subscriber to the events of a run. Events are put on its asyncio queue from the thread of
+    the upstream event log watcher.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, storage_id: int):
+        self._loop = loop
+        self._storage_id = storage_id
+        self.queue: asyncio.Queue[RunEventEntry] = asyncio.Queue()
+
+    def deliver(self, entry: RunEventEntry) -> None:
+        # the subscriber may have already read events past the upstream watcher from storage
+        if entry.storage_id <= self._storage_id:
+            return
+        self._storage_id = entry.storage_id
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, entry)
+
+
+class RunEventBroadcast:
+    """Fans out the events of a single run to its subscribers from a single upstream event log
+    watcher, keeping the most recent events in a bounded buffer so that subscribers can attach at any
+    cursor within it.
+    """
+
+    def __init__(self, instance: DagsterInstance, run_id: str, storage_id: int, buffer_size: int):
+        self._instance = instance
+        self._run_id = run_id
+        self._lock = threading.Lock()
+        self._buffer: Deque[RunEventEntry] = deque(maxlen=buffer_size)
+        self._subscribers: Set[RunEventSubscriber] = set()
+        # all events after this storage id are either in the buffer or yet to be received
+        self._buffer_start_storage_id = storage_id
+
+        self._instance.watch_event_logs(
+            run_id, EventLogCursor.from_storage_id(storage_id).to_string(), self._on_event
+        )
+
+    def _on_event(self, event: EventLogEntry, cursor: str) -> None:
+        entry = RunEventEntry(check.not_none(storage_id_from_cursor(cursor)), cursor, event)
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._buffer_start_storage_id = self._buffer[0].storage_id
+            self._buffer.append(entry)
+            for subscriber in self._subscribers:
+                subscriber.deliver(entry)
+
+    def attach(
+        self, loop: asyncio.AbstractEventLoop, storage_id: int
+    ) -> Optional[RunEventSubscriber]:
+        with self._lock:
+            if storage_id < self._buffer_start_storage_id:
+                return None
+
+            subscriber = RunEventSubscriber(loop, storage_id)
+            for entry in self._buffer:
+                subscriber.deliver(entry)
+            self._subscribers.add(subscriber)
+            return subscriber
+
+    def detach(self, subscriber: RunEventSubscriber) -> bool:
+        """Detaches the subscriber, returning whether any subscribers remain."""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            return bool(self._subscribers)
+
+    def end_watch(self) -> None:
+        self._instance.end_watch_event_logs(self._run_id, self._on_event)
+
+
+class RunEventSubscriptions:
+    """Keeps one RunEventBroadcast per run with active subscribers, so that storage reads for live
+    run events don't scale with the number of subscribers to the run.
+    """
+
+    def __init__(self, instance: DagsterInstance, buffer_size: int):
+        self._instance = instance
+        self._buffer_size = check.int_param(buffer_size, "buffer_size")
+        self._lock = threading.Lock()
+        self._broadcasts: Dict[str, RunEventBroadcast] = {}
+
+    def attach(
+        self, run_id: str, loop: asyncio.AbstractEventLoop, cursor: Optional[str]
+    ) -> Optional[RunEventSubscriber]:
+        """Attaches a subscriber that has seen all the events of the run up to the given cursor.
+
+        Returns None if the cursor is older than the buffered events of the run, in which case the
+        subscriber should first catch up on the events of the run from storage.
+        """
+        storage_id = storage_id_from_cursor(cursor)
+        if storage_id is None:
+            return None
+
+        with self._lock:
+            broadcast = self._broadcasts.get(run_id)
+            if broadcast is None:
+                broadcast = RunEventBroadcast(self._instance, run_id, storage_id, self._buffer_size)
+                self._broadcasts[run_id] = broadcast
+
+            return broadcast.attach(loop, storage_id)
+
+    def detach(self, run_id: str, subscriber: RunEventSubscriber) -> None:
+        with self._lock:
+            broadcast = self._broadcasts.get(run_id)
+            if broadcast is None or broadcast.detach(subscriber):
+                return
+
+            del self._broadcasts[run_id]
+            broadcast.end_watch()
+
+    def has_broadcast(self, run_id: str) -> bool:
+        with self._lock:
+            return run_id in self._broadcasts
+
+
+_subscriptions_by_instance: (
+    "weakref.WeakKeyDictionary[DagsterInstance, RunEventSubscriptions]"
+) = weakref.WeakKeyDictionary()
+_subscriptions_lock = threading.Lock()
+
+
+def get_run_event_subscriptions(instance: DagsterInstance) -> RunEventSubscriptions:
+    with _subscriptions_lock:
+        if instance not in _subscriptions_by_instance:
+            _subscriptions_by_instance[instance] = RunEventSubscriptions(
+                instance, get_subscription_buffer_size()
+            )
+        return _subscriptions_by_instance[instance]
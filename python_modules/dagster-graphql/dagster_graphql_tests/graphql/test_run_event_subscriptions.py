@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from dagster import DagsterEventType, DagsterInstance
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.utils import make_new_run_id
+from dagster_graphql.implementation.execution.run_event_subscriptions import (
+    RunEventSubscriptions,
+)
+
+
+def _store_event(instance: DagsterInstance, run_id: str, message: str) -> None:
+    instance.store_event(
+        EventLogEntry(
+            error_info=None,
+            user_message=message,
+            level="debug",
+            run_id=run_id,
+            timestamp=time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+    )
+
+
+async def _drain(queue):
+    messages = []
+    while not queue.empty():
+        messages.append((await queue.get()).event.user_message)
+    return messages
+
+
+def test_run_event_subscriptions_share_watcher():
+    instance = DagsterInstance.ephemeral()
+    run_id = make_new_run_id()
+    subscriptions = RunEventSubscriptions(instance, buffer_size=3)
+    handlers = instance.event_log_storage._handlers  # noqa: SLF001
+
+    async def _test():
+        loop = asyncio.get_running_loop()
+        first = subscriptions.attach(run_id, loop, None)
+        second = subscriptions.attach(run_id, loop, None)
+        assert first and second
+        assert len(handlers[run_id]) == 1
+
+        for i in range(5):
+            _store_event(instance, run_id, str(i))
+        await asyncio.sleep(0)
+
+        assert await _drain(first.queue) == ["0", "1", "2", "3", "4"]
+        assert await _drain(second.queue) == ["0", "1", "2", "3", "4"]
+
+        records = instance.get_records_for_run(run_id).records
+
+        # older than the buffered events, must catch up from storage first
+        assert (
+            subscriptions.attach(
+                run_id, loop, EventLogCursor.from_storage_id(records[0].storage_id).to_string()
+            )
+            is None
+        )
+
+        third = subscriptions.attach(
+            run_id, loop, EventLogCursor.from_storage_id(records[1].storage_id).to_string()
+        )
+        assert third
+        await asyncio.sleep(0)
+        assert await _drain(third.queue) == ["2", "3", "4"]
+
+        # offset cursors can't be attached
+        assert subscriptions.attach(run_id, loop, EventLogCursor.from_offset(3).to_string()) is None
+
+        for subscriber in [first, second, third]:
+            assert subscriptions.has_broadcast(run_id)
+            subscriptions.detach(run_id, subscriber)
+
+        assert not subscriptions.has_broadcast(run_id)
+        assert not handlers[run_id]
+
+    asyncio.run(_test())
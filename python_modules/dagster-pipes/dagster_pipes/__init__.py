@@ -3,13 +3,14 @@
 import json
 import logging
 import os
+import struct
 import sys
 import time
 import warnings
 import zlib
 from abc import ABC, abstractmethod
 from contextlib import ExitStack, contextmanager
-from io import StringIO
+from io import BytesIO, StringIO
 from queue import Queue
 from threading import Event, Thread
 from typing import (
@@ -21,12 +22,14 @@
     Generic,
     Iterable,
     Iterator,
+    List,
     Literal,
     Mapping,
     Optional,
     Sequence,
     Set,
     TextIO,
+    Tuple,
     Type,
     TypedDict,
     TypeVar,
@@ -73,6 +76,285 @@ class PipesMessage(TypedDict):
     params: Optional[Mapping[str, Any]]
 
 
+# ##### MESSAGE FORMATS
+
+# Messages are written either as one JSON object per line, or as binary frames made of a 4-byte
+# big-endian length followed by the message encoded with MessagePack. Frames are limited to
+# _MAX_FRAME_SIZE bytes so that they always start with a null byte, which never starts a JSON line,
+# so readers can decode streams that mix both formats. Messages that don't fit in a frame are
+# written as JSON lines.
+
+PipesMessageFormat = Literal["json", "msgpack"]
+PIPES_MESSAGE_FORMAT_JSON = "json"
+PIPES_MESSAGE_FORMAT_MSGPACK = "msgpack"
+PIPES_MESSAGE_FORMATS = (PIPES_MESSAGE_FORMAT_JSON, PIPES_MESSAGE_FORMAT_MSGPACK)
+
+# Key of the message reader params that requests a message format from the message writer.
+# Message writers that don't support the requested format write JSON lines.
+PIPES_MESSAGE_FORMAT_KEY = "message_format"
+
+_FRAME_HEADER = struct.Struct(">I")
+_MAX_FRAME_SIZE = 2**24 - 1
+
+try:
+    # much faster than the pure Python implementation below, which is used if it is not installed
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
+
+def _msgpack_encode(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 2**7:
+            out.append(value)
+        elif -(2**5) <= value < 0:
+            out.append(value & 0xFF)
+        elif value > 0:
+            if value < 2**8:
+                out += b"\xcc" + struct.pack(">B", value)
+            elif value < 2**16:
+                out += b"\xcd" + struct.pack(">H", value)
+            elif value < 2**32:
+                out += b"\xce" + struct.pack(">I", value)
+            else:
+                out += b"\xcf" + struct.pack(">Q", value)
+        elif value >= -(2**7):
+            out += b"\xd0" + struct.pack(">b", value)
+        elif value >= -(2**15):
+            out += b"\xd1" + struct.pack(">h", value)
+        elif value >= -(2**31):
+            out += b"\xd2" + struct.pack(">i", value)
+        else:
+            out += b"\xd3" + struct.pack(">q", value)
+    elif isinstance(value, float):
+        out += b"\xcb" + struct.pack(">d", value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        length = len(data)
+        if length < 2**5:
+            out.append(0xA0 | length)
+        elif length < 2**8:
+            out += b"\xd9" + struct.pack(">B", length)
+        elif length < 2**16:
+            out += b"\xda" + struct.pack(">H", length)
+        else:
+            out += b"\xdb" + struct.pack(">I", length)
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        length = len(value)
+        if length < 2**8:
+            out += b"\xc4" + struct.pack(">B", length)
+        elif length < 2**16:
+            out += b"\xc5" + struct.pack(">H", length)
+        else:
+            out += b"\xc6" + struct.pack(">I", length)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        length = len(value)
+        if length < 2**4:
+            out.append(0x90 | length)
+        elif length < 2**16:
+            out += b"\xdc" + struct.pack(">H", length)
+        else:
+            out += b"\xdd" + struct.pack(">I", length)
+        for item in value:
+            _msgpack_encode(item, out)
+    elif isinstance(value, Mapping):
+        length = len(value)
+        if length < 2**4:
+            out.append(0x80 | length)
+        elif length < 2**16:
+            out += b"\xde" + struct.pack(">H", length)
+        else:
+            out += b"\xdf" + struct.pack(">I", length)
+        for key, item in value.items():
+            _msgpack_encode(key, out)
+            _msgpack_encode(item, out)
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+# type byte -> struct of the fixed size value, or of the length of the variable size value
+_MSGPACK_STRUCTS = {
+    0xC4: struct.Struct(">B"),
+    0xC5: struct.Struct(">H"),
+    0xC6: struct.Struct(">I"),
+    0xCA: struct.Struct(">f"),
+    0xCB: struct.Struct(">d"),
+    0xCC: struct.Struct(">B"),
+    0xCD: struct.Struct(">H"),
+    0xCE: struct.Struct(">I"),
+    0xCF: struct.Struct(">Q"),
+    0xD0: struct.Struct(">b"),
+    0xD1: struct.Struct(">h"),
+    0xD2: struct.Struct(">i"),
+    0xD3: struct.Struct(">q"),
+    0xD9: struct.Struct(">B"),
+    0xDA: struct.Struct(">H"),
+    0xDB: struct.Struct(">I"),
+    0xDC: struct.Struct(">H"),
+    0xDD: struct.Struct(">I"),
+    0xDE: struct.Struct(">H"),
+    0xDF: struct.Struct(">I"),
+}
+
+
+def _msgpack_decode(data: bytes, offset: int) -> Tuple[Any, int]:
+    type_byte = data[offset]
+    offset += 1
+    if type_byte <= 0x7F:
+        return type_byte, offset
+    elif type_byte >= 0xE0:
+        return type_byte - 0x100, offset
+    elif type_byte <= 0x8F:
+        return _msgpack_decode_map(data, offset, type_byte & 0x0F)
+    elif type_byte <= 0x9F:
+        return _msgpack_decode_array(data, offset, type_byte & 0x0F)
+    elif type_byte <= 0xBF:
+        end = offset + (type_byte & 0x1F)
+        return data[offset:end].decode("utf-8"), end
+    elif type_byte == 0xC0:
+        return None, offset
+    elif type_byte == 0xC2:
+        return False, offset
+    elif type_byte == 0xC3:
+        return True, offset
+
+    value_struct = _MSGPACK_STRUCTS.get(type_byte)
+    if value_struct is None:
+        raise DagsterPipesError(f"Unsupported MessagePack type byte {type_byte:#x}")
+    (value,) = value_struct.unpack_from(data, offset)
+    offset += value_struct.size
+    if type_byte <= 0xC6:
+        return bytes(data[offset : offset + value]), offset + value
+    elif type_byte <= 0xD3:
+        return value, offset
+    elif type_byte <= 0xDB:
+        return data[offset : offset + value].decode("utf-8"), offset + value
+    elif type_byte <= 0xDD:
+        return _msgpack_decode_array(data, offset, value)
+    else:
+        return _msgpack_decode_map(data, offset, value)
+
+
+def _msgpack_decode_array(data: bytes, offset: int, length: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(length):
+        item, offset = _msgpack_decode(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _msgpack_decode_map(data: bytes, offset: int, length: int) -> Tuple[Dict[Any, Any], int]:
+    items = {}
+    for _ in range(length):
+        key, offset = _msgpack_decode(data, offset)
+        items[key], offset = _msgpack_decode(data, offset)
+    return items, offset
+
+
+def _msgpack_packb(value: Any) -> bytes:
+    if _msgpack is not None:
+        return _msgpack.packb(value, use_bin_type=True)
+    out = bytearray()
+    _msgpack_encode(value, out)
+    return bytes(out)
+
+
+def _msgpack_unpackb(data: bytes) -> Any:
+    if _msgpack is not None:
+        return _msgpack.unpackb(data, raw=False, strict_map_key=False)
+    value, offset = _msgpack_decode(data, 0)
+    if offset != len(data):
+        raise DagsterPipesError("Unexpected trailing data after MessagePack value")
+    return value
+
+
+def encode_message_frame(message: PipesMessage) -> bytes:
+    """Encode a message as a length-prefixed MessagePack frame, or as a JSON line if it is too large
+    to fit in a frame.
+
+    Unlike JSON, MessagePack preserves non-string map keys and bytes values.
+
+    Args:
+        message (PipesMessage): The message to encode.
+
+    Returns:
+        bytes: The encoded message.
+    """
+    payload = _msgpack_packb(message)
+    if len(payload) > _MAX_FRAME_SIZE:
+        return (json.dumps(message) + "\n").encode("utf-8")
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _decode_json_lines(lines: Sequence[bytes]) -> List[PipesMessage]:
+    if not lines:
+        return []
+    try:
+        # a single call to the JSON decoder is much faster than one call per line
+        return json.loads(b"[" + b",".join(lines) + b"]")
+    except ValueError:
+        return [json.loads(line) for line in lines]
+
+
+def decode_messages(data: bytes) -> Tuple[List[PipesMessage], int]:
+    """Decode the complete messages at the start of the given data, which may mix JSON lines and
+    MessagePack frames.
+
+    Args:
+        data (bytes): The data to decode.
+
+    Returns:
+        Tuple[List[PipesMessage], int]: The decoded messages, and the number of bytes that they
+        were decoded from. Any remaining bytes belong to a message that is not complete yet.
+    """
+    messages: List[PipesMessage] = []
+    json_lines: List[bytes] = []
+    offset = 0
+    while offset < len(data):
+        if data[offset] == 0:
+            payload_offset = offset + _FRAME_HEADER.size
+            if payload_offset > len(data):
+                break
+            (length,) = _FRAME_HEADER.unpack_from(data, offset)
+            end = payload_offset + length
+            if end > len(data):
+                break
+            messages.extend(_decode_json_lines(json_lines))
+            json_lines = []
+            messages.append(_msgpack_unpackb(data[payload_offset:end]))
+        else:
+            end = data.find(b"\n", offset)
+            if end == -1:
+                break
+            line = data[offset:end]
+            if line.strip():
+                json_lines.append(line)
+            end += 1
+        offset = end
+
+    messages.extend(_decode_json_lines(json_lines))
+    return messages, offset
+
+
+def _get_env_message_format(env_params: PipesParams, cls: Type) -> PipesMessageFormat:
+    message_format = env_params.get(PIPES_MESSAGE_FORMAT_KEY, PIPES_MESSAGE_FORMAT_JSON)
+    if message_format not in PIPES_MESSAGE_FORMATS:
+        raise DagsterPipesError(
+            f"Invalid value for parameter `{PIPES_MESSAGE_FORMAT_KEY}` passed from orchestration"
+            f" side to `{cls.__name__}`. Expected one of `{PIPES_MESSAGE_FORMATS}`, got"
+            f" `{message_format}`."
+        )
+    return message_format
+
+
 ###### PIPES CONTEXT
 
 
@@ -510,10 +792,19 @@ def make_channel(self, params: PipesParams) -> T_BlobStoreMessageWriterChannel:
 
 
 class PipesBlobStoreMessageWriterChannel(PipesMessageWriterChannel):
-    """Message writer channel that periodically uploads message chunks to some blob store endpoint."""
+    """Message writer channel that periodically uploads message chunks to some blob store endpoint.
 
-    def __init__(self, *, interval: float = 10):
+    Chunks are uploaded as JSON lines, or as MessagePack frames if `message_format` is `"msgpack"`.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 10,
+        message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON,
+    ):
         self._interval = interval
+        self._message_format = message_format
         self._buffer: Queue[PipesMessage] = Queue()
         self._counter = 1
 
@@ -527,9 +818,14 @@ def flush_messages(self) -> Sequence[PipesMessage]:
         return items
 
     @abstractmethod
-    def upload_messages_chunk(self, payload: StringIO, index: int) -> None:
+    def upload_messages_chunk(self, payload: IO, index: int) -> None:
         ...
 
+    def _encode_messages_chunk(self, messages: Sequence[PipesMessage]) -> IO:
+        if self._message_format == PIPES_MESSAGE_FORMAT_MSGPACK:
+            return BytesIO(b"".join([encode_message_frame(message) for message in messages]))
+        return StringIO("\n".join([json.dumps(message) for message in messages]))
+
     @contextmanager
     def buffered_upload_loop(self) -> Iterator[None]:
         thread = None
@@ -550,9 +846,9 @@ def _upload_loop(self, is_task_complete: Event) -> None:
             if self._buffer.empty() and is_task_complete.is_set():
                 break
             elif is_task_complete.is_set() or (now - start_or_last_upload).seconds > self._interval:
-                payload = "\n".join([json.dumps(message) for message in self.flush_messages()])
-                if len(payload) > 0:
-                    self.upload_messages_chunk(StringIO(payload), self._counter)
+                messages = self.flush_messages()
+                if len(messages) > 0:
+                    self.upload_messages_chunk(self._encode_messages_chunk(messages), self._counter)
                     start_or_last_upload = now
                     self._counter += 1
             time.sleep(1)
@@ -565,14 +861,21 @@ class PipesBufferedFilesystemMessageWriterChannel(PipesBlobStoreMessageWriterCha
         interval (float): interval in seconds between chunk uploads
     """
 
-    def __init__(self, path: str, *, interval: float = 10):
-        super().__init__(interval=interval)
+    def __init__(
+        self,
+        path: str,
+        *,
+        interval: float = 10,
+        message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON,
+    ):
+        super().__init__(interval=interval, message_format=message_format)
         self._path = path
 
     def upload_messages_chunk(self, payload: IO, index: int) -> None:
         message_path = os.path.join(self._path, f"{index}.json")
-        with open(message_path, "w") as f:
-            f.write(payload.read())
+        data = payload.read()
+        with open(message_path, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
 
 
 # ########################
@@ -613,9 +916,10 @@ class PipesDefaultMessageWriter(PipesMessageWriter):
     """Message writer that writes messages to either a file or the stdout or stderr stream.
 
     The write location is configured by the params received by the writer. If the params include a
-    key `path`, then messages will be written to a file at the specified path. If the params instead
-    include a key `stdio`, then messages then the corresponding value must specify either `stderr`
-    or `stdout`, and messages will be written to the selected stream.
+    key `path`, then messages will be written to a file at the specified path, in the message format
+    requested by the params. If the params instead include a key `stdio`, then messages then the
+    corresponding value must specify either `stderr` or `stdout`, and messages will be written to
+    the selected stream as JSON lines.
     """
 
     FILE_PATH_KEY = "path"
@@ -627,7 +931,9 @@ class PipesDefaultMessageWriter(PipesMessageWriter):
     def open(self, params: PipesParams) -> Iterator[PipesMessageWriterChannel]:
         if self.FILE_PATH_KEY in params:
             path = _assert_env_param_type(params, self.FILE_PATH_KEY, str, self.__class__)
-            yield PipesFileMessageWriterChannel(path)
+            yield PipesFileMessageWriterChannel(
+                path, message_format=_get_env_message_format(params, self.__class__)
+            )
         elif self.STDIO_KEY in params:
             stream = _assert_env_param_type(params, self.STDIO_KEY, str, self.__class__)
             if stream == self.STDERR:
@@ -647,14 +953,23 @@ def open(self, params: PipesParams) -> Iterator[PipesMessageWriterChannel]:
 
 
 class PipesFileMessageWriterChannel(PipesMessageWriterChannel):
-    """Message writer channel that writes one message per line to a file."""
+    """Message writer channel that writes one message per line to a file, or one MessagePack frame
+    per message if `message_format` is `"msgpack"`.
+    """
 
-    def __init__(self, path: str):
+    def __init__(
+        self, path: str, *, message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON
+    ):
         self._path = path
+        self._message_format = message_format
 
     def write_message(self, message: PipesMessage) -> None:
-        with open(self._path, "a") as f:
-            f.write(json.dumps(message) + "\n")
+        if self._message_format == PIPES_MESSAGE_FORMAT_MSGPACK:
+            with open(self._path, "ab") as f:
+                f.write(encode_message_frame(message))
+        else:
+            with open(self._path, "a") as f:
+                f.write(json.dumps(message) + "\n")
 
 
 class PipesStreamMessageWriterChannel(PipesMessageWriterChannel):
@@ -734,6 +1049,7 @@ def make_channel(
             bucket=bucket,
             key_prefix=key_prefix,
             interval=self.interval,
+            message_format=_get_env_message_format(params, self.__class__),
         )
 
 
@@ -745,13 +1061,20 @@ class PipesS3MessageWriterChannel(PipesBlobStoreMessageWriterChannel):
         bucket (str): The name of the S3 bucket to write to.
         key_prefix (Optional[str]): An optional prefix to use for the keys of written blobs.
         interval (float): interval in seconds between upload chunk uploads
+        message_format (str): The format of the uploaded message chunks, `"json"` or `"msgpack"`.
     """
 
     # client is a boto3.client("s3") object
     def __init__(
-        self, client: Any, bucket: str, key_prefix: Optional[str], *, interval: float = 10
+        self,
+        client: Any,
+        bucket: str,
+        key_prefix: Optional[str],
+        *,
+        interval: float = 10,
+        message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON,
     ):
-        super().__init__(interval=interval)
+        super().__init__(interval=interval, message_format=message_format)
         self._client = client
         self._bucket = bucket
         self._key_prefix = key_prefix
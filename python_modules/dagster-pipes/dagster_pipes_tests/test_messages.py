@@ -0,0 +1,84 @@
+import json
+
+import pytest
+from dagster_pipes import (
+    PipesFileMessageWriterChannel,
+    _msgpack_decode,
+    _msgpack_encode,
+    decode_messages,
+    encode_message_frame,
+)
+
+_VALUES = [
+    None,
+    True,
+    False,
+    0,
+    127,
+    128,
+    2**16,
+    2**40,
+    -1,
+    -33,
+    -(2**15),
+    -(2**40),
+    1.5,
+    "",
+    "x" * 31,
+    "x" * 300,
+    "x" * 70000,
+    b"\x00\x01",
+    [],
+    list(range(20)),
+    {},
+    {str(i): i for i in range(20)},
+    {1: "a", None: [{"b": b"c"}]},
+]
+
+
+@pytest.mark.parametrize("value", _VALUES)
+def test_msgpack_round_trip(value):
+    out = bytearray()
+    _msgpack_encode(value, out)
+    assert _msgpack_decode(bytes(out), 0) == (value, len(out))
+
+
+def test_decode_message_frames():
+    messages = [
+        {"__dagster_pipes_version": "0.1", "method": "log", "params": {"message": str(i)}}
+        for i in range(10)
+    ]
+    data = b"".join(encode_message_frame(message) for message in messages)  # type: ignore
+    assert data[0] == 0
+    assert decode_messages(data) == (messages, len(data))
+
+    # incomplete frames are left for the next read
+    assert decode_messages(data[:-1]) == (messages[:-1], len(data) - len(data) // 10)
+    assert decode_messages(data[:2]) == ([], 0)
+
+
+def test_decode_mixed_messages():
+    json_line = (json.dumps({"method": "a", "params": None}) + "\n").encode()
+    frame = encode_message_frame({"method": "b", "params": None})  # type: ignore
+    data = json_line + frame + b"\n" + json_line + json_line[:-1]
+    messages, consumed = decode_messages(data)
+    assert [message["method"] for message in messages] == ["a", "b", "a"]
+    assert consumed == len(data) - len(json_line) + 1
+
+
+def test_encode_large_message():
+    message = {"method": "log", "params": {"message": "x" * 2**24}}
+    data = encode_message_frame(message)  # type: ignore
+    assert data.endswith(b"\n")
+    assert decode_messages(data) == ([message], len(data))
+
+
+def test_file_message_writer_channel(tmp_path):
+    path = str(tmp_path / "messages")
+    channel = PipesFileMessageWriterChannel(path, message_format="msgpack")
+    messages = [{"method": "log", "params": {"message": str(i)}} for i in range(3)]
+    for message in messages:
+        channel.write_message(message)  # type: ignore
+    with open(path, "rb") as f:
+        data = f.read()
+    assert decode_messages(data) == (messages, len(data))
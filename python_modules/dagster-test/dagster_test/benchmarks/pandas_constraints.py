@@ -0,0 +1,140 @@
+# ruff: noqa: T201
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from dagster_pandas import PandasColumn
+from dagster_pandas.constraints import (
+    ColumnConstraintWithMetadata,
+    MultiColumnConstraintWithMetadata,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    dtype_in_set_validation_factory,
+    non_null_validation,
+    nonnull,
+)
+from dagster_pandas.validation import validate_constraints
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time when validating the constraints of `dagster-pandas` against a large
+synthetic dataframe with an integer, a float, a string and a datetime column. The number of rows is
+configurable via the `--num-rows` arg.
+
+The benchmark validates:
+
+- the column constraints of `PandasColumn`s, against the whole dataframe and against a sample of
+  `--sample-size` rows.
+- the value validation functions of `ColumnConstraintWithMetadata` and
+  `MultiColumnConstraintWithMetadata`.
+
+Requires `dagster-pandas` to be installed.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="pandas_constraints",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-rows",
+    type=int,
+    default=1_000_000,
+    help="Set the number of rows of the validated dataframe.",
+)
+
+parser.add_argument(
+    "--sample-size",
+    type=int,
+    default=10_000,
+    help="Set the number of rows validated when validating a sample of the dataframe.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_dataframe(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": rng.integers(0, 100, num_rows),
+            "float": rng.random(num_rows),
+            "str": pd.Categorical(rng.choice(["a", "b", "c"], num_rows)),
+            "datetime": (
+                pd.Timestamp("2020-01-01")
+                + pd.to_timedelta(rng.integers(0, 365, num_rows), unit="D")
+            ).astype("datetime64[ns]"),
+        }
+    )
+
+
+PANDAS_COLUMNS = [
+    PandasColumn.integer_column("int", min_value=0, max_value=100, non_nullable=True),
+    PandasColumn.float_column("float", min_value=0, max_value=1, non_nullable=True),
+    PandasColumn.categorical_column("str", categories={"a", "b", "c"}, non_nullable=True),
+    PandasColumn.datetime_column(
+        "datetime", min_datetime=pd.Timestamp("2020-01-01"), non_nullable=True
+    ),
+]
+
+COLUMN_VALIDATORS = {
+    "int": [nonnull(column_range_validation_factory(minim=0, maxim=100))],
+    "float": [dtype_in_set_validation_factory((int, float)), non_null_validation],
+    "str": [categorical_column_validator_factory(["a", "b", "c"])],
+}
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_rows: int, sample_size: int) -> None:
+    dataframe = get_dataframe(num_rows)
+
+    session = ProfilingSession(
+        name="Pandas constraints",
+        experiment_settings={"num_rows": num_rows, "sample_size": sample_size},
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Validate PandasColumn constraints"):
+        validate_constraints(dataframe, pandas_columns=PANDAS_COLUMNS)
+
+    with session.logged_execution_time(
+        f"Validate PandasColumn constraints against {sample_size} rows"
+    ):
+        validate_constraints(
+            dataframe, pandas_columns=PANDAS_COLUMNS, sample_size=sample_size, sample_only=True
+        )
+
+    with session.logged_execution_time("Validate ColumnConstraintWithMetadata"):
+        for column, validators in COLUMN_VALIDATORS.items():
+            for validator in validators:
+                result = ColumnConstraintWithMetadata(
+                    description=validator.__doc__,
+                    validation_fn=validator,
+                    resulting_exception=None,
+                    raise_or_typecheck=False,
+                ).validate(dataframe, column)
+                assert result.success
+
+    with session.logged_execution_time("Validate MultiColumnConstraintWithMetadata"):
+        result = MultiColumnConstraintWithMetadata(
+            description="Multi-column constraint",
+            fn_and_columns_dict=COLUMN_VALIDATORS,
+            resulting_exception=None,
+            raise_or_typecheck=False,
+        ).validate(dataframe)
+        assert result.success
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_rows, args.sample_size)
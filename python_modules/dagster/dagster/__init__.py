@@ -67,526 +67,14 @@
 # We could get around this by always remembering to use the `from .foo import X as X` form in
 # containers, but it is simpler to just import directly from the defining module.
 
-# ########################
-# ##### DYNAMIC IMPORTS
-# ########################
-
-from dagster._builtins import (
-    Any as Any,
-    Bool as Bool,
-    Float as Float,
-    Int as Int,
-    Nothing as Nothing,
-    String as String,
-)
-from dagster._config.config_schema import ConfigSchema as ConfigSchema
-from dagster._config.config_type import (
-    Array as Array,
-    Enum as Enum,
-    EnumValue as EnumValue,
-    Noneable as Noneable,
-    ScalarUnion as ScalarUnion,
-)
-from dagster._config.field import Field as Field
-from dagster._config.field_utils import (
-    EnvVar as EnvVar,
-    Map as Map,
-    Permissive as Permissive,
-    Selector as Selector,
-    Shape as Shape,
-)
-from dagster._config.pythonic_config import (
-    Config as Config,
-    ConfigurableIOManager as ConfigurableIOManager,
-    ConfigurableIOManagerFactory as ConfigurableIOManagerFactory,
-    ConfigurableLegacyIOManagerAdapter as ConfigurableLegacyIOManagerAdapter,
-    ConfigurableResource as ConfigurableResource,
-    IAttachDifferentObjectToOpContext as IAttachDifferentObjectToOpContext,
-    PermissiveConfig as PermissiveConfig,
-    ResourceDependency as ResourceDependency,
-)
-from dagster._config.source import (
-    BoolSource as BoolSource,
-    IntSource as IntSource,
-    StringSource as StringSource,
-)
-from dagster._core.definitions import AssetCheckResult as AssetCheckResult
-from dagster._core.definitions.asset_check_spec import (
-    AssetCheckKey as AssetCheckKey,
-    AssetCheckSeverity as AssetCheckSeverity,
-    AssetCheckSpec as AssetCheckSpec,
-)
-from dagster._core.definitions.asset_dep import AssetDep as AssetDep
-from dagster._core.definitions.asset_in import AssetIn as AssetIn
-from dagster._core.definitions.asset_out import AssetOut as AssetOut
-from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
-from dagster._core.definitions.asset_sensor_definition import (
-    AssetSensorDefinition as AssetSensorDefinition,
-)
-from dagster._core.definitions.asset_spec import AssetSpec as AssetSpec
-from dagster._core.definitions.assets import AssetsDefinition as AssetsDefinition
-from dagster._core.definitions.auto_materialize_policy import (
-    AutoMaterializePolicy as AutoMaterializePolicy,
-)
-from dagster._core.definitions.auto_materialize_rule import (
-    AutoMaterializeRule as AutoMaterializeRule,
-)
-from dagster._core.definitions.backfill_policy import BackfillPolicy as BackfillPolicy
-from dagster._core.definitions.composition import PendingNodeInvocation as PendingNodeInvocation
-from dagster._core.definitions.config import ConfigMapping as ConfigMapping
-from dagster._core.definitions.configurable import configured as configured
-from dagster._core.definitions.data_version import (
-    DataProvenance as DataProvenance,
-    DataVersion as DataVersion,
-    DataVersionsByPartition as DataVersionsByPartition,
-)
-from dagster._core.definitions.decorators.asset_check_decorator import (
-    asset_check as asset_check,
-)
-from dagster._core.definitions.decorators.asset_decorator import (
-    asset as asset,
-    graph_asset as graph_asset,
-    graph_multi_asset as graph_multi_asset,
-    multi_asset as multi_asset,
-)
-from dagster._core.definitions.decorators.config_mapping_decorator import (
-    config_mapping as config_mapping,
-)
-from dagster._core.definitions.decorators.graph_decorator import graph as graph
-from dagster._core.definitions.decorators.hook_decorator import (
-    failure_hook as failure_hook,
-    success_hook as success_hook,
-)
-from dagster._core.definitions.decorators.job_decorator import job as job
-from dagster._core.definitions.decorators.op_decorator import op as op
-from dagster._core.definitions.decorators.repository_decorator import repository as repository
-from dagster._core.definitions.decorators.schedule_decorator import schedule as schedule
-from dagster._core.definitions.decorators.sensor_decorator import (
-    asset_sensor as asset_sensor,
-    multi_asset_sensor as multi_asset_sensor,
-    sensor as sensor,
-)
-from dagster._core.definitions.decorators.source_asset_decorator import (
-    observable_source_asset as observable_source_asset,
-)
-from dagster._core.definitions.definitions_class import (
-    BindResourcesToJobs as BindResourcesToJobs,
-    Definitions as Definitions,
-    create_repository_using_definitions_args as create_repository_using_definitions_args,
-)
-from dagster._core.definitions.dependency import (
-    DependencyDefinition as DependencyDefinition,
-    MultiDependencyDefinition as MultiDependencyDefinition,
-    NodeInvocation as NodeInvocation,
-)
-from dagster._core.definitions.events import (
-    AssetKey as AssetKey,
-    AssetMaterialization as AssetMaterialization,
-    AssetObservation as AssetObservation,
-    DynamicOutput as DynamicOutput,
-    ExpectationResult as ExpectationResult,
-    Failure as Failure,
-    Output as Output,
-    RetryRequested as RetryRequested,
-    TypeCheck as TypeCheck,
-)
-from dagster._core.definitions.executor_definition import (
-    ExecutorDefinition as ExecutorDefinition,
-    ExecutorRequirement as ExecutorRequirement,
-    executor as executor,
-    in_process_executor as in_process_executor,
-    multi_or_in_process_executor as multi_or_in_process_executor,
-    multiple_process_executor_requirements as multiple_process_executor_requirements,
-    multiprocess_executor as multiprocess_executor,
-)
-from dagster._core.definitions.external_asset import (
-    external_asset_from_spec as external_asset_from_spec,
-    external_assets_from_specs as external_assets_from_specs,
-)
-from dagster._core.definitions.freshness_policy import FreshnessPolicy as FreshnessPolicy
-from dagster._core.definitions.freshness_policy_sensor_definition import (
-    FreshnessPolicySensorContext as FreshnessPolicySensorContext,
-    FreshnessPolicySensorDefinition as FreshnessPolicySensorDefinition,
-    build_freshness_policy_sensor_context as build_freshness_policy_sensor_context,
-    freshness_policy_sensor as freshness_policy_sensor,
-)
-from dagster._core.definitions.graph_definition import GraphDefinition as GraphDefinition
-from dagster._core.definitions.hook_definition import HookDefinition as HookDefinition
-from dagster._core.definitions.input import (
-    GraphIn as GraphIn,
-    In as In,
-    InputMapping as InputMapping,
-)
-from dagster._core.definitions.job_definition import JobDefinition as JobDefinition
-from dagster._core.definitions.load_asset_checks_from_modules import (
-    load_asset_checks_from_current_module as load_asset_checks_from_current_module,
-    load_asset_checks_from_modules as load_asset_checks_from_modules,
-    load_asset_checks_from_package_module as load_asset_checks_from_package_module,
-    load_asset_checks_from_package_name as load_asset_checks_from_package_name,
-)
-from dagster._core.definitions.load_assets_from_modules import (
-    load_assets_from_current_module as load_assets_from_current_module,
-    load_assets_from_modules as load_assets_from_modules,
-    load_assets_from_package_module as load_assets_from_package_module,
-    load_assets_from_package_name as load_assets_from_package_name,
-)
-from dagster._core.definitions.logger_definition import (
-    LoggerDefinition as LoggerDefinition,
-    build_init_logger_context as build_init_logger_context,
-    logger as logger,
-)
-from dagster._core.definitions.materialize import (
-    materialize as materialize,
-    materialize_to_memory as materialize_to_memory,
-)
-from dagster._core.definitions.metadata import (
-    BoolMetadataValue as BoolMetadataValue,
-    DagsterAssetMetadataValue as DagsterAssetMetadataValue,
-    DagsterRunMetadataValue as DagsterRunMetadataValue,
-    FloatMetadataValue as FloatMetadataValue,
-    IntMetadataValue as IntMetadataValue,
-    JsonMetadataValue as JsonMetadataValue,
-    MarkdownMetadataValue as MarkdownMetadataValue,
-    MetadataEntry as MetadataEntry,
-    MetadataValue as MetadataValue,
-    NotebookMetadataValue as NotebookMetadataValue,
-    NullMetadataValue as NullMetadataValue,
-    PathMetadataValue as PathMetadataValue,
-    PythonArtifactMetadataValue as PythonArtifactMetadataValue,
-    TableMetadataValue as TableMetadataValue,
-    TableSchemaMetadataValue as TableSchemaMetadataValue,
-    TextMetadataValue as TextMetadataValue,
-    UrlMetadataValue as UrlMetadataValue,
-)
-from dagster._core.definitions.metadata.table import (
-    TableColumn as TableColumn,
-    TableColumnConstraints as TableColumnConstraints,
-    TableConstraints as TableConstraints,
-    TableRecord as TableRecord,
-    TableSchema as TableSchema,
-)
-from dagster._core.definitions.multi_asset_sensor_definition import (
-    MultiAssetSensorDefinition as MultiAssetSensorDefinition,
-    MultiAssetSensorEvaluationContext as MultiAssetSensorEvaluationContext,
-    build_multi_asset_sensor_context as build_multi_asset_sensor_context,
-)
-from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionKey as MultiPartitionKey,
-    MultiPartitionsDefinition as MultiPartitionsDefinition,
-)
-from dagster._core.definitions.op_definition import OpDefinition as OpDefinition
-from dagster._core.definitions.output import (
-    DynamicOut as DynamicOut,
-    GraphOut as GraphOut,
-    Out as Out,
-    OutputMapping as OutputMapping,
-)
-from dagster._core.definitions.partition import (
-    DynamicPartitionsDefinition as DynamicPartitionsDefinition,
-    Partition as Partition,
-    PartitionedConfig as PartitionedConfig,
-    PartitionsDefinition as PartitionsDefinition,
-    StaticPartitionsDefinition as StaticPartitionsDefinition,
-    dynamic_partitioned_config as dynamic_partitioned_config,
-    partitioned_config as partitioned_config,
-    static_partitioned_config as static_partitioned_config,
-)
-from dagster._core.definitions.partition_key_range import PartitionKeyRange as PartitionKeyRange
-from dagster._core.definitions.partition_mapping import (
-    AllPartitionMapping as AllPartitionMapping,
-    DimensionPartitionMapping as DimensionPartitionMapping,
-    IdentityPartitionMapping as IdentityPartitionMapping,
-    LastPartitionMapping as LastPartitionMapping,
-    MultiPartitionMapping as MultiPartitionMapping,
-    MultiToSingleDimensionPartitionMapping as MultiToSingleDimensionPartitionMapping,
-    PartitionMapping as PartitionMapping,
-    SpecificPartitionsPartitionMapping as SpecificPartitionsPartitionMapping,
-    StaticPartitionMapping as StaticPartitionMapping,
-)
-from dagster._core.definitions.partitioned_schedule import (
-    build_schedule_from_partitioned_job as build_schedule_from_partitioned_job,
-)
-from dagster._core.definitions.policy import (
-    Backoff as Backoff,
-    Jitter as Jitter,
-    RetryPolicy as RetryPolicy,
-)
-from dagster._core.definitions.reconstruct import (
-    build_reconstructable_job as build_reconstructable_job,
-    reconstructable as reconstructable,
-)
-from dagster._core.definitions.repository_definition import (
-    RepositoryData as RepositoryData,
-    RepositoryDefinition as RepositoryDefinition,
-)
-from dagster._core.definitions.resource_annotation import (
-    ResourceParam as ResourceParam,
-)
-from dagster._core.definitions.resource_definition import (
-    ResourceDefinition as ResourceDefinition,
-    make_values_resource as make_values_resource,
-    resource as resource,
-)
-from dagster._core.definitions.result import MaterializeResult as MaterializeResult
-from dagster._core.definitions.run_config import RunConfig as RunConfig
-from dagster._core.definitions.run_request import (
-    AddDynamicPartitionsRequest as AddDynamicPartitionsRequest,
-    DeleteDynamicPartitionsRequest as DeleteDynamicPartitionsRequest,
-    RunRequest as RunRequest,
-    SensorResult as SensorResult,
-    SkipReason as SkipReason,
-)
-from dagster._core.definitions.run_status_sensor_definition import (
-    RunFailureSensorContext as RunFailureSensorContext,
-    RunStatusSensorContext as RunStatusSensorContext,
-    RunStatusSensorDefinition as RunStatusSensorDefinition,
-    build_run_status_sensor_context as build_run_status_sensor_context,
-    run_failure_sensor as run_failure_sensor,
-    run_status_sensor as run_status_sensor,
-)
-from dagster._core.definitions.schedule_definition import (
-    DefaultScheduleStatus as DefaultScheduleStatus,
-    ScheduleDefinition as ScheduleDefinition,
-    ScheduleEvaluationContext as ScheduleEvaluationContext,
-    build_schedule_context as build_schedule_context,
-)
-from dagster._core.definitions.selector import (
-    CodeLocationSelector as CodeLocationSelector,
-    JobSelector as JobSelector,
-    RepositorySelector as RepositorySelector,
-)
-from dagster._core.definitions.sensor_definition import (
-    DefaultSensorStatus as DefaultSensorStatus,
-    SensorDefinition as SensorDefinition,
-    SensorEvaluationContext as SensorEvaluationContext,
-    build_sensor_context as build_sensor_context,
-)
-from dagster._core.definitions.source_asset import SourceAsset as SourceAsset
-from dagster._core.definitions.step_launcher import (
-    StepLauncher as StepLauncher,
-    StepRunRef as StepRunRef,
-)
-from dagster._core.definitions.time_window_partition_mapping import (
-    TimeWindowPartitionMapping as TimeWindowPartitionMapping,
-)
-from dagster._core.definitions.time_window_partitions import (
-    DailyPartitionsDefinition as DailyPartitionsDefinition,
-    HourlyPartitionsDefinition as HourlyPartitionsDefinition,
-    MonthlyPartitionsDefinition as MonthlyPartitionsDefinition,
-    TimeWindow as TimeWindow,
-    TimeWindowPartitionsDefinition as TimeWindowPartitionsDefinition,
-    WeeklyPartitionsDefinition as WeeklyPartitionsDefinition,
-    daily_partitioned_config as daily_partitioned_config,
-    hourly_partitioned_config as hourly_partitioned_config,
-    monthly_partitioned_config as monthly_partitioned_config,
-    weekly_partitioned_config as weekly_partitioned_config,
-)
-from dagster._core.definitions.unresolved_asset_job_definition import (
-    define_asset_job as define_asset_job,
-)
-from dagster._core.definitions.utils import (
-    config_from_files as config_from_files,
-    config_from_pkg_resources as config_from_pkg_resources,
-    config_from_yaml_strings as config_from_yaml_strings,
-)
-from dagster._core.definitions.version_strategy import (
-    OpVersionContext as OpVersionContext,
-    ResourceVersionContext as ResourceVersionContext,
-    SourceHashVersionStrategy as SourceHashVersionStrategy,
-    VersionStrategy as VersionStrategy,
-)
-from dagster._core.errors import (
-    DagsterConfigMappingFunctionError as DagsterConfigMappingFunctionError,
-    DagsterError as DagsterError,
-    DagsterEventLogInvalidForRun as DagsterEventLogInvalidForRun,
-    DagsterExecutionInterruptedError as DagsterExecutionInterruptedError,
-    DagsterExecutionStepExecutionError as DagsterExecutionStepExecutionError,
-    DagsterExecutionStepNotFoundError as DagsterExecutionStepNotFoundError,
-    DagsterInvalidConfigDefinitionError as DagsterInvalidConfigDefinitionError,
-    DagsterInvalidConfigError as DagsterInvalidConfigError,
-    DagsterInvalidDefinitionError as DagsterInvalidDefinitionError,
-    DagsterInvalidInvocationError as DagsterInvalidInvocationError,
-    DagsterInvalidSubsetError as DagsterInvalidSubsetError,
-    DagsterInvariantViolationError as DagsterInvariantViolationError,
-    DagsterResourceFunctionError as DagsterResourceFunctionError,
-    DagsterRunNotFoundError as DagsterRunNotFoundError,
-    DagsterStepOutputNotFoundError as DagsterStepOutputNotFoundError,
-    DagsterSubprocessError as DagsterSubprocessError,
-    DagsterTypeCheckDidNotPass as DagsterTypeCheckDidNotPass,
-    DagsterTypeCheckError as DagsterTypeCheckError,
-    DagsterUnknownPartitionError as DagsterUnknownPartitionError,
-    DagsterUnknownResourceError as DagsterUnknownResourceError,
-    DagsterUnmetExecutorRequirementsError as DagsterUnmetExecutorRequirementsError,
-    DagsterUserCodeExecutionError as DagsterUserCodeExecutionError,
-    raise_execution_interrupts as raise_execution_interrupts,
-)
-from dagster._core.event_api import (
-    EventLogRecord as EventLogRecord,
-    EventRecordsFilter as EventRecordsFilter,
-    RunShardedEventsCursor as RunShardedEventsCursor,
-)
-from dagster._core.events import (
-    DagsterEvent as DagsterEvent,
-    DagsterEventType as DagsterEventType,
-)
-from dagster._core.events.log import EventLogEntry as EventLogEntry
-from dagster._core.execution.api import (
-    ReexecutionOptions as ReexecutionOptions,
-    execute_job as execute_job,
-)
-from dagster._core.execution.build_resources import build_resources as build_resources
-from dagster._core.execution.context.compute import (
-    AssetExecutionContext as AssetExecutionContext,
-    OpExecutionContext as OpExecutionContext,
-)
-from dagster._core.execution.context.hook import (
-    HookContext as HookContext,
-    build_hook_context as build_hook_context,
-)
-from dagster._core.execution.context.init import (
-    InitResourceContext as InitResourceContext,
-    build_init_resource_context as build_init_resource_context,
-)
-from dagster._core.execution.context.input import (
-    InputContext as InputContext,
-    build_input_context as build_input_context,
-)
-from dagster._core.execution.context.invocation import (
-    build_asset_context as build_asset_context,
-    build_op_context as build_op_context,
-)
-from dagster._core.execution.context.logger import InitLoggerContext as InitLoggerContext
-from dagster._core.execution.context.output import (
-    OutputContext as OutputContext,
-    build_output_context as build_output_context,
-)
-from dagster._core.execution.context.system import (
-    DagsterTypeLoaderContext as DagsterTypeLoaderContext,
-    StepExecutionContext as StepExecutionContext,
-    TypeCheckContext as TypeCheckContext,
-)
-from dagster._core.execution.execute_in_process_result import (
-    ExecuteInProcessResult as ExecuteInProcessResult,
-)
-from dagster._core.execution.job_execution_result import JobExecutionResult as JobExecutionResult
-from dagster._core.execution.plan.external_step import (
-    external_instance_from_step_run_ref as external_instance_from_step_run_ref,
-    run_step_from_ref as run_step_from_ref,
-    step_context_to_step_run_ref as step_context_to_step_run_ref,
-    step_run_ref_to_step_context as step_run_ref_to_step_context,
-)
-from dagster._core.execution.validate_run_config import validate_run_config as validate_run_config
-from dagster._core.execution.with_resources import with_resources as with_resources
-from dagster._core.executor.base import Executor as Executor
-from dagster._core.executor.init import InitExecutorContext as InitExecutorContext
-from dagster._core.instance import DagsterInstance as DagsterInstance
-from dagster._core.instance_for_test import instance_for_test as instance_for_test
-from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
-from dagster._core.log_manager import DagsterLogManager as DagsterLogManager
-from dagster._core.pipes.client import (
-    PipesClient as PipesClient,
-    PipesContextInjector as PipesContextInjector,
-    PipesMessageReader as PipesMessageReader,
-)
-from dagster._core.pipes.context import (
-    PipesMessageHandler as PipesMessageHandler,
-    PipesSession as PipesSession,
-)
-from dagster._core.pipes.subprocess import PipesSubprocessClient as PipesSubprocessClient
-from dagster._core.pipes.utils import (
-    PipesBlobStoreMessageReader as PipesBlobStoreMessageReader,
-    PipesBlobStoreStdioReader as PipesBlobStoreStdioReader,
-    PipesEnvContextInjector as PipesEnvContextInjector,
-    PipesFileContextInjector as PipesFileContextInjector,
-    PipesFileMessageReader as PipesFileMessageReader,
-    PipesTempFileContextInjector as PipesTempFileContextInjector,
-    PipesTempFileMessageReader as PipesTempFileMessageReader,
-    open_pipes_session as open_pipes_session,
-)
-from dagster._core.run_coordinator.queued_run_coordinator import (
-    QueuedRunCoordinator as QueuedRunCoordinator,
-    SubmitRunContext as SubmitRunContext,
-)
-from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
-from dagster._core.storage.dagster_run import (
-    DagsterRun as DagsterRun,
-    DagsterRunStatus as DagsterRunStatus,
-    RunRecord as RunRecord,
-    RunsFilter as RunsFilter,
-)
-from dagster._core.storage.file_manager import (
-    FileHandle as FileHandle,
-    LocalFileHandle as LocalFileHandle,
-    local_file_manager as local_file_manager,
-)
-from dagster._core.storage.fs_io_manager import (
-    FilesystemIOManager as FilesystemIOManager,
-    custom_path_fs_io_manager as custom_path_fs_io_manager,
-    fs_io_manager as fs_io_manager,
-)
-from dagster._core.storage.input_manager import (
-    InputManager as InputManager,
-    InputManagerDefinition as InputManagerDefinition,
-    input_manager as input_manager,
-)
-from dagster._core.storage.io_manager import (
-    IOManager as IOManager,
-    IOManagerDefinition as IOManagerDefinition,
-    io_manager as io_manager,
-)
-from dagster._core.storage.mem_io_manager import (
-    InMemoryIOManager as InMemoryIOManager,
-    mem_io_manager as mem_io_manager,
-)
-from dagster._core.storage.memoizable_io_manager import MemoizableIOManager as MemoizableIOManager
-from dagster._core.storage.partition_status_cache import (
-    AssetPartitionStatus as AssetPartitionStatus,
-)
-from dagster._core.storage.tags import (
-    MAX_RUNTIME_SECONDS_TAG as MAX_RUNTIME_SECONDS_TAG,
-    MEMOIZED_RUN_TAG as MEMOIZED_RUN_TAG,
-)
-from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
-from dagster._core.types.config_schema import (
-    DagsterTypeLoader as DagsterTypeLoader,
-    dagster_type_loader as dagster_type_loader,
-)
-from dagster._core.types.dagster_type import (
-    DagsterType as DagsterType,
-    List as List,
-    Optional as Optional,
-    PythonObjectDagsterType as PythonObjectDagsterType,
-    make_python_type_usable_as_dagster_type as make_python_type_usable_as_dagster_type,
-)
-from dagster._core.types.decorator import usable_as_dagster_type as usable_as_dagster_type
-from dagster._core.types.python_dict import Dict as Dict
-from dagster._core.types.python_set import Set as Set
-from dagster._core.types.python_tuple import Tuple as Tuple
-from dagster._loggers import (
-    colored_console_logger as colored_console_logger,
-    default_loggers as default_loggers,
-    default_system_loggers as default_system_loggers,
-    json_console_logger as json_console_logger,
-)
-from dagster._serdes.serdes import (
-    deserialize_value as deserialize_value,
-    serialize_value as serialize_value,
-)
-from dagster._utils import (
-    file_relative_path as file_relative_path,
-)
-from dagster._utils.alert import (
-    make_email_on_run_failure_sensor as make_email_on_run_failure_sensor,
-)
-from dagster._utils.dagster_type import check_dagster_type as check_dagster_type
-from dagster._utils.log import get_dagster_logger as get_dagster_logger
-from dagster._utils.warnings import ExperimentalWarning as ExperimentalWarning
-from dagster.version import __version__ as __version__
-
-# ruff: isort: split
+# (3) Public symbols are loaded lazily so that `import dagster` (and any import of a dagster
+# submodule, which first imports this module) does not pay for importing the entire framework.
+# Each symbol must therefore be declared twice: once in the `TYPE_CHECKING` block below, so that
+# static analyzers see it, and once in `_LAZY_IMPORTS`, which `__getattr__` uses to import it on
+# first access. `test_lazy_imports_match_type_checking_imports` ensures the two stay in sync.
 
 # ########################
-# ##### DYNAMIC IMPORTS
+# ##### LAZY IMPORTS
 # ########################
 
 import importlib
@@ -601,7 +89,882 @@
 
 from typing_extensions import Final
 
-from dagster._utils.warnings import deprecation_warning
+from dagster.version import __version__ as __version__
+
+if TYPE_CHECKING:
+    from dagster._builtins import (
+        Any as Any,
+        Bool as Bool,
+        Float as Float,
+        Int as Int,
+        Nothing as Nothing,
+        String as String,
+    )
+    from dagster._config.config_schema import ConfigSchema as ConfigSchema
+    from dagster._config.config_type import (
+        Array as Array,
+        Enum as Enum,
+        EnumValue as EnumValue,
+        Noneable as Noneable,
+        ScalarUnion as ScalarUnion,
+    )
+    from dagster._config.field import Field as Field
+    from dagster._config.field_utils import (
+        EnvVar as EnvVar,
+        Map as Map,
+        Permissive as Permissive,
+        Selector as Selector,
+        Shape as Shape,
+    )
+    from dagster._config.pythonic_config import (
+        Config as Config,
+        ConfigurableIOManager as ConfigurableIOManager,
+        ConfigurableIOManagerFactory as ConfigurableIOManagerFactory,
+        ConfigurableLegacyIOManagerAdapter as ConfigurableLegacyIOManagerAdapter,
+        ConfigurableResource as ConfigurableResource,
+        IAttachDifferentObjectToOpContext as IAttachDifferentObjectToOpContext,
+        PermissiveConfig as PermissiveConfig,
+        ResourceDependency as ResourceDependency,
+    )
+    from dagster._config.source import (
+        BoolSource as BoolSource,
+        IntSource as IntSource,
+        StringSource as StringSource,
+    )
+    from dagster._core.definitions import AssetCheckResult as AssetCheckResult
+    from dagster._core.definitions.asset_check_spec import (
+        AssetCheckKey as AssetCheckKey,
+        AssetCheckSeverity as AssetCheckSeverity,
+        AssetCheckSpec as AssetCheckSpec,
+    )
+    from dagster._core.definitions.asset_dep import AssetDep as AssetDep
+    from dagster._core.definitions.asset_in import AssetIn as AssetIn
+    from dagster._core.definitions.asset_out import AssetOut as AssetOut
+    from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
+    from dagster._core.definitions.asset_sensor_definition import (
+        AssetSensorDefinition as AssetSensorDefinition,
+    )
+    from dagster._core.definitions.asset_spec import AssetSpec as AssetSpec
+    from dagster._core.definitions.assets import AssetsDefinition as AssetsDefinition
+    from dagster._core.definitions.auto_materialize_policy import (
+        AutoMaterializePolicy as AutoMaterializePolicy,
+    )
+    from dagster._core.definitions.auto_materialize_rule import (
+        AutoMaterializeRule as AutoMaterializeRule,
+    )
+    from dagster._core.definitions.backfill_policy import BackfillPolicy as BackfillPolicy
+    from dagster._core.definitions.composition import PendingNodeInvocation as PendingNodeInvocation
+    from dagster._core.definitions.config import ConfigMapping as ConfigMapping
+    from dagster._core.definitions.configurable import configured as configured
+    from dagster._core.definitions.data_version import (
+        DataProvenance as DataProvenance,
+        DataVersion as DataVersion,
+        DataVersionsByPartition as DataVersionsByPartition,
+    )
+    from dagster._core.definitions.decorators.asset_check_decorator import (
+        asset_check as asset_check,
+    )
+    from dagster._core.definitions.decorators.asset_decorator import (
+        asset as asset,
+        graph_asset as graph_asset,
+        graph_multi_asset as graph_multi_asset,
+        multi_asset as multi_asset,
+    )
+    from dagster._core.definitions.decorators.config_mapping_decorator import (
+        config_mapping as config_mapping,
+    )
+    from dagster._core.definitions.decorators.graph_decorator import graph as graph
+    from dagster._core.definitions.decorators.hook_decorator import (
+        failure_hook as failure_hook,
+        success_hook as success_hook,
+    )
+    from dagster._core.definitions.decorators.job_decorator import job as job
+    from dagster._core.definitions.decorators.op_decorator import op as op
+    from dagster._core.definitions.decorators.repository_decorator import repository as repository
+    from dagster._core.definitions.decorators.schedule_decorator import schedule as schedule
+    from dagster._core.definitions.decorators.sensor_decorator import (
+        asset_sensor as asset_sensor,
+        multi_asset_sensor as multi_asset_sensor,
+        sensor as sensor,
+    )
+    from dagster._core.definitions.decorators.source_asset_decorator import (
+        observable_source_asset as observable_source_asset,
+    )
+    from dagster._core.definitions.definitions_class import (
+        BindResourcesToJobs as BindResourcesToJobs,
+        Definitions as Definitions,
+        create_repository_using_definitions_args as create_repository_using_definitions_args,
+    )
+    from dagster._core.definitions.dependency import (
+        DependencyDefinition as DependencyDefinition,
+        MultiDependencyDefinition as MultiDependencyDefinition,
+        NodeInvocation as NodeInvocation,
+    )
+    from dagster._core.definitions.events import (
+        AssetKey as AssetKey,
+        AssetMaterialization as AssetMaterialization,
+        AssetObservation as AssetObservation,
+        DynamicOutput as DynamicOutput,
+        ExpectationResult as ExpectationResult,
+        Failure as Failure,
+        Output as Output,
+        RetryRequested as RetryRequested,
+        TypeCheck as TypeCheck,
+    )
+    from dagster._core.definitions.executor_definition import (
+        ExecutorDefinition as ExecutorDefinition,
+        ExecutorRequirement as ExecutorRequirement,
+        executor as executor,
+        in_process_executor as in_process_executor,
+        multi_or_in_process_executor as multi_or_in_process_executor,
+        multiple_process_executor_requirements as multiple_process_executor_requirements,
+        multiprocess_executor as multiprocess_executor,
+    )
+    from dagster._core.definitions.external_asset import (
+        external_asset_from_spec as external_asset_from_spec,
+        external_assets_from_specs as external_assets_from_specs,
+    )
+    from dagster._core.definitions.freshness_policy import FreshnessPolicy as FreshnessPolicy
+    from dagster._core.definitions.freshness_policy_sensor_definition import (
+        FreshnessPolicySensorContext as FreshnessPolicySensorContext,
+        FreshnessPolicySensorDefinition as FreshnessPolicySensorDefinition,
+        build_freshness_policy_sensor_context as build_freshness_policy_sensor_context,
+        freshness_policy_sensor as freshness_policy_sensor,
+    )
+    from dagster._core.definitions.graph_definition import GraphDefinition as GraphDefinition
+    from dagster._core.definitions.hook_definition import HookDefinition as HookDefinition
+    from dagster._core.definitions.input import (
+        GraphIn as GraphIn,
+        In as In,
+        InputMapping as InputMapping,
+    )
+    from dagster._core.definitions.job_definition import JobDefinition as JobDefinition
+    from dagster._core.definitions.load_asset_checks_from_modules import (
+        load_asset_checks_from_current_module as load_asset_checks_from_current_module,
+        load_asset_checks_from_modules as load_asset_checks_from_modules,
+        load_asset_checks_from_package_module as load_asset_checks_from_package_module,
+        load_asset_checks_from_package_name as load_asset_checks_from_package_name,
+    )
+    from dagster._core.definitions.load_assets_from_modules import (
+        load_assets_from_current_module as load_assets_from_current_module,
+        load_assets_from_modules as load_assets_from_modules,
+        load_assets_from_package_module as load_assets_from_package_module,
+        load_assets_from_package_name as load_assets_from_package_name,
+    )
+    from dagster._core.definitions.logger_definition import (
+        LoggerDefinition as LoggerDefinition,
+        build_init_logger_context as build_init_logger_context,
+        logger as logger,
+    )
+    from dagster._core.definitions.materialize import (
+        materialize as materialize,
+        materialize_to_memory as materialize_to_memory,
+    )
+    from dagster._core.definitions.metadata import (
+        BoolMetadataValue as BoolMetadataValue,
+        DagsterAssetMetadataValue as DagsterAssetMetadataValue,
+        DagsterRunMetadataValue as DagsterRunMetadataValue,
+        FloatMetadataValue as FloatMetadataValue,
+        IntMetadataValue as IntMetadataValue,
+        JsonMetadataValue as JsonMetadataValue,
+        MarkdownMetadataValue as MarkdownMetadataValue,
+        MetadataEntry as MetadataEntry,
+        MetadataValue as MetadataValue,
+        NotebookMetadataValue as NotebookMetadataValue,
+        NullMetadataValue as NullMetadataValue,
+        PathMetadataValue as PathMetadataValue,
+        PythonArtifactMetadataValue as PythonArtifactMetadataValue,
+        TableMetadataValue as TableMetadataValue,
+        TableSchemaMetadataValue as TableSchemaMetadataValue,
+        TextMetadataValue as TextMetadataValue,
+        UrlMetadataValue as UrlMetadataValue,
+    )
+    from dagster._core.definitions.metadata.table import (
+        TableColumn as TableColumn,
+        TableColumnConstraints as TableColumnConstraints,
+        TableConstraints as TableConstraints,
+        TableRecord as TableRecord,
+        TableSchema as TableSchema,
+    )
+    from dagster._core.definitions.multi_asset_sensor_definition import (
+        MultiAssetSensorDefinition as MultiAssetSensorDefinition,
+        MultiAssetSensorEvaluationContext as MultiAssetSensorEvaluationContext,
+        build_multi_asset_sensor_context as build_multi_asset_sensor_context,
+    )
+    from dagster._core.definitions.multi_dimensional_partitions import (
+        MultiPartitionKey as MultiPartitionKey,
+        MultiPartitionsDefinition as MultiPartitionsDefinition,
+    )
+    from dagster._core.definitions.op_definition import OpDefinition as OpDefinition
+    from dagster._core.definitions.output import (
+        DynamicOut as DynamicOut,
+        GraphOut as GraphOut,
+        Out as Out,
+        OutputMapping as OutputMapping,
+    )
+    from dagster._core.definitions.partition import (
+        DynamicPartitionsDefinition as DynamicPartitionsDefinition,
+        Partition as Partition,
+        PartitionedConfig as PartitionedConfig,
+        PartitionsDefinition as PartitionsDefinition,
+        StaticPartitionsDefinition as StaticPartitionsDefinition,
+        dynamic_partitioned_config as dynamic_partitioned_config,
+        partitioned_config as partitioned_config,
+        static_partitioned_config as static_partitioned_config,
+    )
+    from dagster._core.definitions.partition_key_range import PartitionKeyRange as PartitionKeyRange
+    from dagster._core.definitions.partition_mapping import (
+        AllPartitionMapping as AllPartitionMapping,
+        DimensionPartitionMapping as DimensionPartitionMapping,
+        IdentityPartitionMapping as IdentityPartitionMapping,
+        LastPartitionMapping as LastPartitionMapping,
+        MultiPartitionMapping as MultiPartitionMapping,
+        MultiToSingleDimensionPartitionMapping as MultiToSingleDimensionPartitionMapping,
+        PartitionMapping as PartitionMapping,
+        SpecificPartitionsPartitionMapping as SpecificPartitionsPartitionMapping,
+        StaticPartitionMapping as StaticPartitionMapping,
+    )
+    from dagster._core.definitions.partitioned_schedule import (
+        build_schedule_from_partitioned_job as build_schedule_from_partitioned_job,
+    )
+    from dagster._core.definitions.policy import (
+        Backoff as Backoff,
+        Jitter as Jitter,
+        RetryPolicy as RetryPolicy,
+    )
+    from dagster._core.definitions.reconstruct import (
+        build_reconstructable_job as build_reconstructable_job,
+        reconstructable as reconstructable,
+    )
+    from dagster._core.definitions.repository_definition import (
+        RepositoryData as RepositoryData,
+        RepositoryDefinition as RepositoryDefinition,
+    )
+    from dagster._core.definitions.resource_annotation import (
+        ResourceParam as ResourceParam,
+    )
+    from dagster._core.definitions.resource_definition import (
+        ResourceDefinition as ResourceDefinition,
+        make_values_resource as make_values_resource,
+        resource as resource,
+    )
+    from dagster._core.definitions.result import MaterializeResult as MaterializeResult
+    from dagster._core.definitions.run_config import RunConfig as RunConfig
+    from dagster._core.definitions.run_request import (
+        AddDynamicPartitionsRequest as AddDynamicPartitionsRequest,
+        DeleteDynamicPartitionsRequest as DeleteDynamicPartitionsRequest,
+        RunRequest as RunRequest,
+        SensorResult as SensorResult,
+        SkipReason as SkipReason,
+    )
+    from dagster._core.definitions.run_status_sensor_definition import (
+        RunFailureSensorContext as RunFailureSensorContext,
+        RunStatusSensorContext as RunStatusSensorContext,
+        RunStatusSensorDefinition as RunStatusSensorDefinition,
+        build_run_status_sensor_context as build_run_status_sensor_context,
+        run_failure_sensor as run_failure_sensor,
+        run_status_sensor as run_status_sensor,
+    )
+    from dagster._core.definitions.schedule_definition import (
+        DefaultScheduleStatus as DefaultScheduleStatus,
+        ScheduleDefinition as ScheduleDefinition,
+        ScheduleEvaluationContext as ScheduleEvaluationContext,
+        build_schedule_context as build_schedule_context,
+    )
+    from dagster._core.definitions.selector import (
+        CodeLocationSelector as CodeLocationSelector,
+        JobSelector as JobSelector,
+        RepositorySelector as RepositorySelector,
+    )
+    from dagster._core.definitions.sensor_definition import (
+        DefaultSensorStatus as DefaultSensorStatus,
+        SensorDefinition as SensorDefinition,
+        SensorEvaluationContext as SensorEvaluationContext,
+        build_sensor_context as build_sensor_context,
+    )
+    from dagster._core.definitions.source_asset import SourceAsset as SourceAsset
+    from dagster._core.definitions.step_launcher import (
+        StepLauncher as StepLauncher,
+        StepRunRef as StepRunRef,
+    )
+    from dagster._core.definitions.time_window_partition_mapping import (
+        TimeWindowPartitionMapping as TimeWindowPartitionMapping,
+    )
+    from dagster._core.definitions.time_window_partitions import (
+        DailyPartitionsDefinition as DailyPartitionsDefinition,
+        HourlyPartitionsDefinition as HourlyPartitionsDefinition,
+        MonthlyPartitionsDefinition as MonthlyPartitionsDefinition,
+        TimeWindow as TimeWindow,
+        TimeWindowPartitionsDefinition as TimeWindowPartitionsDefinition,
+        WeeklyPartitionsDefinition as WeeklyPartitionsDefinition,
+        daily_partitioned_config as daily_partitioned_config,
+        hourly_partitioned_config as hourly_partitioned_config,
+        monthly_partitioned_config as monthly_partitioned_config,
+        weekly_partitioned_config as weekly_partitioned_config,
+    )
+    from dagster._core.definitions.unresolved_asset_job_definition import (
+        define_asset_job as define_asset_job,
+    )
+    from dagster._core.definitions.utils import (
+        config_from_files as config_from_files,
+        config_from_pkg_resources as config_from_pkg_resources,
+        config_from_yaml_strings as config_from_yaml_strings,
+    )
+    from dagster._core.definitions.version_strategy import (
+        OpVersionContext as OpVersionContext,
+        ResourceVersionContext as ResourceVersionContext,
+        SourceHashVersionStrategy as SourceHashVersionStrategy,
+        VersionStrategy as VersionStrategy,
+    )
+    from dagster._core.errors import (
+        DagsterConfigMappingFunctionError as DagsterConfigMappingFunctionError,
+        DagsterError as DagsterError,
+        DagsterEventLogInvalidForRun as DagsterEventLogInvalidForRun,
+        DagsterExecutionInterruptedError as DagsterExecutionInterruptedError,
+        DagsterExecutionStepExecutionError as DagsterExecutionStepExecutionError,
+        DagsterExecutionStepNotFoundError as DagsterExecutionStepNotFoundError,
+        DagsterInvalidConfigDefinitionError as DagsterInvalidConfigDefinitionError,
+        DagsterInvalidConfigError as DagsterInvalidConfigError,
+        DagsterInvalidDefinitionError as DagsterInvalidDefinitionError,
+        DagsterInvalidInvocationError as DagsterInvalidInvocationError,
+        DagsterInvalidSubsetError as DagsterInvalidSubsetError,
+        DagsterInvariantViolationError as DagsterInvariantViolationError,
+        DagsterResourceFunctionError as DagsterResourceFunctionError,
+        DagsterRunNotFoundError as DagsterRunNotFoundError,
+        DagsterStepOutputNotFoundError as DagsterStepOutputNotFoundError,
+        DagsterSubprocessError as DagsterSubprocessError,
+        DagsterTypeCheckDidNotPass as DagsterTypeCheckDidNotPass,
+        DagsterTypeCheckError as DagsterTypeCheckError,
+        DagsterUnknownPartitionError as DagsterUnknownPartitionError,
+        DagsterUnknownResourceError as DagsterUnknownResourceError,
+        DagsterUnmetExecutorRequirementsError as DagsterUnmetExecutorRequirementsError,
+        DagsterUserCodeExecutionError as DagsterUserCodeExecutionError,
+        raise_execution_interrupts as raise_execution_interrupts,
+    )
+    from dagster._core.event_api import (
+        EventLogRecord as EventLogRecord,
+        EventRecordsFilter as EventRecordsFilter,
+        RunShardedEventsCursor as RunShardedEventsCursor,
+    )
+    from dagster._core.events import (
+        DagsterEvent as DagsterEvent,
+        DagsterEventType as DagsterEventType,
+    )
+    from dagster._core.events.log import EventLogEntry as EventLogEntry
+    from dagster._core.execution.api import (
+        ReexecutionOptions as ReexecutionOptions,
+        execute_job as execute_job,
+    )
+    from dagster._core.execution.build_resources import build_resources as build_resources
+    from dagster._core.execution.context.compute import (
+        AssetExecutionContext as AssetExecutionContext,
+        OpExecutionContext as OpExecutionContext,
+    )
+    from dagster._core.execution.context.hook import (
+        HookContext as HookContext,
+        build_hook_context as build_hook_context,
+    )
+    from dagster._core.execution.context.init import (
+        InitResourceContext as InitResourceContext,
+        build_init_resource_context as build_init_resource_context,
+    )
+    from dagster._core.execution.context.input import (
+        InputContext as InputContext,
+        build_input_context as build_input_context,
+    )
+    from dagster._core.execution.context.invocation import (
+        build_asset_context as build_asset_context,
+        build_op_context as build_op_context,
+    )
+    from dagster._core.execution.context.logger import InitLoggerContext as InitLoggerContext
+    from dagster._core.execution.context.output import (
+        OutputContext as OutputContext,
+        build_output_context as build_output_context,
+    )
+    from dagster._core.execution.context.system import (
+        DagsterTypeLoaderContext as DagsterTypeLoaderContext,
+        StepExecutionContext as StepExecutionContext,
+        TypeCheckContext as TypeCheckContext,
+    )
+    from dagster._core.execution.execute_in_process_result import (
+        ExecuteInProcessResult as ExecuteInProcessResult,
+    )
+    from dagster._core.execution.job_execution_result import (
+        JobExecutionResult as JobExecutionResult,
+    )
+    from dagster._core.execution.plan.external_step import (
+        external_instance_from_step_run_ref as external_instance_from_step_run_ref,
+        run_step_from_ref as run_step_from_ref,
+        step_context_to_step_run_ref as step_context_to_step_run_ref,
+        step_run_ref_to_step_context as step_run_ref_to_step_context,
+    )
+    from dagster._core.execution.validate_run_config import (
+        validate_run_config as validate_run_config,
+    )
+    from dagster._core.execution.with_resources import with_resources as with_resources
+    from dagster._core.executor.base import Executor as Executor
+    from dagster._core.executor.init import InitExecutorContext as InitExecutorContext
+    from dagster._core.instance import DagsterInstance as DagsterInstance
+    from dagster._core.instance_for_test import instance_for_test as instance_for_test
+    from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
+    from dagster._core.log_manager import DagsterLogManager as DagsterLogManager
+    from dagster._core.pipes.client import (
+        PipesClient as PipesClient,
+        PipesContextInjector as PipesContextInjector,
+        PipesMessageReader as PipesMessageReader,
+    )
+    from dagster._core.pipes.context import (
+        PipesMessageHandler as PipesMessageHandler,
+        PipesSession as PipesSession,
+    )
+    from dagster._core.pipes.subprocess import PipesSubprocessClient as PipesSubprocessClient
+    from dagster._core.pipes.utils import (
+        PipesBlobStoreMessageReader as PipesBlobStoreMessageReader,
+        PipesBlobStoreStdioReader as PipesBlobStoreStdioReader,
+        PipesEnvContextInjector as PipesEnvContextInjector,
+        PipesFileContextInjector as PipesFileContextInjector,
+        PipesFileMessageReader as PipesFileMessageReader,
+        PipesTempFileContextInjector as PipesTempFileContextInjector,
+        PipesTempFileMessageReader as PipesTempFileMessageReader,
+        open_pipes_session as open_pipes_session,
+    )
+    from dagster._core.run_coordinator.queued_run_coordinator import (
+        QueuedRunCoordinator as QueuedRunCoordinator,
+        SubmitRunContext as SubmitRunContext,
+    )
+    from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
+    from dagster._core.storage.dagster_run import (
+        DagsterRun as DagsterRun,
+        DagsterRunStatus as DagsterRunStatus,
+        RunRecord as RunRecord,
+        RunsFilter as RunsFilter,
+    )
+    from dagster._core.storage.file_manager import (
+        FileHandle as FileHandle,
+        LocalFileHandle as LocalFileHandle,
+        local_file_manager as local_file_manager,
+    )
+    from dagster._core.storage.fs_io_manager import (
+        FilesystemIOManager as FilesystemIOManager,
+        custom_path_fs_io_manager as custom_path_fs_io_manager,
+        fs_io_manager as fs_io_manager,
+    )
+    from dagster._core.storage.input_manager import (
+        InputManager as InputManager,
+        InputManagerDefinition as InputManagerDefinition,
+        input_manager as input_manager,
+    )
+    from dagster._core.storage.io_manager import (
+        IOManager as IOManager,
+        IOManagerDefinition as IOManagerDefinition,
+        io_manager as io_manager,
+    )
+    from dagster._core.storage.mem_io_manager import (
+        InMemoryIOManager as InMemoryIOManager,
+        mem_io_manager as mem_io_manager,
+    )
+    from dagster._core.storage.memoizable_io_manager import (
+        MemoizableIOManager as MemoizableIOManager,
+    )
+    from dagster._core.storage.partition_status_cache import (
+        AssetPartitionStatus as AssetPartitionStatus,
+    )
+    from dagster._core.storage.tags import (
+        MAX_RUNTIME_SECONDS_TAG as MAX_RUNTIME_SECONDS_TAG,
+        MEMOIZED_RUN_TAG as MEMOIZED_RUN_TAG,
+    )
+    from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
+    from dagster._core.types.config_schema import (
+        DagsterTypeLoader as DagsterTypeLoader,
+        dagster_type_loader as dagster_type_loader,
+    )
+    from dagster._core.types.dagster_type import (
+        DagsterType as DagsterType,
+        List as List,
+        Optional as Optional,
+        PythonObjectDagsterType as PythonObjectDagsterType,
+        make_python_type_usable_as_dagster_type as make_python_type_usable_as_dagster_type,
+    )
+    from dagster._core.types.decorator import usable_as_dagster_type as usable_as_dagster_type
+    from dagster._core.types.python_dict import Dict as Dict
+    from dagster._core.types.python_set import Set as Set
+    from dagster._core.types.python_tuple import Tuple as Tuple
+    from dagster._loggers import (
+        colored_console_logger as colored_console_logger,
+        default_loggers as default_loggers,
+        default_system_loggers as default_system_loggers,
+        json_console_logger as json_console_logger,
+    )
+    from dagster._serdes.serdes import (
+        deserialize_value as deserialize_value,
+        serialize_value as serialize_value,
+    )
+    from dagster._utils import (
+        file_relative_path as file_relative_path,
+    )
+    from dagster._utils.alert import (
+        make_email_on_run_failure_sensor as make_email_on_run_failure_sensor,
+    )
+    from dagster._utils.dagster_type import check_dagster_type as check_dagster_type
+    from dagster._utils.log import get_dagster_logger as get_dagster_logger
+    from dagster._utils.warnings import ExperimentalWarning as ExperimentalWarning
+
+_LAZY_IMPORTS: Final[Mapping[str, str]] = {
+    "Any": "dagster._builtins",
+    "Bool": "dagster._builtins",
+    "Float": "dagster._builtins",
+    "Int": "dagster._builtins",
+    "Nothing": "dagster._builtins",
+    "String": "dagster._builtins",
+    "ConfigSchema": "dagster._config.config_schema",
+    "Array": "dagster._config.config_type",
+    "Enum": "dagster._config.config_type",
+    "EnumValue": "dagster._config.config_type",
+    "Noneable": "dagster._config.config_type",
+    "ScalarUnion": "dagster._config.config_type",
+    "Field": "dagster._config.field",
+    "EnvVar": "dagster._config.field_utils",
+    "Map": "dagster._config.field_utils",
+    "Permissive": "dagster._config.field_utils",
+    "Selector": "dagster._config.field_utils",
+    "Shape": "dagster._config.field_utils",
+    "Config": "dagster._config.pythonic_config",
+    "ConfigurableIOManager": "dagster._config.pythonic_config",
+    "ConfigurableIOManagerFactory": "dagster._config.pythonic_config",
+    "ConfigurableLegacyIOManagerAdapter": "dagster._config.pythonic_config",
+    "ConfigurableResource": "dagster._config.pythonic_config",
+    "IAttachDifferentObjectToOpContext": "dagster._config.pythonic_config",
+    "PermissiveConfig": "dagster._config.pythonic_config",
+    "ResourceDependency": "dagster._config.pythonic_config",
+    "BoolSource": "dagster._config.source",
+    "IntSource": "dagster._config.source",
+    "StringSource": "dagster._config.source",
+    "AssetCheckResult": "dagster._core.definitions",
+    "AssetCheckKey": "dagster._core.definitions.asset_check_spec",
+    "AssetCheckSeverity": "dagster._core.definitions.asset_check_spec",
+    "AssetCheckSpec": "dagster._core.definitions.asset_check_spec",
+    "AssetDep": "dagster._core.definitions.asset_dep",
+    "AssetIn": "dagster._core.definitions.asset_in",
+    "AssetOut": "dagster._core.definitions.asset_out",
+    "AssetSelection": "dagster._core.definitions.asset_selection",
+    "AssetSensorDefinition": "dagster._core.definitions.asset_sensor_definition",
+    "AssetSpec": "dagster._core.definitions.asset_spec",
+    "AssetsDefinition": "dagster._core.definitions.assets",
+    "AutoMaterializePolicy": "dagster._core.definitions.auto_materialize_policy",
+    "AutoMaterializeRule": "dagster._core.definitions.auto_materialize_rule",
+    "BackfillPolicy": "dagster._core.definitions.backfill_policy",
+    "PendingNodeInvocation": "dagster._core.definitions.composition",
+    "ConfigMapping": "dagster._core.definitions.config",
+    "configured": "dagster._core.definitions.configurable",
+    "DataProvenance": "dagster._core.definitions.data_version",
+    "DataVersion": "dagster._core.definitions.data_version",
+    "DataVersionsByPartition": "dagster._core.definitions.data_version",
+    "asset_check": "dagster._core.definitions.decorators.asset_check_decorator",
+    "asset": "dagster._core.definitions.decorators.asset_decorator",
+    "graph_asset": "dagster._core.definitions.decorators.asset_decorator",
+    "graph_multi_asset": "dagster._core.definitions.decorators.asset_decorator",
+    "multi_asset": "dagster._core.definitions.decorators.asset_decorator",
+    "config_mapping": "dagster._core.definitions.decorators.config_mapping_decorator",
+    "graph": "dagster._core.definitions.decorators.graph_decorator",
+    "failure_hook": "dagster._core.definitions.decorators.hook_decorator",
+    "success_hook": "dagster._core.definitions.decorators.hook_decorator",
+    "job": "dagster._core.definitions.decorators.job_decorator",
+    "op": "dagster._core.definitions.decorators.op_decorator",
+    "repository": "dagster._core.definitions.decorators.repository_decorator",
+    "schedule": "dagster._core.definitions.decorators.schedule_decorator",
+    "asset_sensor": "dagster._core.definitions.decorators.sensor_decorator",
+    "multi_asset_sensor": "dagster._core.definitions.decorators.sensor_decorator",
+    "sensor": "dagster._core.definitions.decorators.sensor_decorator",
+    "observable_source_asset": "dagster._core.definitions.decorators.source_asset_decorator",
+    "BindResourcesToJobs": "dagster._core.definitions.definitions_class",
+    "Definitions": "dagster._core.definitions.definitions_class",
+    "create_repository_using_definitions_args": "dagster._core.definitions.definitions_class",
+    "DependencyDefinition": "dagster._core.definitions.dependency",
+    "MultiDependencyDefinition": "dagster._core.definitions.dependency",
+    "NodeInvocation": "dagster._core.definitions.dependency",
+    "AssetKey": "dagster._core.definitions.events",
+    "AssetMaterialization": "dagster._core.definitions.events",
+    "AssetObservation": "dagster._core.definitions.events",
+    "DynamicOutput": "dagster._core.definitions.events",
+    "ExpectationResult": "dagster._core.definitions.events",
+    "Failure": "dagster._core.definitions.events",
+    "Output": "dagster._core.definitions.events",
+    "RetryRequested": "dagster._core.definitions.events",
+    "TypeCheck": "dagster._core.definitions.events",
+    "ExecutorDefinition": "dagster._core.definitions.executor_definition",
+    "ExecutorRequirement": "dagster._core.definitions.executor_definition",
+    "executor": "dagster._core.definitions.executor_definition",
+    "in_process_executor": "dagster._core.definitions.executor_definition",
+    "multi_or_in_process_executor": "dagster._core.definitions.executor_definition",
+    "multiple_process_executor_requirements": "dagster._core.definitions.executor_definition",
+    "multiprocess_executor": "dagster._core.definitions.executor_definition",
+    "external_asset_from_spec": "dagster._core.definitions.external_asset",
+    "external_assets_from_specs": "dagster._core.definitions.external_asset",
+    "FreshnessPolicy": "dagster._core.definitions.freshness_policy",
+    "FreshnessPolicySensorContext": "dagster._core.definitions.freshness_policy_sensor_definition",
+    "FreshnessPolicySensorDefinition": "dagster._core.definitions.freshness_policy_sensor_definition",
+    "build_freshness_policy_sensor_context": "dagster._core.definitions.freshness_policy_sensor_definition",
+    "freshness_policy_sensor": "dagster._core.definitions.freshness_policy_sensor_definition",
+    "GraphDefinition": "dagster._core.definitions.graph_definition",
+    "HookDefinition": "dagster._core.definitions.hook_definition",
+    "GraphIn": "dagster._core.definitions.input",
+    "In": "dagster._core.definitions.input",
+    "InputMapping": "dagster._core.definitions.input",
+    "JobDefinition": "dagster._core.definitions.job_definition",
+    "load_asset_checks_from_current_module": "dagster._core.definitions.load_asset_checks_from_modules",
+    "load_asset_checks_from_modules": "dagster._core.definitions.load_asset_checks_from_modules",
+    "load_asset_checks_from_package_module": "dagster._core.definitions.load_asset_checks_from_modules",
+    "load_asset_checks_from_package_name": "dagster._core.definitions.load_asset_checks_from_modules",
+    "load_assets_from_current_module": "dagster._core.definitions.load_assets_from_modules",
+    "load_assets_from_modules": "dagster._core.definitions.load_assets_from_modules",
+    "load_assets_from_package_module": "dagster._core.definitions.load_assets_from_modules",
+    "load_assets_from_package_name": "dagster._core.definitions.load_assets_from_modules",
+    "LoggerDefinition": "dagster._core.definitions.logger_definition",
+    "build_init_logger_context": "dagster._core.definitions.logger_definition",
+    "logger": "dagster._core.definitions.logger_definition",
+    "materialize": "dagster._core.definitions.materialize",
+    "materialize_to_memory": "dagster._core.definitions.materialize",
+    "BoolMetadataValue": "dagster._core.definitions.metadata",
+    "DagsterAssetMetadataValue": "dagster._core.definitions.metadata",
+    "DagsterRunMetadataValue": "dagster._core.definitions.metadata",
+    "FloatMetadataValue": "dagster._core.definitions.metadata",
+    "IntMetadataValue": "dagster._core.definitions.metadata",
+    "JsonMetadataValue": "dagster._core.definitions.metadata",
+    "MarkdownMetadataValue": "dagster._core.definitions.metadata",
+    "MetadataEntry": "dagster._core.definitions.metadata",
+    "MetadataValue": "dagster._core.definitions.metadata",
+    "NotebookMetadataValue": "dagster._core.definitions.metadata",
+    "NullMetadataValue": "dagster._core.definitions.metadata",
+    "PathMetadataValue": "dagster._core.definitions.metadata",
+    "PythonArtifactMetadataValue": "dagster._core.definitions.metadata",
+    "TableMetadataValue": "dagster._core.definitions.metadata",
+    "TableSchemaMetadataValue": "dagster._core.definitions.metadata",
+    "TextMetadataValue": "dagster._core.definitions.metadata",
+    "UrlMetadataValue": "dagster._core.definitions.metadata",
+    "TableColumn": "dagster._core.definitions.metadata.table",
+    "TableColumnConstraints": "dagster._core.definitions.metadata.table",
+    "TableConstraints": "dagster._core.definitions.metadata.table",
+    "TableRecord": "dagster._core.definitions.metadata.table",
+    "TableSchema": "dagster._core.definitions.metadata.table",
+    "MultiAssetSensorDefinition": "dagster._core.definitions.multi_asset_sensor_definition",
+    "MultiAssetSensorEvaluationContext": "dagster._core.definitions.multi_asset_sensor_definition",
+    "build_multi_asset_sensor_context": "dagster._core.definitions.multi_asset_sensor_definition",
+    "MultiPartitionKey": "dagster._core.definitions.multi_dimensional_partitions",
+    "MultiPartitionsDefinition": "dagster._core.definitions.multi_dimensional_partitions",
+    "OpDefinition": "dagster._core.definitions.op_definition",
+    "DynamicOut": "dagster._core.definitions.output",
+    "GraphOut": "dagster._core.definitions.output",
+    "Out": "dagster._core.definitions.output",
+    "OutputMapping": "dagster._core.definitions.output",
+    "DynamicPartitionsDefinition": "dagster._core.definitions.partition",
+    "Partition": "dagster._core.definitions.partition",
+    "PartitionedConfig": "dagster._core.definitions.partition",
+    "PartitionsDefinition": "dagster._core.definitions.partition",
+    "StaticPartitionsDefinition": "dagster._core.definitions.partition",
+    "dynamic_partitioned_config": "dagster._core.definitions.partition",
+    "partitioned_config": "dagster._core.definitions.partition",
+    "static_partitioned_config": "dagster._core.definitions.partition",
+    "PartitionKeyRange": "dagster._core.definitions.partition_key_range",
+    "AllPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "DimensionPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "IdentityPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "LastPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "MultiPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "MultiToSingleDimensionPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "PartitionMapping": "dagster._core.definitions.partition_mapping",
+    "SpecificPartitionsPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "StaticPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "build_schedule_from_partitioned_job": "dagster._core.definitions.partitioned_schedule",
+    "Backoff": "dagster._core.definitions.policy",
+    "Jitter": "dagster._core.definitions.policy",
+    "RetryPolicy": "dagster._core.definitions.policy",
+    "build_reconstructable_job": "dagster._core.definitions.reconstruct",
+    "reconstructable": "dagster._core.definitions.reconstruct",
+    "RepositoryData": "dagster._core.definitions.repository_definition",
+    "RepositoryDefinition": "dagster._core.definitions.repository_definition",
+    "ResourceParam": "dagster._core.definitions.resource_annotation",
+    "ResourceDefinition": "dagster._core.definitions.resource_definition",
+    "make_values_resource": "dagster._core.definitions.resource_definition",
+    "resource": "dagster._core.definitions.resource_definition",
+    "MaterializeResult": "dagster._core.definitions.result",
+    "RunConfig": "dagster._core.definitions.run_config",
+    "AddDynamicPartitionsRequest": "dagster._core.definitions.run_request",
+    "DeleteDynamicPartitionsRequest": "dagster._core.definitions.run_request",
+    "RunRequest": "dagster._core.definitions.run_request",
+    "SensorResult": "dagster._core.definitions.run_request",
+    "SkipReason": "dagster._core.definitions.run_request",
+    "RunFailureSensorContext": "dagster._core.definitions.run_status_sensor_definition",
+    "RunStatusSensorContext": "dagster._core.definitions.run_status_sensor_definition",
+    "RunStatusSensorDefinition": "dagster._core.definitions.run_status_sensor_definition",
+    "build_run_status_sensor_context": "dagster._core.definitions.run_status_sensor_definition",
+    "run_failure_sensor": "dagster._core.definitions.run_status_sensor_definition",
+    "run_status_sensor": "dagster._core.definitions.run_status_sensor_definition",
+    "DefaultScheduleStatus": "dagster._core.definitions.schedule_definition",
+    "ScheduleDefinition": "dagster._core.definitions.schedule_definition",
+    "ScheduleEvaluationContext": "dagster._core.definitions.schedule_definition",
+    "build_schedule_context": "dagster._core.definitions.schedule_definition",
+    "CodeLocationSelector": "dagster._core.definitions.selector",
+    "JobSelector": "dagster._core.definitions.selector",
+    "RepositorySelector": "dagster._core.definitions.selector",
+    "DefaultSensorStatus": "dagster._core.definitions.sensor_definition",
+    "SensorDefinition": "dagster._core.definitions.sensor_definition",
+    "SensorEvaluationContext": "dagster._core.definitions.sensor_definition",
+    "build_sensor_context": "dagster._core.definitions.sensor_definition",
+    "SourceAsset": "dagster._core.definitions.source_asset",
+    "StepLauncher": "dagster._core.definitions.step_launcher",
+    "StepRunRef": "dagster._core.definitions.step_launcher",
+    "TimeWindowPartitionMapping": "dagster._core.definitions.time_window_partition_mapping",
+    "DailyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "HourlyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "MonthlyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "TimeWindow": "dagster._core.definitions.time_window_partitions",
+    "TimeWindowPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "WeeklyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "daily_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "hourly_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "monthly_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "weekly_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "define_asset_job": "dagster._core.definitions.unresolved_asset_job_definition",
+    "config_from_files": "dagster._core.definitions.utils",
+    "config_from_pkg_resources": "dagster._core.definitions.utils",
+    "config_from_yaml_strings": "dagster._core.definitions.utils",
+    "OpVersionContext": "dagster._core.definitions.version_strategy",
+    "ResourceVersionContext": "dagster._core.definitions.version_strategy",
+    "SourceHashVersionStrategy": "dagster._core.definitions.version_strategy",
+    "VersionStrategy": "dagster._core.definitions.version_strategy",
+    "DagsterConfigMappingFunctionError": "dagster._core.errors",
+    "DagsterError": "dagster._core.errors",
+    "DagsterEventLogInvalidForRun": "dagster._core.errors",
+    "DagsterExecutionInterruptedError": "dagster._core.errors",
+    "DagsterExecutionStepExecutionError": "dagster._core.errors",
+    "DagsterExecutionStepNotFoundError": "dagster._core.errors",
+    "DagsterInvalidConfigDefinitionError": "dagster._core.errors",
+    "DagsterInvalidConfigError": "dagster._core.errors",
+    "DagsterInvalidDefinitionError": "dagster._core.errors",
+    "DagsterInvalidInvocationError": "dagster._core.errors",
+    "DagsterInvalidSubsetError": "dagster._core.errors",
+    "DagsterInvariantViolationError": "dagster._core.errors",
+    "DagsterResourceFunctionError": "dagster._core.errors",
+    "DagsterRunNotFoundError": "dagster._core.errors",
+    "DagsterStepOutputNotFoundError": "dagster._core.errors",
+    "DagsterSubprocessError": "dagster._core.errors",
+    "DagsterTypeCheckDidNotPass": "dagster._core.errors",
+    "DagsterTypeCheckError": "dagster._core.errors",
+    "DagsterUnknownPartitionError": "dagster._core.errors",
+    "DagsterUnknownResourceError": "dagster._core.errors",
+    "DagsterUnmetExecutorRequirementsError": "dagster._core.errors",
+    "DagsterUserCodeExecutionError": "dagster._core.errors",
+    "raise_execution_interrupts": "dagster._core.errors",
+    "EventLogRecord": "dagster._core.event_api",
+    "EventRecordsFilter": "dagster._core.event_api",
+    "RunShardedEventsCursor": "dagster._core.event_api",
+    "DagsterEvent": "dagster._core.events",
+    "DagsterEventType": "dagster._core.events",
+    "EventLogEntry": "dagster._core.events.log",
+    "ReexecutionOptions": "dagster._core.execution.api",
+    "execute_job": "dagster._core.execution.api",
+    "build_resources": "dagster._core.execution.build_resources",
+    "AssetExecutionContext": "dagster._core.execution.context.compute",
+    "OpExecutionContext": "dagster._core.execution.context.compute",
+    "HookContext": "dagster._core.execution.context.hook",
+    "build_hook_context": "dagster._core.execution.context.hook",
+    "InitResourceContext": "dagster._core.execution.context.init",
+    "build_init_resource_context": "dagster._core.execution.context.init",
+    "InputContext": "dagster._core.execution.context.input",
+    "build_input_context": "dagster._core.execution.context.input",
+    "build_asset_context": "dagster._core.execution.context.invocation",
+    "build_op_context": "dagster._core.execution.context.invocation",
+    "InitLoggerContext": "dagster._core.execution.context.logger",
+    "OutputContext": "dagster._core.execution.context.output",
+    "build_output_context": "dagster._core.execution.context.output",
+    "DagsterTypeLoaderContext": "dagster._core.execution.context.system",
+    "StepExecutionContext": "dagster._core.execution.context.system",
+    "TypeCheckContext": "dagster._core.execution.context.system",
+    "ExecuteInProcessResult": "dagster._core.execution.execute_in_process_result",
+    "JobExecutionResult": "dagster._core.execution.job_execution_result",
+    "external_instance_from_step_run_ref": "dagster._core.execution.plan.external_step",
+    "run_step_from_ref": "dagster._core.execution.plan.external_step",
+    "step_context_to_step_run_ref": "dagster._core.execution.plan.external_step",
+    "step_run_ref_to_step_context": "dagster._core.execution.plan.external_step",
+    "validate_run_config": "dagster._core.execution.validate_run_config",
+    "with_resources": "dagster._core.execution.with_resources",
+    "Executor": "dagster._core.executor.base",
+    "InitExecutorContext": "dagster._core.executor.init",
+    "DagsterInstance": "dagster._core.instance",
+    "instance_for_test": "dagster._core.instance_for_test",
+    "DefaultRunLauncher": "dagster._core.launcher.default_run_launcher",
+    "DagsterLogManager": "dagster._core.log_manager",
+    "PipesClient": "dagster._core.pipes.client",
+    "PipesContextInjector": "dagster._core.pipes.client",
+    "PipesMessageReader": "dagster._core.pipes.client",
+    "PipesMessageHandler": "dagster._core.pipes.context",
+    "PipesSession": "dagster._core.pipes.context",
+    "PipesSubprocessClient": "dagster._core.pipes.subprocess",
+    "PipesBlobStoreMessageReader": "dagster._core.pipes.utils",
+    "PipesBlobStoreStdioReader": "dagster._core.pipes.utils",
+    "PipesEnvContextInjector": "dagster._core.pipes.utils",
+    "PipesFileContextInjector": "dagster._core.pipes.utils",
+    "PipesFileMessageReader": "dagster._core.pipes.utils",
+    "PipesTempFileContextInjector": "dagster._core.pipes.utils",
+    "PipesTempFileMessageReader": "dagster._core.pipes.utils",
+    "open_pipes_session": "dagster._core.pipes.utils",
+    "QueuedRunCoordinator": "dagster._core.run_coordinator.queued_run_coordinator",
+    "SubmitRunContext": "dagster._core.run_coordinator.queued_run_coordinator",
+    "AssetValueLoader": "dagster._core.storage.asset_value_loader",
+    "DagsterRun": "dagster._core.storage.dagster_run",
+    "DagsterRunStatus": "dagster._core.storage.dagster_run",
+    "RunRecord": "dagster._core.storage.dagster_run",
+    "RunsFilter": "dagster._core.storage.dagster_run",
+    "FileHandle": "dagster._core.storage.file_manager",
+    "LocalFileHandle": "dagster._core.storage.file_manager",
+    "local_file_manager": "dagster._core.storage.file_manager",
+    "FilesystemIOManager": "dagster._core.storage.fs_io_manager",
+    "custom_path_fs_io_manager": "dagster._core.storage.fs_io_manager",
+    "fs_io_manager": "dagster._core.storage.fs_io_manager",
+    "InputManager": "dagster._core.storage.input_manager",
+    "InputManagerDefinition": "dagster._core.storage.input_manager",
+    "input_manager": "dagster._core.storage.input_manager",
+    "IOManager": "dagster._core.storage.io_manager",
+    "IOManagerDefinition": "dagster._core.storage.io_manager",
+    "io_manager": "dagster._core.storage.io_manager",
+    "InMemoryIOManager": "dagster._core.storage.mem_io_manager",
+    "mem_io_manager": "dagster._core.storage.mem_io_manager",
+    "MemoizableIOManager": "dagster._core.storage.memoizable_io_manager",
+    "AssetPartitionStatus": "dagster._core.storage.partition_status_cache",
+    "MAX_RUNTIME_SECONDS_TAG": "dagster._core.storage.tags",
+    "MEMOIZED_RUN_TAG": "dagster._core.storage.tags",
+    "UPathIOManager": "dagster._core.storage.upath_io_manager",
+    "DagsterTypeLoader": "dagster._core.types.config_schema",
+    "dagster_type_loader": "dagster._core.types.config_schema",
+    "DagsterType": "dagster._core.types.dagster_type",
+    "List": "dagster._core.types.dagster_type",
+    "Optional": "dagster._core.types.dagster_type",
+    "PythonObjectDagsterType": "dagster._core.types.dagster_type",
+    "make_python_type_usable_as_dagster_type": "dagster._core.types.dagster_type",
+    "usable_as_dagster_type": "dagster._core.types.decorator",
+    "Dict": "dagster._core.types.python_dict",
+    "Set": "dagster._core.types.python_set",
+    "Tuple": "dagster._core.types.python_tuple",
+    "colored_console_logger": "dagster._loggers",
+    "default_loggers": "dagster._loggers",
+    "default_system_loggers": "dagster._loggers",
+    "json_console_logger": "dagster._loggers",
+    "deserialize_value": "dagster._serdes.serdes",
+    "serialize_value": "dagster._serdes.serdes",
+    "file_relative_path": "dagster._utils",
+    "make_email_on_run_failure_sensor": "dagster._utils.alert",
+    "check_dagster_type": "dagster._utils.dagster_type",
+    "get_dagster_logger": "dagster._utils.log",
+    "ExperimentalWarning": "dagster._utils.warnings",
+}
+
+# `from dagster import *` only imports the names that are already module globals unless `__all__`
+# is defined, so it lists the lazily loaded public API explicitly.
+__all__ = list(_LAZY_IMPORTS) + ["__version__"]
+
+# ########################
+# ##### DEPRECATED IMPORTS
+# ########################
 
 # NOTE: Unfortunately we have to declare deprecated aliases twice-- the
 # TYPE_CHECKING declaration satisfies linters and type checkers, but the entry
@@ -630,8 +993,28 @@
 }
 
 
+def _load_lazy_import(name: str) -> TypingAny:
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    # cache the symbol on the module so that subsequent accesses bypass `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def _load_all_lazy_imports() -> None:
+    """Imports every public symbol. Used where code depends on the side effects of importing the
+    full public API, e.g. registration of serializable classes.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            _load_lazy_import(name)
+
+
 def __getattr__(name: str) -> TypingAny:
-    if name in _DEPRECATED:
+    from dagster._utils.warnings import deprecation_warning
+
+    if name in _LAZY_IMPORTS:
+        return _load_lazy_import(name)
+    elif name in _DEPRECATED:
         module, breaking_version, additional_warn_text = _DEPRECATED[name]
         value = getattr(importlib.import_module(module), name)
         stacklevel = 3 if sys.version_info >= (3, 7) else 4
@@ -652,4 +1035,19 @@ def __getattr__(name: str) -> TypingAny:
 
 
 def __dir__() -> Sequence[str]:
-    return [*globals(), *_DEPRECATED.keys(), *_DEPRECATED_RENAMED.keys()]
+    return [
+        *globals(),
+        *(name for name in _LAZY_IMPORTS.keys() if name not in globals()),
+        *_DEPRECATED.keys(),
+        *_DEPRECATED_RENAMED.keys(),
+    ]
+
+
+# ruff: isort: split
+
+# Dagster's internal modules have import cycles that only resolve if the definitions layer is
+# imported before anything else, so it is always loaded eagerly. This must come after
+# `__getattr__` is defined, since some of those modules import public symbols from `dagster`.
+# Everything else (the execution engine, storage and IO managers, pythonic config and its pydantic
+# dependency, etc.) is loaded on first access.
+import dagster._core.definitions  # noqa: F401
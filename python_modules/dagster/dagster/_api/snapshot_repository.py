@@ -14,7 +14,9 @@
 
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    defer_snapshots: bool = True,
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
 
@@ -27,7 +29,8 @@ def sync_get_streaming_external_repositories_data_grpc(
                 external_repository_origin=ExternalRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                defer_snapshots=defer_snapshots,
             )
         )
 
@@ -4,8 +4,10 @@
 import os
 import sys
 import threading
+import time
 import zlib
-from typing import Any, Callable, Optional, cast
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, cast
 
 import click
 
@@ -20,6 +22,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.origin import (
@@ -321,13 +324,25 @@ def execute_step_command(input_json, compressed_input_json):
             "Must provide one of input_json or compressed_input_json",
         )
 
-        if compressed_input_json:
-            input_json = zlib.decompress(base64.b64decode(compressed_input_json.encode())).decode()
+        timer = _StepWorkerTimer()
 
-        args = deserialize_value(input_json, ExecuteStepArgs)
+        with timer.time("deserialize_args"):
+            if compressed_input_json:
+                input_json = zlib.decompress(
+                    base64.b64decode(compressed_input_json.encode())
+                ).decode()
 
-        with get_instance_for_cli(instance_ref=args.instance_ref) as instance:
-            dagster_run = instance.get_run_by_id(args.run_id)
+            args = deserialize_value(input_json, ExecuteStepArgs)
+
+        with ExitStack() as stack:
+            with timer.time("load_instance"):
+                instance = stack.enter_context(get_instance_for_cli(instance_ref=args.instance_ref))
+
+            # the orchestrator may send the run along with the step args
+            dagster_run = args.dagster_run
+            if not dagster_run:
+                with timer.time("fetch_run"):
+                    dagster_run = instance.get_run_by_id(args.run_id)
 
             buff = []
 
@@ -335,6 +350,7 @@ def execute_step_command(input_json, compressed_input_json):
                 args,
                 instance,
                 dagster_run,
+                timer,
             ):
                 buff.append(serialize_value(event))
 
@@ -343,9 +359,33 @@ def execute_step_command(input_json, compressed_input_json):
                     click.echo(line)
 
 
+class _StepWorkerTimer:
+    """Records how long each phase of the bootstrap of a step worker takes."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def time(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[phase] = self.durations.get(phase, 0.0) + time.perf_counter() - start
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+
 def _execute_step_command_body(
-    args: ExecuteStepArgs, instance: DagsterInstance, dagster_run: DagsterRun
+    args: ExecuteStepArgs,
+    instance: DagsterInstance,
+    dagster_run: DagsterRun,
+    timer: Optional[_StepWorkerTimer] = None,
 ):
+    timer = timer or _StepWorkerTimer()
     single_step_key = (
         args.step_keys_to_execute[0]
         if args.step_keys_to_execute and len(args.step_keys_to_execute) == 1
@@ -392,29 +432,54 @@ def _execute_step_command_body(
             if not success:
                 return
 
-        if dagster_run.has_repository_load_data:
-            repository_load_data = instance.get_execution_plan_snapshot(
-                check.not_none(dagster_run.execution_plan_snapshot_id)
-            ).repository_load_data
+        execution_plan_snapshot = args.execution_plan_snapshot
+        if execution_plan_snapshot:
+            repository_load_data = execution_plan_snapshot.repository_load_data
+        elif dagster_run.has_repository_load_data:
+            with timer.time("fetch_repository_load_data"):
+                repository_load_data = instance.get_execution_plan_snapshot(
+                    check.not_none(dagster_run.execution_plan_snapshot_id)
+                ).repository_load_data
         else:
             repository_load_data = None
 
-        recon_job = (
-            recon_job_from_origin(cast(JobPythonOrigin, dagster_run.job_code_origin))
-            .with_repository_load_data(repository_load_data)
-            .get_subset(
-                op_selection=dagster_run.resolved_op_selection,
-                asset_selection=dagster_run.asset_selection,
-                asset_check_selection=dagster_run.asset_check_selection,
+        with timer.time("load_code"):
+            recon_job = (
+                recon_job_from_origin(cast(JobPythonOrigin, dagster_run.job_code_origin))
+                .with_repository_load_data(repository_load_data)
+                .get_subset(
+                    op_selection=dagster_run.resolved_op_selection,
+                    asset_selection=dagster_run.asset_selection,
+                    asset_check_selection=dagster_run.asset_check_selection,
+                )
             )
-        )
+            recon_job.get_definition()
 
-        execution_plan = create_execution_plan(
-            recon_job,
-            run_config=dagster_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            known_state=args.known_state,
-            repository_load_data=repository_load_data,
+        with timer.time("build_execution_plan"):
+            if execution_plan_snapshot:
+                execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                    dagster_run.job_name, execution_plan_snapshot
+                )
+            else:
+                execution_plan = create_execution_plan(
+                    recon_job,
+                    run_config=dagster_run.run_config,
+                    step_keys_to_execute=args.step_keys_to_execute,
+                    known_state=args.known_state,
+                    repository_load_data=repository_load_data,
+                )
+
+        yield instance.report_engine_event(
+            f"Step worker initialized in {timer.elapsed:.2f}s"
+            + (f' for "{single_step_key}".' if single_step_key else "."),
+            dagster_run,
+            EngineEventData(
+                metadata={
+                    f"{phase}_seconds": MetadataValue.float(round(duration, 4))
+                    for phase, duration in timer.durations.items()
+                }
+            ),
+            step_key=single_step_key,
         )
 
         yield from execute_plan_iterator(
@@ -1,6 +1,6 @@
 import typing
 from enum import Enum as PythonEnum
-from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence, cast
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._annotations import public
@@ -78,6 +78,10 @@ def __init__(
 
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
+        # memoized schema snapshot, which also holds the compiled validators for this type
+        self._schema_snapshot: Optional["ConfigSchemaSnapshot"] = None
+        # memoized compiled post-processing function
+        self._compiled_post_processor: Optional[Callable[[typing.Any], typing.Any]] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -105,13 +109,26 @@ def get_snapshot(self) -> "ConfigTypeSnap":
 
         return self._snap
 
+    def get_compiled_post_processor(self) -> Callable[[typing.Any], typing.Any]:
+        from .post_process import compile_post_processor
+
+        if self._compiled_post_processor is None:
+            self._compiled_post_processor = compile_post_processor(self)
+
+        return self._compiled_post_processor
+
     def type_iterator(self) -> Iterator["ConfigType"]:
         yield self
 
     def get_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         from .snap import ConfigSchemaSnapshot
 
-        return ConfigSchemaSnapshot({ct.key: ct.get_snapshot() for ct in self.type_iterator()})
+        if self._schema_snapshot is None:
+            self._schema_snapshot = ConfigSchemaSnapshot(
+                {ct.key: ct.get_snapshot() for ct in self.type_iterator()}
+            )
+
+        return self._schema_snapshot
 
 
 @whitelist_for_serdes
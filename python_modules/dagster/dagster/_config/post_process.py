@@ -1,5 +1,5 @@
 import sys
-from typing import Any, Dict, List, Mapping, Optional, cast
+from typing import Any, Callable, Dict, List, Mapping, Optional, cast
 
 import dagster._check as check
 from dagster._utils import ensure_single_item
@@ -13,8 +13,19 @@
 
 
 def post_process_config(config_type: ConfigType, config_value: Any) -> EvaluateValueResult[Any]:
+    check.inst_param(config_type, "config_type", ConfigType)
+
+    # Try the compiled post-processor first. It only raises PostProcessingError to signal failure,
+    # in which case we re-run the interpreted traversal to build errors with the full context.
+    try:
+        return EvaluateValueResult.for_value(
+            config_type.get_compiled_post_processor()(config_value)
+        )
+    except PostProcessingError:
+        pass
+
     ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
+        config_type=config_type,
         stack=EvaluationStack(entries=[]),
         traversal_type=TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
     )
@@ -249,3 +260,172 @@ def _recurse_in_to_map(context: TraversalContext, config_value: Any) -> Evaluate
         return EvaluateValueResult.for_errors(errors)
 
     return EvaluateValueResult.for_value({key: result.value for key, result in results.items()})
+
+
+CompiledPostProcessor = Callable[[Any], Any]
+
+
+def compile_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    """Compiles a function that resolves defaults and post-processes an already validated config
+    value for the given config type.
+
+    The compiled function raises PostProcessingError if any post-processing step fails.
+    """
+    kind = config_type.kind
+
+    resolve_defaults: Optional[CompiledPostProcessor]
+    if kind == ConfigTypeKind.SCALAR or kind == ConfigTypeKind.ENUM or kind == ConfigTypeKind.ANY:
+        resolve_defaults = None
+    elif kind == ConfigTypeKind.SELECTOR:
+        resolve_defaults = _compile_selector_post_processor(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        resolve_defaults = _compile_shape_post_processor(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        resolve_defaults = _compile_array_post_processor(config_type)
+    elif kind == ConfigTypeKind.MAP:
+        resolve_defaults = _compile_map_post_processor(config_type)
+    elif kind == ConfigTypeKind.NONEABLE:
+        resolve_defaults = _compile_noneable_post_processor(config_type)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        resolve_defaults = _compile_scalar_union_post_processor(config_type)
+    else:
+        check.failed(f"Unsupported type {config_type.key}")
+
+    # skip calling post_process entirely for the (common) types that do not override it
+    post_process = (
+        None
+        if type(config_type).post_process is ConfigType.post_process
+        else config_type.post_process
+    )
+
+    if resolve_defaults is None:
+        return post_process if post_process else lambda config_value: config_value
+    elif post_process is None:
+        return resolve_defaults
+    else:
+        return lambda config_value: post_process(resolve_defaults(config_value))
+
+
+def _compile_noneable_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    process_inner = config_type.inner_type.get_compiled_post_processor()  # type: ignore
+
+    def _process_noneable(config_value: Any) -> Any:
+        return None if config_value is None else process_inner(config_value)
+
+    return _process_noneable
+
+
+def _compile_scalar_union_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    process_scalar = config_type.scalar_type.get_compiled_post_processor()  # type: ignore
+    process_non_scalar = config_type.non_scalar_type.get_compiled_post_processor()  # type: ignore
+
+    def _process_scalar_union(config_value: Any) -> Any:
+        if isinstance(config_value, (dict, list)):
+            return process_non_scalar(config_value)
+        return process_scalar(config_value)
+
+    return _process_scalar_union
+
+
+def _compile_selector_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    fields = config_type.fields  # type: ignore
+    field_processors = {
+        field_name: (
+            field_def.config_type.get_compiled_post_processor(),
+            ConfigTypeKind.has_fields(field_def.config_type.kind),
+        )
+        for field_name, field_def in fields.items()
+    }
+
+    def _process_selector(config_value: Any) -> Any:
+        if config_value:
+            check.invariant(len(config_value) == 1)
+            field_name, incoming_field_value = ensure_single_item(config_value)
+        else:
+            field_name, field_def = ensure_single_item(fields)
+            incoming_field_value = field_def.default_value if field_def.default_provided else None
+
+        process_field, has_fields = field_processors[field_name]
+        return {
+            field_name: process_field(
+                {} if incoming_field_value is None and has_fields else incoming_field_value
+            )
+        }
+
+    return _process_selector
+
+
+def _compile_shape_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    fields = config_type.fields  # type: ignore
+    field_aliases: Dict[str, str] = getattr(config_type, "field_aliases", None) or {}
+    is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+    compiled_fields = [
+        (
+            field_name,
+            field_aliases.get(field_name),
+            field_def,
+            field_def.config_type.get_compiled_post_processor(),
+        )
+        for field_name, field_def in fields.items()
+    ]
+
+    def _process_shape(config_value: Any) -> Any:
+        config_value = check.opt_mapping_param(config_value, "config_value", key_type=str)
+
+        processed_fields = {}
+        for field_name, aliased_name, field_def, process_field in compiled_fields:
+            if field_name in config_value:
+                processed_fields[field_name] = process_field(config_value[field_name])
+            elif aliased_name is not None and aliased_name in config_value:
+                processed_fields[field_name] = process_field(config_value[aliased_name])
+            elif field_def.default_provided:
+                processed_fields[field_name] = process_field(field_def.default_value)
+            elif field_def.is_required:
+                check.failed("Missing required composite member not caught in validation")
+
+        # For permissive composite fields, we skip applying defaults because these fields are
+        # unknown to us
+        if is_permissive:
+            for extra_field, extra_value in config_value.items():
+                if extra_field not in fields:
+                    processed_fields[extra_field] = extra_value
+
+        return processed_fields
+
+    return _process_shape
+
+
+def _compile_array_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    inner_type = config_type.inner_type  # type: ignore
+    process_item = inner_type.get_compiled_post_processor()
+    allows_none = inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _process_array(config_value: Any) -> Any:
+        if not config_value:
+            return []
+
+        if not allows_none and any(cv is None for cv in config_value):
+            check.failed("Null array member not caught in validation")
+
+        return [process_item(item) for item in config_value]
+
+    return _process_array
+
+
+def _compile_map_post_processor(config_type: ConfigType) -> CompiledPostProcessor:
+    inner_type = config_type.inner_type  # type: ignore
+    process_item = inner_type.get_compiled_post_processor()
+    allows_none = inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _process_map(config_value: Any) -> Any:
+        if not config_value:
+            return {}
+
+        if any(ck is None for ck in config_value.keys()):
+            check.failed("Null map key not caught in validation")
+        if not allows_none and any(cv is None for cv in config_value.values()):
+            check.failed("Null map member not caught in validation")
+
+        return {key: process_item(item) for key, item in config_value.items()}
+
+    return _process_map
@@ -1,11 +1,15 @@
-from typing import Any, List, Mapping, NamedTuple, Optional, Sequence, Set, cast
+from typing import TYPE_CHECKING, Any, List, Mapping, NamedTuple, Optional, Sequence, Set, cast
 
 import dagster._check as check
 from dagster._serdes import whitelist_for_serdes
+from dagster._utils.cached_method import cached_method
 
 from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from .field import Field
 
+if TYPE_CHECKING:
+    from .validate import CompiledConfigValidator
+
 
 def get_recursive_type_keys(
     config_type_snap: "ConfigTypeSnap", config_schema_snapshot: "ConfigSchemaSnapshot"
@@ -51,6 +55,15 @@ def has_config_snap(self, key: str) -> bool:
         check.str_param(key, "key")
         return key in self.all_config_snaps_by_key
 
+    @cached_method
+    def get_compiled_validator(self, key: str) -> "CompiledConfigValidator":
+        """Returns a validation function for the config type with the given key, compiled once
+        per snapshot so that repeated validations against the same schema skip re-walking it.
+        """
+        from .validate import compile_config_validator
+
+        return compile_config_validator(self, key)
+
 
 @whitelist_for_serdes(skip_when_empty_fields={"field_aliases"})
 class ConfigTypeSnap(
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, TypeVar, cast
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, TypeVar, cast
 
 import dagster._check as check
 from dagster._utils import ensure_single_item
@@ -70,6 +70,15 @@ def validate_config_from_snap(
 ) -> EvaluateValueResult[T]:
     check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
     check.str_param(config_type_key, "config_type_key")
+
+    # Valid config is by far the common case, so first run the compiled validator, which does
+    # not build any evaluation contexts. Only if it rejects the value do we fall back to the
+    # interpreted traversal below, which is responsible for producing the detailed errors.
+    compiled_validator = config_schema_snapshot.get_compiled_validator(key=config_type_key)
+    validated_value = compiled_validator(config_value)
+    if validated_value is not INVALID_CONFIG:
+        return EvaluateValueResult.for_value(cast(T, validated_value))
+
     return _validate_config(
         ValidationContext(
             config_schema_snapshot=config_schema_snapshot,
@@ -442,3 +451,223 @@ def process_config(
         return validate_evr
 
     return post_process_config(config_type, validate_evr.value)
+
+
+# Sentinel returned by compiled validators when the config value does not match the schema
+INVALID_CONFIG = object()
+
+CompiledConfigValidator = Callable[[object], object]
+
+
+def compile_config_validator(
+    config_schema_snapshot: ConfigSchemaSnapshot, config_type_key: str
+) -> CompiledConfigValidator:
+    """Compiles the config type with the given key into a validation function.
+
+    The returned function accepts a config value and returns either the validated value (with the
+    same contents that ``_validate_config`` would produce) or ``INVALID_CONFIG``. It does not
+    produce errors; callers are expected to re-run the interpreted validation to report them.
+    """
+    check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
+    check.str_param(config_type_key, "config_type_key")
+    return _ConfigValidatorCompiler(config_schema_snapshot).compile(config_type_key)
+
+
+class _ConfigValidatorCompiler:
+    def __init__(self, config_schema_snapshot: ConfigSchemaSnapshot):
+        self._config_schema_snapshot = config_schema_snapshot
+        self._compiled: Dict[str, CompiledConfigValidator] = {}
+
+    def compile(self, config_type_key: str) -> CompiledConfigValidator:
+        if config_type_key not in self._compiled:
+            self._compiled[config_type_key] = self._compile_snap(
+                self._config_schema_snapshot.get_config_snap(config_type_key)
+            )
+        return self._compiled[config_type_key]
+
+    def _compile_snap(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        kind = snap.kind
+
+        if kind == ConfigTypeKind.NONEABLE:
+            return self._compile_noneable(snap)
+        if kind == ConfigTypeKind.ANY:
+            return lambda value: value
+
+        if kind == ConfigTypeKind.SCALAR:
+            validate_kind = self._compile_scalar(snap)
+        elif kind == ConfigTypeKind.SELECTOR:
+            validate_kind = self._compile_selector(snap)
+        elif kind == ConfigTypeKind.STRICT_SHAPE:
+            validate_kind = self._compile_shape(snap, check_for_extra_incoming_fields=True)
+        elif kind == ConfigTypeKind.PERMISSIVE_SHAPE:
+            validate_kind = self._compile_shape(snap, check_for_extra_incoming_fields=False)
+        elif kind == ConfigTypeKind.MAP:
+            validate_kind = self._compile_map(snap)
+        elif kind == ConfigTypeKind.ARRAY:
+            validate_kind = self._compile_array(snap)
+        elif kind == ConfigTypeKind.ENUM:
+            validate_kind = self._compile_enum(snap)
+        elif kind == ConfigTypeKind.SCALAR_UNION:
+            validate_kind = self._compile_scalar_union(snap)
+        else:
+            check.failed(f"Unsupported ConfigTypeKind {kind}")
+
+        def _validate_not_none(value: object) -> object:
+            if value is None:
+                return INVALID_CONFIG
+            return validate_kind(value)
+
+        return _validate_not_none
+
+    def _compile_noneable(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        validate_inner = self.compile(snap.inner_type_key)
+
+        def _validate_noneable(value: object) -> object:
+            return None if value is None else validate_inner(value)
+
+        return _validate_noneable
+
+    def _compile_scalar(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        from dagster._config.field_utils import EnvVar, IntEnvVar
+
+        scalar_kind = snap.scalar_kind
+        if scalar_kind == ConfigScalarKind.INT:
+            return lambda value: (
+                value if isinstance(value, int) and not isinstance(value, bool) else INVALID_CONFIG
+            )
+        elif scalar_kind == ConfigScalarKind.STRING:
+            return lambda value: (
+                value
+                if isinstance(value, str) and not isinstance(value, (EnvVar, IntEnvVar))
+                else INVALID_CONFIG
+            )
+        elif scalar_kind == ConfigScalarKind.BOOL:
+            return lambda value: value if isinstance(value, bool) else INVALID_CONFIG
+        elif scalar_kind == ConfigScalarKind.FLOAT:
+            return lambda value: value if isinstance(value, VALID_FLOAT_TYPES) else INVALID_CONFIG
+        elif scalar_kind is None:
+            # historical snapshot without scalar kind. do no validation
+            return lambda value: value
+        else:
+            check.failed(f"Not a supported scalar {snap}")
+
+    def _compile_selector(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        field_snaps = check.not_none(snap.fields)
+        empty_selector_is_valid = len(field_snaps) == 1 and not field_snaps[0].is_required
+        # (validator, whether a None value should be replaced by an empty dict) per field
+        field_validators = {
+            check.not_none(field_snap.name): (
+                self.compile(field_snap.type_key),
+                ConfigTypeKind.has_fields(
+                    self._config_schema_snapshot.get_config_snap(field_snap.type_key).kind
+                ),
+            )
+            for field_snap in field_snaps
+        }
+
+        def _validate_selector(value: object) -> object:
+            if value == {}:
+                return {} if empty_selector_is_valid else INVALID_CONFIG
+            if not isinstance(value, dict) or len(value) > 1:
+                return INVALID_CONFIG
+
+            field_name, field_value = next(iter(value.items()))
+            if field_name not in field_validators:
+                return INVALID_CONFIG
+
+            validate_field, has_fields = field_validators[field_name]
+            field_result = validate_field({} if field_value is None and has_fields else field_value)
+            if field_result is INVALID_CONFIG:
+                return INVALID_CONFIG
+            return {field_name: field_result}
+
+        return _validate_selector
+
+    def _compile_shape(
+        self, snap: ConfigTypeSnap, check_for_extra_incoming_fields: bool
+    ) -> CompiledConfigValidator:
+        field_aliases = snap.field_aliases or {}
+        field_snaps = check.not_none(snap.fields)
+        defined_field_names = frozenset(
+            {check.not_none(fs.name) for fs in field_snaps}.union(field_aliases.values())
+        )
+        fields = [
+            (
+                check.not_none(field_snap.name),
+                field_aliases.get(check.not_none(field_snap.name)),
+                field_snap.is_required,
+                self.compile(field_snap.type_key),
+            )
+            for field_snap in field_snaps
+        ]
+
+        def _validate_shape(value: object) -> object:
+            if not isinstance(value, dict):
+                return INVALID_CONFIG
+
+            if check_for_extra_incoming_fields and not defined_field_names.issuperset(value):
+                return INVALID_CONFIG
+
+            for name, aliased_name, is_required, validate_field in fields:
+                if name in value:
+                    if aliased_name is not None and aliased_name in value:
+                        return INVALID_CONFIG
+                    if validate_field(value[name]) is INVALID_CONFIG:
+                        return INVALID_CONFIG
+                elif aliased_name is not None and aliased_name in value:
+                    if validate_field(value[aliased_name]) is INVALID_CONFIG:
+                        return INVALID_CONFIG
+                elif is_required:
+                    return INVALID_CONFIG
+
+            return value
+
+        return _validate_shape
+
+    def _compile_map(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        validate_key = self.compile(snap.key_type_key)
+        validate_value = self.compile(snap.inner_type_key)
+
+        def _validate_map(value: object) -> object:
+            if not isinstance(value, dict):
+                return INVALID_CONFIG
+            for map_key, map_value in value.items():
+                if (
+                    validate_key(map_key) is INVALID_CONFIG
+                    or validate_value(map_value) is INVALID_CONFIG
+                ):
+                    return INVALID_CONFIG
+            return value
+
+        return _validate_map
+
+    def _compile_array(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        validate_item = self.compile(snap.inner_type_key)
+
+        def _validate_array(value: object) -> object:
+            if not isinstance(value, list):
+                return INVALID_CONFIG
+            items = []
+            for item in value:
+                item_result = validate_item(item)
+                if item_result is INVALID_CONFIG:
+                    return INVALID_CONFIG
+                items.append(item_result)
+            return items
+
+        return _validate_array
+
+    def _compile_enum(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        enum_values = frozenset(enum_value.value for enum_value in check.not_none(snap.enum_values))
+        return lambda value: (
+            value if isinstance(value, str) and value in enum_values else INVALID_CONFIG
+        )
+
+    def _compile_scalar_union(self, snap: ConfigTypeSnap) -> CompiledConfigValidator:
+        validate_scalar = self.compile(snap.scalar_type_key)
+        validate_non_scalar = self.compile(snap.non_scalar_type_key)
+        return lambda value: (
+            validate_non_scalar(value)
+            if isinstance(value, (dict, list))
+            else validate_scalar(value)
+        )
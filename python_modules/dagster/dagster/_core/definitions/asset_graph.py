@@ -1,5 +1,7 @@
 import functools
-from collections import deque
+import weakref
+from array import array
+from collections import defaultdict, deque
 from datetime import datetime
 from heapq import heapify, heappop, heappush
 from typing import (
@@ -7,6 +9,7 @@
     AbstractSet,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Iterator,
     List,
@@ -15,6 +18,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -28,6 +32,7 @@
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.selector.subset_selector import (
     DependencyGraph,
+    Direction,
     fetch_sources,
     generate_asset_dep_graph,
 )
@@ -39,7 +44,8 @@
 from .backfill_policy import BackfillPolicy
 from .events import AssetKey, AssetKeyPartitionKey
 from .freshness_policy import FreshnessPolicy
-from .partition import PartitionsDefinition, PartitionsSubset
+from .multi_dimensional_partitions import MultiPartitionsDefinition
+from .partition import DynamicPartitionsDefinition, PartitionsDefinition, PartitionsSubset
 from .partition_key_range import PartitionKeyRange
 from .partition_mapping import (
     PartitionMapping,
@@ -54,6 +60,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+    from dagster._core.definitions.asset_selection import AssetSelection
 
 AssetKeyOrCheckKey = Union[AssetKey, AssetCheckKey]
 
@@ -71,6 +78,120 @@ class ParentsPartitionsResult(NamedTuple):
     required_but_nonexistent_parents_partitions: AbstractSet[AssetKeyPartitionKey]
 
 
+class CompactAssetDepGraph:
+    """Array-backed representation of the dependencies between assets, used to traverse large
+    asset graphs without hashing asset keys or allocating sets at every step.
+
+    Asset keys are numbered in topological order, with parents before children. The parents and
+    children of the asset with id `i` are stored in CSR (compressed sparse row) arrays, e.g. its
+    parents are `parent_ids[parent_offsets[i]:parent_offsets[i + 1]]`. Self-dependencies are
+    left out.
+    """
+
+    def __init__(self, asset_dep_graph: DependencyGraph[AssetKey]):
+        upstream = asset_dep_graph["upstream"]
+        downstream = asset_dep_graph["downstream"]
+
+        all_keys: Dict[AssetKey, None] = {}
+        for dep_graph in (upstream, downstream):
+            for asset_key, connected_keys in dep_graph.items():
+                all_keys[asset_key] = None
+                for connected_key in connected_keys:
+                    all_keys[connected_key] = None
+
+        # assign ids level by level (Kahn's algorithm), so that parents come before children
+        parents_by_key = {
+            asset_key: [
+                parent_key for parent_key in upstream.get(asset_key, ()) if parent_key != asset_key
+            ]
+            for asset_key in all_keys
+        }
+        children_by_key: Dict[AssetKey, List[AssetKey]] = defaultdict(list)
+        for asset_key, parent_keys in parents_by_key.items():
+            for parent_key in parent_keys:
+                children_by_key[parent_key].append(asset_key)
+        num_unsorted_parents = {
+            asset_key: len(set(parent_keys)) for asset_key, parent_keys in parents_by_key.items()
+        }
+
+        keys: List[AssetKey] = []
+        level_offsets = [0]
+        level = [asset_key for asset_key, count in num_unsorted_parents.items() if count == 0]
+        while level:
+            keys.extend(level)
+            level_offsets.append(len(keys))
+            next_level = []
+            for asset_key in level:
+                for child_key in set(children_by_key.get(asset_key, ())):
+                    num_unsorted_parents[child_key] -= 1
+                    if num_unsorted_parents[child_key] == 0:
+                        next_level.append(child_key)
+            level = next_level
+
+        # assets in dependency cycles have no topological order and are numbered last
+        self.is_acyclic = len(keys) == len(all_keys)
+        if not self.is_acyclic:
+            sorted_keys = set(keys)
+            keys.extend(asset_key for asset_key in all_keys if asset_key not in sorted_keys)
+
+        self.keys: Sequence[AssetKey] = keys
+        self.ids_by_key: Mapping[AssetKey, int] = {
+            asset_key: asset_id for asset_id, asset_key in enumerate(keys)
+        }
+        self.level_offsets = array("l", level_offsets)
+        self.parent_offsets, self.parent_ids = self._build_csr_arrays(upstream)
+        self.child_offsets, self.child_ids = self._build_csr_arrays(downstream)
+
+    def _build_csr_arrays(
+        self, dep_graph: Mapping[AssetKey, AbstractSet[AssetKey]]
+    ) -> "tuple[array[int], array[int]]":
+        offsets = array("l", [0])
+        adjacent_ids = array("l")
+        for asset_key in self.keys:
+            adjacent_ids.extend(
+                sorted(
+                    self.ids_by_key[connected_key]
+                    for connected_key in dep_graph.get(asset_key, ())
+                    if connected_key != asset_key
+                )
+            )
+            offsets.append(len(adjacent_ids))
+        return offsets, adjacent_ids
+
+    @property
+    def toposorted_ids_by_level(self) -> Iterator[Sequence[int]]:
+        for i in range(len(self.level_offsets) - 1):
+            yield range(self.level_offsets[i], self.level_offsets[i + 1])
+
+    def get_reachable_ids(
+        self, start_ids: Iterable[int], upstream: bool, depth: Optional[int] = None
+    ) -> Sequence[int]:
+        """Returns the ids of the assets that can be reached from any of the given assets by
+        following at most `depth` dependencies upstream or downstream. The given assets are only
+        included if they can be reached from another one of the given assets.
+        """
+        if upstream:
+            offsets, adjacent_ids = self.parent_offsets, self.parent_ids
+        else:
+            offsets, adjacent_ids = self.child_offsets, self.child_ids
+
+        visited = bytearray(len(self.keys))
+        reached: List[int] = []
+        frontier = list(start_ids)
+        curr_depth = 0
+        while frontier and (depth is None or curr_depth < depth):
+            next_frontier = []
+            for asset_id in frontier:
+                for adjacent_id in adjacent_ids[offsets[asset_id] : offsets[asset_id + 1]]:
+                    if not visited[adjacent_id]:
+                        visited[adjacent_id] = 1
+                        next_frontier.append(adjacent_id)
+            reached.extend(next_frontier)
+            frontier = next_frontier
+            curr_depth += 1
+        return reached
+
+
 class AssetGraph:
     def __init__(
         self,
@@ -104,7 +225,17 @@ def __init__(
         self._materializable_asset_keys = (
             self._asset_dep_graph["upstream"].keys() - self.source_asset_keys
         )
+        self._all_asset_keys = frozenset(self._materializable_asset_keys | self.source_asset_keys)
         self._required_assets_and_checks_by_key = required_assets_and_checks_by_key
+        # asset keys resolved by the asset selections resolved against this graph
+        self._resolved_asset_selections: (
+            "weakref.WeakKeyDictionary[AssetSelection, AbstractSet[AssetKey]]"
+        ) = weakref.WeakKeyDictionary()
+        # partitions mapped between assets during the latest evaluation, see
+        # _get_partition_mapping_cache
+        self._partition_mapping_cache: Tuple[
+            Optional[Tuple[Optional[DynamicPartitionsStore], datetime]], Dict[Hashable, object]
+        ] = (None, {})
 
     @property
     def asset_dep_graph(self) -> DependencyGraph[AssetKey]:
@@ -227,7 +358,7 @@ def materializable_asset_keys(self) -> AbstractSet[AssetKey]:
 
     @property
     def all_asset_keys(self) -> AbstractSet[AssetKey]:
-        return self._materializable_asset_keys | self.source_asset_keys
+        return self._all_asset_keys
 
     def get_partitions_def(self, asset_key: AssetKey) -> Optional[PartitionsDefinition]:
         return self._partitions_defs_by_key.get(asset_key)
@@ -290,12 +421,88 @@ def get_ancestors(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = {asset_key} if include_self else set()
-        parents = self.get_parents(asset_key) - {asset_key}  # remove self-dependencies
-        return ancestors.union(
-            *[self.get_ancestors(parent, include_self=True) for parent in parents]
+        ancestors = self.get_connected_asset_keys({asset_key}, "upstream") - {asset_key}
+        if include_self:
+            ancestors.add(asset_key)
+        return ancestors
+
+    @cached_method
+    def get_compact_dep_graph(self) -> CompactAssetDepGraph:
+        """Returns an array-backed representation of the dependencies between the assets of this
+        graph, to traverse it efficiently.
+        """
+        return CompactAssetDepGraph(self._asset_dep_graph)
+
+    @cached_method
+    def _get_asset_keys_by_group_name(self) -> Mapping[Optional[str], AbstractSet[AssetKey]]:
+        asset_keys_by_group_name: Dict[Optional[str], Set[AssetKey]] = defaultdict(set)
+        for asset_key, group_name in self.group_names_by_key.items():
+            asset_keys_by_group_name[group_name].add(asset_key)
+        return asset_keys_by_group_name
+
+    def get_asset_keys_in_groups(self, group_names: Iterable[str]) -> AbstractSet[AssetKey]:
+        """Returns the keys of the assets and source assets that belong to any of the given groups."""
+        asset_keys_by_group_name = self._get_asset_keys_by_group_name()
+        return set().union(
+            *(asset_keys_by_group_name.get(group_name, set()) for group_name in group_names)
         )
 
+    @cached_method
+    def _get_asset_keys_by_prefix(self) -> Mapping[Sequence[str], AbstractSet[AssetKey]]:
+        asset_keys_by_prefix: Dict[Sequence[str], Set[AssetKey]] = defaultdict(set)
+        for asset_key in self.all_asset_keys:
+            for i in range(1, len(asset_key.path) + 1):
+                asset_keys_by_prefix[tuple(asset_key.path[:i])].add(asset_key)
+        return asset_keys_by_prefix
+
+    def get_asset_keys_with_prefixes(
+        self, key_prefixes: Iterable[Sequence[str]]
+    ) -> AbstractSet[AssetKey]:
+        """Returns the keys of the assets and source assets whose key starts with any of the given
+        prefixes.
+        """
+        asset_keys_by_prefix = self._get_asset_keys_by_prefix()
+        asset_keys: Set[AssetKey] = set()
+        for key_prefix in key_prefixes:
+            if not key_prefix:
+                return set(self.all_asset_keys)
+            asset_keys.update(asset_keys_by_prefix.get(tuple(key_prefix), set()))
+        return asset_keys
+
+    def get_connected_asset_keys(
+        self,
+        asset_keys: AbstractSet[AssetKey],
+        direction: Direction,
+        depth: Optional[int] = None,
+    ) -> AbstractSet[AssetKey]:
+        """Returns the keys that can be reached from any of the given keys by following at most
+        `depth` dependencies in the given direction, ignoring self-dependencies. The given keys are
+        only included if they can be reached from another one of the given keys.
+        """
+        compact_dep_graph = self.get_compact_dep_graph()
+        ids_by_key = compact_dep_graph.ids_by_key
+        keys = compact_dep_graph.keys
+        return {
+            keys[asset_id]
+            for asset_id in compact_dep_graph.get_reachable_ids(
+                (ids_by_key[asset_key] for asset_key in asset_keys if asset_key in ids_by_key),
+                upstream=direction == "upstream",
+                depth=depth,
+            )
+        }
+
+    def resolve_asset_selection(self, asset_selection: "AssetSelection") -> AbstractSet[AssetKey]:
+        """Returns the asset keys selected by the given asset selection in this graph.
+
+        The result is memoized for as long as both the graph and the selection are alive, so
+        resolving the same selection repeatedly against the same graph is cheap.
+        """
+        resolved = self._resolved_asset_selections.get(asset_selection)
+        if resolved is None:
+            resolved = frozenset(asset_selection.resolve_inner(self))
+            self._resolved_asset_selections[asset_selection] = resolved
+        return resolved
+
     def get_children_partitions(
         self,
         dynamic_partitions_store: DynamicPartitionsStore,
@@ -361,6 +568,13 @@ def get_child_partition_keys_of_parent(
                 f" '{parent_asset_key}' is not partitioned."
             )
 
+        cache = self._get_partition_mapping_cache(
+            dynamic_partitions_store, current_time, [parent_partitions_def, child_partitions_def]
+        )
+        cache_key = ("downstream", parent_asset_key, child_asset_key, parent_partition_key)
+        if cache is not None and cache_key in cache:
+            return cast(Sequence[str], cache[cache_key])
+
         partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
         child_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
             parent_partitions_def.empty_subset().with_partition_keys([parent_partition_key]),
@@ -368,8 +582,46 @@ def get_child_partition_keys_of_parent(
             dynamic_partitions_store=dynamic_partitions_store,
             current_time=current_time,
         )
+        child_partition_keys = list(child_partitions_subset.get_partition_keys())
 
-        return list(child_partitions_subset.get_partition_keys())
+        if cache is not None:
+            cache[cache_key] = child_partition_keys
+        return child_partition_keys
+
+    def _get_partition_mapping_cache(
+        self,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+        current_time: datetime,
+        partitions_defs: Sequence[Optional[PartitionsDefinition]],
+    ) -> Optional[Dict[Hashable, object]]:
+        """Returns a cache for partitions mapped between assets of this graph with the given dynamic
+        partitions store and time, or None if the mapped partitions can't be cached.
+
+        During a tick of the asset daemon, or an iteration of a backfill, the same partitions are
+        mapped many times, e.g. once per auto-materialize rule that checks the parents of a
+        candidate. Those evaluations share a dynamic partitions store and an evaluation time, so
+        only the cache of the latest evaluation is kept.
+        """
+        # dynamic partitions can be added to the store at any time
+        for partitions_def in partitions_defs:
+            if isinstance(partitions_def, DynamicPartitionsDefinition) or (
+                isinstance(partitions_def, MultiPartitionsDefinition)
+                and any(
+                    isinstance(dimension.partitions_def, DynamicPartitionsDefinition)
+                    for dimension in partitions_def.partitions_defs
+                )
+            ):
+                return None
+
+        evaluation, cache = self._partition_mapping_cache
+        if (
+            evaluation is None
+            or evaluation[0] is not dynamic_partitions_store
+            or evaluation[1] != current_time
+        ):
+            cache = {}
+            self._partition_mapping_cache = ((dynamic_partitions_store, current_time), cache)
+        return cache
 
     def get_parents_partitions(
         self,
@@ -445,9 +697,15 @@ def get_parent_partition_keys_for_child(
                 f"Asset key {parent_asset_key} is not partitioned. Cannot get partition keys."
             )
 
-        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        cache = self._get_partition_mapping_cache(
+            dynamic_partitions_store, current_time, [parent_partitions_def, child_partitions_def]
+        )
+        cache_key = ("upstream", parent_asset_key, child_asset_key, partition_key)
+        if cache is not None and cache_key in cache:
+            return cast(UpstreamPartitionsResult, cache[cache_key])
 
-        return partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        result = partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
             (
                 cast(PartitionsDefinition, child_partitions_def).subset_with_partition_keys(
                     [partition_key]
@@ -460,6 +718,10 @@ def get_parent_partition_keys_for_child(
             current_time=current_time,
         )
 
+        if cache is not None:
+            cache[cache_key] = result
+        return result
+
     def is_source(self, asset_key: AssetKey) -> bool:
         return (
             asset_key in self.source_asset_keys or asset_key not in self.materializable_asset_keys
@@ -518,10 +780,29 @@ def get_code_version(self, asset_key: AssetKey) -> Optional[str]:
 
     @cached_method
     def toposort_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
+        compact_dep_graph = self.get_compact_dep_graph()
+        if not compact_dep_graph.is_acyclic:
+            # raises an error that describes the cycle
+            toposort.toposort_flatten(self._asset_dep_graph["upstream"])
+
+        keys = compact_dep_graph.keys
         return [
-            {key for key in level} for level in toposort.toposort(self._asset_dep_graph["upstream"])
+            {keys[asset_id] for asset_id in level}
+            for level in compact_dep_graph.toposorted_ids_by_level
         ]
 
+    @cached_method
+    def _get_toposort_level_by_asset_key(self) -> Mapping[AssetKey, int]:
+        return {
+            asset_key: i
+            for i, asset_keys in enumerate(self.toposort_asset_keys())
+            for asset_key in asset_keys
+        }
+
+    def get_toposort_level(self, asset_key: AssetKey) -> int:
+        """Returns the index of the level of `toposort_asset_keys` that contains the given asset."""
+        return self._get_toposort_level_by_asset_key()[asset_key]
+
     def get_auto_materialize_policy(self, asset_key: AssetKey) -> Optional[AutoMaterializePolicy]:
         return self.auto_materialize_policies_by_key.get(asset_key)
 
@@ -818,12 +1099,6 @@ def __init__(
         self._asset_graph = asset_graph
         self._include_required_multi_assets = include_required_multi_assets
 
-        toposorted_asset_keys = asset_graph.toposort_asset_keys()
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(toposorted_asset_keys)
-            for asset_key in asset_keys
-        }
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
@@ -848,7 +1123,7 @@ def _queue_item(
             required_multi_asset_keys = {asset_key}
 
         level = max(
-            self._toposort_level_by_asset_key[required_asset_key]
+            self._asset_graph.get_toposort_level(required_asset_key)
             for required_asset_key in required_multi_asset_keys
         )
 
@@ -10,12 +10,7 @@
 from dagster._annotations import deprecated, public
 from dagster._core.definitions.asset_checks import AssetChecksDefinition
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import parse_clause
 
 from .asset_check_spec import AssetCheckKey
 from .asset_graph import AssetGraph, InternalAssetGraph
@@ -300,11 +295,10 @@ def resolve(
             check.iterable_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
             asset_graph = AssetGraph.from_assets(all_assets)
 
-        resolved = self.resolve_inner(asset_graph)
+        resolved = asset_graph.resolve_asset_selection(self)
         resolved_source_assets = asset_graph.source_asset_keys & resolved
-        resolved_regular_assets = resolved - asset_graph.source_asset_keys
         check.invariant(
-            not (len(resolved_source_assets) > 0 and len(resolved_regular_assets) > 0),
+            not (0 < len(resolved_source_assets) < len(resolved)),
             "Asset selection specified both regular assets and source assets. This is not"
             " currently supported. Selections must be all regular assets or all source assets.",
         )
@@ -423,7 +417,9 @@ def __init__(self, left: AssetSelection, right: AssetSelection):
         self._right = right
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        return self._left.resolve_inner(asset_graph) & self._right.resolve_inner(asset_graph)
+        return asset_graph.resolve_asset_selection(
+            self._left
+        ) & asset_graph.resolve_asset_selection(self._right)
 
     def resolve_checks_inner(self, asset_graph: InternalAssetGraph) -> AbstractSet[AssetCheckKey]:
         return self._left.resolve_checks_inner(asset_graph) & self._right.resolve_checks_inner(
@@ -437,7 +433,9 @@ def __init__(self, left: AssetSelection, right: AssetSelection):
         self._right = right
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        return self._left.resolve_inner(asset_graph) - self._right.resolve_inner(asset_graph)
+        return asset_graph.resolve_asset_selection(
+            self._left
+        ) - asset_graph.resolve_asset_selection(self._right)
 
     def resolve_checks_inner(self, asset_graph: InternalAssetGraph) -> AbstractSet[AssetCheckKey]:
         return self._left.resolve_checks_inner(asset_graph) - self._right.resolve_checks_inner(
@@ -450,8 +448,10 @@ def __init__(self, child: AssetSelection):
         self._child = child
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        selection = self._child.resolve_inner(asset_graph)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        selection = asset_graph.resolve_asset_selection(self._child)
+        # a sink has no downstream assets within the selection, i.e. it is not upstream of any
+        # other selected asset
+        return selection - asset_graph.get_connected_asset_keys(selection, "upstream")
 
 
 class RequiredNeighborsAssetSelection(AssetSelection):
@@ -459,7 +459,7 @@ def __init__(self, child: AssetSelection):
         self._child = child
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        selection = self._child.resolve_inner(asset_graph)
+        selection = asset_graph.resolve_asset_selection(self._child)
         output = set(selection)
         for asset_key in selection:
             output.update(asset_graph.get_required_multi_asset_keys(asset_key))
@@ -471,8 +471,10 @@ def __init__(self, child: AssetSelection):
         self._child = child
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        selection = self._child.resolve_inner(asset_graph)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        selection = asset_graph.resolve_asset_selection(self._child)
+        # a root has no upstream assets within the selection, i.e. it is not downstream of any
+        # other selected asset
+        return selection - asset_graph.get_connected_asset_keys(selection, "downstream")
 
 
 class DownstreamAssetSelection(AssetSelection):
@@ -488,21 +490,10 @@ def __init__(
         self.include_self = include_self
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        selection = self._child.resolve_inner(asset_graph)
+        selection = asset_graph.resolve_asset_selection(self._child)
         return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
+            selection
+            | asset_graph.get_connected_asset_keys(selection, "downstream", depth=self.depth),
             selection if not self.include_self else set(),
         )
 
@@ -518,11 +509,7 @@ def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
             if self._include_sources
             else asset_graph.materializable_asset_keys
         )
-        return {
-            asset_key
-            for asset_key, group in asset_graph.group_names_by_key.items()
-            if group in self._groups and asset_key in base_set
-        }
+        return asset_graph.get_asset_keys_in_groups(self._groups) & base_set
 
 
 class KeysAssetSelection(AssetSelection):
@@ -552,9 +539,7 @@ def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
             if self._include_sources
             else asset_graph.materializable_asset_keys
         )
-        return {
-            key for key in base_set if any(key.has_prefix(prefix) for prefix in self._key_prefixes)
-        }
+        return asset_graph.get_asset_keys_with_prefixes(self._key_prefixes) & base_set
 
 
 class OrAssetSelection(AssetSelection):
@@ -563,7 +548,9 @@ def __init__(self, left: AssetSelection, right: AssetSelection):
         self._right = right
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        return self._left.resolve_inner(asset_graph) | self._right.resolve_inner(asset_graph)
+        return asset_graph.resolve_asset_selection(
+            self._left
+        ) | asset_graph.resolve_asset_selection(self._right)
 
     def resolve_checks_inner(self, asset_graph: InternalAssetGraph) -> AbstractSet[AssetCheckKey]:
         return self._left.resolve_checks_inner(asset_graph) | self._right.resolve_checks_inner(
@@ -578,20 +565,7 @@ def _fetch_all_upstream(
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
     return operator.sub(
-        reduce(
-            operator.or_,
-            [
-                {asset_key}
-                | fetch_connected(
-                    item=asset_key,
-                    graph=asset_graph.asset_dep_graph,
-                    direction="upstream",
-                    depth=depth,
-                )
-                for asset_key in selection
-            ],
-            set(),
-        ),
+        selection | asset_graph.get_connected_asset_keys(selection, "upstream", depth=depth),
         selection if not include_self else set(),
     )
 
@@ -609,7 +583,7 @@ def __init__(
         self.include_self = include_self
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        selection = self._child.resolve_inner(asset_graph)
+        selection = asset_graph.resolve_asset_selection(self._child)
         if len(selection) == 0:
             return selection
         all_upstream = _fetch_all_upstream(selection, asset_graph, self.depth, self.include_self)
@@ -621,7 +595,7 @@ def __init__(self, child: AssetSelection):
         self._child = child
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        selection = self._child.resolve_inner(asset_graph)
+        selection = asset_graph.resolve_asset_selection(self._child)
         if len(selection) == 0:
             return selection
         all_upstream = _fetch_all_upstream(selection, asset_graph)
@@ -99,17 +99,26 @@ def __repr__(self):
         return f"AssetKey({self.path})"
 
     def __hash__(self):
-        return hash(tuple(self.path))
+        # Asset keys are hashed very often when used as dictionary keys, so the hash of the path is
+        # computed once. The path is copied on construction, so it is not expected to change.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self.path))
+            return self._hash
+
+    def __getstate__(self):
+        # the cached hash must not be pickled, since string hashes differ across processes
+        return None
 
     def __eq__(self, other):
         if not isinstance(other, AssetKey):
             return False
-        if len(self.path) != len(other.path):
-            return False
-        for i in range(0, len(self.path)):
-            if self.path[i] != other.path[i]:
-                return False
-        return True
+        if self is other:
+            return True
+        if type(self.path) is type(other.path):
+            return self.path == other.path
+        return list(self.path) == list(other.path)
 
     def to_string(self) -> str:
         """E.g. '["first_component", "second_component"]'."""
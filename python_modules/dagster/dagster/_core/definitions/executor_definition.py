@@ -271,6 +271,7 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore  # (possible none)
         marker_to_close=config.get("marker_to_close"),  # type: ignore  # (should be str)
+        max_concurrent=config.get("max_concurrent", 1),  # type: ignore  # (should be int)
     )
 
 
@@ -282,6 +283,16 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
             is_required=False,
             description="[DEPRECATED]",
         ),
+        "max_concurrent": Field(
+            int,
+            is_required=False,
+            default_value=1,
+            description=(
+                "The number of steps that may run concurrently, in threads of the process. Steps"
+                " only run concurrently if the compute log manager captures the logs of the whole"
+                " process."
+            ),
+        ),
     },
     description="Execute all steps in a single process.",
 )
@@ -304,6 +315,16 @@ def in_process_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Independent steps can run concurrently in threads of the process by setting
+    ``max_concurrent``:
+
+    .. code-block:: yaml
+
+        execution:
+          in_process:
+            config:
+              max_concurrent: 4
     """
     return _core_in_process_executor_creation(init_context.executor_config)
 
@@ -324,6 +345,29 @@ def execute_in_process_executor(_) -> "InProcessExecutor":
     )
 
 
+def is_execute_in_process_executor(executor_def: ExecutorDefinition) -> bool:
+    return executor_def.name == execute_in_process_executor.name
+
+
+def get_execute_in_process_executor(max_concurrent: int) -> ExecutorDefinition:
+    """Get the executor used by execute_in_process, running up to max_concurrent steps at a time."""
+    from dagster._core.executor.in_process import InProcessExecutor
+
+    check.int_param(max_concurrent, "max_concurrent")
+    if max_concurrent == 1:
+        return execute_in_process_executor
+
+    return ExecutorDefinition(
+        name=execute_in_process_executor.name,
+        executor_creation_fn=lambda _: InProcessExecutor(
+            retries=RetryMode.ENABLED,
+            marker_to_close=None,
+            max_concurrent=max_concurrent,
+        ),
+        description=execute_in_process_executor.description,
+    )
+
+
 def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "MultiprocessExecutor":
     from dagster._core.executor.multiprocess import MultiprocessExecutor
 
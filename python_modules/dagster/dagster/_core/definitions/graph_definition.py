@@ -678,6 +678,7 @@ def execute_in_process(
         op_selection: Optional[Sequence[str]] = None,
         run_id: Optional[str] = None,
         input_values: Optional[Mapping[str, object]] = None,
+        max_concurrent: int = 1,
     ) -> "ExecuteInProcessResult":
         """Execute this graph in-process, collecting results in-memory.
 
@@ -702,6 +703,8 @@ def execute_in_process(
                 ancestors, ``other_op_a`` itself, and ``other_op_b`` and its direct child ops.
             input_values (Optional[Mapping[str, Any]]):
                 A dictionary that maps python objects to the top-level inputs of the graph.
+            max_concurrent (int): The number of independent steps that may run concurrently, in
+                threads of the current process. Defaults to 1, which runs steps one at a time.
 
         Returns:
             :py:class:`~dagster.ExecuteInProcessResult`
@@ -734,6 +737,7 @@ def execute_in_process(
             instance=instance,
             raise_on_error=raise_on_error,
             run_id=run_id,
+            max_concurrent=max_concurrent,
         )
 
     @property
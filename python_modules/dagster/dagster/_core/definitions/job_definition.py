@@ -593,6 +593,7 @@ def execute_in_process(
         input_values: Optional[Mapping[str, object]] = None,
         tags: Optional[Mapping[str, str]] = None,
         resources: Optional[Mapping[str, object]] = None,
+        max_concurrent: int = 1,
     ) -> "ExecuteInProcessResult":
         """Execute the Job in-process, gathering results in-memory.
 
@@ -623,12 +624,14 @@ def execute_in_process(
             resources (Optional[Mapping[str, Any]]):
                 The resources needed if any are required. Can provide resource instances directly,
                 or resource definitions.
+            max_concurrent (int): The number of independent steps that may run concurrently, in
+                threads of the current process. Defaults to 1, which runs steps one at a time.
 
         Returns:
             :py:class:`~dagster.ExecuteInProcessResult`
 
         """
-        from dagster._core.definitions.executor_definition import execute_in_process_executor
+        from dagster._core.definitions.executor_definition import get_execute_in_process_executor
         from dagster._core.definitions.run_config import convert_config_input
         from dagster._core.execution.build_resources import wrap_resources_for_execution
         from dagster._core.execution.execute_in_process import core_execute_in_process
@@ -637,6 +640,8 @@ def execute_in_process(
         op_selection = check.opt_sequence_param(op_selection, "op_selection", str)
         asset_selection = check.opt_sequence_param(asset_selection, "asset_selection", AssetKey)
         resources = check.opt_mapping_param(resources, "resources", key_type=str)
+        max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        check.param_invariant(max_concurrent > 0, "max_concurrent", "must be positive")
 
         resource_defs = wrap_resources_for_execution(resources)
 
@@ -659,7 +664,7 @@ def execute_in_process(
             name=self._name,
             graph_def=self._graph_def,
             resource_defs={**_swap_default_io_man(bound_resource_defs, self), **resource_defs},
-            executor_def=execute_in_process_executor,
+            executor_def=get_execute_in_process_executor(max_concurrent),
             logger_defs=self._loggers,
             hook_defs=self.hook_defs,
             config=self.config_mapping or self.partitioned_config or self.run_config,
@@ -29,6 +29,7 @@ def materialize(
     raise_on_error: bool = True,
     tags: Optional[Mapping[str, str]] = None,
     selection: Optional["CoercibleToAssetSelection"] = None,
+    max_concurrent: int = 1,
 ) -> "ExecuteInProcessResult":
     """Executes a single-threaded, in-process run which materializes provided assets.
 
@@ -62,6 +63,9 @@ def materialize(
             If providing a string or sequence of strings,
             https://docs.dagster.io/concepts/assets/asset-selection-syntax describes the accepted
             syntax.
+        max_concurrent (int): The number of independent assets that may be materialized
+            concurrently, in threads of the current process. Defaults to 1, which materializes
+            assets one at a time.
 
     Returns:
         ExecuteInProcessResult: The result of the execution.
@@ -109,6 +113,7 @@ def asset2(asset1):
         partition_key=partition_key,
         raise_on_error=raise_on_error,
         tags=tags,
+        max_concurrent=max_concurrent,
     )
 
 
@@ -121,6 +126,7 @@ def materialize_to_memory(
     raise_on_error: bool = True,
     tags: Optional[Mapping[str, str]] = None,
     selection: Optional["CoercibleToAssetSelection"] = None,
+    max_concurrent: int = 1,
 ) -> "ExecuteInProcessResult":
     """Executes a single-threaded, in-process run which materializes provided assets in memory.
 
@@ -148,6 +154,9 @@ def materialize_to_memory(
             If providing a string or sequence of strings,
             https://docs.dagster.io/concepts/assets/asset-selection-syntax describes the accepted
             syntax.
+        max_concurrent (int): The number of independent assets that may be materialized
+            concurrently, in threads of the current process. Defaults to 1, which materializes
+            assets one at a time.
 
     Returns:
         ExecuteInProcessResult: The result of the execution.
@@ -199,6 +208,7 @@ def asset2(asset1):
         raise_on_error=raise_on_error,
         tags=tags,
         selection=selection,
+        max_concurrent=max_concurrent,
     )
 
 
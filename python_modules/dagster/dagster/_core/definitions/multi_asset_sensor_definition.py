@@ -1189,6 +1189,7 @@ def _check_cursor_not_set(sensor_result: SensorResult):
             return _fn
 
         self._raw_asset_materialization_fn = asset_materialization_fn
+        self._monitored_assets = monitored_assets
 
         super(MultiAssetSensorDefinition, self).__init__(
             name=check_valid_name(name),
@@ -1227,6 +1228,11 @@ def __call__(self, *args, **kwargs) -> AssetMaterializationFunctionReturn:
             context.update_cursor_after_evaluation()
         return result
 
+    @property
+    def monitored_assets(self) -> Union[Sequence[AssetKey], AssetSelection]:
+        """Union[Sequence[AssetKey], AssetSelection]: The assets monitored by this sensor."""
+        return self._monitored_assets
+
     @property
     def sensor_type(self) -> SensorType:
         return SensorType.MULTI_ASSET
@@ -28,8 +28,8 @@
 from dagster._core.definitions.asset_layer import AssetLayer
 from dagster._core.definitions.executor_definition import (
     ExecutorDefinition,
-    execute_in_process_executor,
     in_process_executor,
+    is_execute_in_process_executor,
 )
 from dagster._core.definitions.input import InputDefinition
 from dagster._core.definitions.output import OutputDefinition
@@ -128,7 +128,7 @@ def define_execution_field(executor_defs: Sequence[ExecutorDefinition], descript
         )
 
     # If we are using the execute_in_process executor, then ignore all executor config.
-    if len(executor_defs) == 1 and executor_defs[0] == execute_in_process_executor:
+    if len(executor_defs) == 1 and is_execute_in_process_executor(executor_defs[0]):
         return Field(Permissive(), is_required=False, default_value={}, description=description)
 
     return Field(selector, description=description)
@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from datetime import datetime
 from enum import Enum
@@ -541,6 +542,34 @@ def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence
                 break
         return result
 
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        """Returns the number of partitions that start within the given time window.
+
+        Equivalent to counting the keys returned by `get_partition_keys_in_time_window`, without
+        formatting the keys. Hourly partitions, and daily partitions in UTC, are counted without
+        iterating over them.
+        """
+        start_timestamp = time_window.start.timestamp()
+        end_timestamp = time_window.end.timestamp()
+        if end_timestamp <= start_timestamp:
+            return 0
+
+        if self.timezone == "UTC" and (self.is_basic_hourly or self.is_basic_daily):
+            # partition boundaries are multiples of the partition length since the epoch, so the
+            # partitions that start in [start, end) can be counted arithmetically
+            seconds_per_partition = 3600 if self.is_basic_hourly else 86400
+            return math.ceil(end_timestamp / seconds_per_partition) - math.ceil(
+                start_timestamp / seconds_per_partition
+            )
+
+        num_partitions = 0
+        for partition_time_window in self._iterate_time_windows(time_window.start):
+            if partition_time_window.start < time_window.end:
+                num_partitions += 1
+            else:
+                break
+        return num_partitions
+
     def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
         start_partition_key = self.get_partition_key_for_timestamp(time_window.start.timestamp())
         end_partition_key = self.get_partition_key_for_timestamp(
@@ -762,6 +791,24 @@ def partitions_subset_class(self) -> Type["PartitionsSubset"]:
     def empty_subset(self) -> "PartitionsSubset":
         return self.partitions_subset_class.empty_subset(self)
 
+    def subset_with_all_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        # a single time window covers all partitions, so the partition keys don't need to be
+        # computed
+        first_window = self.get_first_partition_window(current_time=current_time)
+        last_window = self.get_last_partition_window(current_time=current_time)
+        if first_window is None or last_window is None:
+            return self.empty_subset()
+
+        return TimeWindowPartitionsSubset(
+            self,
+            num_partitions=None,
+            included_time_windows=[TimeWindow(first_window.start, last_window.end)],
+        )
+
     def is_valid_partition_key(self, partition_key: str) -> bool:
         try:
             partition_time = pendulum.instance(
@@ -1392,6 +1439,18 @@ def inner(
     return inner
 
 
+def _merge_time_windows(time_windows: Sequence[TimeWindow]) -> List[TimeWindow]:
+    """Sorts the given time windows and merges the ones that overlap or are adjacent."""
+    merged_windows: List[TimeWindow] = []
+    for time_window in sorted(time_windows):
+        if merged_windows and time_window.start <= merged_windows[-1].end:
+            if time_window.end > merged_windows[-1].end:
+                merged_windows[-1] = TimeWindow(merged_windows[-1].start, time_window.end)
+        elif time_window.start < time_window.end:
+            merged_windows.append(time_window)
+    return merged_windows
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1481,12 +1540,88 @@ def num_partitions(self) -> int:
                 self._num_partitions = len(self._included_partition_keys)
             else:
                 self._num_partitions = sum(
-                    len(self._partitions_def.get_partition_keys_in_time_window(time_window))
+                    self._partitions_def.get_num_partitions_in_time_window(time_window)
                     for time_window in self.included_time_windows
                 )
 
         return self._num_partitions
 
+    def _has_same_time_windows_as(self, other: PartitionsSubset) -> bool:
+        """Whether the time windows of this subset can be combined with the time windows of the
+        other subset, which is cheaper than combining their partition keys.
+        """
+        if not isinstance(other, TimeWindowPartitionsSubset):
+            return False
+
+        # subsets of a few partition keys are cheaper to combine as sets of keys
+        return self._partitions_def == other.partitions_def and (
+            self._included_time_windows is not None or other._included_time_windows is not None  # noqa: SLF001
+        )
+
+    def __or__(self, other: PartitionsSubset) -> "TimeWindowPartitionsSubset":
+        if self is other or not self._has_same_time_windows_as(other):
+            return cast(TimeWindowPartitionsSubset, super().__or__(other))
+
+        other = cast(TimeWindowPartitionsSubset, other)
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=None,
+            included_time_windows=_merge_time_windows(
+                [*self.included_time_windows, *other.included_time_windows]
+            ),
+        )
+
+    def __and__(self, other: PartitionsSubset) -> "TimeWindowPartitionsSubset":
+        if self is other or not self._has_same_time_windows_as(other):
+            return cast(TimeWindowPartitionsSubset, super().__and__(other))
+
+        other = cast(TimeWindowPartitionsSubset, other)
+        time_windows = _merge_time_windows(self.included_time_windows)
+        other_time_windows = _merge_time_windows(other.included_time_windows)
+
+        result_windows: List[TimeWindow] = []
+        i = j = 0
+        while i < len(time_windows) and j < len(other_time_windows):
+            start = max(time_windows[i].start, other_time_windows[j].start)
+            end = min(time_windows[i].end, other_time_windows[j].end)
+            if start < end:
+                result_windows.append(TimeWindow(start, end))
+            if time_windows[i].end < other_time_windows[j].end:
+                i += 1
+            else:
+                j += 1
+
+        return TimeWindowPartitionsSubset(
+            self._partitions_def, num_partitions=None, included_time_windows=result_windows
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> "TimeWindowPartitionsSubset":
+        if self is other or not self._has_same_time_windows_as(other):
+            return cast(TimeWindowPartitionsSubset, super().__sub__(other))
+
+        other = cast(TimeWindowPartitionsSubset, other)
+        other_time_windows = _merge_time_windows(other.included_time_windows)
+
+        result_windows: List[TimeWindow] = []
+        j = 0
+        for time_window in _merge_time_windows(self.included_time_windows):
+            start = time_window.start
+            # skip the windows of the other subset that end before this window
+            while j < len(other_time_windows) and other_time_windows[j].end <= start:
+                j += 1
+            k = j
+            while k < len(other_time_windows) and other_time_windows[k].start < time_window.end:
+                if start < other_time_windows[k].start:
+                    result_windows.append(TimeWindow(start, other_time_windows[k].start))
+                start = max(start, other_time_windows[k].end)
+                k += 1
+            if start < time_window.end:
+                result_windows.append(TimeWindow(start, time_window.end))
+
+        return TimeWindowPartitionsSubset(
+            self._partitions_def, num_partitions=None, included_time_windows=result_windows
+        )
+
     def _get_partition_time_windows_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
@@ -1659,7 +1794,7 @@ def tuples_to_time_windows(tuples):
             # backwards compatibility
             time_windows = tuples_to_time_windows(loaded)
             num_partitions = sum(
-                len(partitions_def.get_partition_keys_in_time_window(time_window))
+                partitions_def.get_num_partitions_in_time_window(time_window)
                 for time_window in time_windows
             )
         elif isinstance(loaded, dict) and (
@@ -6,6 +6,7 @@
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
     Iterable,
     List,
@@ -76,6 +77,8 @@
 
 MAX_RUNS_CANCELED_PER_ITERATION = 50
 
+FAILED_RUN_EVENT_TYPES = [DagsterEventType.RUN_FAILURE, DagsterEventType.RUN_CANCELED]
+
 
 class AssetBackfillStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
@@ -128,29 +131,90 @@ def __new__(cls, asset_key: AssetKey, asset_backfill_status: Optional[AssetBackf
         )
 
 
-class AssetBackfillData(NamedTuple):
+class AssetBackfillData(
+    NamedTuple(
+        "_AssetBackfillData",
+        [
+            ("target_subset", AssetGraphSubset),
+            ("requested_runs_for_target_roots", bool),
+            ("latest_storage_id", Optional[int]),
+            ("materialized_subset", AssetGraphSubset),
+            ("requested_subset", AssetGraphSubset),
+            ("failed_and_downstream_subset", AssetGraphSubset),
+            ("backfill_start_time", datetime),
+            # storage id of the latest run failure or cancellation event that has been folded into
+            # failed_and_downstream_subset, so that each iteration only processes newly failed runs
+            ("latest_failed_run_event_storage_id", Optional[int]),
+        ],
+    )
+):
     """Has custom serialization instead of standard Dagster NamedTuple serialization because the
     asset graph is required to build the AssetGraphSubset objects.
     """
 
-    target_subset: AssetGraphSubset
-    requested_runs_for_target_roots: bool
-    latest_storage_id: Optional[int]
-    materialized_subset: AssetGraphSubset
-    requested_subset: AssetGraphSubset
-    failed_and_downstream_subset: AssetGraphSubset
-    backfill_start_time: datetime
+    def __new__(
+        cls,
+        target_subset: AssetGraphSubset,
+        requested_runs_for_target_roots: bool,
+        latest_storage_id: Optional[int],
+        materialized_subset: AssetGraphSubset,
+        requested_subset: AssetGraphSubset,
+        failed_and_downstream_subset: AssetGraphSubset,
+        backfill_start_time: datetime,
+        latest_failed_run_event_storage_id: Optional[int] = None,
+    ):
+        return super(AssetBackfillData, cls).__new__(
+            cls,
+            target_subset=check.inst_param(target_subset, "target_subset", AssetGraphSubset),
+            requested_runs_for_target_roots=check.bool_param(
+                requested_runs_for_target_roots, "requested_runs_for_target_roots"
+            ),
+            latest_storage_id=check.opt_int_param(latest_storage_id, "latest_storage_id"),
+            materialized_subset=check.inst_param(
+                materialized_subset, "materialized_subset", AssetGraphSubset
+            ),
+            requested_subset=check.inst_param(
+                requested_subset, "requested_subset", AssetGraphSubset
+            ),
+            failed_and_downstream_subset=check.inst_param(
+                failed_and_downstream_subset, "failed_and_downstream_subset", AssetGraphSubset
+            ),
+            backfill_start_time=check.inst_param(
+                backfill_start_time, "backfill_start_time", datetime
+            ),
+            latest_failed_run_event_storage_id=check.opt_int_param(
+                latest_failed_run_event_storage_id, "latest_failed_run_event_storage_id"
+            ),
+        )
+
+    def _get_serialized_target_subset(
+        self, dynamic_partitions_store: DynamicPartitionsStore
+    ) -> Mapping[str, Any]:
+        # The target subset never changes, so its serialization is kept around to avoid
+        # re-serializing it on every iteration. It is stored outside of the tuple so that it doesn't
+        # take part in equality.
+        serialized_target_subset = getattr(self, "_serialized_target_subset", None)
+        if serialized_target_subset is None:
+            serialized_target_subset = self.target_subset.to_storage_dict(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+            object.__setattr__(self, "_serialized_target_subset", serialized_target_subset)
+        return serialized_target_subset
+
+    def with_target_subset_of(self, other: "AssetBackfillData") -> "AssetBackfillData":
+        """Carries over the serialization of the target subset of another backfill with the same
+        target subset, typically the previous iteration of this backfill.
+        """
+        if other.target_subset is self.target_subset:
+            object.__setattr__(
+                self,
+                "_serialized_target_subset",
+                getattr(other, "_serialized_target_subset", None),
+            )
+        return self
 
     def replace_requested_subset(self, requested_subset: AssetGraphSubset) -> "AssetBackfillData":
-        return AssetBackfillData(
-            target_subset=self.target_subset,
-            latest_storage_id=self.latest_storage_id,
-            requested_runs_for_target_roots=self.requested_runs_for_target_roots,
-            materialized_subset=self.materialized_subset,
-            failed_and_downstream_subset=self.failed_and_downstream_subset,
-            requested_subset=requested_subset,
-            backfill_start_time=self.backfill_start_time,
-        )
+        return self._replace(requested_subset=requested_subset).with_target_subset_of(self)
 
     def is_complete(self) -> bool:
         """The asset backfill is complete when all runs to be requested have finished (success,
@@ -400,7 +464,7 @@ def from_serialized(
     ) -> "AssetBackfillData":
         storage_dict = json.loads(serialized)
 
-        return cls(
+        backfill_data = cls(
             target_subset=AssetGraphSubset.from_storage_dict(
                 storage_dict["serialized_target_subset"], asset_graph
             ),
@@ -416,7 +480,14 @@ def from_serialized(
             ),
             latest_storage_id=storage_dict["latest_storage_id"],
             backfill_start_time=utc_datetime_from_timestamp(backfill_start_timestamp),
+            latest_failed_run_event_storage_id=storage_dict.get(
+                "latest_failed_run_event_storage_id"
+            ),
         )
+        object.__setattr__(
+            backfill_data, "_serialized_target_subset", storage_dict["serialized_target_subset"]
+        )
+        return backfill_data
 
     @classmethod
     def from_partitions_by_assets(
@@ -540,10 +611,11 @@ def from_asset_partitions(
     def serialize(self, dynamic_partitions_store: DynamicPartitionsStore) -> str:
         storage_dict = {
             "requested_runs_for_target_roots": self.requested_runs_for_target_roots,
-            "serialized_target_subset": self.target_subset.to_storage_dict(
-                dynamic_partitions_store=dynamic_partitions_store
+            "serialized_target_subset": self._get_serialized_target_subset(
+                dynamic_partitions_store
             ),
             "latest_storage_id": self.latest_storage_id,
+            "latest_failed_run_event_storage_id": self.latest_failed_run_event_storage_id,
             "serialized_requested_subset": self.requested_subset.to_storage_dict(
                 dynamic_partitions_store=dynamic_partitions_store
             ),
@@ -888,7 +960,10 @@ def get_canceling_asset_backfill_iteration_data(
             " AssetGraphSubset"
         )
 
-    failed_and_downstream_subset = _get_failed_and_downstream_asset_partitions(
+    (
+        failed_and_downstream_subset,
+        latest_failed_run_event_storage_id,
+    ) = _get_failed_and_downstream_asset_partitions(
         backfill_id,
         asset_backfill_data,
         asset_graph,
@@ -903,7 +978,8 @@ def get_canceling_asset_backfill_iteration_data(
         failed_and_downstream_subset=failed_and_downstream_subset,
         requested_subset=asset_backfill_data.requested_subset,
         backfill_start_time=backfill_start_time,
-    )
+        latest_failed_run_event_storage_id=latest_failed_run_event_storage_id,
+    ).with_target_subset_of(asset_backfill_data)
 
     yield updated_backfill_data
 
@@ -1040,20 +1116,45 @@ def _get_failed_and_downstream_asset_partitions(
     asset_graph: ExternalAssetGraph,
     instance_queryer: CachingInstanceQueryer,
     backfill_start_time: datetime,
-) -> AssetGraphSubset:
-    failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
-        asset_graph.bfs_filter_asset_partitions(
-            instance_queryer,
-            lambda asset_partitions, _: any(
-                asset_partition in asset_backfill_data.target_subset
-                for asset_partition in asset_partitions
-            ),
-            _get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph),
-            evaluation_time=backfill_start_time,
-        ),
+) -> Tuple[AssetGraphSubset, Optional[int]]:
+    """Returns the failed and downstream subset of the backfill, along with the storage id of the
+    latest run failure or cancellation event that it accounts for.
+
+    Failed runs stay failed, so the failed and downstream subset only grows. Only runs that have
+    failed since the previous iteration are processed, and only their downstream asset partitions
+    that are not already known to be failed are traversed.
+    """
+    (
+        failed_asset_partitions,
+        latest_failed_run_event_storage_id,
+    ) = _get_failed_asset_partitions(
+        instance_queryer,
+        backfill_id,
         asset_graph,
+        after_storage_id=asset_backfill_data.latest_failed_run_event_storage_id,
+    )
+    newly_failed_asset_partitions = [
+        asset_partition
+        for asset_partition in failed_asset_partitions
+        if asset_partition not in asset_backfill_data.failed_and_downstream_subset
+    ]
+    if not newly_failed_asset_partitions:
+        return asset_backfill_data.failed_and_downstream_subset, latest_failed_run_event_storage_id
+
+    newly_failed_and_downstream_asset_partitions = asset_graph.bfs_filter_asset_partitions(
+        instance_queryer,
+        lambda asset_partitions, _: any(
+            asset_partition in asset_backfill_data.target_subset
+            for asset_partition in asset_partitions
+        ),
+        newly_failed_asset_partitions,
+        evaluation_time=backfill_start_time,
+    )
+    return (
+        asset_backfill_data.failed_and_downstream_subset
+        | newly_failed_and_downstream_asset_partitions,
+        latest_failed_run_event_storage_id,
     )
-    return failed_and_downstream_subset
 
 
 def execute_asset_backfill_iteration_inner(
@@ -1087,6 +1188,11 @@ def execute_asset_backfill_iteration_inner(
 
         updated_materialized_subset = AssetGraphSubset(asset_graph)
         failed_and_downstream_subset = AssetGraphSubset(asset_graph)
+        # no runs have been launched for the backfill yet, so any failed runs are found after the
+        # latest run failure or cancellation event
+        latest_failed_run_event_storage_id = _get_latest_failed_run_event_storage_id(
+            instance_queryer.instance
+        )
     else:
         target_parent_asset_keys = {
             parent
@@ -1109,10 +1215,15 @@ def execute_asset_backfill_iteration_inner(
         yield None
 
         updated_materialized_subset = None
-        for updated_materialized_subset in get_asset_backfill_iteration_materialized_partitions(
-            backfill_id, asset_backfill_data, asset_graph, instance_queryer
-        ):
-            yield None
+        if next_latest_storage_id == asset_backfill_data.latest_storage_id:
+            # no target asset has been materialized since the last iteration, so the materialized
+            # subset can't have changed
+            updated_materialized_subset = asset_backfill_data.materialized_subset
+        else:
+            for updated_materialized_subset in get_asset_backfill_iteration_materialized_partitions(
+                backfill_id, asset_backfill_data, asset_graph, instance_queryer
+            ):
+                yield None
 
         if not isinstance(updated_materialized_subset, AssetGraphSubset):
             check.failed(
@@ -1120,7 +1231,10 @@ def execute_asset_backfill_iteration_inner(
                 " AssetGraphSubset"
             )
 
-        failed_and_downstream_subset = _get_failed_and_downstream_asset_partitions(
+        (
+            failed_and_downstream_subset,
+            latest_failed_run_event_storage_id,
+        ) = _get_failed_and_downstream_asset_partitions(
             backfill_id, asset_backfill_data, asset_graph, instance_queryer, backfill_start_time
         )
 
@@ -1190,7 +1304,8 @@ def execute_asset_backfill_iteration_inner(
         failed_and_downstream_subset=failed_and_downstream_subset,
         requested_subset=asset_backfill_data.requested_subset | asset_partitions_to_request,
         backfill_start_time=backfill_start_time,
-    )
+        latest_failed_run_event_storage_id=latest_failed_run_event_storage_id,
+    ).with_target_subset_of(asset_backfill_data)
     yield AssetBackfillIterationResult(run_requests, updated_asset_backfill_data)
 
 
@@ -1250,25 +1365,75 @@ def should_backfill_atomic_asset_partitions_unit(
     return True
 
 
+def _get_latest_failed_run_event_storage_id(instance: DagsterInstance) -> Optional[int]:
+    """Returns the storage id of the latest run failure or cancellation event, or None if failed
+    runs can't be queried by event storage id.
+    """
+    if not instance.event_log_storage.supports_event_consumer_queries():
+        return None
+
+    storage_ids = [
+        record.storage_id
+        for event_type in FAILED_RUN_EVENT_TYPES
+        for record in instance.get_event_records(EventRecordsFilter(event_type=event_type), limit=1)
+    ]
+    return max(storage_ids, default=0)
+
+
 def _get_failed_asset_partitions(
-    instance_queryer: CachingInstanceQueryer, backfill_id: str, asset_graph: ExternalAssetGraph
-) -> Sequence[AssetKeyPartitionKey]:
+    instance_queryer: CachingInstanceQueryer,
+    backfill_id: str,
+    asset_graph: ExternalAssetGraph,
+    after_storage_id: Optional[int] = None,
+) -> Tuple[Sequence[AssetKeyPartitionKey], Optional[int]]:
     """Returns asset partitions that materializations were requested for as part of the backfill, but
-    will not be materialized.
+    will not be materialized, along with the storage id of the latest run failure or cancellation
+    event that was accounted for.
 
     Includes canceled asset partitions. Implementation assumes that successful runs won't have any
     failed partitions.
+
+    Args:
+        after_storage_id (Optional[int]): If provided, only runs with a run failure or cancellation
+            event after this storage id are considered. Otherwise, all failed and canceled runs of
+            the backfill are considered.
     """
-    runs = instance_queryer.instance.get_runs(
-        filters=RunsFilter(
-            tags={BACKFILL_ID_TAG: backfill_id},
-            statuses=[DagsterRunStatus.CANCELED, DagsterRunStatus.FAILURE],
+    instance = instance_queryer.instance
+    if after_storage_id is None:
+        # take the cursor before fetching runs, so that runs that fail while they are being
+        # processed are picked up again on the next iteration
+        latest_storage_id = _get_latest_failed_run_event_storage_id(instance)
+        run_records = instance.get_run_records(
+            filters=RunsFilter(
+                tags={BACKFILL_ID_TAG: backfill_id},
+                statuses=[DagsterRunStatus.CANCELED, DagsterRunStatus.FAILURE],
+            ),
+        )
+    else:
+        event_records = [
+            record
+            for event_type in FAILED_RUN_EVENT_TYPES
+            for record in instance.get_event_records(
+                EventRecordsFilter(event_type=event_type, after_cursor=after_storage_id),
+                ascending=True,
+            )
+        ]
+        latest_storage_id = max(
+            (record.storage_id for record in event_records), default=after_storage_id
+        )
+        run_ids = list({record.run_id for record in event_records})
+        run_records = (
+            instance.get_run_records(
+                filters=RunsFilter(run_ids=run_ids, tags={BACKFILL_ID_TAG: backfill_id})
+            )
+            if run_ids
+            else []
         )
-    )
 
     result: List[AssetKeyPartitionKey] = []
 
-    for run in runs:
+    for run_record in run_records:
+        run = run_record.dagster_run
         if (
             run.tags.get(ASSET_PARTITION_RANGE_START_TAG)
             and run.tags.get(ASSET_PARTITION_RANGE_END_TAG)
@@ -1308,4 +1473,4 @@ def _get_failed_asset_partitions(
                 for asset_key in planned_asset_keys - completed_asset_keys
             )
 
-    return result
+    return result, latest_storage_id
@@ -1,6 +1,7 @@
+import queue
 import sys
 from contextlib import ExitStack
-from typing import Iterator, Optional, Sequence, cast
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._core.definitions import Failure, HookExecutionResult, RetryRequested
@@ -26,6 +27,7 @@
 )
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.storage.captured_log_manager import CapturedLogManager
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
@@ -143,6 +145,123 @@ def inner_plan_execution_iterator(
                 yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
 
 
+def concurrent_plan_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+) -> Iterator[DagsterEvent]:
+    """Executes the steps of the plan in the current process, running up to max_concurrent steps
+    at a time in a thread pool.
+
+    Steps run in worker threads, but their events are yielded and handled in the calling thread,
+    in the order that each step emitted them. Logs are captured for the whole process, so this
+    requires a CapturedLogManager.
+    """
+    check.inst_param(job_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    compute_log_manager = job_context.instance.compute_log_manager
+    check.inst(
+        compute_log_manager,
+        CapturedLogManager,
+        "Executing steps concurrently requires a CapturedLogManager",
+    )
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+
+    # events of the running steps, as (step key, event or None once the step is done, exc_info)
+    event_queue: "queue.Queue[Tuple[str, Optional[DagsterEvent], Optional[tuple]]]" = queue.Queue()
+    running_steps: Dict[str, Tuple[StepExecutionContext, List[DagsterEvent]]] = {}
+    # retries of steps whose previous attempt's thread has not finished yet, which are only
+    # submitted once it has, so that the events of the two attempts are not mixed up
+    pending_retries: Dict[str, StepExecutionContext] = {}
+
+    with execution_plan.start(
+        retry_mode=job_context.retry_mode,
+        max_concurrent=max_concurrent,
+        instance_concurrency_context=instance_concurrency_context,
+    ) as active_execution, InheritContextThreadPoolExecutor(
+        max_workers=max_concurrent, thread_name_prefix="dagster_step_worker"
+    ) as executor:
+        with ExitStack() as capture_stack:
+            file_key = create_compute_log_file_key()
+            log_key = compute_log_manager.build_log_key_for_run(job_context.run_id, file_key)
+            try:
+                log_context = capture_stack.enter_context(compute_log_manager.capture_logs(log_key))
+                yield DagsterEvent.capture_logs(job_context, step_keys, log_key, log_context)
+            except Exception:
+                yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
+
+            # steps are done once their thread is, which can be after their success or failure
+            # event was handled
+            while running_steps or not active_execution.is_complete:
+                for step in active_execution.get_steps_to_execute():
+                    step_context = cast(
+                        StepExecutionContext,
+                        job_context.for_step(step, active_execution.get_known_state()),
+                    )
+                    if step.key in running_steps:
+                        pending_retries[step.key] = step_context
+                        continue
+                    running_steps[step.key] = (step_context, [])
+                    executor.submit(_execute_step_in_thread, step_context, event_queue)
+
+                yield from active_execution.concurrency_event_iterator(job_context)
+
+                if not running_steps:
+                    active_execution.sleep_til_ready()
+                    continue
+
+                step_key, step_event, exc_info = event_queue.get()
+                if exc_info:
+                    raise exc_info[1].with_traceback(exc_info[2])
+
+                step_context, step_event_list = running_steps[step_key]
+                if step_event:
+                    step_event_list.append(step_event)
+                    yield step_event
+                    active_execution.handle_event(step_event)
+                    continue
+
+                del running_steps[step_key]
+                retry_step_context = pending_retries.pop(step_key, None)
+                if retry_step_context:
+                    running_steps[step_key] = (retry_step_context, [])
+                    executor.submit(_execute_step_in_thread, retry_step_context, event_queue)
+                else:
+                    active_execution.verify_complete(job_context, step_key)
+
+                # process skips from failures or uncovered inputs
+                for event in active_execution.plan_events_iterator(job_context):
+                    step_event_list.append(event)
+                    yield event
+
+                # pass a list of step events to hooks
+                for hook_event in _trigger_hook(step_context, step_event_list):
+                    yield hook_event
+
+            try:
+                capture_stack.close()
+            except Exception:
+                yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
+
+
+def _execute_step_in_thread(
+    step_context: StepExecutionContext,
+    event_queue: "queue.Queue[Tuple[str, Optional[DagsterEvent], Optional[tuple]]]",
+) -> None:
+    step_key = step_context.step.key
+    try:
+        for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+            check.inst(step_event, DagsterEvent)
+            event_queue.put((step_key, step_event, None))
+    except BaseException:
+        # e.g. errors re-raised when raise_on_error is set, surfaced in the calling thread
+        event_queue.put((step_key, None, sys.exc_info()))
+    else:
+        event_queue.put((step_key, None, None))
+
+
 def _handle_compute_log_setup_error(
     context: PlanExecutionContext, exc_info
 ) -> Iterator[DagsterEvent]:
@@ -1,4 +1,5 @@
 import os
+from functools import partial
 from typing import Iterator, Optional
 
 import dagster._check as check
@@ -6,10 +7,14 @@
 from dagster._core.execution.api import ExecuteRunWithPlanIterable
 from dagster._core.execution.context.system import PlanExecutionContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import PlanExecutionContextManager
-from dagster._core.execution.plan.execute_plan import inner_plan_execution_iterator
+from dagster._core.execution.plan.execute_plan import (
+    concurrent_plan_execution_iterator,
+    inner_plan_execution_iterator,
+)
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
+from dagster._core.storage.captured_log_manager import CapturedLogManager
 from dagster._utils.timing import format_duration, time_execution_scope
 
 from .base import Executor
@@ -19,24 +24,44 @@ def inprocess_execution_iterator(
     job_context: PlanExecutionContext,
     execution_plan: ExecutionPlan,
     instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+    max_concurrent: int = 1,
 ) -> Iterator[DagsterEvent]:
     with InstanceConcurrencyContext(
         job_context.instance, job_context.run_id
     ) as instance_concurrency_context:
-        yield from inner_plan_execution_iterator(
-            job_context, execution_plan, instance_concurrency_context
-        )
+        # steps can only run concurrently if their logs are captured for the whole process
+        if max_concurrent > 1 and isinstance(
+            job_context.instance.compute_log_manager, CapturedLogManager
+        ):
+            yield from concurrent_plan_execution_iterator(
+                job_context, execution_plan, max_concurrent, instance_concurrency_context
+            )
+        else:
+            yield from inner_plan_execution_iterator(
+                job_context, execution_plan, instance_concurrency_context
+            )
 
 
 class InProcessExecutor(Executor):
-    def __init__(self, retries: RetryMode, marker_to_close: Optional[str] = None):
+    def __init__(
+        self,
+        retries: RetryMode,
+        marker_to_close: Optional[str] = None,
+        max_concurrent: int = 1,
+    ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         self.marker_to_close = check.opt_str_param(marker_to_close, "marker_to_close")
+        self._max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        check.invariant(self._max_concurrent > 0, "max_concurrent must be positive")
 
     @property
     def retries(self) -> RetryMode:
         return self._retries
 
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
     def execute(
         self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
     ) -> Iterator[DagsterEvent]:
@@ -55,7 +80,9 @@ def execute(
             yield from iter(
                 ExecuteRunWithPlanIterable(
                     execution_plan=plan_context.execution_plan,
-                    iterator=inprocess_execution_iterator,
+                    iterator=partial(
+                        inprocess_execution_iterator, max_concurrent=self._max_concurrent
+                    ),
                     execution_context_manager=PlanExecutionContextManager(
                         job=plan_context.job,
                         retry_mode=plan_context.retry_mode,
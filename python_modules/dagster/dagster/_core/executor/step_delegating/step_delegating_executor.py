@@ -16,6 +16,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import step_subset_snapshot_from_execution_plan
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -91,19 +92,38 @@ def _pop_events(self, instance: DagsterInstance, run_id: str) -> Sequence[Dagste
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
+        step_keys_to_execute = [step.key for step in steps]
+        known_state = active_execution.get_known_state()
+        dagster_run = plan_context.dagster_run
+
+        # Send the plan of the steps along with the run, so that the step workers can skip
+        # fetching the run and rebuilding the plan from the job definition
+        execution_plan_snapshot = (
+            step_subset_snapshot_from_execution_plan(
+                plan_context.execution_plan,
+                step_keys_to_execute,
+                known_state,
+                dagster_run.job_snapshot_id,
+            )
+            if dagster_run.job_snapshot_id
+            else None
+        )
+
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
             plan_context=plan_context,
             steps=steps,
             execute_step_args=ExecuteStepArgs(
                 job_origin=plan_context.reconstructable_job.get_python_origin(),
-                run_id=plan_context.dagster_run.run_id,
-                step_keys_to_execute=[step.key for step in steps],
+                run_id=dagster_run.run_id,
+                step_keys_to_execute=step_keys_to_execute,
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
-                known_state=active_execution.get_known_state(),
+                known_state=known_state,
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
+                dagster_run=dagster_run,
+                execution_plan_snapshot=execution_plan_snapshot,
             ),
             dagster_run=plan_context.dagster_run,
         )
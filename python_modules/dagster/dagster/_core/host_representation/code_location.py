@@ -1,7 +1,10 @@
 import datetime
+import functools
+import os
 import sys
 import threading
 from abc import abstractmethod
+from collections import OrderedDict
 from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
 
@@ -10,7 +13,10 @@
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.notebook_data import sync_get_streaming_external_notebook_data_grpc
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_data_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
@@ -34,6 +40,8 @@
     ExternalRepository,
 )
 from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalJobRef,
     ExternalPartitionNamesData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
@@ -42,6 +50,7 @@
 from dagster._core.host_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.host_representation.origin import (
     CodeLocationOrigin,
+    ExternalRepositoryOrigin,
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
 )
@@ -72,6 +81,7 @@
         ExternalPartitionSetExecutionParamData,
         ExternalPartitionTagsData,
     )
+    from dagster._grpc.client import DagsterGrpcClient
 
 
 class CodeLocation(AbstractContextManager):
@@ -538,6 +548,47 @@ def get_dagster_library_versions(self) -> Mapping[str, str]:
         return DagsterLibraryRegistry.get()
 
 
+# Maximum number of job snapshots fetched from gRPC servers that are kept in memory
+DEFAULT_MAX_CACHED_JOB_SNAPSHOTS = 256
+
+
+def get_max_cached_job_snapshots() -> int:
+    return int(os.getenv("DAGSTER_MAX_CACHED_JOB_SNAPSHOTS", str(DEFAULT_MAX_CACHED_JOB_SNAPSHOTS)))
+
+
+_job_datas_lock = threading.Lock()
+_job_datas_by_snapshot_id: "OrderedDict[str, ExternalJobData]" = OrderedDict()
+
+
+def _get_external_job_data_from_grpc_server(
+    client: "DagsterGrpcClient",
+    repository_origin: ExternalRepositoryOrigin,
+    job_ref: ExternalJobRef,
+) -> ExternalJobData:
+    """Fetch the data of a job whose snapshot was deferred when its repository was loaded.
+
+    The fetched data is shared across code locations and reloads by snapshot id, so that unchanged
+    jobs are only fetched once per process. The least recently used snapshots are evicted.
+    """
+    with _job_datas_lock:
+        job_data = _job_datas_by_snapshot_id.get(job_ref.snapshot_id)
+        if job_data is not None:
+            _job_datas_by_snapshot_id.move_to_end(job_ref.snapshot_id)
+
+    if job_data is None:
+        job_data = sync_get_external_job_data_grpc(client, repository_origin, job_ref.name)
+        with _job_datas_lock:
+            _job_datas_by_snapshot_id[job_ref.snapshot_id] = job_data
+            while len(_job_datas_by_snapshot_id) > get_max_cached_job_snapshots():
+                _job_datas_by_snapshot_id.popitem(last=False)
+
+    # presets are not part of the job snapshot
+    if job_data.active_presets != job_ref.active_presets:
+        job_data = job_data._replace(active_presets=job_ref.active_presets)
+
+    return job_data
+
+
 class GrpcServerCodeLocation(CodeLocation):
     def __init__(
         self,
@@ -639,6 +690,11 @@ def __init__(
                         repository_name=repo_name,
                         code_location=self,
                     ),
+                    ref_to_data_fn=functools.partial(
+                        _get_external_job_data_from_grpc_server,
+                        self.client,
+                        ExternalRepositoryOrigin(self.origin, repo_name),
+                    ),
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
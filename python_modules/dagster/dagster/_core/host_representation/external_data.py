@@ -32,6 +32,7 @@
     StaticPartitionsDefinition,
     _check as check,
 )
+from dagster._check import CheckError
 from dagster._config.pythonic_config import (
     ConfigurableIOManagerFactoryResourceDefinition,
     ConfigurableResourceFactoryResourceDefinition,
@@ -46,6 +47,7 @@
     SourceAsset,
 )
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
+from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.asset_sensor_definition import AssetSensorDefinition
 from dagster._core.definitions.asset_spec import (
     SYSTEM_METADATA_KEY_ASSET_EXECUTION_TYPE,
@@ -72,6 +74,7 @@
     TextMetadataValue,
     normalize_metadata,
 )
+from dagster._core.definitions.multi_asset_sensor_definition import MultiAssetSensorDefinition
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
 from dagster._core.definitions.op_definition import OpDefinition
 from dagster._core.definitions.partition import DynamicPartitionsDefinition, ScheduleType
@@ -88,7 +91,7 @@
 )
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
 from dagster._core.definitions.utils import DEFAULT_GROUP_NAME
-from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.errors import DagsterError, DagsterInvalidDefinitionError
 from dagster._core.snap import JobSnapshot
 from dagster._core.snap.mode import ResourceDefSnap, build_resource_def_snap
 from dagster._core.storage.io_manager import IOManagerDefinition
@@ -1993,6 +1996,8 @@ def external_sensor_data_from_def(
     asset_keys = None
     if isinstance(sensor_def, AssetSensorDefinition):
         asset_keys = [sensor_def.asset_key]
+    elif isinstance(sensor_def, MultiAssetSensorDefinition):
+        asset_keys = _get_monitored_asset_keys(sensor_def, repository_def)
 
     if sensor_def.asset_selection is not None:
         target_dict = {
@@ -2025,6 +2030,24 @@ def external_sensor_data_from_def(
     )
 
 
+def _get_monitored_asset_keys(
+    sensor_def: MultiAssetSensorDefinition, repository_def: RepositoryDefinition
+) -> Optional[Sequence[AssetKey]]:
+    monitored_assets = sensor_def.monitored_assets
+    if not isinstance(monitored_assets, AssetSelection):
+        return list(monitored_assets)
+
+    try:
+        return sorted(
+            monitored_assets.resolve(repository_def.asset_graph),
+            key=lambda asset_key: asset_key.to_string(),
+        )
+    except (DagsterError, CheckError):
+        # the selection is only required to resolve when the sensor is evaluated, so don't fail
+        # loading the repository here, e.g. for selections of both source and regular assets
+        return None
+
+
 def active_presets_from_job_def(job_def: JobDefinition) -> Sequence[ExternalPresetData]:
     check.inst_param(job_def, "job_def", JobDefinition)
     if job_def.run_config is None:
@@ -261,6 +261,15 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "max_concurrent_ticks_per_code_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "When use_threads is set, the maximum number of sensor ticks that are"
+                    " evaluated in parallel against a single code location. Prevents a slow code"
+                    " location from occupying every worker thread."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -286,6 +295,15 @@ def schedules_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "max_concurrent_ticks_per_code_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "When use_threads is set, the maximum number of schedule ticks that are"
+                    " evaluated in parallel against a single code location. Prevents a slow code"
+                    " location from occupying every worker thread."
+                ),
+            ),
         },
         is_required=False,
     )
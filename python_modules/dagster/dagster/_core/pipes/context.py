@@ -1,7 +1,7 @@
 from contextlib import contextmanager
 from dataclasses import dataclass
 from queue import Queue
-from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Union
 
 from dagster_pipes import (
     DAGSTER_PIPES_CONTEXT_ENV_VAR,
@@ -141,6 +141,38 @@ def handle_message(self, message: PipesMessage) -> None:
         else:
             raise DagsterPipesExecutionError(f"Unknown message method: {message['method']}")
 
+    def handle_message_batch(self, messages: Sequence[PipesMessage]) -> None:
+        """Handle a batch of messages in order. Consecutive log messages of the same level are
+        coalesced into a single log entry.
+        """
+        pending_logs: List[PipesMessage] = []
+        for message in messages:
+            if (
+                message["method"] == "log"
+                and self._received_any_msg
+                and not self._received_closed_msg
+            ):
+                if pending_logs and _get_log_level(pending_logs[-1]) != _get_log_level(message):
+                    self._handle_logs(pending_logs)
+                    pending_logs = []
+                pending_logs.append(message)
+            else:
+                self._handle_logs(pending_logs)
+                pending_logs = []
+                self.handle_message(message)
+        self._handle_logs(pending_logs)
+
+    def _handle_logs(self, messages: Sequence[PipesMessage]) -> None:
+        if not messages:
+            return
+        self._handle_log(
+            "\n".join(
+                check.str_param(message["params"]["message"], "message")  # type: ignore
+                for message in messages
+            ),
+            _get_log_level(messages[0]),
+        )
+
     def _handle_closed(self) -> None:
         self._received_closed_msg = True
 
@@ -194,6 +226,10 @@ def _handle_log(self, message: str, level: str = "info") -> None:
         self._context.log.log(level, message)
 
 
+def _get_log_level(message: PipesMessage) -> str:
+    return (message["params"] or {}).get("level", "info")
+
+
 @experimental
 @dataclass
 class PipesSession:
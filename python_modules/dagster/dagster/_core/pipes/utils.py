@@ -6,17 +6,27 @@
 import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from queue import Empty, Queue
 from threading import Event, Thread
-from typing import Iterator, Optional, TextIO
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
 
 from dagster_pipes import (
+    PIPES_MESSAGE_FORMAT_JSON,
+    PIPES_MESSAGE_FORMAT_KEY,
+    PIPES_MESSAGE_FORMATS,
     PIPES_PROTOCOL_VERSION_FIELD,
     PipesContextData,
     PipesDefaultContextLoader,
     PipesDefaultMessageWriter,
     PipesExtras,
+    PipesMessage,
+    PipesMessageFormat,
     PipesParams,
+    decode_messages,
 )
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 
 from dagster import (
     OpExecutionContext,
@@ -32,11 +42,124 @@
     PipesSession,
     build_external_execution_context_data,
 )
-from dagster._utils import tail_file
 
 _CONTEXT_INJECTOR_FILENAME = "context"
 _MESSAGE_READER_FILENAME = "messages"
 
+# Maximum number of message batches that have been read from an external process but not yet
+# handled. Readers block while this many batches are queued.
+DEFAULT_MESSAGE_QUEUE_SIZE = 64
+# Maximum number of messages handed to the message handler at once.
+DEFAULT_MESSAGE_BATCH_SIZE = 1000
+
+
+def decode_message_lines(lines: Iterable[str]) -> List[PipesMessage]:
+    """Decodes messages written one JSON object per line, skipping empty lines."""
+    lines = [line for line in lines if line.strip()]
+    try:
+        # a single call to the JSON decoder is much faster than one call per line
+        return json.loads("[" + ",".join(lines) + "]")
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in lines]
+
+
+def _with_message_format(params: PipesParams, message_format: PipesMessageFormat) -> PipesParams:
+    # JSON is the default of all message writers, so the params are left untouched for writers
+    # from versions of dagster-pipes without support for message formats
+    if message_format == PIPES_MESSAGE_FORMAT_JSON:
+        return params
+    return {**params, PIPES_MESSAGE_FORMAT_KEY: message_format}
+
+
+class PipesMessageBatcher:
+    """Hands messages read from an external process to a message handler in batches, on a thread of
+    its own.
+
+    Readers put decoded messages on a bounded queue and block while it is full, so that the messages
+    held in memory stay bounded when an external process reports faster than its messages can be
+    handled. The handler thread takes all queued messages at once, up to the batch size.
+
+    If the handler raises, the remaining messages are still handed to it, and the first error is
+    re-raised from `stop` on the calling thread.
+
+    Args:
+        handler (PipesMessageHandler): The handler to hand batches of messages to.
+        max_queue_size (int): The maximum number of queued batches of messages.
+        max_batch_size (int): The maximum number of messages in a batch.
+    """
+
+    def __init__(
+        self,
+        handler: "PipesMessageHandler",
+        max_queue_size: int = DEFAULT_MESSAGE_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MESSAGE_BATCH_SIZE,
+    ):
+        self._handler = handler
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        # None is put on the queue to stop the handler thread
+        self._queue: Queue[Optional[Sequence[PipesMessage]]] = Queue(
+            maxsize=check.int_param(max_queue_size, "max_queue_size")
+        )
+        self._thread: Optional[Thread] = None
+        self._error: Optional[Exception] = None
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._handler_thread, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Waits for all queued messages to be handled and stops the handler thread. Raises the
+        first error raised by the message handler, if any.
+        """
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+    def put_messages(self, messages: Sequence[PipesMessage]) -> None:
+        for i in range(0, len(messages), self._max_batch_size):
+            self._queue.put(messages[i : i + self._max_batch_size])
+
+    def put_lines(self, lines: Iterable[str]) -> None:
+        self.put_messages(decode_message_lines(lines))
+
+    def _handler_thread(self) -> None:
+        is_stopped = False
+        while not is_stopped:
+            batch: List[PipesMessage] = []
+            messages = self._queue.get()
+            while True:
+                if messages is None:
+                    is_stopped = True
+                    break
+                batch.extend(messages)
+                if len(batch) >= self._max_batch_size:
+                    break
+                try:
+                    messages = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if batch:
+                # keep handling messages so that readers never block on a full queue
+                try:
+                    self._handler.handle_message_batch(batch)
+                except Exception as e:
+                    self._error = self._error or e
+
+
+class _PipesMessageFileWatchdog(PatternMatchingEventHandler):
+    def __init__(self, path: str, has_changes: Event):
+        self._has_changes = has_changes
+        super().__init__(patterns=[path])
+
+    def on_any_event(self, event) -> None:
+        self._has_changes.set()
+
 
 @experimental
 class PipesFileContextInjector(PipesContextInjector):
@@ -127,17 +250,36 @@ def no_messages_debug_text(self) -> str:
         return "Attempted to inject context directly, typically as an environment variable."
 
 
+# Number of seconds to wait for filesystem notifications of changes to the messages file before
+# checking it anyway.
+_FILE_CHANGES_TIMEOUT = 1
+# Without filesystem notifications, the messages file is polled at an interval that backs off from
+# the minimum to the maximum number of seconds for as long as no messages are written.
+_FILE_MIN_POLL_INTERVAL = 0.01
+_FILE_MAX_POLL_INTERVAL = 1
+_FILE_READ_SIZE = 1024 * 1024
+
+
 @experimental
 class PipesFileMessageReader(PipesMessageReader):
     """Message reader that reads messages by tailing a specified file.
 
+    The file is read whenever the filesystem notifies that it changed, and all messages written
+    since the last read are handled as a batch.
+
     Args:
         path (str): The path of the file to which messages will be written. The file will be deleted
             on close of the pipes session.
+        message_format (str): The format that the external process is requested to write messages
+            in, `"json"` (the default) for one JSON object per line or `"msgpack"` for
+            length-prefixed MessagePack frames, which are more compact and faster to decode.
     """
 
-    def __init__(self, path: str):
-        self._path = check.str_param(path, "path")
+    def __init__(self, path: str, message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON):
+        self._path = os.path.abspath(check.str_param(path, "path"))
+        self._message_format = check.literal_param(
+            message_format, "message_format", PIPES_MESSAGE_FORMATS
+        )
 
     @contextmanager
     def read_messages(
@@ -155,25 +297,90 @@ def read_messages(
             pipes protocol messages.
         """
         is_task_complete = Event()
+        has_changes = Event()
+        batcher = PipesMessageBatcher(handler)
+        observer = None
         thread = None
         try:
             open(self._path, "w").close()  # create file
+            observer = self._start_observer(has_changes)
+            batcher.start()
             thread = Thread(
-                target=self._reader_thread, args=(handler, is_task_complete), daemon=True
+                target=self._reader_thread,
+                args=(
+                    open(self._path, "rb"),
+                    batcher,
+                    is_task_complete,
+                    has_changes,
+                    _FILE_CHANGES_TIMEOUT if observer else _FILE_MIN_POLL_INTERVAL,
+                    _FILE_CHANGES_TIMEOUT if observer else _FILE_MAX_POLL_INTERVAL,
+                ),
+                daemon=True,
             )
             thread.start()
-            yield {PipesDefaultMessageWriter.FILE_PATH_KEY: self._path}
+            yield _with_message_format(
+                {PipesDefaultMessageWriter.FILE_PATH_KEY: self._path}, self._message_format
+            )
         finally:
             is_task_complete.set()
+            has_changes.set()
             if os.path.exists(self._path):
                 os.remove(self._path)
             if thread:
                 thread.join()
+            if observer:
+                observer.stop()
+                observer.join()
+            # last, since it raises errors of the message handler
+            batcher.stop()
+
+    def _start_observer(self, has_changes: Event) -> Optional[BaseObserver]:
+        # fall back to polling the file if filesystem notifications are unavailable
+        try:
+            observer = Observer()
+            observer.schedule(
+                _PipesMessageFileWatchdog(self._path, has_changes),
+                os.path.dirname(self._path),
+                recursive=False,
+            )
+            observer.start()
+            return observer
+        except OSError:
+            return None
 
-    def _reader_thread(self, handler: "PipesMessageHandler", is_resource_complete: Event) -> None:
-        for line in tail_file(self._path, lambda: is_resource_complete.is_set()):
-            message = json.loads(line)
-            handler.handle_message(message)
+    def _reader_thread(
+        self,
+        file: IO[bytes],
+        batcher: PipesMessageBatcher,
+        is_resource_complete: Event,
+        has_changes: Event,
+        min_timeout: float,
+        max_timeout: float,
+    ) -> None:
+        # messages are decoded as bytes since the file may hold binary message frames
+        buffer = b""
+        timeout = min_timeout
+        with file:
+            while True:
+                # checked before reading so that messages written before completion are read
+                is_complete = is_resource_complete.is_set()
+                has_changes.clear()
+                data = file.read(_FILE_READ_SIZE)
+                if data:
+                    buffer += data
+                    messages, consumed = decode_messages(buffer)
+                    buffer = buffer[consumed:]
+                    batcher.put_messages(messages)
+                    timeout = min_timeout
+                elif is_complete:
+                    break
+                else:
+                    has_changes.wait(timeout)
+                    timeout = min(timeout * 2, max_timeout)
+
+        # a last JSON line may not be terminated by a newline
+        if buffer.strip():
+            batcher.put_messages(decode_messages(buffer + b"\n")[0])
 
     def no_messages_debug_text(self) -> str:
         return f"Attempted to read messages from file {self._path}."
@@ -181,7 +388,17 @@ def no_messages_debug_text(self) -> str:
 
 @experimental
 class PipesTempFileMessageReader(PipesMessageReader):
-    """Message reader that reads messages by tailing an automatically-generated temporary file."""
+    """Message reader that reads messages by tailing an automatically-generated temporary file.
+
+    Args:
+        message_format (str): The format that the external process is requested to write messages
+            in, `"json"` (the default) or `"msgpack"`. See :py:class:`PipesFileMessageReader`.
+    """
+
+    def __init__(self, message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON):
+        self._message_format = check.literal_param(
+            message_format, "message_format", PIPES_MESSAGE_FORMATS
+        )
 
     @contextmanager
     def read_messages(
@@ -200,7 +417,7 @@ def read_messages(
         """
         with tempfile.TemporaryDirectory() as tempdir:
             with PipesFileMessageReader(
-                os.path.join(tempdir, _MESSAGE_READER_FILENAME)
+                os.path.join(tempdir, _MESSAGE_READER_FILENAME), self._message_format
             ).read_messages(handler) as params:
                 yield params
 
@@ -221,8 +438,10 @@ class PipesBlobStoreMessageReader(PipesMessageReader):
     The reader maintains a counter, starting at 1, that is synchronized with a message writer in
     some pipes process. The reader starts a thread that periodically attempts to read a chunk
     indexed by the counter at some location expected to be written by the pipes process. The chunk
-    should be a file with each line corresponding to a JSON-encoded pipes message. When a chunk is
-    successfully read, the messages are processed and the counter is incremented. The
+    should be a file with each line corresponding to a JSON-encoded pipes message, or a sequence of
+    length-prefixed MessagePack frames if `message_format` is `"msgpack"`. When a chunk is
+    successfully read, the messages are processed as a batch, the counter is incremented and the
+    next chunk is read right away. The
     :py:class:`PipesBlobStoreMessageWriter` on the other end is expected to similarly increment a
     counter (starting from 1) on successful write, keeping counters on the read and write end in
     sync.
@@ -235,6 +454,9 @@ class PipesBlobStoreMessageReader(PipesMessageReader):
         interval (float): interval in seconds between attempts to download a chunk
         stdout_reader (Optional[PipesBlobStoreStdioReader]): A reader for reading stdout logs.
         stderr_reader (Optional[PipesBlobStoreStdioReader]): A reader for reading stderr logs.
+        message_format (str): The format that the external process is requested to write message
+            chunks in, `"json"` (the default) or `"msgpack"`. Message writers from versions of
+            dagster-pipes without support for message formats always write JSON.
     """
 
     interval: float
@@ -247,9 +469,13 @@ def __init__(
         interval: float = 10,
         stdout_reader: Optional["PipesBlobStoreStdioReader"] = None,
         stderr_reader: Optional["PipesBlobStoreStdioReader"] = None,
+        message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON,
     ):
         self.interval = interval
         self.counter = 1
+        self.message_format = check.literal_param(
+            message_format, "message_format", PIPES_MESSAGE_FORMATS
+        )
         self.stdout_reader = (
             check.opt_inst_param(stdout_reader, "stdout_reader", PipesBlobStoreStdioReader)
             or PipesNoOpStdioReader()
@@ -274,12 +500,15 @@ def read_messages(
             PipesParams: A dict of parameters that specifies where a pipes process should write
             pipes protocol message chunks.
         """
-        with self.get_params() as params:
+        with self.get_params() as reader_params:
+            params = _with_message_format(reader_params, self.message_format)
             is_task_complete = Event()
+            batcher = PipesMessageBatcher(handler)
             messages_thread = None
             try:
+                batcher.start()
                 messages_thread = Thread(
-                    target=self._messages_thread, args=(handler, params, is_task_complete)
+                    target=self._messages_thread, args=(batcher, params, is_task_complete)
                 )
                 messages_thread.start()
                 self.stdout_reader.start(params, is_task_complete)
@@ -292,6 +521,8 @@ def read_messages(
                     messages_thread.join()
                 self.stdout_reader.stop()
                 self.stderr_reader.stop()
+                # last, since it raises errors of the message handler
+                batcher.stop()
 
     # In cases where we are forwarding logs, in some cases the logs might not be written out until
     # after the run completes. We wait for them to exist.
@@ -316,29 +547,37 @@ def get_params(self) -> Iterator[PipesParams]:
         """
 
     @abstractmethod
-    def download_messages_chunk(self, index: int, params: PipesParams) -> Optional[str]:
-        ...
+    def download_messages_chunk(
+        self, index: int, params: PipesParams
+    ) -> Optional[Union[str, bytes]]:
+        """Download the chunk with the given index, or return None if it doesn't exist yet.
+
+        Chunks of JSON lines may be returned as `str` or `bytes`. Chunks of MessagePack frames must
+        be returned as `bytes`.
+        """
 
     def _messages_thread(
         self,
-        handler: "PipesMessageHandler",
+        batcher: PipesMessageBatcher,
         params: PipesParams,
         is_task_complete: Event,
     ) -> None:
-        start_or_last_download = datetime.datetime.now()
         while True:
-            now = datetime.datetime.now()
-            if (now - start_or_last_download).seconds > self.interval or is_task_complete.is_set():
-                start_or_last_download = now
-                chunk = self.download_messages_chunk(self.counter, params)
-                if chunk:
-                    for line in chunk.split("\n"):
-                        message = json.loads(line)
-                        handler.handle_message(message)
-                    self.counter += 1
-                elif is_task_complete.is_set():
-                    break
-            time.sleep(1)
+            # checked before downloading so that chunks written before completion are read
+            is_complete = is_task_complete.is_set()
+            chunk = self.download_messages_chunk(self.counter, params)
+            # an empty chunk is treated like a missing one, so that it is downloaded again
+            if chunk:
+                if isinstance(chunk, bytes):
+                    # a last JSON line may not be terminated by a newline
+                    batcher.put_messages(decode_messages(chunk + b"\n")[0])
+                else:
+                    batcher.put_lines(chunk.split("\n"))
+                self.counter += 1
+            elif is_complete:
+                break
+            else:
+                is_task_complete.wait(self.interval)
 
 
 class PipesBlobStoreStdioReader(ABC):
@@ -386,19 +625,16 @@ def _reader_thread(
         params: PipesParams,
         is_task_complete: Event,
     ) -> None:
-        start_or_last_download = datetime.datetime.now()
         while True:
-            now = datetime.datetime.now()
-            if (
-                (now - start_or_last_download).seconds > self.interval or is_task_complete.is_set()
-            ) and self.is_ready(params):
-                start_or_last_download = now
-                chunk = self.download_log_chunk(params)
-                if chunk:
-                    self.target_stream.write(chunk)
-                elif is_task_complete.is_set():
-                    break
-            time.sleep(self.interval)
+            # checked before downloading so that logs written before completion are read
+            is_complete = is_task_complete.is_set()
+            chunk = self.download_log_chunk(params) if self.is_ready(params) else None
+            if chunk:
+                self.target_stream.write(chunk)
+            elif is_complete:
+                break
+            # returns right away once the task is complete, to read any remaining logs
+            is_task_complete.wait(self.interval)
 
 
 class PipesNoOpStdioReader(PipesBlobStoreStdioReader):
@@ -315,3 +315,43 @@ def snapshot_from_execution_plan(
         executor_name=execution_plan.executor_name,
         repository_load_data=execution_plan.repository_load_data,
     )
+
+
+def step_subset_snapshot_from_execution_plan(
+    execution_plan: ExecutionPlan,
+    step_keys_to_execute: Sequence[str],
+    known_state: KnownExecutionState,
+    job_snapshot_id: str,
+) -> ExecutionPlanSnapshot:
+    """Snapshot the plan that executes the given steps of an execution plan, so that it can be
+    rebuilt with `ExecutionPlan.rebuild_from_snapshot` without the job definition.
+
+    Only the steps to execute and the steps they directly depend on are included.
+    """
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    check.inst_param(known_state, "known_state", KnownExecutionState)
+    check.str_param(job_snapshot_id, "job_snapshot_id")
+
+    step_keys = set(step_keys_to_execute)
+    for step_key in step_keys_to_execute:
+        step_keys.update(
+            execution_plan.get_executable_step_by_key(step_key).get_execution_dependency_keys()
+        )
+
+    return ExecutionPlanSnapshot(
+        steps=sorted(
+            [
+                _snapshot_from_execution_step(execution_plan.get_step_by_key(step_key))
+                for step_key in step_keys
+            ],
+            key=lambda es: es.key,
+        ),
+        artifacts_persisted=execution_plan.artifacts_persisted,
+        job_snapshot_id=job_snapshot_id,
+        step_keys_to_execute=step_keys_to_execute,
+        initial_known_state=known_state,
+        snapshot_version=CURRENT_SNAPSHOT_VERSION,
+        executor_name=execution_plan.executor_name,
+        repository_load_data=execution_plan.repository_load_data,
+    )
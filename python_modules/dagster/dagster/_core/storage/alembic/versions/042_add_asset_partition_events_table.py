@@ -0,0 +1,82 @@
+"""add asset_partition_events table
+
+Revision ID: 3b3c5b4ea4c6
+Revises: ec80dd91891a
+Create Date: 2023-09-12 10:21:09.512334
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "3b3c5b4ea4c6"
+down_revision = "ec80dd91891a"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "asset_partition_events"
+INDEX_NAME = "idx_asset_partition_events"
+
+# name of the data migration that backfills the table from the event log
+SECONDARY_INDEX_NAME = "asset_partition_events_table"
+
+
+def upgrade():
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("dagster_event_type", db.Text, nullable=False),
+            db.Column(
+                "last_event_id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                nullable=False,
+            ),
+            db.Column("last_event_timestamp", db.types.TIMESTAMP),
+            db.Column("last_run_id", db.String(255)),
+            db.Column("event_count", db.BigInteger, nullable=False),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+        # the table is only read once it has been backfilled from the event log, which happens
+        # after it is created
+        if has_table("secondary_indexes"):
+            op.execute(
+                db.text("DELETE FROM secondary_indexes WHERE name = :name").bindparams(
+                    name=SECONDARY_INDEX_NAME
+                )
+            )
+
+    if not has_index(TABLE_NAME, INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            TABLE_NAME,
+            ["asset_key", "dagster_event_type", "partition"],
+            unique=True,
+            mysql_length={"asset_key": 255, "dagster_event_type": 64, "partition": 255},
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        if has_index(TABLE_NAME, INDEX_NAME):
+            op.drop_index(INDEX_NAME, TABLE_NAME)
+
+        op.drop_table(TABLE_NAME)
+
+    if has_table("secondary_indexes"):
+        op.execute(
+            db.text("DELETE FROM secondary_indexes WHERE name = :name").bindparams(
+                name=SECONDARY_INDEX_NAME
+            )
+        )
@@ -1,9 +1,12 @@
+import itertools
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from typing import (
     Any,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -17,19 +20,23 @@
 
 import dagster._check as check
 from dagster._check import CheckError
-from dagster._core.definitions.metadata import RawMetadataValue
+from dagster._core.definitions.metadata import IntMetadataValue, RawMetadataValue
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
 )
+from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     TimeWindow,
     TimeWindowPartitionsDefinition,
+    has_one_dimension_time_window_partitioning,
 )
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.execution.context.input import InputContext
 from dagster._core.execution.context.output import OutputContext
 from dagster._core.storage.io_manager import IOManager
+from dagster._core.utils import InheritContextThreadPoolExecutor
 
 T = TypeVar("T")
 
@@ -47,6 +54,36 @@ class TableSlice(NamedTuple):
     partition_dimensions: Optional[Sequence[TablePartitionDimension]] = None
 
 
+class TableChunks(Generic[T]):
+    """The contents of a table as a lazy sequence of chunks, e.g. DataFrames of a bounded number
+    of rows, so that tables larger than memory can be written and read.
+
+    Return a ``TableChunks`` from an op or asset to write the chunks one after the other, and
+    annotate an input with ``TableChunks`` to read it chunk by chunk. The chunks of an input are
+    loaded as the default load type of the I/O manager.
+
+    Since a generator returned by an op is interpreted as a stream of events, wrap generators of
+    chunks in a ``TableChunks`` rather than returning them directly.
+
+    Examples:
+        .. code-block:: python
+
+            @asset
+            def my_table() -> TableChunks:
+                return TableChunks(pd.read_csv("my_table.csv", chunksize=100_000))
+
+            @asset
+            def my_table_count(my_table: TableChunks) -> int:
+                return sum(len(chunk) for chunk in my_table)
+    """
+
+    def __init__(self, chunks: Iterable[T]):
+        self._chunks = check.iterable_param(chunks, "chunks")
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._chunks)
+
+
 class DbTypeHandler(ABC, Generic[T]):
     @abstractmethod
     def handle_output(
@@ -58,6 +95,25 @@ def handle_output(
     def load_input(self, context: InputContext, table_slice: TableSlice, connection) -> T:
         """Loads the contents of the given table in the given schema."""
 
+    def handle_output_chunks(
+        self, context: OutputContext, table_slice: TableSlice, chunks: Iterator[T], connection
+    ) -> Optional[Mapping[str, RawMetadataValue]]:
+        """Appends each of the given chunks to the given table in the given schema, and returns the
+        metadata of the whole output rather than adding it to the context.
+
+        Handlers that support outputs of :py:class:`TableChunks` must implement this method.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support writing chunks.")
+
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection
+    ) -> Iterator[T]:
+        """Lazily loads the contents of the given table in the given schema, chunk by chunk.
+
+        Defaults to loading the whole table as a single chunk.
+        """
+        yield self.load_input(context, table_slice, connection)
+
     @property
     @abstractmethod
     def supported_types(self) -> Sequence[Type[object]]:
@@ -86,6 +142,53 @@ def connect(context: Union[OutputContext, InputContext], table_slice: TableSlice
         ...
 
 
+def _unwrap_row_count(row_count: object) -> object:
+    # metadata added through the context is normalized into metadata values
+    return row_count.value if isinstance(row_count, IntMetadataValue) else row_count
+
+
+class _PartitionOutputContext(OutputContext):
+    """The context of an output that is written partition by partition, narrowed to one of its
+    partitions. Metadata and events logged by a type handler are kept apart from those of the
+    other partitions, since the partitions may be written concurrently.
+    """
+
+    def __init__(self, context: OutputContext, partition_key: str):
+        # shares the state of the output's context, except for the logged metadata and events
+        self.__dict__.update(vars(context))
+        # the resources are owned and torn down by the output's context
+        self._resources_cm = None
+        self._events = []
+        self._user_events = []
+        self._user_generated_metadata = {}
+        self._asset_partition_key = partition_key
+
+    @property
+    def asset_partition_key(self) -> str:
+        return self._asset_partition_key
+
+    @property
+    def asset_partition_key_range(self) -> PartitionKeyRange:
+        return PartitionKeyRange(self._asset_partition_key, self._asset_partition_key)
+
+    @property
+    def asset_partition_keys(self) -> Sequence[str]:
+        return [self._asset_partition_key]
+
+    @property
+    def asset_partitions_time_window(self) -> TimeWindow:
+        partitions_def = self.asset_partitions_def
+        if not has_one_dimension_time_window_partitioning(partitions_def):
+            raise ValueError(
+                "Tried to get asset partitions for an output that correponds to a partitioned "
+                "asset that is not time-partitioned."
+            )
+
+        return cast(
+            Union[TimeWindowPartitionsDefinition, MultiPartitionsDefinition], partitions_def
+        ).time_window_for_partition_key(self._asset_partition_key)
+
+
 class DbIOManager(IOManager):
     def __init__(
         self,
@@ -96,6 +199,7 @@ def __init__(
         schema: Optional[str] = None,
         io_manager_name: Optional[str] = None,
         default_load_type: Optional[Type] = None,
+        max_concurrent_partition_writes: int = 1,
     ):
         self._handlers_by_type: Dict[Optional[Type], DbTypeHandler] = {}
         self._io_manager_name = io_manager_name or self.__class__.__name__
@@ -120,22 +224,25 @@ def __init__(
             self._default_load_type = type_handlers[0].supported_types[0]
         else:
             self._default_load_type = default_load_type
+        self._max_concurrent_partition_writes = check.int_param(
+            max_concurrent_partition_writes, "max_concurrent_partition_writes"
+        )
+        check.invariant(
+            self._max_concurrent_partition_writes > 0,
+            "max_concurrent_partition_writes must be positive",
+        )
 
     def handle_output(self, context: OutputContext, obj: object) -> None:
         table_slice = self._get_table_slice(context, context)
 
-        if obj is not None:
-            obj_type = type(obj)
-            self._check_supported_type(obj_type)
-
-            with self._db_client.connect(context, table_slice) as conn:
-                self._db_client.ensure_schema_exists(context, table_slice, conn)
-                self._db_client.delete_table_slice(context, table_slice, conn)
-
-                handler_metadata = (
-                    self._handlers_by_type[obj_type].handle_output(context, table_slice, obj, conn)
-                    or {}
-                )
+        if isinstance(obj, TableChunks):
+            handler_metadata = self._handle_output_chunks(context, table_slice, obj)
+        elif self._is_output_by_partition(context, obj):
+            handler_metadata = self._handle_output_by_partition(
+                context, table_slice, cast(Mapping[str, object], obj)
+            )
+        elif obj is not None:
+            handler_metadata = self._handle_output_obj(context, table_slice, obj)
         else:
             check.invariant(
                 context.dagster_type.is_nothing,
@@ -149,9 +256,123 @@ def handle_output(self, context: OutputContext, obj: object) -> None:
             {**handler_metadata, "Query": self._db_client.get_select_statement(table_slice)}
         )
 
+    def _handle_output_obj(
+        self,
+        context: OutputContext,
+        table_slice: TableSlice,
+        obj: object,
+        handler_context: Optional[OutputContext] = None,
+    ) -> Mapping[str, RawMetadataValue]:
+        obj_type = type(obj)
+        self._check_supported_type(obj_type)
+
+        with self._db_client.connect(context, table_slice) as conn:
+            self._db_client.ensure_schema_exists(context, table_slice, conn)
+            self._db_client.delete_table_slice(context, table_slice, conn)
+
+            return (
+                self._handlers_by_type[obj_type].handle_output(
+                    handler_context or context, table_slice, obj, conn
+                )
+                or {}
+            )
+
+    def _handle_output_chunks(
+        self, context: OutputContext, table_slice: TableSlice, chunks: TableChunks
+    ) -> Mapping[str, RawMetadataValue]:
+        # the handler is determined by the type of the first chunk, which is read before
+        # connecting so that a failure to produce the chunks leaves the table untouched
+        chunks_iter = iter(chunks)
+        first_chunk = next(chunks_iter, None)
+        if first_chunk is not None:
+            self._check_supported_type(type(first_chunk))
+
+        with self._db_client.connect(context, table_slice) as conn:
+            self._db_client.ensure_schema_exists(context, table_slice, conn)
+            self._db_client.delete_table_slice(context, table_slice, conn)
+
+            if first_chunk is None:
+                return {}
+
+            return (
+                self._handlers_by_type[type(first_chunk)].handle_output_chunks(
+                    context, table_slice, itertools.chain([first_chunk], chunks_iter), conn
+                )
+                or {}
+            )
+
+    def _is_output_by_partition(self, context: OutputContext, obj: object) -> bool:
+        """Whether the output is a mapping of the partitions of the output to their contents, which
+        are written separately.
+        """
+        return (
+            isinstance(obj, Mapping)
+            and type(obj) not in self._handlers_by_type
+            and context.has_asset_key
+            and context.has_asset_partitions
+            and len(context.asset_partition_keys) > 1
+        )
+
+    def _handle_output_by_partition(
+        self, context: OutputContext, table_slice: TableSlice, obj: Mapping[str, object]
+    ) -> Mapping[str, RawMetadataValue]:
+        partition_keys = context.asset_partition_keys
+        check.invariant(
+            set(obj.keys()) == set(partition_keys),
+            f"{self._io_manager_name} expected the output of '{context.asset_key}' to contain the"
+            f" partitions {sorted(partition_keys)}, but got {sorted(obj.keys())}.",
+        )
+
+        def _write_partition(partition_key: str) -> Mapping[str, RawMetadataValue]:
+            value = obj[partition_key]
+            partition_table_slice = table_slice._replace(
+                partition_dimensions=self._get_partition_dimensions(
+                    context,
+                    context.asset_partitions_def,
+                    (context.metadata or {}).get("partition_expr"),
+                    partition_key,
+                )
+            )
+            if isinstance(value, TableChunks):
+                return self._handle_output_chunks(context, partition_table_slice, value)
+            elif value is None:
+                # an empty partition only clears the previous contents of the partition
+                return self._handle_output_chunks(context, partition_table_slice, TableChunks([]))
+            else:
+                partition_context = _PartitionOutputContext(context, partition_key)
+                handler_metadata = self._handle_output_obj(
+                    context, partition_table_slice, value, handler_context=partition_context
+                )
+                for event in partition_context.get_logged_events():
+                    context.log_event(event)
+                return {**partition_context.consume_logged_metadata(), **handler_metadata}
+
+        # the first partition is written on its own, so that the schema and the table are created
+        # before the remaining partitions are written concurrently
+        first_partition_key, *other_partition_keys = partition_keys
+        partition_metadata = [_write_partition(first_partition_key)]
+        with InheritContextThreadPoolExecutor(
+            max_workers=self._max_concurrent_partition_writes,
+            thread_name_prefix="db_io_manager_partition_writer",
+        ) as executor:
+            partition_metadata.extend(executor.map(_write_partition, other_partition_keys))
+
+        metadata: Dict[str, RawMetadataValue] = {}
+        for partition_metadatum in partition_metadata:
+            metadata.update(partition_metadatum)
+        # empty partitions have no metadata
+        row_counts = [
+            _unwrap_row_count(partition_metadatum.get("row_count"))
+            for partition_metadatum in partition_metadata
+            if partition_metadatum
+        ]
+        if row_counts and all(isinstance(row_count, int) for row_count in row_counts):
+            metadata["row_count"] = sum(cast(List[int], row_counts))
+        return metadata
+
     def load_input(self, context: InputContext) -> object:
         obj_type = context.dagster_type.typing_type
-        if obj_type is Any and self._default_load_type is not None:
+        if (obj_type is Any or obj_type is TableChunks) and self._default_load_type is not None:
             load_type = self._default_load_type
         else:
             load_type = obj_type
@@ -160,9 +381,22 @@ def load_input(self, context: InputContext) -> object:
 
         table_slice = self._get_table_slice(context, cast(OutputContext, context.upstream_output))
 
+        if obj_type is TableChunks:
+            return TableChunks(self._load_input_chunks(context, table_slice, load_type))
+
         with self._db_client.connect(context, table_slice) as conn:
             return self._handlers_by_type[load_type].load_input(context, table_slice, conn)
 
+    def _load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, load_type: Type
+    ) -> Iterator[object]:
+        # the connection is only opened once the chunks are iterated over, and stays open until
+        # all of them have been read
+        with self._db_client.connect(context, table_slice) as conn:
+            yield from self._handlers_by_type[load_type].load_input_chunks(
+                context, table_slice, conn
+            )
+
     def _get_table_slice(
         self, context: Union[OutputContext, InputContext], output_context: OutputContext
     ) -> TableSlice:
@@ -198,32 +432,12 @@ def _get_table_slice(
                     )
 
                 if isinstance(context.asset_partitions_def, MultiPartitionsDefinition):
-                    multi_partition_key_mapping = cast(
-                        MultiPartitionKey, context.asset_partition_key
-                    ).keys_by_dimension
-                    for part in context.asset_partitions_def.partitions_defs:
-                        partition_key = multi_partition_key_mapping[part.name]
-                        if isinstance(part.partitions_def, TimeWindowPartitionsDefinition):
-                            partitions = part.partitions_def.time_window_for_partition_key(
-                                partition_key
-                            )
-                        else:
-                            partitions = [partition_key]
-
-                        partition_expr_str = cast(Mapping[str, str], partition_expr).get(part.name)
-                        if partition_expr is None:
-                            raise ValueError(
-                                f"Asset '{context.asset_key}' has partition {part.name}, but the"
-                                f" 'partition_expr' metadata does not contain a {part.name} entry,"
-                                " so we don't know what column to filter it on. Specify which"
-                                " column of the database contains data for the"
-                                f" {part.name} partition."
-                            )
-                        partition_dimensions.append(
-                            TablePartitionDimension(
-                                partition_expr=cast(str, partition_expr_str), partitions=partitions
-                            )
-                        )
+                    partition_dimensions = self._get_partition_dimensions(
+                        context,
+                        context.asset_partitions_def,
+                        partition_expr,
+                        context.asset_partition_key,
+                    )
                 elif isinstance(context.asset_partitions_def, TimeWindowPartitionsDefinition):
                     partition_dimensions.append(
                         TablePartitionDimension(
@@ -266,6 +480,55 @@ def _get_table_slice(
             columns=(context.metadata or {}).get("columns"),
         )
 
+    @staticmethod
+    def _get_partition_dimensions(
+        context: Union[OutputContext, InputContext],
+        partitions_def: PartitionsDefinition,
+        partition_expr: object,
+        partition_key: str,
+    ) -> List[TablePartitionDimension]:
+        """The partition dimensions of a single partition of the asset of the context."""
+        if isinstance(partitions_def, MultiPartitionsDefinition):
+            if not isinstance(partition_key, MultiPartitionKey):
+                partition_key = partitions_def.get_partition_key_from_str(partition_key)
+            multi_partition_key_mapping = partition_key.keys_by_dimension
+            partition_dimensions = []
+            for part in partitions_def.partitions_defs:
+                dimension_key = multi_partition_key_mapping[part.name]
+                if isinstance(part.partitions_def, TimeWindowPartitionsDefinition):
+                    partitions = part.partitions_def.time_window_for_partition_key(dimension_key)
+                else:
+                    partitions = [dimension_key]
+
+                partition_expr_str = cast(Mapping[str, str], partition_expr).get(part.name)
+                if partition_expr is None:
+                    raise ValueError(
+                        f"Asset '{context.asset_key}' has partition {part.name}, but the"
+                        f" 'partition_expr' metadata does not contain a {part.name} entry,"
+                        " so we don't know what column to filter it on. Specify which"
+                        " column of the database contains data for the"
+                        f" {part.name} partition."
+                    )
+                partition_dimensions.append(
+                    TablePartitionDimension(
+                        partition_expr=cast(str, partition_expr_str), partitions=partitions
+                    )
+                )
+            return partition_dimensions
+        elif isinstance(partitions_def, TimeWindowPartitionsDefinition):
+            return [
+                TablePartitionDimension(
+                    partition_expr=cast(str, partition_expr),
+                    partitions=partitions_def.time_window_for_partition_key(partition_key),
+                )
+            ]
+        else:
+            return [
+                TablePartitionDimension(
+                    partition_expr=cast(str, partition_expr), partitions=[partition_key]
+                )
+            ]
+
     def _check_supported_type(self, obj_type):
         if obj_type not in self._handlers_by_type:
             msg = (
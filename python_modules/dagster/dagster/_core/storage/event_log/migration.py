@@ -11,11 +11,16 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+# builds the asset partition events summary table from the event log
+ASSET_PARTITION_EVENTS_TABLE = "asset_partition_events_table"
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITION_EVENTS_TABLE: lambda: migrate_asset_partition_events,
+}
 
 
 def migrate_event_log_data(instance=None):
@@ -161,6 +166,43 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_partition_events(event_log_storage, print_fn=None):
+    """Utility method to build the asset partition events summary table from the data in existing
+    event log records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.definitions.events import AssetKey
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import AssetKeyTable, AssetPartitionEventsTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if not event_log_storage.has_table(AssetPartitionEventsTable.name):
+        if print_fn:
+            print_fn(
+                "The asset_partition_events table does not exist, run `dagster instance migrate`"
+                " to create it."
+            )
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying asset keys.")
+        asset_keys = [
+            AssetKey.from_db_string(row[0])
+            for row in conn.execute(db_select([AssetKeyTable.c.asset_key])).fetchall()
+        ]
+
+    if print_fn:
+        print_fn(f"Found {len(asset_keys)} assets to index.")
+        asset_keys = tqdm(asset_keys)
+
+    for asset_key in asset_keys:
+        if asset_key:
+            event_log_storage.rebuild_asset_partition_events(asset_key)
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
@@ -89,6 +89,31 @@
     db.Column("event_timestamp", db.types.TIMESTAMP),
 )
 
+# Summary of the asset events of each asset partition, by event type. It is maintained as events are
+# stored, so that the latest event of each partition can be found without aggregating over the
+# event_logs table.
+AssetPartitionEventsTable = db.Table(
+    "asset_partition_events",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    db.Column(
+        "last_event_id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        nullable=False,
+    ),
+    db.Column("last_event_timestamp", db.types.TIMESTAMP),
+    db.Column("last_run_id", db.String(255)),
+    db.Column("event_count", db.BigInteger, nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
 
 DynamicPartitionsTable = db.Table(
     "dynamic_partitions",
@@ -239,6 +264,14 @@
     ),
     mysql_length={"asset_key": 64, "dagster_event_type": 64, "partition": 64},
 )
+db.Index(
+    "idx_asset_partition_events",
+    AssetPartitionEventsTable.c.asset_key,
+    AssetPartitionEventsTable.c.dagster_event_type,
+    AssetPartitionEventsTable.c.partition,
+    mysql_length={"asset_key": 255, "dagster_event_type": 64, "partition": 255},
+    unique=True,
+)
 db.Index(
     "idx_dynamic_partitions",
     DynamicPartitionsTable.c.partitions_def_name,
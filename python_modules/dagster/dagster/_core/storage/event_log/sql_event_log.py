@@ -1,4 +1,5 @@
 import logging
+import time
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from datetime import datetime
@@ -81,11 +82,17 @@
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITION_EVENTS_TABLE,
+    EVENT_LOG_DATA_MIGRATIONS,
+)
 from .schema import (
     AssetCheckExecutionsTable,
     AssetEventTagsTable,
     AssetKeyTable,
+    AssetPartitionEventsTable,
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
@@ -98,6 +105,11 @@
 
 MAX_CONCURRENCY_SLOTS = 1000
 MIN_ASSET_ROWS = 25
+# Maximum number of rows read or written per statement when rebuilding asset partition summaries
+_ASSET_PARTITION_EVENTS_BATCH_SIZE = 500
+# Number of seconds for which the absence of the asset_partition_events table is cached, after which
+# it is checked again in case the table has been created by a migration in another process
+_ASSET_PARTITION_EVENTS_TABLE_CHECK_INTERVAL = 60
 
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
@@ -381,6 +393,167 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
                     ],
                 )
 
+    def has_asset_partition_events_table(self) -> bool:
+        # the table can be created by a migration while the storage is in use, so its absence is
+        # only cached for a while, whereas its existence is cached indefinitely
+        if getattr(self, "_has_asset_partition_events_table", False):
+            return True
+
+        checked_at = getattr(self, "_asset_partition_events_table_checked_at", None)
+        if (
+            checked_at is None
+            or time.monotonic() - checked_at >= _ASSET_PARTITION_EVENTS_TABLE_CHECK_INTERVAL
+        ):
+            self._has_asset_partition_events_table = self.has_table(AssetPartitionEventsTable.name)
+            self._asset_partition_events_table_checked_at = time.monotonic()
+        return self._has_asset_partition_events_table
+
+    def _can_read_asset_partition_events(self) -> bool:
+        # the summary table is read once it has been backfilled from the event log
+        return self.has_secondary_index(ASSET_PARTITION_EVENTS_TABLE)
+
+    def store_asset_partition_event(self, event: EventLogEntry, event_id: int) -> None:
+        """Update the summary of the events of the asset partition of the given event in the
+        asset_partition_events table.
+        """
+        check.inst_param(event, "event", EventLogEntry)
+        check.int_param(event_id, "event_id")
+
+        dagster_event = event.dagster_event
+        if not (dagster_event and dagster_event.asset_key and dagster_event.partition):
+            return
+
+        if not self.has_asset_partition_events_table():
+            # If the summary table does not exist, silently exit. Reads fall back to the event log
+            # until the table is created and backfilled by `dagster instance migrate`.
+            return
+
+        partition_filter = db.and_(
+            AssetPartitionEventsTable.c.asset_key == dagster_event.asset_key.to_string(),
+            AssetPartitionEventsTable.c.dagster_event_type == dagster_event.event_type_value,
+            AssetPartitionEventsTable.c.partition == dagster_event.partition,
+        )
+        # Postgres requires a datetime that is in UTC but has no timezone info set in order to be
+        # stored correctly
+        last_event_values = dict(
+            last_event_id=event_id,
+            last_event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            last_run_id=event.run_id,
+        )
+        increment_count_statement = (
+            AssetPartitionEventsTable.update()
+            .where(partition_filter)
+            .values(event_count=AssetPartitionEventsTable.c.event_count + 1)
+        )
+        # events of concurrent runs may be summarized out of order
+        update_last_event_statement = (
+            AssetPartitionEventsTable.update()
+            .where(db.and_(partition_filter, AssetPartitionEventsTable.c.last_event_id < event_id))
+            .values(**last_event_values)
+        )
+
+        with self.index_connection() as conn:
+            if conn.execute(increment_count_statement).rowcount == 0:
+                try:
+                    conn.execute(
+                        AssetPartitionEventsTable.insert().values(
+                            asset_key=dagster_event.asset_key.to_string(),
+                            dagster_event_type=dagster_event.event_type_value,
+                            partition=dagster_event.partition,
+                            event_count=1,
+                            **last_event_values,
+                        )
+                    )
+                    return
+                except db_exc.IntegrityError:
+                    # the row was inserted concurrently
+                    conn.execute(increment_count_statement)
+
+            conn.execute(update_last_event_statement)
+
+    def rebuild_asset_partition_events(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> None:
+        """Utility method to rebuild the asset_partition_events summary of an asset from the event
+        log, for the given partitions or for all of the partitions of the asset.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.opt_nullable_sequence_param(partitions, "partitions", of_type=str)
+
+        asset_key_str = asset_key.to_string()
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("last_event_id"),
+                    db.func.count(SqlEventLogStorageTable.c.id).label("event_count"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key_str,
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in ASSET_EVENTS]
+                    ),
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.dagster_event_type, SqlEventLogStorageTable.c.partition
+            )
+        )
+        delete_statement = AssetPartitionEventsTable.delete().where(
+            AssetPartitionEventsTable.c.asset_key == asset_key_str
+        )
+        if partitions is not None:
+            query = query.where(SqlEventLogStorageTable.c.partition.in_(partitions))
+            delete_statement = delete_statement.where(
+                AssetPartitionEventsTable.c.partition.in_(partitions)
+            )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details([asset_key]), [asset_key]
+        )
+
+        with self.index_connection() as conn:
+            summary_rows = db_fetch_mappings(conn, query)
+
+            last_events_by_id = {}
+            for chunk_start in range(0, len(summary_rows), _ASSET_PARTITION_EVENTS_BATCH_SIZE):
+                chunk = summary_rows[chunk_start : chunk_start + _ASSET_PARTITION_EVENTS_BATCH_SIZE]
+                for row in db_fetch_mappings(
+                    conn,
+                    db_select(
+                        [
+                            SqlEventLogStorageTable.c.id,
+                            SqlEventLogStorageTable.c.timestamp,
+                            SqlEventLogStorageTable.c.run_id,
+                        ]
+                    ).where(
+                        SqlEventLogStorageTable.c.id.in_([row["last_event_id"] for row in chunk])
+                    ),
+                ):
+                    last_events_by_id[row["id"]] = row
+
+            conn.execute(delete_statement)
+            values = [
+                dict(
+                    asset_key=asset_key_str,
+                    dagster_event_type=row["dagster_event_type"],
+                    partition=row["partition"],
+                    last_event_id=row["last_event_id"],
+                    last_event_timestamp=last_events_by_id[row["last_event_id"]]["timestamp"],
+                    last_run_id=last_events_by_id[row["last_event_id"]]["run_id"],
+                    event_count=row["event_count"],
+                )
+                for row in summary_rows
+            ]
+            for chunk_start in range(0, len(values), _ASSET_PARTITION_EVENTS_BATCH_SIZE):
+                conn.execute(
+                    AssetPartitionEventsTable.insert(),
+                    values[chunk_start : chunk_start + _ASSET_PARTITION_EVENTS_BATCH_SIZE],
+                )
+
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
 
@@ -410,6 +583,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags(event, event_id)
+            self.store_asset_partition_event(event, event_id)
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
@@ -638,6 +812,8 @@ def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False
 
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the asset_keys table."""
+        # the asset_partition_events table may have just been created by a schema migration
+        self._asset_partition_events_table_checked_at = None
         for migration_name, migration_fn in ASSET_DATA_MIGRATIONS.items():
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
@@ -666,6 +842,9 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("asset_partition_events"):
+                conn.execute(AssetPartitionEventsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -688,13 +867,56 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("asset_partition_events"):
+                conn.execute(AssetPartitionEventsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
+        asset_partitions_by_key = self._get_asset_partitions_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
+        self._rebuild_asset_partition_events_for_partitions(asset_partitions_by_key)
         self.free_concurrency_slots_for_run(run_id)
 
+    def _get_asset_partitions_for_run(self, run_id: str) -> Mapping[AssetKey, Sequence[str]]:
+        """The partitions of each asset that have events in the given run, whose summaries need to be
+        rebuilt when the events of the run are deleted.
+        """
+        if not self.has_asset_partition_events_table():
+            return {}
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.asset_key != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                )
+            )
+            .distinct()
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        asset_partitions_by_key: Dict[AssetKey, List[str]] = defaultdict(list)
+        for asset_key_str, partition in rows:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                asset_partitions_by_key[asset_key].append(partition)
+        return asset_partitions_by_key
+
+    def _rebuild_asset_partition_events_for_partitions(
+        self, asset_partitions_by_key: Mapping[AssetKey, Sequence[str]]
+    ) -> None:
+        for asset_key, partitions in asset_partitions_by_key.items():
+            for chunk_start in range(0, len(partitions), _ASSET_PARTITION_EVENTS_BATCH_SIZE):
+                self.rebuild_asset_partition_events(
+                    asset_key,
+                    partitions[chunk_start : chunk_start + _ASSET_PARTITION_EVENTS_BATCH_SIZE],
+                )
+
     def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         conn.execute(
@@ -1646,12 +1868,36 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
                 )
             )
 
+            if self.has_asset_partition_events_table():
+                conn.execute(
+                    AssetPartitionEventsTable.delete().where(
+                        AssetPartitionEventsTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialized_partitions(
         self,
         asset_key: AssetKey,
         before_cursor: Optional[int] = None,
         after_cursor: Optional[int] = None,
     ) -> Set[str]:
+        if before_cursor is None and self._can_read_asset_partition_events():
+            summary_query = db_select([AssetPartitionEventsTable.c.partition]).where(
+                db.and_(
+                    AssetPartitionEventsTable.c.asset_key == asset_key.to_string(),
+                    AssetPartitionEventsTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            # the latest materialization of a partition is after the cursor if any of its
+            # materializations are
+            if after_cursor:
+                summary_query = summary_query.where(
+                    AssetPartitionEventsTable.c.last_event_id > after_cursor
+                )
+            with self.index_connection() as conn:
+                return set([cast(str, row[0]) for row in conn.execute(summary_query).fetchall()])
+
         query = (
             db_select(
                 [
@@ -1691,6 +1937,41 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         check.sequence_param(asset_keys, "asset_keys", AssetKey)
 
+        if not after_cursor and self._can_read_asset_partition_events():
+            query = db_select(
+                [
+                    AssetPartitionEventsTable.c.asset_key,
+                    AssetPartitionEventsTable.c.partition,
+                    AssetPartitionEventsTable.c.event_count,
+                ]
+            ).where(
+                db.and_(
+                    AssetPartitionEventsTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    AssetPartitionEventsTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+        else:
+            query = self._materialization_count_by_partition_query(asset_keys, after_cursor)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for row in results:
+            asset_key = AssetKey.from_db_string(cast(Optional[str], row[0]))
+            if asset_key:
+                materialization_count_by_partition[asset_key][cast(str, row[1])] = cast(int, row[2])
+
+        return materialization_count_by_partition
+
+    def _materialization_count_by_partition_query(
+        self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int]
+    ) -> SqlAlchemyQuery:
         query = (
             db_select(
                 [
@@ -1718,18 +1999,7 @@ def get_materialization_count_by_partition(
         if after_cursor:
             query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
 
-        with self.index_connection() as conn:
-            results = conn.execute(query).fetchall()
-
-        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
-            asset_key: {} for asset_key in asset_keys
-        }
-        for row in results:
-            asset_key = AssetKey.from_db_string(cast(Optional[str], row[0]))
-            if asset_key:
-                materialization_count_by_partition[asset_key][cast(str, row[1])] = cast(int, row[2])
-
-        return materialization_count_by_partition
+        return query
 
     def _latest_event_ids_by_partition_subquery(
         self,
@@ -1742,6 +2012,32 @@ def _latest_event_ids_by_partition_subquery(
         """Subquery for locating the latest event ids by partition for a given asset key and set
         of event types.
         """
+        if before_cursor is None and self._can_read_asset_partition_events():
+            summary_query = db_select(
+                [
+                    AssetPartitionEventsTable.c.dagster_event_type,
+                    AssetPartitionEventsTable.c.partition,
+                    AssetPartitionEventsTable.c.last_event_id.label("id"),
+                ]
+            ).where(
+                db.and_(
+                    AssetPartitionEventsTable.c.asset_key == asset_key.to_string(),
+                    AssetPartitionEventsTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in event_types]
+                    ),
+                )
+            )
+            if asset_partitions is not None:
+                summary_query = summary_query.where(
+                    AssetPartitionEventsTable.c.partition.in_(asset_partitions)
+                )
+            # the latest event of a partition is after the cursor if any of its events are
+            if after_cursor is not None:
+                summary_query = summary_query.where(
+                    AssetPartitionEventsTable.c.last_event_id > after_cursor
+                )
+            return db_subquery(summary_query, "latest_event_ids_by_partition_subquery")
+
         query = db_select(
             [
                 SqlEventLogStorageTable.c.dagster_event_type,
@@ -89,7 +89,11 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
 
         self._obs = None
 
+        # cursors of the registered watch callbacks, keyed by run id
         self._watchers = defaultdict(dict)
+        # watchers are registered and removed on other threads than the watchdog's, which updates
+        # their cursors
+        self._watchers_lock = threading.Lock()
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
         # Used to ensure that each run ID attempts to initialize its DB the first time it connects,
@@ -99,6 +103,11 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        # Every asset and run status event is mirrored into the index shard and every cross-run
+        # query reads from it, so its engine is reused instead of being created per connection.
+        # Run shard engines are not cached since there is one shard per run.
+        self._index_engine: Optional[Engine] = None
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
@@ -205,8 +214,14 @@ def _connect(self, shard: str) -> Iterator[Connection]:
         with self._db_lock:
             check.str_param(shard, "shard")
 
-            conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
+            if shard == INDEX_SHARD_NAME:
+                if self._index_engine is None:
+                    self._index_engine = create_engine(
+                        self.conn_string_for_shard(shard), poolclass=NullPool
+                    )
+                engine = self._index_engine
+            else:
+                engine = create_engine(self.conn_string_for_shard(shard), poolclass=NullPool)
 
             if shard not in self._initialized_dbs:
                 self._initdb(engine)
@@ -215,7 +230,9 @@ def _connect(self, shard: str) -> Iterator[Connection]:
             with engine.connect() as conn:
                 with conn.begin():
                     yield conn
-            engine.dispose()
+
+            if engine is not self._index_engine:
+                engine.dispose()
 
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
@@ -259,6 +276,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags(event, event_id)
+            self.store_asset_partition_event(event, event_id)
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, None)
@@ -365,12 +383,14 @@ def supports_event_consumer_queries(self) -> bool:
         return False
 
     def delete_events(self, run_id: str) -> None:
+        asset_partitions_by_key = self._get_asset_partitions_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
         # delete the mirrored event in the cross-run index database
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
+        self._rebuild_asset_partition_events_for_partitions(asset_partitions_by_key)
 
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
@@ -409,23 +429,64 @@ def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) ->
         if not self._obs:
             self._obs = Observer()
             self._obs.start()
+            # a single watchdog dispatches changes to the run shards to the watchers of that run,
+            # instead of scheduling a handler per watcher on the whole directory
+            self._obs.schedule(SqliteEventLogStorageWatchdog(self), self._base_dir, recursive=True)
 
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        with self._watchers_lock:
+            self._watchers[run_id][callback] = cursor
 
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)  # type: ignore  # (possible none)
-            del self._watchers[run_id][handler]
+        with self._watchers_lock:
+            if run_id in self._watchers and handler in self._watchers[run_id]:
+                del self._watchers[run_id][handler]
+                if not self._watchers[run_id]:
+                    del self._watchers[run_id]
+
+    def on_modified(self, run_id: str) -> None:
+        callbacks_by_cursor = defaultdict(list)
+        with self._watchers_lock:
+            for callback, cursor in self._watchers.get(run_id, {}).items():
+                callbacks_by_cursor[cursor].append(callback)
+
+        # watchers of the same run converge on the same cursor, so the new records are usually
+        # fetched once per change to the run shard regardless of the number of watchers
+        for cursor, callbacks in callbacks_by_cursor.items():
+            connection = self.get_records_for_run(run_id, cursor)
+
+            for callback in callbacks:
+                if connection.cursor:
+                    # the watcher may have been removed since, in which case it is not re-added
+                    with self._watchers_lock:
+                        run_watchers = self._watchers.get(run_id, {})
+                        if callback in run_watchers:
+                            run_watchers[callback] = connection.cursor
+
+                for record in connection.records:
+                    status = None
+                    try:
+                        status = callback(
+                            record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(record.storage_id)),
+                        )
+                    except Exception:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.", run_id
+                        )
+
+                    if (
+                        status == DagsterRunStatus.SUCCESS
+                        or status == DagsterRunStatus.FAILURE
+                        or status == DagsterRunStatus.CANCELED
+                    ):
+                        self.end_watch(run_id, callback)
 
     def dispose(self) -> None:
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        if self._index_engine:
+            self._index_engine.dispose()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -442,43 +503,15 @@ def supports_global_concurrency_limits(self) -> bool:
 
 
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(
-        self,
-        event_log_storage: SqliteEventLogStorage,
-        run_id: str,
-        callback: EventHandlerFn,
-        cursor: Optional[str],
-        **kwargs: Any,
-    ):
+    def __init__(self, event_log_storage: SqliteEventLogStorage, **kwargs: Any):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", SqliteEventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._cb = check.callable_param(callback, "callback")
-        self._log_path = event_log_storage.path_for_shard(run_id)
-        self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
-
-    def _process_log(self) -> None:
-        connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
-        if connection.cursor:
-            self._cursor = connection.cursor
-        for record in connection.records:
-            status = None
-            try:
-                status = self._cb(
-                    record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
-                )
-            except Exception:
-                logging.exception("Exception in callback for event watch on run %s.", self._run_id)
-
-            if (
-                status == DagsterRunStatus.SUCCESS
-                or status == DagsterRunStatus.FAILURE
-                or status == DagsterRunStatus.CANCELED
-            ):
-                self._event_log_storage.end_watch(self._run_id, self._cb)
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[event_log_storage.path_for_shard("*")], **kwargs
+        )
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        run_id = os.path.splitext(os.path.basename(event.src_path))[0]
+        if run_id != INDEX_SHARD_NAME:
+            self._event_log_storage.on_modified(run_id)
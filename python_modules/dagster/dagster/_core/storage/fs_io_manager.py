@@ -1,6 +1,7 @@
+import importlib
 import os
 import pickle
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 from pydantic import Field
 
@@ -17,6 +18,13 @@
 from dagster._core.execution.context.init import InitResourceContext
 from dagster._core.execution.context.input import InputContext
 from dagster._core.execution.context.output import OutputContext
+from dagster._core.storage.fs_io_manager_formats import (
+    COMPRESSION_MODULES,
+    ObjectFileFormat,
+    dump_object,
+    get_object_file_formats,
+    load_object,
+)
 from dagster._core.storage.io_manager import IOManager, dagster_maintained_io_manager, io_manager
 from dagster._core.storage.upath_io_manager import UPathIOManager
 from dagster._utils import PICKLE_PROTOCOL, mkdir_p
@@ -122,6 +130,39 @@ def job():
     """
 
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+    serialization_format: str = Field(
+        default="pickle",
+        description=(
+            'Either "pickle", to store all values with pickle, or "auto", to store pandas'
+            " DataFrames in the format set by dataframe_format, NumPy arrays as .npy files and"
+            " other values with pickle protocol 5 and out-of-band buffers."
+        ),
+    )
+    dataframe_format: str = Field(
+        default="arrow",
+        description=(
+            'Either "arrow" or "parquet", the format to store pandas DataFrames with if'
+            ' serialization_format is "auto".'
+        ),
+    )
+    compression: Optional[str] = Field(
+        default=None,
+        description='Either "zstd" or "lz4", to compress stored files with.',
+    )
+    memory_map: bool = Field(
+        default=False,
+        description=(
+            "Whether to memory map local uncompressed files in the Arrow, .npy or pickle protocol 5"
+            " formats when loading them. Memory mapped NumPy arrays are read-only."
+        ),
+    )
+    max_partition_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of threads used to load or store multiple partitions of an asset"
+            " concurrently. Defaults to loading and storing partitions one at a time."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -129,7 +170,13 @@ def _is_dagster_maintained(cls) -> bool:
 
     def create_io_manager(self, context: InitResourceContext) -> "PickledObjectFilesystemIOManager":
         base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
-        return PickledObjectFilesystemIOManager(base_dir=base_dir)
+        return PickledObjectFilesystemIOManager(
+            base_dir=base_dir,
+            formats=get_object_file_formats(self.serialization_format, self.dataframe_format),
+            compression=self.compression,
+            memory_map=self.memory_map,
+            max_partition_workers=self.max_partition_workers,
+        )
 
 
 @dagster_maintained_io_manager
@@ -239,25 +286,55 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Is compatible with local and remote filesystems via `universal-pathlib` and `fsspec`.
     Learn more about how to use remote filesystems here: https://github.com/fsspec/universal_pathlib.
 
+    Values can also be stored in other formats, tried in order before falling back to pickle. The
+    format of a stored file is detected when loading it, so files can always be loaded regardless
+    of the formats that they were stored with.
+
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        formats (Optional[Sequence[ObjectFileFormat]]): formats to try storing values with before
+            falling back to pickle.
+        compression (Optional[str]): either "zstd" or "lz4", to compress stored files with.
+        memory_map (bool): whether formats may memory map local uncompressed files when loading
+            them.
+        max_partition_workers (Optional[int]): maximum number of threads used to load or store
+            multiple partitions concurrently.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(
+        self,
+        base_dir=None,
+        formats: Optional[Sequence[ObjectFileFormat]] = None,
+        compression: Optional[str] = None,
+        memory_map: bool = False,
+        max_partition_workers: Optional[int] = None,
+        **kwargs,
+    ):
         from upath import UPath
 
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-
-        super().__init__(base_path=UPath(base_dir, **kwargs))
+        self.formats = check.opt_sequence_param(formats, "formats", of_type=ObjectFileFormat)
+        self.compression = check.opt_str_param(compression, "compression")
+        if compression is not None:
+            check.invariant(
+                compression in COMPRESSION_MODULES,
+                f"compression must be one of {tuple(COMPRESSION_MODULES)}, got {compression}",
+            )
+            # fail early rather than when storing the first value if the library isn't installed
+            importlib.import_module(COMPRESSION_MODULES[compression])
+        self.memory_map = check.bool_param(memory_map, "memory_map")
+
+        super().__init__(
+            base_path=UPath(base_dir, **kwargs), max_partition_workers=max_partition_workers
+        )
 
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
         try:
-            with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+            dump_object(obj, path, self.formats, self.compression)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.job_def.executor_def
 
@@ -280,8 +357,7 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
             ) from e
 
     def load_from_path(self, context: InputContext, path: "UPath") -> Any:
-        with path.open("rb") as file:
-            return pickle.load(file)
+        return load_object(path, self.formats, self.memory_map)
 
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
@@ -0,0 +1,385 @@
+"""File formats used by the filesystem IO manager to store values of specific types.
+
+Each format writes files that start with its own magic bytes, so that the format of a stored file
+can be detected when loading it, regardless of the formats that the loading IO manager is configured
+to store values with. Files that don't start with the magic bytes of any known format are loaded
+with pickle, which keeps files written by earlier versions of the filesystem IO manager loadable.
+"""
+
+import io
+import mmap
+import os
+import pickle
+import struct
+import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._utils import PICKLE_PROTOCOL
+
+if TYPE_CHECKING:
+    from upath import UPath
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+LZ4_MAGIC = b"\x04\x22\x4d\x18"
+COMPRESSION_MAGICS = {"zstd": ZSTD_MAGIC, "lz4": LZ4_MAGIC}
+COMPRESSION_MODULES = {"zstd": "zstandard", "lz4": "lz4.frame"}
+
+# enough leading bytes to detect any of the formats below
+HEADER_SIZE = 8
+
+SERIALIZATION_FORMATS = ("pickle", "auto")
+DATAFRAME_FORMATS = ("arrow", "parquet")
+
+
+def get_local_path(path: "UPath") -> Optional[str]:
+    """Returns the path on the local filesystem for local paths, which can be memory mapped."""
+    protocol = getattr(path, "protocol", "")
+    if protocol == "":
+        return os.fspath(path)
+    if protocol in ("file", "local"):
+        return path.path
+    return None
+
+
+@contextmanager
+def open_for_write(path: "UPath", compression: Optional[str]) -> Iterator[BinaryIO]:
+    with path.open("wb") as file:
+        if compression is None:
+            yield file
+        elif compression == "zstd":
+            import zstandard
+
+            with zstandard.ZstdCompressor().stream_writer(file, closefd=False) as stream:
+                yield stream  # type: ignore
+        elif compression == "lz4":
+            import lz4.frame
+
+            with lz4.frame.LZ4FrameFile(file, mode="wb") as stream:
+                yield stream  # type: ignore
+        else:
+            check.failed(f"Unsupported compression {compression}")
+
+
+@contextmanager
+def open_for_read(path: "UPath", compression: Optional[str]) -> Iterator[BinaryIO]:
+    with path.open("rb") as file:
+        if compression is None:
+            yield file
+        elif compression == "zstd":
+            import zstandard
+
+            with io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(file, closefd=False)  # type: ignore
+            ) as stream:
+                yield stream  # type: ignore
+        elif compression == "lz4":
+            import lz4.frame
+
+            with lz4.frame.LZ4FrameFile(file, mode="rb") as stream:
+                yield stream  # type: ignore
+        else:
+            check.failed(f"Unsupported compression {compression}")
+
+
+class ObjectFileFormat(ABC):
+    """A format that the filesystem IO manager can store values of some types with.
+
+    Files in a format must start with its magic bytes, which must not be a prefix of a pickle
+    stream, or of the magic bytes of another format.
+    """
+
+    @property
+    @abstractmethod
+    def magic(self) -> bytes:
+        ...
+
+    @abstractmethod
+    def dump(self, obj: Any, path: "UPath", compression: Optional[str]) -> bool:
+        """Stores the value at the given path, returning False without writing anything if the
+        value can't be stored in this format.
+        """
+
+    @abstractmethod
+    def load(self, path: "UPath", compression: Optional[str], memory_map: bool) -> Any:
+        """Loads the value stored at the given path. If memory_map is True, the format may memory
+        map local uncompressed files instead of reading them.
+        """
+
+
+def _get_dataframe_table(obj: Any) -> Any:
+    # avoid importing pandas and pyarrow for values that can't be DataFrames
+    pd = sys.modules.get("pandas")
+    if pd is None or type(obj) is not pd.DataFrame:
+        return None
+    if not all(isinstance(column, str) for column in obj.columns):
+        return None
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    try:
+        return pa.Table.from_pandas(obj)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+
+class ArrowObjectFileFormat(ObjectFileFormat):
+    """Stores pandas DataFrames as Arrow IPC files, compressed by Arrow itself so that they can
+    still be memory mapped.
+    """
+
+    @property
+    def magic(self) -> bytes:
+        return b"ARROW1"
+
+    def dump(self, obj: Any, path: "UPath", compression: Optional[str]) -> bool:
+        table = _get_dataframe_table(obj)
+        if table is None:
+            return False
+
+        import pyarrow as pa
+
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with path.open("wb") as file:
+            with pa.ipc.new_file(file, table.schema, options=options) as writer:
+                writer.write_table(table)
+        return True
+
+    def load(self, path: "UPath", compression: Optional[str], memory_map: bool) -> Any:
+        import pyarrow as pa
+
+        local_path = get_local_path(path)
+        if memory_map and local_path is not None:
+            # the memory map is kept open by the buffers of the loaded table
+            return pa.ipc.open_file(pa.memory_map(local_path)).read_all().to_pandas()
+
+        with path.open("rb") as file:
+            return pa.ipc.open_file(file).read_all().to_pandas()
+
+
+class ParquetObjectFileFormat(ObjectFileFormat):
+    """Stores pandas DataFrames as Parquet files, compressed by Parquet itself."""
+
+    @property
+    def magic(self) -> bytes:
+        return b"PAR1"
+
+    def dump(self, obj: Any, path: "UPath", compression: Optional[str]) -> bool:
+        table = _get_dataframe_table(obj)
+        if table is None:
+            return False
+
+        import pyarrow.parquet as pq
+
+        with path.open("wb") as file:
+            if compression is None:
+                pq.write_table(table, file)
+            else:
+                pq.write_table(table, file, compression=compression)
+        return True
+
+    def load(self, path: "UPath", compression: Optional[str], memory_map: bool) -> Any:
+        import pyarrow.parquet as pq
+
+        local_path = get_local_path(path)
+        if local_path is not None:
+            return pq.read_table(local_path, memory_map=memory_map).to_pandas()
+
+        with path.open("rb") as file:
+            return pq.read_table(file).to_pandas()
+
+
+class NumpyObjectFileFormat(ObjectFileFormat):
+    """Stores NumPy arrays without Python objects as .npy files."""
+
+    @property
+    def magic(self) -> bytes:
+        return b"\x93NUMPY"
+
+    def dump(self, obj: Any, path: "UPath", compression: Optional[str]) -> bool:
+        np = sys.modules.get("numpy")
+        if np is None or type(obj) is not np.ndarray or obj.dtype.hasobject:
+            return False
+
+        with open_for_write(path, compression) as file:
+            np.lib.format.write_array(file, obj, allow_pickle=False)
+        return True
+
+    def load(self, path: "UPath", compression: Optional[str], memory_map: bool) -> Any:
+        import numpy as np
+
+        local_path = get_local_path(path)
+        if memory_map and compression is None and local_path is not None:
+            return np.load(local_path, mmap_mode="r", allow_pickle=False)
+
+        with open_for_read(path, compression) as file:
+            return np.lib.format.read_array(file, allow_pickle=False)
+
+
+class PickleObjectFileFormat(ObjectFileFormat):
+    """Stores any picklable value with pickle protocol 5. Buffers that support out-of-band
+    pickling, like the data of NumPy arrays, are written after the pickle stream without being
+    copied into it, and can be memory mapped when loading.
+
+    Values without such buffers are stored as plain pickle files.
+    """
+
+    PROTOCOL = 5
+    # pickle length, buffer count
+    HEADER = struct.Struct("<QI")
+    BUFFER_LENGTH = struct.Struct("<Q")
+    ALIGNMENT = 64
+
+    @property
+    def magic(self) -> bytes:
+        return b"\x93DGPKL5"
+
+    def _padding(self, offset: int) -> int:
+        return -offset % self.ALIGNMENT
+
+    def dump(self, obj: Any, path: "UPath", compression: Optional[str]) -> bool:
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(obj, protocol=self.PROTOCOL, buffer_callback=buffers.append)
+
+        with open_for_write(path, compression) as file:
+            if not buffers:
+                file.write(data)
+                return True
+
+            raw_buffers = [buffer.raw() for buffer in buffers]
+            header = b"".join(
+                [
+                    self.magic,
+                    self.HEADER.pack(len(data), len(raw_buffers)),
+                    *(self.BUFFER_LENGTH.pack(raw.nbytes) for raw in raw_buffers),
+                ]
+            )
+            file.write(header)
+            file.write(data)
+            offset = len(header) + len(data)
+            for raw in raw_buffers:
+                padding = self._padding(offset)
+                file.write(b"\x00" * padding)
+                file.write(raw)
+                offset += padding + raw.nbytes
+        return True
+
+    def _read_header(self, file: BinaryIO) -> Tuple[int, List[int], int]:
+        file.read(len(self.magic))
+        data_length, buffer_count = self.HEADER.unpack(file.read(self.HEADER.size))
+        buffer_lengths = [
+            self.BUFFER_LENGTH.unpack(file.read(self.BUFFER_LENGTH.size))[0]
+            for _ in range(buffer_count)
+        ]
+        header_length = len(self.magic) + self.HEADER.size + self.BUFFER_LENGTH.size * buffer_count
+        return data_length, buffer_lengths, header_length
+
+    def load(self, path: "UPath", compression: Optional[str], memory_map: bool) -> Any:
+        local_path = get_local_path(path)
+        with open_for_read(path, compression) as file:
+            data_length, buffer_lengths, offset = self._read_header(file)
+            data = file.read(data_length)
+            offset += data_length
+
+            buffers: List[Any] = []
+            if memory_map and compression is None and local_path is not None:
+                with open(local_path, "rb") as local_file:
+                    mapped = memoryview(mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_READ))
+                for length in buffer_lengths:
+                    offset += self._padding(offset)
+                    buffers.append(mapped[offset : offset + length])
+                    offset += length
+            else:
+                for length in buffer_lengths:
+                    padding = self._padding(offset)
+                    file.read(padding)
+                    buffer = bytearray(length)
+                    file.readinto(buffer)  # type: ignore
+                    buffers.append(buffer)
+                    offset += padding + length
+
+        return pickle.loads(data, buffers=buffers)
+
+
+BUILTIN_OBJECT_FILE_FORMATS: Sequence[ObjectFileFormat] = [
+    ArrowObjectFileFormat(),
+    ParquetObjectFileFormat(),
+    NumpyObjectFileFormat(),
+    PickleObjectFileFormat(),
+]
+
+
+def get_object_file_formats(
+    serialization_format: str, dataframe_format: str = "arrow"
+) -> Sequence[ObjectFileFormat]:
+    """Returns the formats to store values with for the given filesystem IO manager settings, in
+    the order they should be tried. An empty sequence means that values are stored with plain
+    pickle files.
+    """
+    check.invariant(
+        serialization_format in SERIALIZATION_FORMATS,
+        f"serialization_format must be one of {SERIALIZATION_FORMATS}, got"
+        f" {serialization_format}",
+    )
+    check.invariant(
+        dataframe_format in DATAFRAME_FORMATS,
+        f"dataframe_format must be one of {DATAFRAME_FORMATS}, got {dataframe_format}",
+    )
+    if serialization_format == "pickle":
+        return []
+
+    dataframe_file_format = (
+        ArrowObjectFileFormat() if dataframe_format == "arrow" else ParquetObjectFileFormat()
+    )
+    return [dataframe_file_format, NumpyObjectFileFormat(), PickleObjectFileFormat()]
+
+
+def dump_object(
+    obj: Any,
+    path: "UPath",
+    formats: Sequence[ObjectFileFormat],
+    compression: Optional[str],
+) -> None:
+    for file_format in formats:
+        if file_format.dump(obj, path, compression):
+            return
+
+    with open_for_write(path, compression) as file:
+        pickle.dump(obj, file, PICKLE_PROTOCOL)
+
+
+def load_object(path: "UPath", formats: Sequence[ObjectFileFormat], memory_map: bool) -> Any:
+    formats = [*formats, *BUILTIN_OBJECT_FILE_FORMATS]
+
+    with path.open("rb") as file:
+        header = file.read(HEADER_SIZE)
+        compression = next(
+            (
+                compression
+                for compression, magic in COMPRESSION_MAGICS.items()
+                if header.startswith(magic)
+            ),
+            None,
+        )
+        # plain pickle files, including all files written by earlier versions
+        if compression is None and not any(
+            header.startswith(file_format.magic) for file_format in formats
+        ):
+            file.seek(0)
+            return pickle.load(file)
+
+    if compression is not None:
+        with open_for_read(path, compression) as stream:
+            header = stream.read(HEADER_SIZE)
+
+    for file_format in formats:
+        if header.startswith(file_format.magic):
+            return file_format.load(path, compression, memory_map)
+
+    with open_for_read(path, compression) as stream:
+        return pickle.load(stream)
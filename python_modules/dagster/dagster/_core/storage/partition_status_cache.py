@@ -1,5 +1,7 @@
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, cast
 
 from dagster import (
     AssetKey,
@@ -20,7 +22,10 @@
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import (
+    TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+)
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
 from dagster._core.storage.tags import (
@@ -149,7 +154,9 @@ def deserialize_materialized_partition_subsets(
         if not self.serialized_materialized_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        return _deserialize_partitions_subset(
+            self, partitions_def, self.serialized_materialized_partition_subset
+        )
 
     def deserialize_failed_partition_subsets(
         self, partitions_def: PartitionsDefinition
@@ -157,7 +164,9 @@ def deserialize_failed_partition_subsets(
         if not self.serialized_failed_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+        return _deserialize_partitions_subset(
+            self, partitions_def, self.serialized_failed_partition_subset
+        )
 
     def deserialize_in_progress_partition_subsets(
         self, partitions_def: PartitionsDefinition
@@ -165,7 +174,97 @@ def deserialize_in_progress_partition_subsets(
         if not self.serialized_in_progress_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+        return _deserialize_partitions_subset(
+            self, partitions_def, self.serialized_in_progress_partition_subset
+        )
+
+
+# Maximum number of asset status cache values whose partition subsets are kept deserialized in
+# memory.
+_MAX_DESERIALIZED_CACHE_VALUES = 256
+
+_deserialized_subsets_lock = threading.Lock()
+_deserialized_subsets_by_cache_value: "OrderedDict[Tuple[Optional[str], int], Tuple[AssetStatusCacheValue, Dict[str, PartitionsSubset]]]" = OrderedDict()
+
+
+def _deserialize_partitions_subset(
+    cache_value: AssetStatusCacheValue,
+    partitions_def: PartitionsDefinition,
+    serialized_subset: str,
+) -> PartitionsSubset:
+    """Deserializes one of the partition subsets of the given cache value.
+
+    The subsets of large partitions definitions are expensive to deserialize, and the same cache
+    value is read many times, e.g. by the webserver and the asset daemon, until new events for the
+    asset are stored. So the deserialized subsets of the recently read cache values are kept in
+    memory. The latest storage id of a cache value identifies it in practice, but the whole value is
+    compared to tell apart the values of different instances.
+    """
+    key = (cache_value.partitions_def_id, cache_value.latest_storage_id)
+    with _deserialized_subsets_lock:
+        entry = _deserialized_subsets_by_cache_value.get(key)
+        if entry is not None and entry[0] == cache_value:
+            _deserialized_subsets_by_cache_value.move_to_end(key)
+            subsets_by_serialized_subset = entry[1]
+            if serialized_subset in subsets_by_serialized_subset:
+                return subsets_by_serialized_subset[serialized_subset]
+        else:
+            subsets_by_serialized_subset = {}
+            _deserialized_subsets_by_cache_value[key] = (cache_value, subsets_by_serialized_subset)
+            while len(_deserialized_subsets_by_cache_value) > _MAX_DESERIALIZED_CACHE_VALUES:
+                _deserialized_subsets_by_cache_value.popitem(last=False)
+
+    subset = partitions_def.deserialize_subset(serialized_subset)
+    with _deserialized_subsets_lock:
+        subsets_by_serialized_subset[serialized_subset] = subset
+    return subset
+
+
+def _build_cache_value(
+    latest_storage_id: int,
+    partitions_def_id: str,
+    materialized_subset: PartitionsSubset,
+    failed_subset: PartitionsSubset,
+    in_progress_subset: PartitionsSubset,
+    earliest_in_progress_materialization_event_id: Optional[int],
+) -> AssetStatusCacheValue:
+    """Builds a cache value from the given partition subsets, and keeps the time window subsets in
+    memory so that reading the new cache value doesn't deserialize them again.
+    """
+    serialized_subsets = [
+        (materialized_subset.serialize(), materialized_subset),
+        (failed_subset.serialize(), failed_subset),
+        (in_progress_subset.serialize(), in_progress_subset),
+    ]
+    cache_value = AssetStatusCacheValue(
+        latest_storage_id=latest_storage_id,
+        partitions_def_id=partitions_def_id,
+        serialized_materialized_partition_subset=serialized_subsets[0][0],
+        serialized_failed_partition_subset=serialized_subsets[1][0],
+        serialized_in_progress_partition_subset=serialized_subsets[2][0],
+        earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+    )
+
+    subsets_by_serialized_subset = {}
+    for serialized_subset, subset in serialized_subsets:
+        # other subsets are cheap to deserialize, or may be represented differently once
+        # deserialized, e.g. with multi-partition keys instead of strings
+        if isinstance(subset, TimeWindowPartitionsSubset):
+            # the same representation as a deserialized subset, whose keys are sorted
+            subsets_by_serialized_subset[serialized_subset] = TimeWindowPartitionsSubset(
+                cast(TimeWindowPartitionsDefinition, subset.partitions_def),
+                num_partitions=subset.num_partitions,
+                included_time_windows=subset.included_time_windows,
+            )
+
+    with _deserialized_subsets_lock:
+        key = (cache_value.partitions_def_id, cache_value.latest_storage_id)
+        _deserialized_subsets_by_cache_value[key] = (cache_value, subsets_by_serialized_subset)
+        _deserialized_subsets_by_cache_value.move_to_end(key)
+        while len(_deserialized_subsets_by_cache_value) > _MAX_DESERIALIZED_CACHE_VALUES:
+            _deserialized_subsets_by_cache_value.popitem(last=False)
+
+    return cache_value
 
 
 def get_materialized_multipartitions(
@@ -255,14 +354,14 @@ def _build_status_cache(
         instance, asset_key, partitions_def, dynamic_partitions_store
     )
 
-    return AssetStatusCacheValue(
+    return _build_cache_value(
         latest_storage_id=latest_storage_id,
         partitions_def_id=partitions_def.get_serializable_unique_identifier(
             dynamic_partitions_store=dynamic_partitions_store
         ),
-        serialized_materialized_partition_subset=serialized_materialized_partition_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        materialized_subset=serialized_materialized_partition_subset,
+        failed_subset=failed_subset,
+        in_progress_subset=in_progress_subset,
         earliest_in_progress_materialization_event_id=cursor,
     )
 
@@ -443,12 +542,8 @@ def _get_updated_status_cache(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
-    materialized_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(
-            stored_cache_value.serialized_materialized_partition_subset
-        )
-        if stored_cache_value and stored_cache_value.serialized_materialized_partition_subset
-        else partitions_def.empty_subset()
+    materialized_subset = stored_cache_value.deserialize_materialized_partition_subsets(
+        partitions_def
     )
     newly_materialized_partitions = set()
 
@@ -468,11 +563,7 @@ def _get_updated_status_cache(
         )
     )
 
-    failed_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
-        if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
-        else partitions_def.empty_subset()
-    )
+    failed_subset = stored_cache_value.deserialize_failed_partition_subsets(partitions_def)
 
     (
         failed_subset,
@@ -487,12 +578,12 @@ def _get_updated_status_cache(
         dynamic_partitions_store=dynamic_partitions_store,
     )
 
-    return AssetStatusCacheValue(
+    return _build_cache_value(
         latest_storage_id=latest_storage_id,
-        partitions_def_id=stored_cache_value.partitions_def_id,
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        partitions_def_id=check.not_none(stored_cache_value.partitions_def_id),
+        materialized_subset=materialized_subset,
+        failed_subset=failed_subset,
+        in_progress_subset=in_progress_subset,
         earliest_in_progress_materialization_event_id=new_cursor,
     )
 
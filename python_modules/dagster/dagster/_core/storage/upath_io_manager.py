@@ -15,6 +15,7 @@
     _check as check,
 )
 from dagster._core.storage.memoizable_io_manager import MemoizableIOManager
+from dagster._core.utils import InheritContextThreadPoolExecutor
 
 if TYPE_CHECKING:
     from upath import UPath
@@ -28,6 +29,9 @@ class UPathIOManager(MemoizableIOManager):
      - handles loading a single upstream partition
      - handles loading multiple upstream partitions (with respect to :py:class:`PartitionMapping`)
      - supports loading multiple partitions concurrently with async `load_from_path` method
+     - supports loading and storing multiple partitions concurrently in a bounded thread pool with
+       sync `load_from_path` and `dump_to_path` methods, by setting `max_partition_workers`
+     - handles storing a dict output keyed by partition key for an output with multiple partitions
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
@@ -35,15 +39,24 @@ class UPathIOManager(MemoizableIOManager):
     """
 
     extension: Optional[str] = None  # override in child class
+    # maximum number of threads used to load or store multiple partitions with sync
+    # `load_from_path` and `dump_to_path` methods. Override in child class or set per instance.
+    max_partition_workers: int = 1
 
     def __init__(
         self,
         base_path: Optional["UPath"] = None,
+        max_partition_workers: Optional[int] = None,
     ):
         from upath import UPath
 
         assert not self.extension or "." in self.extension
         self._base_path = base_path or UPath(".")
+        if max_partition_workers is not None:
+            self.max_partition_workers = check.int_param(
+                max_partition_workers, "max_partition_workers"
+            )
+        check.invariant(self.max_partition_workers >= 1, "max_partition_workers must be positive")
 
     @abstractmethod
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
@@ -310,6 +323,65 @@ def _load_partition_from_path(
             else:
                 raise e
 
+    def _load_partition_or_backcompat_from_path(
+        self, context: InputContext, path: "UPath", backcompat_path: Optional["UPath"]
+    ) -> Any:
+        try:
+            return self.load_from_path(context=context, path=path)
+        except FileNotFoundError:
+            if backcompat_path is None:
+                raise
+            return self.load_from_path(context=context, path=backcompat_path)
+
+    def _load_multiple_inputs_in_threads(
+        self,
+        context: InputContext,
+        paths: Mapping[str, "UPath"],
+        backcompat_paths: Mapping[str, "UPath"],
+    ) -> Dict[str, Any]:
+        """Loads multiple partitions with a sync `load_from_path` in a bounded thread pool.
+
+        Logging happens in the calling thread, and partitions that were not found are handled the
+        same way as when loading partitions sequentially.
+        """
+        allow_missing_partitions = (
+            context.metadata.get("allow_missing_partitions", False)
+            if context.metadata is not None
+            else False
+        )
+
+        with InheritContextThreadPoolExecutor(
+            max_workers=min(self.max_partition_workers, len(paths)),
+            thread_name_prefix="upath_io_manager_worker",
+        ) as executor:
+            futures = {}
+            for partition_key in context.asset_partition_keys:
+                path = paths[partition_key]
+                context.log.debug(self.get_loading_input_partition_log_message(path, partition_key))
+                futures[partition_key] = executor.submit(
+                    self._load_partition_or_backcompat_from_path,
+                    context,
+                    path,
+                    backcompat_paths.get(partition_key),
+                )
+
+            objs = {}
+            for partition_key, future in futures.items():
+                try:
+                    obj = future.result()
+                except FileNotFoundError:
+                    if not allow_missing_partitions:
+                        for pending_future in futures.values():
+                            pending_future.cancel()
+                        raise
+                    context.log.warning(self.get_missing_partition_log_message(partition_key))
+                    continue
+
+                if obj is not None:
+                    objs[partition_key] = obj
+
+            return objs
+
     def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
         # load multiple partitions
         paths = self._get_paths_for_partitions(context)  # paths for normal partitions
@@ -322,6 +394,9 @@ def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
         objs = {}
 
         if not inspect.iscoroutinefunction(self.load_from_path):
+            if self.max_partition_workers > 1:
+                return self._load_multiple_inputs_in_threads(context, paths, backcompat_paths)
+
             for partition_key in context.asset_partition_keys:
                 obj = self._load_partition_from_path(
                     context,
@@ -437,12 +512,16 @@ def handle_output(self, context: OutputContext, obj: Any):
         if context.has_asset_partitions:
             paths = self._get_paths_for_partitions(context)
 
+            if len(paths) > 1 and isinstance(obj, Mapping) and set(obj.keys()) == set(paths.keys()):
+                return self._handle_multiple_outputs(context, obj, paths)
+
             check.invariant(
                 len(paths) == 1,
                 f"The current IO manager {type(self)} does not support persisting an output"
-                " associated with multiple partitions. This error is likely occurring because a"
-                " backfill was launched using the 'single run' option. Instead, launch the"
-                " backfill with the 'multiple runs' option.",
+                " associated with multiple partitions, unless the output is a dict keyed by"
+                " partition key. This error is likely occurring because a backfill was launched"
+                " using the 'single run' option. Instead, launch the backfill with the 'multiple"
+                " runs' option.",
             )
 
             path = next(iter(paths.values()))
@@ -458,6 +537,39 @@ def handle_output(self, context: OutputContext, obj: Any):
 
         context.add_output_metadata(metadata)
 
+    def _handle_multiple_outputs(
+        self, context: OutputContext, objs: Mapping[str, Any], paths: Mapping[str, "UPath"]
+    ) -> None:
+        """Stores each value of a dict output keyed by partition key at the path for its partition,
+        in a bounded thread pool if `max_partition_workers` is greater than 1.
+        """
+        for partition_key, path in paths.items():
+            self.make_directory(path.parent)
+            context.log.debug(self.get_writing_output_log_message(path))
+
+        if self.max_partition_workers > 1:
+            with InheritContextThreadPoolExecutor(
+                max_workers=min(self.max_partition_workers, len(paths)),
+                thread_name_prefix="upath_io_manager_worker",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.dump_to_path, context=context, obj=objs[partition_key], path=path
+                    )
+                    for partition_key, path in paths.items()
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for partition_key, path in paths.items():
+                self.dump_to_path(context=context, obj=objs[partition_key], path=path)
+
+        metadata = {"path": MetadataValue.path(str(self._get_path_without_extension(context)))}
+        custom_metadata = self.get_metadata(context=context, obj=objs)
+        metadata.update(custom_metadata)  # type: ignore
+
+        context.add_output_metadata(metadata)
+
 
 def is_dict_type(type_obj) -> bool:
     if type_obj == dict:
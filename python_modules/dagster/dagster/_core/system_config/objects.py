@@ -17,7 +17,7 @@
 from dagster._core.definitions.configurable import ConfigurableDefinition
 from dagster._core.definitions.executor_definition import (
     ExecutorDefinition,
-    execute_in_process_executor,
+    is_execute_in_process_executor,
 )
 from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.resource_definition import ResourceDefinition
@@ -165,7 +165,7 @@ def build(
 
         # If using the `execute_in_process` executor, we ignore the execution config value, since it
         # may be pointing to the executor for the job rather than the `execute_in_process` executor.
-        if job_def.executor_def == execute_in_process_executor:
+        if is_execute_in_process_executor(job_def.executor_def):
             config_mapped_execution_configs: Optional[Mapping[str, Any]] = {}
         else:
             executor_config = config_value.get("execution", {})
@@ -1,9 +1,11 @@
 import logging
+import os
 import sys
 import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import as_completed
 from contextlib import ExitStack
 from itertools import count
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Set, TypeVar, Union
@@ -39,6 +41,7 @@
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.instance import DagsterInstance
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from .load_target import WorkspaceLoadTarget
@@ -441,6 +444,18 @@ def __exit__(self, exception_type, exception_value, traceback):
         pass
 
 
+DEFAULT_MAX_CONCURRENT_LOCATION_LOADS = 8
+
+
+def get_max_concurrent_location_loads() -> int:
+    return int(
+        os.getenv(
+            "DAGSTER_WORKSPACE_MAX_CONCURRENT_LOCATION_LOADS",
+            str(DEFAULT_MAX_CONCURRENT_LOCATION_LOADS),
+        )
+    )
+
+
 class WorkspaceProcessContext(IWorkspaceProcessContext):
     """Process-scoped object that tracks the state of a workspace.
 
@@ -450,6 +465,10 @@ class WorkspaceProcessContext(IWorkspaceProcessContext):
 
     To access a CodeLocation, you should create a `WorkspaceRequestContext`
     using `create_request_context`.
+
+    Code locations are loaded concurrently, by up to `max_concurrent_location_loads` threads.
+    When the workspace is refreshed or reloaded, each location replaces its previous entry as soon
+    as it is loaded.
     """
 
     def __init__(
@@ -460,11 +479,21 @@ def __init__(
         read_only: bool = False,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         code_server_log_level: str = "INFO",
+        max_concurrent_location_loads: Optional[int] = None,
     ):
         self._stack = ExitStack()
 
         check.opt_str_param(version, "version")
         check.bool_param(read_only, "read_only")
+        self._max_concurrent_location_loads = check.opt_int_param(
+            max_concurrent_location_loads,
+            "max_concurrent_location_loads",
+            default=get_max_concurrent_location_loads(),
+        )
+        check.invariant(
+            self._max_concurrent_location_loads > 0,
+            "max_concurrent_location_loads must be positive",
+        )
 
         self._instance = check.inst_param(instance, "instance", DagsterInstance)
         self._workspace_load_target = check.opt_inst_param(
@@ -502,12 +531,7 @@ def __init__(
             )
 
         self._location_entry_dict: Dict[str, CodeLocationEntry] = {}
-        self._update_workspace(
-            {
-                origin.location_name: self._load_location(origin, reload=False)
-                for origin in self._origins
-            }
-        )
+        self._load_workspace(reload=False)
 
     @property
     def workspace_load_target(self) -> Optional[WorkspaceLoadTarget]:
@@ -669,44 +693,73 @@ def shutdown_code_location(self, name: str) -> None:
             self._location_entry_dict[name].origin.shutdown_server()
 
     def refresh_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=False)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        self._load_workspace(reload=False)
 
     def reload_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=True)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        self._load_workspace(reload=True)
+
+    def _load_workspace(self, reload: bool) -> None:
+        origins = self._origins
+        location_names = [origin.location_name for origin in origins]
+
+        with self._lock:
+            removed_location_names = [
+                name for name in self._location_entry_dict if name not in location_names
+            ]
+        self._update_locations({name: None for name in removed_location_names})
+
+        # load the locations concurrently, so that the workspace takes as long to load as its
+        # slowest location rather than the sum of all of them
+        with InheritContextThreadPoolExecutor(
+            max_workers=self._max_concurrent_location_loads,
+            thread_name_prefix="workspace_location_loader",
+        ) as executor:
+            futures = [
+                executor.submit(self._load_location, origin, reload=reload) for origin in origins
+            ]
+            for future in as_completed(futures):
+                # _load_location captures load errors in the entry
+                entry = future.result()
+                self._update_locations({entry.origin.location_name: entry})
+
+        # keep the locations in the order of the workspace
+        with self._lock:
+            self._location_entry_dict = {
+                name: self._location_entry_dict[name]
+                for name in location_names
+                if name in self._location_entry_dict
+            }
 
-    def _update_workspace(self, new_locations: Dict[str, CodeLocationEntry]):
+    def _update_locations(self, new_entries: Mapping[str, Optional[CodeLocationEntry]]) -> None:
+        """Replace the entries of the given locations, or remove them if their new entry is None."""
         # minimize lock time by only holding while swapping data old to new
         with self._lock:
-            previous_events = self._watch_thread_shutdown_events
-            self._watch_thread_shutdown_events = {}
+            previous_events = []
+            previous_threads = []
+            previous_entries = []
+            for name, entry in new_entries.items():
+                if name in self._watch_thread_shutdown_events:
+                    previous_events.append(self._watch_thread_shutdown_events.pop(name))
+                    previous_threads.append(self._watch_threads.pop(name))
 
-            previous_threads = self._watch_threads
-            self._watch_threads = {}
+                if name in self._location_entry_dict:
+                    previous_entries.append(self._location_entry_dict.pop(name))
 
-            previous_locations = self._location_entry_dict
-            self._location_entry_dict = new_locations
+                if entry:
+                    self._location_entry_dict[name] = entry
 
-            # start monitoring for new locations
-            for entry in self._location_entry_dict.values():
-                if isinstance(entry.origin, GrpcServerCodeLocationOrigin):
-                    self._start_watch_thread(entry.origin)
+                    # start monitoring the new location
+                    if isinstance(entry.origin, GrpcServerCodeLocationOrigin):
+                        self._start_watch_thread(entry.origin)
 
         # clean up previous locations
-        for event in previous_events.values():
+        for event in previous_events:
             event.set()
 
-        for watch_thread in previous_threads.values():
+        for watch_thread in previous_threads:
             watch_thread.join()
 
-        for entry in previous_locations.values():
+        for entry in previous_entries:
             if entry.code_location:
                 entry.code_location.cleanup()
 
@@ -749,7 +802,8 @@ def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self._update_workspace({})  # update to empty to close all current locations
+        # remove all current locations to close them
+        self._update_locations({name: None for name in self.code_location_names})
         self._stack.close()
 
     def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcessContext":
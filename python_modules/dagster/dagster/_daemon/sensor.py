@@ -31,9 +31,15 @@
     RunRequest,
 )
 from dagster._core.definitions.selector import JobSubsetSelector
-from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
+from dagster._core.definitions.sensor_definition import (
+    DefaultSensorStatus,
+    SensorExecutionData,
+    SensorType,
+)
 from dagster._core.definitions.utils import validate_tags
 from dagster._core.errors import DagsterError
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.host_representation.code_location import CodeLocation
 from dagster._core.host_representation.external import ExternalJob, ExternalSensor
 from dagster._core.host_representation.external_data import ExternalTargetData
@@ -242,6 +248,7 @@ def execute_sensor_iteration_loop(
     sensor_tick_futures: Dict[str, Future] = {}
     submit_threadpool_executor = None
     threadpool_executor = None
+    max_concurrent_ticks_per_code_location = None
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
         if settings.get("use_threads"):
@@ -251,6 +258,9 @@ def execute_sensor_iteration_loop(
                     thread_name_prefix="sensor_daemon_worker",
                 )
             )
+            max_concurrent_ticks_per_code_location = settings.get(
+                "max_concurrent_ticks_per_code_location"
+            )
             num_submit_workers = settings.get("num_submit_workers")
             if num_submit_workers:
                 submit_threadpool_executor = stack.enter_context(
@@ -279,6 +289,7 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                max_concurrent_ticks_per_code_location=max_concurrent_ticks_per_code_location,
             )
             # Yield to check for heartbeats in case there were no yields within
             # execute_sensor_iteration
@@ -305,6 +316,7 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    max_concurrent_ticks_per_code_location: Optional[int] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -387,7 +399,22 @@ def execute_sensor_iteration(
         yield
         return
 
-    for external_sensor in sensors.values():
+    # number of ticks still in flight for each code location, so that a single slow code server
+    # cannot occupy every worker thread
+    in_flight_ticks_by_location: Dict[str, int] = defaultdict(int)
+    if threadpool_executor and sensor_tick_futures:
+        for selector_id, future in sensor_tick_futures.items():
+            if selector_id in sensors and not future.done():
+                in_flight_ticks_by_location[sensors[selector_id].handle.location_name] += 1
+
+    # evaluate the sensors that have been due for the longest first, so that sensors are not
+    # starved when there are more due sensors than workers
+    for external_sensor in sorted(
+        sensors.values(),
+        key=lambda sensor: _get_next_eligible_tick_timestamp(
+            all_sensor_states.get(sensor.selector_id), sensor
+        ),
+    ):
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
@@ -414,6 +441,19 @@ def execute_sensor_iteration(
             ):
                 continue
 
+            location_name = external_sensor.handle.location_name
+            if (
+                max_concurrent_ticks_per_code_location
+                and in_flight_ticks_by_location[location_name]
+                >= max_concurrent_ticks_per_code_location
+            ):
+                logger.info(
+                    f"Deferring sensor {sensor_name} to the next iteration since code location"
+                    f" {location_name} already has {in_flight_ticks_by_location[location_name]}"
+                    " ticks in progress."
+                )
+                continue
+
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
@@ -426,6 +466,7 @@ def execute_sensor_iteration(
                 submit_threadpool_executor,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
+            in_flight_ticks_by_location[location_name] += 1
             yield
 
         else:
@@ -647,14 +688,23 @@ def _evaluate_sensor(
     repository_handle = external_sensor.handle.repository_handle
     instigator_data = _sensor_instigator_data(state)
 
-    sensor_runtime_data = code_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
+    sensor_runtime_data = _get_unchanged_asset_sensor_execution_data(
+        instance, external_sensor, instigator_data.cursor if instigator_data else None
     )
+    if sensor_runtime_data:
+        context.logger.info(
+            f"No new materialization events for the asset monitored by {external_sensor.name}, "
+            "skipping the evaluation on the code server"
+        )
+    else:
+        sensor_runtime_data = code_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+        )
 
     yield
 
@@ -855,22 +905,75 @@ def _evaluate_sensor(
     yield
 
 
-def _is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
-    instigator_data = _sensor_instigator_data(state)
+def _get_unchanged_asset_sensor_execution_data(
+    instance: DagsterInstance, external_sensor: ExternalSensor, cursor: Optional[str]
+) -> Optional[SensorExecutionData]:
+    """An asset sensor only calls its materialization function when the monitored asset has been
+    materialized after the cursor. When it hasn't, the result of the evaluation is known without
+    calling the code server, so it is built here instead.
+    """
+    if external_sensor.sensor_type != SensorType.ASSET:
+        return None
+
+    asset_keys = external_sensor.metadata.asset_keys if external_sensor.metadata else None
+    if not asset_keys or len(asset_keys) != 1:
+        return None
+
+    asset_key = asset_keys[0]
+    after_cursor = None
+    if cursor:
+        try:
+            after_cursor = int(cursor)
+        except ValueError:
+            after_cursor = None
+
+    event_records = instance.get_event_records(
+        EventRecordsFilter(
+            event_type=DagsterEventType.ASSET_MATERIALIZATION,
+            asset_key=asset_key,
+            after_cursor=after_cursor,
+        ),
+        ascending=False,
+        limit=1,
+    )
+    if event_records:
+        return None
+
+    return SensorExecutionData(
+        skip_message=f"No new materialization events found for asset key {asset_key}",
+        cursor=cursor,
+    )
+
+
+def _get_next_eligible_tick_timestamp(
+    state: Optional[InstigatorState], external_sensor: ExternalSensor
+) -> float:
+    """Returns the earliest timestamp at which the sensor may be evaluated again, given its
+    minimum interval, or 0 if it can be evaluated right away.
+    """
+    instigator_data = _sensor_instigator_data(state) if state else None
     if not instigator_data:
-        return False
+        return 0
 
     if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
-        return False
+        return 0
 
     if not external_sensor.min_interval_seconds:
-        return False
+        return 0
 
-    elapsed = pendulum.now("UTC").timestamp() - max(
-        instigator_data.last_tick_timestamp or 0,
-        instigator_data.last_tick_start_timestamp or 0,
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + external_sensor.min_interval_seconds
+    )
+
+
+def _is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+    return pendulum.now("UTC").timestamp() < _get_next_eligible_tick_timestamp(
+        state, external_sensor
     )
-    return elapsed < external_sensor.min_interval_seconds
 
 
 def _fetch_existing_runs(
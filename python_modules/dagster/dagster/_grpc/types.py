@@ -16,6 +16,8 @@
 )
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.origin import JobPythonOrigin, get_python_environment_entry_point
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster._core.storage.dagster_run import DagsterRun
 from dagster._serdes import serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import SetToSequenceFieldSerializer
 from dagster._utils.error import SerializableErrorInfo
@@ -241,6 +243,10 @@ class ExecuteStepArgs(
             ("known_state", Optional[KnownExecutionState]),
             ("should_verify_step", Optional[bool]),
             ("print_serialized_events", bool),
+            # The run and the plan of the steps to execute, resolved by the orchestrator so that
+            # the step worker does not need to fetch the run or rebuild the plan
+            ("dagster_run", Optional[DagsterRun]),
+            ("execution_plan_snapshot", Optional[ExecutionPlanSnapshot]),
         ],
     )
 ):
@@ -254,6 +260,8 @@ def __new__(
         known_state: Optional[KnownExecutionState] = None,
         should_verify_step: Optional[bool] = None,
         print_serialized_events: Optional[bool] = None,
+        dagster_run: Optional[DagsterRun] = None,
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
     ):
         return super(ExecuteStepArgs, cls).__new__(
             cls,
@@ -271,6 +279,10 @@ def __new__(
             print_serialized_events=check.opt_bool_param(
                 print_serialized_events, "print_serialized_events", False
             ),
+            dagster_run=check.opt_inst_param(dagster_run, "dagster_run", DagsterRun),
+            execution_plan_snapshot=check.opt_inst_param(
+                execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot
+            ),
         )
 
     def _get_compressed_args(self) -> str:
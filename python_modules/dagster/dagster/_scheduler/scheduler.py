@@ -135,6 +135,7 @@ def execute_scheduler_iteration_loop(
 
     submit_threadpool_executor = None
     threadpool_executor = None
+    max_concurrent_ticks_per_code_location = None
 
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("schedules")
@@ -145,6 +146,9 @@ def execute_scheduler_iteration_loop(
                     thread_name_prefix="schedule_daemon_worker",
                 )
             )
+            max_concurrent_ticks_per_code_location = settings.get(
+                "max_concurrent_ticks_per_code_location"
+            )
             num_submit_workers = settings.get("num_submit_workers")
             if num_submit_workers:
                 submit_threadpool_executor = stack.enter_context(
@@ -174,6 +178,7 @@ def execute_scheduler_iteration_loop(
                 max_catchup_runs=max_catchup_runs,
                 max_tick_retries=max_tick_retries,
                 log_verbose_checks=verbose_logs_iteration,
+                max_concurrent_ticks_per_code_location=max_concurrent_ticks_per_code_location,
             )
             yield
             end_time = pendulum.now("UTC").timestamp()
@@ -202,6 +207,7 @@ def launch_scheduled_runs(
     max_tick_retries: int = 0,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     log_verbose_checks: bool = True,
+    max_concurrent_ticks_per_code_location: Optional[int] = None,
 ) -> "DaemonIterator":
     instance = workspace_process_context.instance
 
@@ -310,6 +316,14 @@ def launch_scheduled_runs(
         schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
         logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
 
+    # number of ticks still in flight for each code location, so that a single slow code server
+    # cannot occupy every worker thread
+    in_flight_ticks_by_location: Dict[str, int] = defaultdict(int)
+    if threadpool_executor and scheduler_run_futures:
+        for selector_id, future in scheduler_run_futures.items():
+            if selector_id in schedules and not future.done():
+                in_flight_ticks_by_location[schedules[selector_id].handle.location_name] += 1
+
     for external_schedule in schedules.values():
         error_info = None
         try:
@@ -344,6 +358,19 @@ def launch_scheduled_runs(
                 ):
                     continue
 
+                location_name = external_schedule.handle.location_name
+                if (
+                    max_concurrent_ticks_per_code_location
+                    and in_flight_ticks_by_location[location_name]
+                    >= max_concurrent_ticks_per_code_location
+                ):
+                    logger.info(
+                        f"Deferring schedule {external_schedule.name} to the next iteration since"
+                        f" code location {location_name} already has"
+                        f" {in_flight_ticks_by_location[location_name]} ticks in progress."
+                    )
+                    continue
+
                 future = threadpool_executor.submit(
                     launch_scheduled_runs_for_schedule,
                     workspace_process_context,
@@ -360,6 +387,7 @@ def launch_scheduled_runs(
                     submit_threadpool_executor=submit_threadpool_executor,
                 )
                 scheduler_run_futures[external_schedule.selector_id] = future
+                in_flight_ticks_by_location[location_name] += 1
                 yield
 
             else:
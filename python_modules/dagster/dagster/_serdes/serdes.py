@@ -808,10 +808,33 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
         self.value = value
 
 
+_public_api_loaded = False
+
+
+def _ensure_public_api_loaded(whitelist_map: WhitelistMap) -> bool:
+    """The public API in `dagster/__init__.py` is imported lazily, so serializable classes may not
+    have been registered yet when a value is deserialized. Import it in full the first time an
+    unknown class is encountered by the default whitelist map. Returns whether anything was loaded.
+    """
+    global _public_api_loaded  # noqa: PLW0603
+
+    if whitelist_map is not _WHITELIST_MAP or _public_api_loaded:
+        return False
+
+    import dagster
+
+    dagster._load_all_lazy_imports()  # noqa: SLF001
+    _public_api_loaded = True
+    return True
+
+
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        if not whitelist_map.has_tuple_deserializer(klass_name) and not (
+            _ensure_public_api_loaded(whitelist_map)
+            and whitelist_map.has_tuple_deserializer(klass_name)
+        ):
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -826,7 +849,9 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
     if "__enum__" in val:
         enum = cast(str, val["__enum__"])
         name, member = enum.split(".")
-        if not whitelist_map.has_enum_entry(name):
+        if not whitelist_map.has_enum_entry(name) and not (
+            _ensure_public_api_loaded(whitelist_map) and whitelist_map.has_enum_entry(name)
+        ):
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f"Attempted to deserialize enum {name} which was not in the whitelist.",
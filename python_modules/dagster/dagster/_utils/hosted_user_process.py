@@ -44,7 +44,14 @@ def recon_repository_from_origin(origin: RepositoryPythonOrigin) -> "Reconstruct
 def external_repo_from_def(
     repository_def: "RepositoryDefinition", repository_handle: "RepositoryHandle"
 ) -> ExternalRepository:
-    return ExternalRepository(external_repository_data_from_def(repository_def), repository_handle)
+    # job snapshots are only built for the jobs that are accessed
+    return ExternalRepository(
+        external_repository_data_from_def(repository_def, defer_snapshots=True),
+        repository_handle,
+        ref_to_data_fn=lambda job_ref: external_job_data_from_def(
+            repository_def.get_job(job_ref.name)
+        ),
+    )
 
 
 def external_job_from_recon_job(recon_job, op_selection, repository_handle, asset_selection=None):
@@ -335,7 +335,7 @@ def get_all_direct_subclasses_of_marker(marker_interface_cls: Type) -> List[Type
 
     return [
         symbol
-        for symbol in dagster.__dict__.values()
+        for symbol in (getattr(dagster, name) for name in dir(dagster))
         if isinstance(symbol, type)
         and issubclass(symbol, marker_interface_cls)
         and marker_interface_cls
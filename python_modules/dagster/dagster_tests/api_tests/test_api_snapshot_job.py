@@ -1,10 +1,18 @@
 import sys
 
 import pytest
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_data_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.host_representation.external_data import ExternalJobSubsetResult
+from dagster._core.host_representation import code_location as code_location_module
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalJobSubsetResult,
+)
 from dagster._core.host_representation.handle import JobHandle
+from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -29,6 +37,35 @@ def test_job_snapshot_api_grpc(instance):
         assert external_job_subset_result.external_job_data.name == "foo"
 
 
+def test_job_data_api_grpc(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repository_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+
+        job_data = sync_get_external_job_data_grpc(code_location.client, repository_origin, "foo")
+        assert isinstance(job_data, ExternalJobData)
+        assert job_data.name == "foo"
+
+        with pytest.raises(DagsterUserCodeProcessError, match="Could not find job"):
+            sync_get_external_job_data_grpc(
+                code_location.client, repository_origin, "does_not_exist"
+            )
+
+
+def test_deferred_job_snapshots(instance):
+    code_location_module._job_datas_by_snapshot_id.clear()  # noqa: SLF001
+
+    with get_bar_repo_code_location(instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+        assert repo.external_repository_data.external_job_datas is None
+
+        job = repo.get_full_external_job("foo")
+        snapshot_id = job.computed_job_snapshot_id
+        assert snapshot_id not in code_location_module._job_datas_by_snapshot_id  # noqa: SLF001
+
+        assert job.job_snapshot.name == "foo"
+        assert snapshot_id in code_location_module._job_datas_by_snapshot_id  # noqa: SLF001
+
+
 def test_job_snapshot_deserialize_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         job_handle = JobHandle("foo", code_location.get_repository("bar_repo").handle)
@@ -10,6 +10,7 @@
     AssetOut,
     AssetsDefinition,
     DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
     GraphOut,
     HourlyPartitionsDefinition,
     LastPartitionMapping,
@@ -350,6 +351,113 @@ def bar(foo):
     assert asset_graph.get_non_source_roots(AssetKey("bar")) == {AssetKey("foo")}
 
 
+def test_ancestors_and_toposort(asset_graph_from_assets):
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset
+    def top():
+        pass
+
+    @asset
+    def left(top):
+        pass
+
+    @asset
+    def right(top):
+        pass
+
+    @asset(
+        partitions_def=daily_partitions_def,
+        ins={
+            "bottom": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def bottom(left, right, bottom):
+        pass
+
+    asset_graph = asset_graph_from_assets([top, left, right, bottom])
+    assert asset_graph.get_ancestors(AssetKey("bottom")) == {
+        AssetKey("top"),
+        AssetKey("left"),
+        AssetKey("right"),
+    }
+    assert asset_graph.get_ancestors(AssetKey("left"), include_self=True) == {
+        AssetKey("top"),
+        AssetKey("left"),
+    }
+    assert asset_graph.get_ancestors(AssetKey("top")) == set()
+    assert asset_graph.get_ancestors(AssetKey("unknown"), include_self=True) == {
+        AssetKey("unknown")
+    }
+
+    assert asset_graph.toposort_asset_keys() == [
+        {AssetKey("top")},
+        {AssetKey("left"), AssetKey("right")},
+        {AssetKey("bottom")},
+    ]
+    assert asset_graph.get_toposort_level(AssetKey("right")) == 1
+    assert asset_graph.get_toposort_level(AssetKey("bottom")) == 2
+
+
+def test_partition_mapping_cache(asset_graph_from_assets):
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def daily_parent():
+        pass
+
+    @asset(partitions_def=daily_partitions_def)
+    def daily_child(daily_parent):
+        pass
+
+    @asset(partitions_def=DynamicPartitionsDefinition(name="fruits"))
+    def dynamic_parent():
+        pass
+
+    @asset(partitions_def=DynamicPartitionsDefinition(name="ripe_fruits"))
+    def dynamic_child(dynamic_parent):
+        pass
+
+    asset_graph = asset_graph_from_assets(
+        [daily_parent, daily_child, dynamic_parent, dynamic_child]
+    )
+    current_time = create_pendulum_time(year=2022, month=1, day=5)
+
+    with instance_for_test() as instance:
+        # the same partitions mapped with the same dynamic partitions store and time are reused
+        result = asset_graph.get_parent_partition_keys_for_child(
+            "2022-01-02", AssetKey("daily_parent"), AssetKey("daily_child"), instance, current_time
+        )
+        assert set(result.partitions_subset.get_partition_keys()) == {"2022-01-02"}
+        assert (
+            asset_graph.get_parent_partition_keys_for_child(
+                "2022-01-02",
+                AssetKey("daily_parent"),
+                AssetKey("daily_child"),
+                instance,
+                current_time,
+            )
+            is result
+        )
+        assert asset_graph.get_child_partition_keys_of_parent(
+            instance, "2022-01-02", AssetKey("daily_parent"), AssetKey("daily_child"), current_time
+        ) == ["2022-01-02"]
+
+        # dynamic partitions can be added at any time, so they are not cached
+        result = asset_graph.get_parent_partition_keys_for_child(
+            "apple", AssetKey("dynamic_parent"), AssetKey("dynamic_child"), instance, current_time
+        )
+        assert result.required_but_nonexistent_partition_keys == ["apple"]
+        instance.add_dynamic_partitions("fruits", ["apple"])
+        result = asset_graph.get_parent_partition_keys_for_child(
+            "apple", AssetKey("dynamic_parent"), AssetKey("dynamic_child"), instance, current_time
+        )
+        assert result.required_but_nonexistent_partition_keys == []
+        assert set(result.partitions_subset.get_partition_keys()) == {"apple"}
+
+
 def test_partitioned_source_asset(asset_graph_from_assets):
     partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
 
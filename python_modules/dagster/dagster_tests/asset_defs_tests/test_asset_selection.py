@@ -17,6 +17,7 @@
     multi_asset,
 )
 from dagster._core.definitions import AssetSelection, asset
+from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.definitions.events import AssetKey
 from typing_extensions import TypeAlias
@@ -159,6 +160,31 @@ def test_asset_selection_key_prefixes(all_assets: _AssetList):
     assert sel.resolve(all_assets) == {earth.key}
 
 
+def test_asset_selection_multiple_key_prefixes(all_assets: _AssetList):
+    sel = AssetSelection.key_prefixes("animals", ["celestial", "mars"], "alice")
+    assert sel.resolve(all_assets) == _asset_keys_of({zebra, alice})
+
+    sel = AssetSelection.key_prefixes([])
+    assert sel.resolve(all_assets) == _asset_keys_of(all_assets) - {earth.key}
+
+
+def test_asset_selection_resolution_is_memoized(all_assets: _AssetList):
+    asset_graph = AssetGraph.from_assets(all_assets)
+    candace_sel = AssetSelection.keys("candace")
+    sel = candace_sel.downstream(depth=1) | AssetSelection.groups("gentlemen")
+
+    resolved = sel.resolve(asset_graph)
+    assert resolved == _asset_keys_of({candace, danny, bob, edgar, george})
+    assert sel.resolve(asset_graph) is resolved
+    # sub-selections are memoized as well
+    assert candace_sel.resolve(asset_graph) is candace_sel.resolve(asset_graph)
+
+    # a different graph resolves the selection again
+    assert sel.resolve(AssetGraph.from_assets([earth, alice, candace, danny])) == _asset_keys_of(
+        {candace, danny}
+    )
+
+
 def test_select_source_asset_keys():
     a = SourceAsset("a")
     selection = AssetSelection.keys(a.key)
@@ -2,6 +2,7 @@
 from dagster._core.test_utils import instance_for_test
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._core.workspace.load import load_workspace_process_context_from_yaml_paths
+from dagster._core.workspace.load_target import WorkspaceFileTarget
 from dagster._utils import file_relative_path
 
 
@@ -53,3 +54,27 @@ def test_workspace_with_only_error(instance):
         assert (
             "No module named" in request_context.get_code_location_error("broken_location").message
         )
+
+
+@pytest.mark.parametrize("max_concurrent_location_loads", [1, 4])
+def test_multi_location_error_reload(instance, max_concurrent_location_loads):
+    with WorkspaceProcessContext(
+        instance,
+        WorkspaceFileTarget(paths=[file_relative_path(__file__, "multi_location_with_error.yaml")]),
+        max_concurrent_location_loads=max_concurrent_location_loads,
+    ) as cli_workspace:
+        # locations are kept in the order of the workspace, regardless of when they loaded
+        assert cli_workspace.code_location_names == ["working_location", "broken_location"]
+        working_location = cli_workspace.create_request_context().get_code_location(
+            "working_location"
+        )
+
+        cli_workspace.reload_workspace()
+
+        assert cli_workspace.code_location_names == ["working_location", "broken_location"]
+        assert cli_workspace.has_code_location("working_location")
+        assert cli_workspace.has_code_location_error("broken_location")
+        assert (
+            cli_workspace.create_request_context().get_code_location("working_location")
+            is not working_location
+        )
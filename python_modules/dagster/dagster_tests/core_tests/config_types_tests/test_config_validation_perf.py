@@ -0,0 +1,218 @@
+from typing import Any, Mapping, NamedTuple
+from unittest import mock
+
+import pytest
+from dagster import Array, Enum, EnumValue, Field, Map, Noneable, Permissive, Selector, Shape
+from dagster._config import (
+    ConfigType,
+    post_process_config,
+    process_config,
+    resolve_to_config_type,
+    validate_config,
+)
+from dagster._config.post_process import _recursively_process_config, compile_post_processor
+from dagster._config.stack import EvaluationStack
+from dagster._config.traversal_context import TraversalContext, TraversalType, ValidationContext
+from dagster._config.validate import _validate_config, compile_config_validator
+
+
+def _dbt_like_config_type(n_ops: int) -> ConfigType:
+    """A run config schema shaped like a large dbt project: one op per model, each with nested
+    config, selectors, and arrays.
+    """
+    op_config = Shape(
+        {
+            "config": Field(
+                Shape(
+                    {
+                        "select": Field(Array(str)),
+                        "exclude": Field(Noneable(Array(str)), is_required=False),
+                        "target": Field(str, default_value="prod"),
+                        "threads": Field(int, default_value=4),
+                        "full_refresh": Field(bool, default_value=False),
+                        "materialization": Field(
+                            Enum(
+                                "Materialization",
+                                [EnumValue("table"), EnumValue("view"), EnumValue("incremental")],
+                            ),
+                            default_value="table",
+                        ),
+                        "target_path": Field(
+                            Selector({"local": Field(str), "s3": Field(Shape({"bucket": str}))})
+                        ),
+                        "vars": Field(Map(str, str), default_value={}),
+                    }
+                )
+            )
+        }
+    )
+    return resolve_to_config_type(
+        Shape({"ops": Field(Shape({f"model_{i}": Field(op_config) for i in range(n_ops)}))})
+    )
+
+
+def _dbt_like_config_value(n_ops: int) -> Mapping[str, Any]:
+    return {
+        "ops": {
+            f"model_{i}": {
+                "config": {
+                    "select": [f"tag:model_{i}", "+downstream"],
+                    "exclude": None if i % 2 else ["tag:skip"],
+                    "materialization": "view",
+                    "target_path": {"s3": {"bucket": "bucket"}} if i % 3 else {"local": "/tmp"},
+                    "vars": {"run_date": "2023-01-01"},
+                }
+            }
+            for i in range(n_ops)
+        }
+    }
+
+
+def _spark_like_config_type(n_ops: int) -> ConfigType:
+    """A run config schema shaped like a set of Spark ops with large permissive conf dicts."""
+    op_config = Shape(
+        {
+            "config": Field(
+                Shape(
+                    {
+                        "spark_conf": Field(Permissive({"spark.app.name": Field(str)})),
+                        "jars": Field(Array(str), default_value=[]),
+                        "executor_env": Field(Map(str, Noneable(str)), is_required=False),
+                    }
+                )
+            )
+        }
+    )
+    return resolve_to_config_type(
+        Shape({"ops": Field(Shape({f"spark_op_{i}": Field(op_config) for i in range(n_ops)}))})
+    )
+
+
+def _spark_like_config_value(n_ops: int) -> Mapping[str, Any]:
+    return {
+        "ops": {
+            f"spark_op_{i}": {
+                "config": {
+                    "spark_conf": {
+                        "spark.app.name": f"app_{i}",
+                        **{f"spark.conf.key_{j}": str(j) for j in range(50)},
+                    },
+                    "jars": [f"s3://jars/jar_{j}.jar" for j in range(10)],
+                    "executor_env": {f"ENV_{j}": None if j % 2 else "value" for j in range(10)},
+                }
+            }
+            for i in range(n_ops)
+        }
+    }
+
+
+class ConfigPerfScenario(NamedTuple):
+    name: str
+    config_type: ConfigType
+    config_value: Mapping[str, Any]
+    n_iterations: int
+
+
+perf_scenarios = [
+    ConfigPerfScenario(
+        name="dbt_like_2000_models",
+        config_type=_dbt_like_config_type(2000),
+        config_value=_dbt_like_config_value(2000),
+        n_iterations=10,
+    ),
+    ConfigPerfScenario(
+        name="spark_like_500_ops",
+        config_type=_spark_like_config_type(500),
+        config_value=_spark_like_config_value(500),
+        n_iterations=10,
+    ),
+]
+
+
+@pytest.mark.parametrize("scenario", perf_scenarios, ids=[s.name for s in perf_scenarios])
+def test_config_validation_perf(scenario: ConfigPerfScenario):
+    # first call compiles the validators and post-processors for this schema
+    first_result = process_config(scenario.config_type, scenario.config_value)
+    assert first_result.success
+
+    with mock.patch(
+        "dagster._config.validate.compile_config_validator", wraps=compile_config_validator
+    ) as compile_validator_mock, mock.patch(
+        "dagster._config.post_process.compile_post_processor", wraps=compile_post_processor
+    ) as compile_post_processor_mock, mock.patch(
+        "dagster._config.validate._validate_config", wraps=_validate_config
+    ) as interpreted_validate_mock, mock.patch(
+        "dagster._config.post_process._recursively_process_config",
+        wraps=_recursively_process_config,
+    ) as interpreted_post_process_mock:
+        for _ in range(scenario.n_iterations):
+            result = process_config(scenario.config_type, scenario.config_value)
+            assert result.success
+            assert result.value == first_result.value
+
+    # the compiled functions are reused, and valid config never takes the interpreted path
+    assert compile_validator_mock.call_count == 0
+    assert compile_post_processor_mock.call_count == 0
+    assert interpreted_validate_mock.call_count == 0
+    assert interpreted_post_process_mock.call_count == 0
+
+
+@pytest.mark.parametrize("scenario", perf_scenarios, ids=[s.name for s in perf_scenarios])
+def test_compiled_validation_matches_interpreted(scenario: ConfigPerfScenario):
+    config_type = scenario.config_type
+    config_schema_snapshot = config_type.get_schema_snapshot()
+
+    interpreted = _validate_config(
+        ValidationContext(
+            config_schema_snapshot=config_schema_snapshot,
+            config_type_snap=config_schema_snapshot.get_config_snap(config_type.key),
+            stack=EvaluationStack(entries=[]),
+        ),
+        scenario.config_value,
+    )
+    compiled = validate_config(config_type, scenario.config_value)
+
+    assert interpreted.success and compiled.success
+    assert compiled.value == interpreted.value
+
+    interpreted_post_processed = _recursively_process_config(
+        TraversalContext.from_config_type(
+            config_type=config_type,
+            stack=EvaluationStack(entries=[]),
+            traversal_type=TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
+        ),
+        compiled.value,
+    )
+    compiled_post_processed = post_process_config(config_type, compiled.value)
+
+    assert interpreted_post_processed.success and compiled_post_processed.success
+    assert compiled_post_processed.value == interpreted_post_processed.value
+
+
+def test_compiled_validator_cached_per_schema_snapshot():
+    config_type = _dbt_like_config_type(3)
+    config_schema_snapshot = config_type.get_schema_snapshot()
+    assert config_type.get_schema_snapshot() is config_schema_snapshot
+
+    validator = config_schema_snapshot.get_compiled_validator(key=config_type.key)
+    assert config_schema_snapshot.get_compiled_validator(key=config_type.key) is validator
+    assert config_type.get_compiled_post_processor() is config_type.get_compiled_post_processor()
+
+
+def test_compiled_validation_falls_back_for_errors():
+    config_type = _dbt_like_config_type(3)
+    config_value = _dbt_like_config_value(3)
+    config_value["ops"]["model_1"]["config"]["threads"] = "not_an_int"
+    del config_value["ops"]["model_2"]["config"]["select"]
+
+    with mock.patch(
+        "dagster._config.validate._validate_config", wraps=_validate_config
+    ) as interpreted_validate_mock:
+        result = validate_config(config_type, config_value)
+    assert interpreted_validate_mock.call_count > 0
+    assert not result.success
+    assert len(result.errors) == 2
+    assert {tuple(error.stack.levels) for error in result.errors} == {
+        ("ops", "model_1", "config", "threads"),
+        ("ops", "model_2", "config"),
+    }
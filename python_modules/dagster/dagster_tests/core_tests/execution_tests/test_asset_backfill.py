@@ -45,6 +45,8 @@
     PartitionsSelector,
 )
 from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.asset_backfill import (
     AssetBackfillData,
     AssetBackfillIterationResult,
@@ -1295,3 +1297,77 @@ def foo_grandchild(foo_child):
         AssetKeyPartitionKey(asset_key=AssetKey(["foo_grandchild"]), partition_key="2023-10-12"),
         AssetKeyPartitionKey(asset_key=AssetKey(["foo_grandchild"]), partition_key="2023-10-10"),
     }
+
+
+def test_asset_backfill_iterations_are_incremental():
+    @asset(partitions_def=DailyPartitionsDefinition("2023-01-01"))
+    def upstream():
+        raise Exception("noo")
+
+    @asset(partitions_def=DailyPartitionsDefinition("2023-01-01"))
+    def downstream(upstream):
+        pass
+
+    assets_by_repo_name = {"repo": [upstream, downstream]}
+    asset_graph = get_asset_graph(assets_by_repo_name)
+    instance = DagsterInstance.ephemeral()
+
+    backfill_data = AssetBackfillData.from_asset_partitions(
+        partition_names=["2023-01-01", "2023-01-02"],
+        asset_graph=asset_graph,
+        asset_selection=[upstream.key, downstream.key],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=False,
+        backfill_start_time=pendulum.now("UTC"),
+    )
+
+    backfill_data = _single_backfill_iteration(
+        "fake_id", backfill_data, asset_graph, instance, assets_by_repo_name
+    )
+    # no runs have failed yet
+    assert backfill_data.latest_failed_run_event_storage_id == 0
+    backfill_data = _single_backfill_iteration(
+        "fake_id", backfill_data, asset_graph, instance, assets_by_repo_name
+    )
+    assert backfill_data.failed_and_downstream_subset == backfill_data.target_subset
+    latest_failed_run_event_storage_id = backfill_data.latest_failed_run_event_storage_id
+    assert latest_failed_run_event_storage_id
+    assert latest_failed_run_event_storage_id == max(
+        record.storage_id
+        for record in instance.get_event_records(
+            EventRecordsFilter(event_type=DagsterEventType.RUN_FAILURE)
+        )
+    )
+    assert backfill_data.is_complete()
+
+    # the failed run cursor survives serialization, and the serialized target subset is reused
+    serialized = backfill_data.serialize(dynamic_partitions_store=instance)
+    deserialized = AssetBackfillData.from_serialized(
+        serialized, asset_graph, backfill_data.backfill_start_time.timestamp()
+    )
+    # the cached serialization of the target subset doesn't take part in equality
+    assert deserialized == backfill_data
+    with patch.object(
+        AssetGraphSubset,
+        "to_storage_dict",
+        autospec=True,
+        side_effect=AssetGraphSubset.to_storage_dict,
+    ) as to_storage_dict_mock:
+        assert deserialized.serialize(dynamic_partitions_store=instance) == serialized
+    # only the requested, materialized, and failed subsets are serialized
+    assert to_storage_dict_mock.call_count == 3
+
+    # nothing has changed since the last iteration, so materializations aren't re-fetched and
+    # runs that failed before the cursor aren't re-processed
+    with patch(
+        "dagster._core.execution.asset_backfill.get_asset_backfill_iteration_materialized_partitions"
+    ) as materialized_partitions_mock, patch.object(
+        CachingInstanceQueryer, "get_planned_materializations_for_run"
+    ) as planned_materializations_mock:
+        result = execute_asset_backfill_iteration_consume_generator(
+            "fake_id", deserialized, asset_graph, instance
+        )
+    assert materialized_partitions_mock.call_count == 0
+    assert planned_materializations_mock.call_count == 0
+    assert result.run_requests == []
+    assert result.backfill_data == deserialized
@@ -39,11 +39,18 @@ def foo_job():
 class TestDynamicRepositoryData(RepositoryData):
     def __init__(self):
         self._num_calls = 0
+        self._jobs_by_name = {}
 
     # List of jobs changes everytime get_all_jobs is called
     def get_all_jobs(self):
         self._num_calls = self._num_calls + 1
-        return [define_foo_job(self._num_calls)]
+        foo_job = define_foo_job(self._num_calls)
+        self._jobs_by_name[foo_job.name] = foo_job
+        return [foo_job]
+
+    # Job snapshots are fetched on demand, so jobs that were listed before remain available
+    def get_job(self, job_name):
+        return self._jobs_by_name[job_name]
 
     def get_top_level_resources(self):
         return {}
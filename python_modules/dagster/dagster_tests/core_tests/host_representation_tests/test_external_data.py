@@ -6,7 +6,9 @@
     AssetKey,
     AssetOut,
     AssetsDefinition,
+    AssetSelection,
     DailyPartitionsDefinition,
+    Definitions,
     GraphOut,
     HourlyPartitionsDefinition,
     Out,
@@ -15,6 +17,7 @@
     graph,
     graph_asset,
     graph_multi_asset,
+    multi_asset_sensor,
     op,
 )
 from dagster._check import ParameterCheckError
@@ -38,6 +41,7 @@
     ExternalTimeWindowPartitionsDefinitionData,
     external_asset_nodes_from_defs,
     external_multi_partitions_definition_from_def,
+    external_repository_data_from_def,
     external_time_window_partitions_definition_from_def,
 )
 from dagster._serdes import deserialize_value, serialize_value
@@ -1043,6 +1047,30 @@ def asset2(asset1):
     ]
 
 
+def test_multi_asset_sensor_with_source_and_regular_asset_selection():
+    source = SourceAsset("source")
+
+    @asset(deps=[source])
+    def downstream():
+        ...
+
+    @multi_asset_sensor(
+        monitored_assets=AssetSelection.keys("source") | AssetSelection.keys("downstream")
+    )
+    def mixed_sensor():
+        ...
+
+    repository_def = Definitions(
+        assets=[source, downstream], sensors=[mixed_sensor]
+    ).get_repository_def()
+
+    # the selection can't be resolved, but that doesn't fail loading the repository
+    external_repository_data = external_repository_data_from_def(repository_def)
+    (external_sensor_data,) = external_repository_data.external_sensor_datas
+    assert external_sensor_data.metadata
+    assert external_sensor_data.metadata.asset_keys is None
+
+
 def test_back_compat_external_sensor():
     SERIALIZED_0_12_10_SENSOR = (
         '{"__class__": "ExternalSensorData", "description": null, "min_interval": null, "mode":'
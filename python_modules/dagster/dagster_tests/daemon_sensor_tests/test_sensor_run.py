@@ -2,7 +2,7 @@
 import random
 import string
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
 from typing import Any
 from unittest import mock
@@ -46,6 +46,7 @@
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, RunRequest, SkipReason
 from dagster._core.events import DagsterEventType
 from dagster._core.host_representation import ExternalInstigatorOrigin, ExternalRepositoryOrigin
+from dagster._core.host_representation.code_location import GrpcServerCodeLocation
 from dagster._core.host_representation.external import ExternalRepository
 from dagster._core.host_representation.origin import (
     ManagedGrpcPythonEnvCodeLocationOrigin,
@@ -1911,6 +1912,70 @@ def test_asset_sensor(executor, instance, workspace_context, external_repo):
         assert run.tags.get("dagster/sensor_name") == "asset_foo_sensor"
 
 
+def test_asset_sensor_skipped_without_new_materializations(
+    executor, instance, workspace_context, external_repo
+):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        foo_sensor = external_repo.get_external_sensor("asset_foo_sensor")
+        assert foo_sensor.metadata
+        assert foo_sensor.metadata.asset_keys == [AssetKey("foo")]
+        instance.start_sensor(foo_sensor)
+
+        with mock.patch.object(
+            GrpcServerCodeLocation,
+            "get_external_sensor_execution_data",
+            side_effect=Exception("should not be called"),
+        ):
+            evaluate_sensors(workspace_context, executor)
+
+        ticks = instance.get_ticks(foo_sensor.get_external_origin_id(), foo_sensor.selector_id)
+        assert len(ticks) == 1
+        validate_tick(ticks[0], foo_sensor, freeze_datetime, TickStatus.SKIPPED)
+        assert ticks[0].skip_reason == (
+            f"No new materialization events found for asset key {AssetKey('foo')}"
+        )
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+    with pendulum.test(freeze_datetime):
+        foo_job.execute_in_process(instance=instance)
+
+        # a new materialization is evaluated on the code server
+        evaluate_sensors(workspace_context, executor)
+        ticks = instance.get_ticks(foo_sensor.get_external_origin_id(), foo_sensor.selector_id)
+        assert len(ticks) == 2
+        validate_tick(ticks[0], foo_sensor, freeze_datetime, TickStatus.SUCCESS)
+        assert ticks[0].cursor
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+    with pendulum.test(freeze_datetime):
+        with mock.patch.object(
+            GrpcServerCodeLocation,
+            "get_external_sensor_execution_data",
+            side_effect=Exception("should not be called"),
+        ):
+            evaluate_sensors(workspace_context, executor)
+
+        ticks = instance.get_ticks(foo_sensor.get_external_origin_id(), foo_sensor.selector_id)
+        assert len(ticks) == 3
+        validate_tick(ticks[0], foo_sensor, freeze_datetime, TickStatus.SKIPPED)
+        # the cursor is kept when the evaluation is skipped
+        assert ticks[0].cursor == ticks[1].cursor
+
+
+def test_multi_asset_sensor_monitored_asset_keys(external_repo):
+    asset_a_and_b_sensor = external_repo.get_external_sensor("asset_a_and_b_sensor")
+    assert asset_a_and_b_sensor.metadata
+    assert asset_a_and_b_sensor.metadata.asset_keys == [AssetKey("asset_a"), AssetKey("asset_b")]
+
+    selection_sensor = external_repo.get_external_sensor("asset_selection_sensor")
+    assert selection_sensor.metadata
+    assert selection_sensor.metadata.asset_keys == [AssetKey("asset_b")]
+
+
 def test_asset_job_sensor(executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
         create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
@@ -2827,6 +2892,59 @@ def test_settings():
         assert thread_inst.get_settings("sensors") == settings
 
 
+def test_max_concurrent_ticks_per_code_location(caplog, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    executor = ThreadPoolExecutor()
+    with pendulum.test(freeze_datetime):
+        in_flight_sensor = external_repo.get_external_sensor("simple_sensor")
+        external_sensor = external_repo.get_external_sensor("always_on_sensor")
+        external_origin_id = external_sensor.get_external_origin_id()
+        instance.start_sensor(in_flight_sensor)
+        instance.start_sensor(external_sensor)
+
+        # a tick from the same code location that has not finished yet
+        futures = {in_flight_sensor.selector_id: Future()}
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                get_default_daemon_logger("SensorDaemon"),
+                threadpool_executor=executor,
+                sensor_tick_futures=futures,
+                max_concurrent_ticks_per_code_location=1,
+            )
+        )
+        assert set(futures.keys()) == {in_flight_sensor.selector_id}
+        assert len(instance.get_ticks(external_origin_id, external_sensor.selector_id)) == 0
+        assert "Deferring sensor always_on_sensor to the next iteration" in caplog.text
+
+        # once the in-flight tick finishes, the deferred sensor runs on the next iteration
+        futures[in_flight_sensor.selector_id].set_result(None)
+        instance.stop_sensor(
+            in_flight_sensor.get_external_origin_id(),
+            in_flight_sensor.selector_id,
+            in_flight_sensor,
+        )
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                get_default_daemon_logger("SensorDaemon"),
+                threadpool_executor=executor,
+                sensor_tick_futures=futures,
+                max_concurrent_ticks_per_code_location=1,
+            )
+        )
+        wait_for_futures(
+            {external_sensor.selector_id: futures[external_sensor.selector_id]},
+            timeout=FUTURES_TIMEOUT,
+        )
+        ticks = instance.get_ticks(external_origin_id, external_sensor.selector_id)
+        assert len(ticks) == 1
+        assert ticks[0].status == TickStatus.SUCCESS
+
+
 def test_sensor_logging(executor, instance, workspace_context, external_repo):
     external_sensor = external_repo.get_external_sensor("logging_sensor")
     instance.add_instigator_state(
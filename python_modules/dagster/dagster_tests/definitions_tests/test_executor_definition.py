@@ -7,12 +7,14 @@
     ExecutorRequirement,
     _check as check,
     execute_job,
+    in_process_executor,
     job,
     multiprocess_executor,
     op,
     reconstructable,
 )
 from dagster._core.definitions.executor_definition import (
+    _core_in_process_executor_creation,
     _core_multiprocess_executor_creation,
     executor,
 )
@@ -332,3 +334,34 @@ def test_multiprocess_executor_config_zero_is_sentinel() -> None:
         }
     )
     assert executor._max_concurrent == multiprocessing.cpu_count()  # noqa: SLF001
+
+
+@op
+def emit_one_op():
+    return 1
+
+
+@job(executor_def=in_process_executor)
+def in_process_concurrent_job():
+    emit_one_op.alias("a")()
+    emit_one_op.alias("b")()
+
+
+def test_in_process_executor_max_concurrent_config():
+    executor = _core_in_process_executor_creation(
+        {
+            "retries": {
+                "enabled": {},
+            },
+            "max_concurrent": 4,
+        }
+    )
+    assert executor.max_concurrent == 4
+
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(in_process_concurrent_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+        )
+        assert result.success
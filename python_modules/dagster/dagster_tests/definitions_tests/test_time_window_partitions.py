@@ -920,6 +920,103 @@ def test_partition_subset_with_partition_keys(initial: str, added: str):
     assert len(updated_subset) == updated_subset_str.count("+")
 
 
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("-----", "-----"),
+        ("+++++", "-----"),
+        ("-+-+-", "+-+-+"),
+        ("--+++---+++--", "++---+++---++"),
+        ("+++---+++", "-+++++++-"),
+        ("-++++++-", "+--++--+"),
+    ],
+)
+def test_partition_subset_operators(first: str, second: str):
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    full_set_keys = partitions_def.get_partition_keys(
+        current_time=datetime(year=2015, month=1, day=30)
+    )[: len(first)]
+
+    def subset_from_str(subset_str: str) -> TimeWindowPartitionsSubset:
+        subset = partitions_def.empty_subset().with_partition_keys(
+            [key for key, included in zip(full_set_keys, subset_str) if included == "+"]
+        )
+        # subsets backed by time windows are combined without listing their partition keys
+        return TimeWindowPartitionsSubset(
+            partitions_def,
+            num_partitions=None,
+            included_time_windows=cast(TimeWindowPartitionsSubset, subset).included_time_windows,
+        )
+
+    def keys_from_str(subset_str: str) -> Sequence[str]:
+        return [key for key, included in zip(full_set_keys, subset_str) if included == "+"]
+
+    first_subset = subset_from_str(first)
+    second_subset = subset_from_str(second)
+    for result, expected_str in [
+        (first_subset | second_subset, [a == "+" or b == "+" for a, b in zip(first, second)]),
+        (first_subset & second_subset, [a == "+" and b == "+" for a, b in zip(first, second)]),
+        (first_subset - second_subset, [a == "+" and b != "+" for a, b in zip(first, second)]),
+    ]:
+        expected_keys = keys_from_str("".join("+" if e else "-" for e in expected_str))
+        assert list(result.get_partition_keys()) == expected_keys
+        assert len(result) == len(expected_keys)
+        assert len(cast(TimeWindowPartitionsSubset, result).included_time_windows) == len(
+            [
+                i
+                for i in range(len(expected_str))
+                if expected_str[i] and (i == 0 or not expected_str[i - 1])
+            ]
+        )
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2020-01-01-00:00"),
+        HourlyPartitionsDefinition(start_date="2020-01-01-00:00", timezone="America/New_York"),
+        DailyPartitionsDefinition(start_date="2020-01-01"),
+        DailyPartitionsDefinition(start_date="2020-01-01", timezone="America/New_York"),
+        MonthlyPartitionsDefinition(start_date="2020-01-01"),
+    ],
+)
+def test_get_num_partitions_in_time_window(partitions_def: TimeWindowPartitionsDefinition):
+    # includes a daylight saving time change in America/New_York, and unaligned boundaries
+    for window in [
+        time_window("2020-03-07T00:00:00", "2020-03-10T00:00:00"),
+        time_window("2020-03-07T05:30:00", "2020-06-09T17:15:00"),
+        time_window("2020-03-07T05:30:00", "2020-03-07T05:45:00"),
+        time_window("2020-03-08T00:00:00", "2020-03-07T00:00:00"),
+    ]:
+        assert partitions_def.get_num_partitions_in_time_window(window) == len(
+            partitions_def.get_partition_keys_in_time_window(window)
+        )
+
+
+def test_subset_with_all_partitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2020-01-01-00:00", end_offset=1)
+    current_time = datetime(year=2020, month=3, day=1, hour=5, minute=30)
+
+    subset = cast(
+        TimeWindowPartitionsSubset,
+        partitions_def.subset_with_all_partitions(current_time=current_time),
+    )
+    assert len(subset.included_time_windows) == 1
+    assert list(subset.get_partition_keys()) == partitions_def.get_partition_keys(
+        current_time=current_time
+    )
+    assert len(subset) == partitions_def.get_num_partitions(current_time=current_time)
+
+    assert (
+        len(
+            HourlyPartitionsDefinition(start_date="2020-01-01-00:00").subset_with_all_partitions(
+                current_time=datetime(year=2019, month=1, day=1)
+            )
+        )
+        == 0
+    )
+
+
 def test_weekly_time_window_partitions_subset():
     weekly_partitions_def = WeeklyPartitionsDefinition(start_date="2022-01-01")
 
@@ -140,6 +140,35 @@ def test_execute():
     assert TestStepHandler.verify_step_count == 0
 
 
+def test_execute_step_worker_bootstrap():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={"execution": {"config": {}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+        initialized_events = [
+            record
+            for record in instance.all_logs(result.run_id, of_type=DagsterEventType.ENGINE_EVENT)
+            if record.dagster_event
+            and record.dagster_event.message
+            and record.dagster_event.message.startswith("Step worker initialized")
+        ]
+
+    assert result.success
+    assert len(initialized_events) == 3
+    for record in initialized_events:
+        metadata = record.get_dagster_event().engine_event_data.metadata
+        assert "load_code_seconds" in metadata
+        assert "build_execution_plan_seconds" in metadata
+        # the run and the step plan are sent by the orchestrator
+        assert "fetch_run_seconds" not in metadata
+        assert "fetch_repository_load_data_seconds" not in metadata
+
+
 def test_skip_execute():
     from .test_jobs import define_dynamic_skipping_job
 
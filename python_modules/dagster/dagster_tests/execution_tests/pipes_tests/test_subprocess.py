@@ -1,10 +1,12 @@
 import inspect
+import json
 import re
 import shutil
 import subprocess
 import textwrap
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
+from threading import Event, Thread
 from typing import Any, Callable, Iterator
 
 import boto3
@@ -41,9 +43,12 @@
     PipesSubprocessClient,
 )
 from dagster._core.pipes.utils import (
+    PipesBlobStoreMessageReader,
     PipesEnvContextInjector,
+    PipesMessageBatcher,
     PipesTempFileContextInjector,
     PipesTempFileMessageReader,
+    decode_message_lines,
     open_pipes_session,
 )
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecordStatus
@@ -86,7 +91,8 @@ def script_fn():
 
         context_loader = None
         message_writer = None
-        if context_injector_spec == "user/s3" or message_reader_spec == "user/s3":
+        use_s3_messages = message_reader_spec in ("user/s3", "user/s3-msgpack")
+        if context_injector_spec == "user/s3" or use_s3_messages:
             import boto3
 
             client = boto3.client(
@@ -94,7 +100,7 @@ def script_fn():
             )
             if context_injector_spec == "user/s3":
                 context_loader = PipesS3ContextLoader(client=client)
-            if message_reader_spec == "user/s3":
+            if use_s3_messages:
                 message_writer = PipesS3MessageWriter(client, interval=0.001)
 
         with open_dagster_pipes(
@@ -139,6 +145,8 @@ def s3_client() -> Iterator[boto3.client]:
         ("default", "default"),
         ("default", "user/file"),
         ("default", "user/s3"),
+        ("default", "user/file-msgpack"),
+        ("default", "user/s3-msgpack"),
         ("user/file", "default"),
         ("user/file", "user/file"),
         ("user/env", "default"),
@@ -168,6 +176,12 @@ def test_pipes_subprocess(
         message_reader = PipesS3MessageReader(
             bucket=_S3_TEST_BUCKET, client=s3_client, interval=0.001
         )
+    elif message_reader_spec == "user/file-msgpack":
+        message_reader = PipesTempFileMessageReader(message_format="msgpack")
+    elif message_reader_spec == "user/s3-msgpack":
+        message_reader = PipesS3MessageReader(
+            bucket=_S3_TEST_BUCKET, client=s3_client, interval=0.001, message_format="msgpack"
+        )
     else:
         assert False, "Unreachable"
 
@@ -536,3 +550,161 @@ def foo(context: OpExecutionContext, pipes_client: PipesSubprocessClient):
         assert len(pipes_msgs) == 2
         assert "successfully opened" in pipes_msgs[0]
         assert "did not receive closed message" in pipes_msgs[1]
+
+
+def test_pipes_many_messages():
+    def script_fn():
+        from dagster_pipes import open_dagster_pipes
+
+        with open_dagster_pipes() as context:
+            for i in range(2000):
+                context.log.info(f"line {i}")
+            context.log.warning("done")
+            context.report_asset_materialization(data_version="alpha")
+
+    @asset
+    def foo(context: OpExecutionContext, pipes_client: PipesSubprocessClient):
+        with temp_script(script_fn) as script_path:
+            cmd = [_PYTHON_EXECUTABLE, script_path]
+            return pipes_client.run(command=cmd, context=context).get_results()
+
+    with instance_for_test() as instance:
+        result = materialize(
+            [foo], instance=instance, resources={"pipes_client": PipesSubprocessClient()}
+        )
+        assert result.success
+        mat = instance.get_latest_materialization_event(foo.key)
+        assert mat and mat.asset_materialization
+        assert mat.asset_materialization.tags
+        assert mat.asset_materialization.tags[DATA_VERSION_TAG] == "alpha"
+
+        log_lines = [
+            line
+            for record in instance.get_records_for_run(result.run_id).records
+            if not record.event_log_entry.is_dagster_event
+            for line in record.event_log_entry.user_message.split("\n")
+        ]
+        assert [line for line in log_lines if line.startswith("line ")] == [
+            f"line {i}" for i in range(2000)
+        ]
+        assert "done" in log_lines
+        # consecutive log messages are coalesced into fewer log entries
+        assert len(instance.get_records_for_run(result.run_id, limit=10000).records) < 2000
+
+
+class _BlockingMessageHandler:
+    def __init__(self):
+        self.batches = []
+        self.can_handle = Event()
+
+    def handle_message_batch(self, messages):
+        self.can_handle.wait()
+        self.batches.append(list(messages))
+
+
+def test_pipes_message_batcher():
+    handler = _BlockingMessageHandler()
+    batcher = PipesMessageBatcher(handler, max_queue_size=2, max_batch_size=3)  # type: ignore
+    batcher.start()
+
+    messages = [{"method": "log", "params": {"message": str(i)}} for i in range(8)]
+    has_put_all = Event()
+
+    def _put():
+        for message in messages:
+            batcher.put_messages([message])  # type: ignore
+        has_put_all.set()
+
+    thread = Thread(target=_put)
+    thread.start()
+
+    # the handler thread holds one message, the queue two more, and the reader blocks
+    assert not has_put_all.wait(0.5)
+    handler.can_handle.set()
+    thread.join()
+    batcher.stop()
+
+    assert [message for batch in handler.batches for message in batch] == messages
+    assert all(len(batch) <= 3 for batch in handler.batches)
+    assert len(handler.batches) < len(messages)
+
+
+class _FailingMessageHandler:
+    def __init__(self):
+        self.batches = []
+
+    def handle_message_batch(self, messages):
+        self.batches.append(list(messages))
+        if len(self.batches) == 1:
+            raise Exception("handler failed")
+
+
+def test_pipes_message_batcher_handler_error():
+    handler = _FailingMessageHandler()
+    batcher = PipesMessageBatcher(handler, max_batch_size=1)  # type: ignore
+    batcher.start()
+
+    messages = [{"method": "log", "params": {"message": str(i)}} for i in range(3)]
+    batcher.put_messages(messages)  # type: ignore
+
+    # the error is raised on the thread that stops the batcher, after the remaining messages
+    # have been handled
+    with pytest.raises(Exception, match="handler failed"):
+        batcher.stop()
+    assert [message for batch in handler.batches for message in batch] == messages
+
+
+class _InMemoryBlobStoreMessageReader(PipesBlobStoreMessageReader):
+    def __init__(self, chunks, is_task_complete):
+        super().__init__(interval=0.01)
+        # responses to successive downloads of each chunk
+        self.chunks = chunks
+        self.is_task_complete = is_task_complete
+        self.downloaded_indexes = []
+
+    @contextmanager
+    def get_params(self):
+        yield {}
+
+    def download_messages_chunk(self, index, params):
+        self.downloaded_indexes.append(index)
+        responses = self.chunks.get(index)
+        if not responses:
+            # the external process is done once all chunks have been downloaded
+            self.is_task_complete.set()
+            return None
+        return responses.pop(0)
+
+    def no_messages_debug_text(self):
+        return ""
+
+
+def test_blob_store_message_reader_retries_empty_chunks():
+    handler = _BlockingMessageHandler()
+    handler.can_handle.set()
+    batcher = PipesMessageBatcher(handler)  # type: ignore
+    batcher.start()
+
+    is_task_complete = Event()
+    reader = _InMemoryBlobStoreMessageReader(
+        {
+            # the first download of chunk 1 happens before it is written
+            1: [b"", b'{"method": "log", "params": {"message": "1"}}'],
+            2: ['{"method": "log", "params": {"message": "2"}}'],
+        },
+        is_task_complete,
+    )
+    reader._messages_thread(batcher, {}, is_task_complete)  # noqa: SLF001
+    batcher.stop()
+
+    assert reader.downloaded_indexes[:3] == [1, 1, 2]
+    assert [message["params"]["message"] for batch in handler.batches for message in batch] == [
+        "1",
+        "2",
+    ]
+
+
+def test_decode_message_lines():
+    assert decode_message_lines(['{"a": 1}', "", '{"b": 2}']) == [{"a": 1}, {"b": 2}]
+    with pytest.raises(json.JSONDecodeError):
+        decode_message_lines(['{"a": 1}', "{"])
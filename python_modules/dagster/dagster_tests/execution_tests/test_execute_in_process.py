@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from dagster import (
     AssetKey,
@@ -6,8 +8,10 @@
     DagsterInvariantViolationError,
     DynamicOut,
     DynamicOutput,
+    OpExecutionContext,
     Out,
     Output,
+    RetryPolicy,
     RetryRequested,
     daily_partitioned_config,
     graph,
@@ -404,3 +408,97 @@ def some_graph():
     some_graph.to_job().execute_in_process()
 
     some_graph.alias("hello").execute_in_process()
+
+
+def test_execute_in_process_max_concurrent():
+    barrier = threading.Barrier(3, timeout=10)
+
+    @op
+    def emit_one():
+        # only passes once all three ops are running at the same time
+        barrier.wait()
+        return 1
+
+    @op(out=DynamicOut())
+    def fan_out(x, y, z):
+        for i in range(x + y + z):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(x):
+        return x * 2
+
+    @op
+    def total(xs):
+        return sum(xs)
+
+    @graph
+    def concurrent():
+        total(
+            fan_out(emit_one.alias("a")(), emit_one.alias("b")(), emit_one.alias("c")())
+            .map(double)
+            .collect()
+        )
+
+    result = concurrent.execute_in_process(max_concurrent=3)
+    assert result.success
+    assert result.output_for_node("total") == 6
+
+    for step_key in ["a", "b", "c", "fan_out", "total"]:
+        step_events = [event for event in result.all_events if event.step_key == step_key]
+        assert step_events[0].is_step_start
+        assert step_events[-1].is_step_success
+
+
+def test_execute_in_process_max_concurrent_failure():
+    @op
+    def emit_one():
+        return 1
+
+    @op
+    def fail(_x):
+        raise Exception("I have failed")
+
+    @op
+    def downstream(_x):
+        pass
+
+    @graph
+    def concurrent():
+        emit_one.alias("a")()
+        downstream(fail(emit_one.alias("b")()))
+
+    with pytest.raises(Exception, match="I have failed"):
+        concurrent.execute_in_process(max_concurrent=2)
+
+    result = concurrent.execute_in_process(max_concurrent=2, raise_on_error=False)
+    assert not result.success
+    assert result.is_node_success("a")
+    assert result.is_node_failed("fail")
+    assert result.is_node_untouched("downstream")
+
+
+def test_execute_in_process_max_concurrent_retry():
+    @op
+    def emit_one():
+        return 1
+
+    @op(retry_policy=RetryPolicy(max_retries=2))
+    def flaky(context: OpExecutionContext, x):
+        if context.retry_number < 2:
+            raise Exception("try again")
+        return x
+
+    @op
+    def downstream(x):
+        return x + 1
+
+    @graph
+    def concurrent():
+        emit_one.alias("a")()
+        downstream(flaky(emit_one.alias("b")()))
+
+    result = concurrent.execute_in_process(max_concurrent=2)
+    assert result.success
+    assert result.output_for_node("downstream") == 2
+    assert len(result.filter_events(lambda event: event.is_step_up_for_retry)) == 2
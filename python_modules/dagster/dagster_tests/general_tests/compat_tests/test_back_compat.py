@@ -1061,6 +1061,53 @@ def asset_job():
             assert get_sqlite3_indexes(db_path, "asset_event_tags") == []
 
 
+def test_add_asset_partition_events_table():
+    @op
+    def yields_partitioned_materializations(_):
+        yield AssetMaterialization(asset_key=AssetKey(["a"]), partition="x")
+        yield AssetMaterialization(asset_key=AssetKey(["a"]), partition="y")
+        yield Output(1)
+
+    @job
+    def asset_job():
+        yields_partitioned_materializations()
+
+    src_dir = file_relative_path(__file__, "snapshot_1_0_12_pre_add_asset_event_tags_table/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "asset_partition_events" not in get_sqlite3_tables(db_path)
+
+            # reads fall back to the event log while the summary table does not exist
+            asset_job.execute_in_process(instance=instance)
+            asset_job.execute_in_process(instance=instance)
+            expected_counts = {AssetKey(["a"]): {"x": 2, "y": 2}}
+            assert (
+                instance._event_storage.get_materialization_count_by_partition([AssetKey(["a"])])
+                == expected_counts
+            )
+
+            instance.upgrade()
+
+            # the summary table is backfilled from the event log
+            assert "asset_partition_events" in get_sqlite3_tables(db_path)
+            assert "idx_asset_partition_events" in get_sqlite3_indexes(
+                db_path, "asset_partition_events"
+            )
+            assert instance._event_storage.has_secondary_index("asset_partition_events_table")
+            assert (
+                instance._event_storage.get_materialization_count_by_partition([AssetKey(["a"])])
+                == expected_counts
+            )
+
+            instance._run_storage._alembic_downgrade(rev="ec80dd91891a")
+
+            assert "asset_partition_events" not in get_sqlite3_tables(db_path)
+            assert get_sqlite3_indexes(db_path, "asset_partition_events") == []
+
+
 def test_1_0_17_add_cached_status_data_column():
     src_dir = file_relative_path(
         __file__, "snapshot_1_0_17_pre_add_cached_status_data_column/sqlite"
@@ -29,3 +29,62 @@ def test_import_perf():
 
     # one way to debug imports is to `pip install tuna` then run
     # python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="fails on windows, unix coverage sufficient")
+def test_import_dagster_is_lazy():
+    result = subprocess.run(
+        ["python", "-X", "importtime", "-c", "import dagster"],
+        check=True,
+        capture_output=True,
+    )
+    import_profile = result.stderr.decode("utf-8")
+
+    # beyond the definitions layer, the public API is loaded on first attribute access, so a bare
+    # `import dagster` should not import the execution engine, storage, or their dependencies
+    assert "dagster._core.execution.api" not in import_profile
+    assert "dagster._core.storage.fs_io_manager" not in import_profile
+    assert "dagster._config.pythonic_config" not in import_profile
+    assert "pydantic" not in import_profile
+    assert "click" not in import_profile
+    assert "sqlalchemy" not in import_profile
+    assert "grpc" not in import_profile
+
+
+def test_lazy_imports_match_type_checking_imports():
+    import ast
+    import importlib
+
+    import dagster
+
+    with open(dagster.__file__, encoding="utf8") as f:
+        module_ast = ast.parse(f.read())
+
+    type_checking_imports = {}
+    for node in module_ast.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            for import_node in node.body:
+                if isinstance(import_node, ast.ImportFrom):
+                    for alias in import_node.names:
+                        type_checking_imports[alias.asname or alias.name] = import_node.module
+
+    assert type_checking_imports == dagster._LAZY_IMPORTS  # noqa: SLF001
+
+    for name, module in dagster._LAZY_IMPORTS.items():  # noqa: SLF001
+        assert getattr(dagster, name) is getattr(importlib.import_module(module), name)
+
+
+def test_star_import_includes_public_api():
+    import dagster
+
+    namespace = {}
+    exec("from dagster import *", namespace)
+
+    for name in ["asset", "Definitions", "materialize", "DagsterInstance", "__version__"]:
+        assert name in namespace
+    assert set(dagster._LAZY_IMPORTS) <= set(namespace)  # noqa: SLF001
+    assert namespace["asset"] is dagster.asset
@@ -10,6 +10,7 @@
     DbClient,
     DbIOManager,
     DbTypeHandler,
+    TableChunks,
     TablePartitionDimension,
     TableSlice,
 )
@@ -59,6 +60,19 @@ def supported_types(self):
         return [str]
 
 
+class ChunkedIntHandler(IntHandler):
+    def handle_output_chunks(
+        self, context: OutputContext, table_slice: TableSlice, chunks, connection
+    ):
+        chunks = list(chunks)
+        self.handle_output_calls.append((context, table_slice, chunks))
+        return {"row_count": len(chunks)}
+
+    def load_input_chunks(self, context: InputContext, table_slice: TableSlice, connection):
+        self.handle_input_calls.append((context, table_slice))
+        yield from [7, 8]
+
+
 def build_db_io_manager(type_handlers, db_client, resource_config_override=None):
     conf = resource_config_override if resource_config_override else resource_config
 
@@ -550,3 +564,155 @@ def test_default_load_type_determination():
         default_load_type=int,
     )
     assert manager._default_load_type == int  # noqa: SLF001
+
+
+def test_chunked_output_and_input():
+    handler = ChunkedIntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = DbIOManager(
+        type_handlers=[handler],
+        database=resource_config["database"],
+        db_client=db_client,
+        default_load_type=int,
+    )
+    asset_key = AssetKey(["schema1", "table1"])
+    output_context = build_output_context(asset_key=asset_key, resource_config=resource_config)
+    manager.handle_output(output_context, TableChunks(iter([1, 2, 3])))
+
+    table_slice = TableSlice(
+        database="database_abc", schema="schema1", table="table1", partition_dimensions=[]
+    )
+    assert len(handler.handle_output_calls) == 1
+    assert handler.handle_output_calls[0][1:] == (table_slice, [1, 2, 3])
+    assert output_context.get_logged_metadata()["row_count"].value == 3
+    db_client.delete_table_slice.assert_called_once_with(
+        output_context, table_slice, connect_mock().__enter__()
+    )
+
+    input_context = MagicMock(
+        upstream_output=output_context,
+        resource_config=resource_config,
+        dagster_type=resolve_dagster_type(TableChunks),
+        asset_key=asset_key,
+        has_asset_partitions=False,
+        metadata=None,
+    )
+    chunks = manager.load_input(input_context)
+    assert isinstance(chunks, TableChunks)
+    # chunks are loaded lazily
+    assert len(handler.handle_input_calls) == 0
+    assert list(chunks) == [7, 8]
+    assert handler.handle_input_calls[0][1] == table_slice
+
+
+def test_chunked_output_not_supported():
+    handler = IntHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    output_context = build_output_context(
+        asset_key=AssetKey(["schema1", "table1"]), resource_config=resource_config
+    )
+    with pytest.raises(NotImplementedError, match="IntHandler does not support writing chunks"):
+        manager.handle_output(output_context, TableChunks([1, 2]))
+
+
+def test_asset_out_by_partition():
+    handler = ChunkedIntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = DbIOManager(
+        type_handlers=[handler],
+        database=resource_config["database"],
+        db_client=db_client,
+        max_concurrent_partition_writes=2,
+    )
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = StaticPartitionsDefinition(["red", "yellow", "blue"])
+    output_context = MagicMock(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        asset_partition_keys=["red", "yellow", "blue"],
+        metadata={"partition_expr": "abc"},
+        asset_partitions_def=partitions_def,
+    )
+    manager.handle_output(
+        output_context, {"red": 1, "yellow": TableChunks([2, 3]), "blue": TableChunks([])}
+    )
+
+    def _table_slice(partition_key):
+        return TableSlice(
+            database="database_abc",
+            schema="schema1",
+            table="table1",
+            partition_dimensions=[
+                TablePartitionDimension(partitions=[partition_key], partition_expr="abc")
+            ],
+        )
+
+    assert sorted(call[1:] for call in handler.handle_output_calls) == sorted(
+        [(_table_slice("red"), 1), (_table_slice("yellow"), [2, 3])]
+    )
+    # the slice of every partition is deleted, including the empty ones
+    assert db_client.delete_table_slice.call_count == 3
+    output_context.add_output_metadata.assert_called_once_with({"row_count": 2, "Query": ""})
+
+    with pytest.raises(CheckError, match="expected the output of"):
+        manager.handle_output(output_context, {"red": 1})
+
+
+class MetadataIntHandler(IntHandler):
+    def __init__(self):
+        super().__init__()
+        self.handled_partition_keys = []
+
+    def handle_output(self, context: OutputContext, table_slice: TableSlice, obj: int, connection):
+        super().handle_output(context, table_slice, obj, connection)
+        assert isinstance(context, OutputContext)
+        self.handled_partition_keys.append(
+            (context.asset_partition_key, context.asset_partition_keys)
+        )
+        context.add_output_metadata({"row_count": obj})
+
+
+def test_asset_out_by_partition_without_chunks_support():
+    handler = MetadataIntHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = DbIOManager(
+        type_handlers=[handler],
+        database=resource_config["database"],
+        db_client=db_client,
+        max_concurrent_partition_writes=2,
+    )
+    output_context = MagicMock(
+        asset_key=AssetKey(["schema1", "table1"]),
+        resource_config=resource_config,
+        asset_partition_keys=["red", "yellow", "blue"],
+        metadata={"partition_expr": "abc"},
+        asset_partitions_def=StaticPartitionsDefinition(["red", "yellow", "blue"]),
+    )
+    manager.handle_output(output_context, {"red": 1, "yellow": 2, "blue": None})
+
+    assert sorted(
+        (call[1].partition_dimensions[0].partitions, call[2])
+        for call in handler.handle_output_calls
+    ) == [(["red"], 1), (["yellow"], 2)]
+    # the handler sees a context narrowed to the partition it writes
+    assert sorted(handler.handled_partition_keys) == [("red", ["red"]), ("yellow", ["yellow"])]
+    assert db_client.delete_table_slice.call_count == 3
+    # the metadata added by the handler for each partition is combined
+    output_context.add_output_metadata.assert_called_once_with({"row_count": 3, "Query": ""})
+
+
+def test_invalid_max_concurrent_partition_writes():
+    with pytest.raises(CheckError, match="max_concurrent_partition_writes must be positive"):
+        DbIOManager(
+            type_handlers=[IntHandler()],
+            database=resource_config["database"],
+            db_client=MagicMock(spec=DbClient),
+            max_concurrent_partition_writes=0,
+        )
@@ -2,7 +2,10 @@
 import os
 import sys
 import tempfile
+import threading
+import time
 import traceback
+from unittest import mock
 
 import pytest
 import sqlalchemy
@@ -17,8 +20,9 @@
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._core.utils import make_new_run_id
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TEST_TIMEOUT, TestEventLogStorage, create_test_event_log_record
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -109,6 +113,62 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
             excs.append(exceptions.get())
         assert not excs, excs
 
+    def test_watchers_share_single_watchdog(self, storage):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        watched = {run_id: ([], []) for run_id in run_ids}
+        for run_id in run_ids:
+            for events in watched[run_id]:
+                storage.watch(run_id, None, lambda x, _y, events=events: events.append(x))
+
+        assert len(storage._obs.emitters) == 1  # noqa: SLF001
+
+        for run_id in run_ids:
+            for i in range(3):
+                storage.store_event(create_test_event_log_record(str(i), run_id))
+
+        start = time.time()
+        while (
+            any(len(events) < 3 for lists in watched.values() for events in lists)
+            and time.time() - start < TEST_TIMEOUT
+        ):
+            time.sleep(0.01)
+
+        for run_id in run_ids:
+            for events in watched[run_id]:
+                assert [event.user_message for event in events] == ["0", "1", "2"]
+                assert all(event.run_id == run_id for event in events)
+
+        storage.end_watch(run_ids[0], next(iter(storage._watchers[run_ids[0]])))  # noqa: SLF001
+        assert len(storage._watchers[run_ids[0]]) == 1  # noqa: SLF001
+
+    def test_end_watch_while_handling_changes(self, storage):
+        run_id = make_new_run_id()
+        storage.store_event(create_test_event_log_record("0", run_id))
+
+        def _callback(_event, _cursor):
+            pass
+
+        end_watch_threads = []
+
+        class _EndWatchOnFirstCheck(dict):
+            def __contains__(self, key):
+                is_contained = super().__contains__(key)
+                if not end_watch_threads:
+                    # the watch ends on another thread just as the watchdog updates its cursor
+                    thread = threading.Thread(target=storage.end_watch, args=(run_id, _callback))
+                    end_watch_threads.append(thread)
+                    thread.start()
+                    thread.join(timeout=0.5)
+                return is_contained
+
+        storage.watch(run_id, None, _callback)
+        storage._watchers[run_id] = _EndWatchOnFirstCheck(storage._watchers[run_id])  # noqa: SLF001
+        storage.on_modified(run_id)
+        end_watch_threads[0].join()
+
+        # updating the cursor of the ended watch does not register it again
+        assert run_id not in storage._watchers  # noqa: SLF001
+
 
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
@@ -124,6 +184,24 @@ def event_log_storage(self):
             finally:
                 storage.dispose()
 
+    def test_asset_partition_events_table_absence_is_cached(self, storage):
+        with mock.patch.object(storage, "has_table", return_value=False) as has_table_mock:
+            with mock.patch("time.monotonic", return_value=1000.0):
+                assert not storage.has_asset_partition_events_table()
+                assert not storage.has_asset_partition_events_table()
+            assert has_table_mock.call_count == 1
+
+            # the table is checked for again once the cached result has expired
+            with mock.patch("time.monotonic", return_value=1060.0):
+                assert not storage.has_asset_partition_events_table()
+            assert has_table_mock.call_count == 2
+
+            has_table_mock.return_value = True
+            with mock.patch("time.monotonic", return_value=1120.0):
+                assert storage.has_asset_partition_events_table()
+                assert storage.has_asset_partition_events_table()
+            assert has_table_mock.call_count == 3
+
 
 class TestLegacyStorage(TestEventLogStorage):
     __test__ = True
@@ -7,11 +7,13 @@
 
 import pytest
 from dagster import (
+    AllPartitionMapping,
     AssetKey,
     AssetOut,
     AssetsDefinition,
     DagsterInstance,
     DailyPartitionsDefinition,
+    FilesystemIOManager,
     In,
     MetadataValue,
     MultiPartitionKey,
@@ -22,6 +24,7 @@
     PartitionsDefinition,
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
+    build_init_resource_context,
     define_asset_job,
     graph,
     job,
@@ -29,6 +32,7 @@
     op,
     with_resources,
 )
+from dagster._check import CheckError
 from dagster._core.definitions import AssetIn, asset, build_assets_job, multi_asset
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.definitions_class import Definitions
@@ -38,10 +42,16 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
+from dagster._core.storage.fs_io_manager_formats import (
+    COMPRESSION_MODULES,
+    PickleObjectFileFormat,
+    get_object_file_formats,
+)
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path
+from upath import UPath
 
 
 def define_job(io_manager: IOManagerDefinition):
@@ -605,3 +615,200 @@ def downstream_of_multipartitioned(multipartitioned):
         materializations = result.asset_materializations_for_node("downstream_of_multipartitioned")
         assert len(materializations) == 1
         assert "c/2020-04-22" in get_path_metadata_entry(materializations[0]).path
+
+
+class OutOfBandBytes:
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self), (pickle.PickleBuffer(self.data),)
+        return type(self), (bytes(self.data),)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_fs_io_manager_auto_serialization_format(memory_map: bool):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager_def = fs_io_manager.configured(
+            {"base_dir": tmpdir_path, "serialization_format": "auto", "memory_map": memory_map}
+        )
+
+        @asset
+        def out_of_band_asset():
+            return {"a": OutOfBandBytes(bytearray(b"abc" * 100)), "b": [1, 2, 3]}
+
+        @asset
+        def in_band_asset():
+            return [1, 2, 3]
+
+        @asset
+        def downstream_asset(out_of_band_asset, in_band_asset):
+            return (bytes(out_of_band_asset["a"].data), out_of_band_asset["b"], in_band_asset)
+
+        result = materialize(
+            with_resources(
+                [out_of_band_asset, in_band_asset, downstream_asset],
+                resource_defs={"io_manager": io_manager_def},
+            )
+        )
+        assert result.success
+        assert result.output_for_node("downstream_asset") == (b"abc" * 100, [1, 2, 3], [1, 2, 3])
+
+        with open(os.path.join(tmpdir_path, "out_of_band_asset"), "rb") as read_obj:
+            assert read_obj.read(7) == PickleObjectFileFormat().magic
+        with open(os.path.join(tmpdir_path, "in_band_asset"), "rb") as read_obj:
+            assert pickle.load(read_obj) == [1, 2, 3]
+
+
+def test_fs_io_manager_loads_any_format():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        path = UPath(tmpdir_path) / "obj"
+        value = OutOfBandBytes(bytearray(b"abc"))
+
+        PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, formats=get_object_file_formats("auto")
+        ).dump_to_path(None, value, path)  # type: ignore
+        loaded = PickledObjectFilesystemIOManager(base_dir=tmpdir_path).load_from_path(
+            None,  # type: ignore
+            path,
+        )
+        assert bytes(loaded.data) == b"abc"
+
+
+def test_fs_io_manager_invalid_format_config():
+    with pytest.raises(CheckError):
+        get_object_file_formats("feather")
+
+    with pytest.raises(CheckError):
+        get_object_file_formats("auto", "feather")
+
+    with pytest.raises(CheckError):
+        PickledObjectFilesystemIOManager(compression="gzip")
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4"])
+@pytest.mark.parametrize("serialization_format", ["pickle", "auto"])
+def test_fs_io_manager_compression(compression: str, serialization_format: str):
+    pytest.importorskip(COMPRESSION_MODULES[compression])
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager_def = fs_io_manager.configured(
+            {
+                "base_dir": tmpdir_path,
+                "serialization_format": serialization_format,
+                "compression": compression,
+            }
+        )
+
+        @asset
+        def upstream_asset():
+            return {"a": OutOfBandBytes(bytearray(b"abc" * 100)), "b": "b" * 1000}
+
+        @asset
+        def downstream_asset(upstream_asset):
+            return (bytes(upstream_asset["a"].data), upstream_asset["b"])
+
+        result = materialize(
+            with_resources(
+                [upstream_asset, downstream_asset],
+                resource_defs={"io_manager": io_manager_def},
+            )
+        )
+        assert result.success
+        assert result.output_for_node("downstream_asset") == (b"abc" * 100, "b" * 1000)
+        assert os.path.getsize(os.path.join(tmpdir_path, "upstream_asset")) < 1000
+
+
+@pytest.mark.parametrize("dataframe_format", ["arrow", "parquet"])
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_fs_io_manager_dataframes_and_arrays(dataframe_format: str, memory_map: bool):
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager_def = fs_io_manager.configured(
+            {
+                "base_dir": tmpdir_path,
+                "serialization_format": "auto",
+                "dataframe_format": dataframe_format,
+                "memory_map": memory_map,
+            }
+        )
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}, index=["i", "j", "k"])
+        array = np.arange(12).reshape(3, 4)
+
+        @asset
+        def df_asset():
+            return df
+
+        @asset
+        def array_asset():
+            return array
+
+        @asset
+        def unconvertible_df_asset():
+            return pd.DataFrame({0: [1, 2]})
+
+        @asset
+        def downstream_asset(df_asset, array_asset, unconvertible_df_asset):
+            assert df_asset.equals(df)
+            assert np.array_equal(array_asset, array)
+            assert unconvertible_df_asset.equals(pd.DataFrame({0: [1, 2]}))
+            return array_asset.flags.writeable
+
+        result = materialize(
+            with_resources(
+                [df_asset, array_asset, unconvertible_df_asset, downstream_asset],
+                resource_defs={"io_manager": io_manager_def},
+            )
+        )
+        assert result.success
+        assert result.output_for_node("downstream_asset") is not memory_map
+
+        magics = {"arrow": b"ARROW1", "parquet": b"PAR1"}
+        with open(os.path.join(tmpdir_path, "df_asset"), "rb") as read_obj:
+            assert read_obj.read(8).startswith(magics[dataframe_format])
+        with open(os.path.join(tmpdir_path, "array_asset"), "rb") as read_obj:
+            assert read_obj.read(6) == b"\x93NUMPY"
+
+
+def test_fs_io_manager_max_partition_workers():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager_def = fs_io_manager.configured(
+            {"base_dir": tmpdir_path, "max_partition_workers": 4}
+        )
+        io_manager = fs_io_manager(
+            build_init_resource_context(
+                config={"base_dir": tmpdir_path, "max_partition_workers": 4}
+            )
+        )
+        assert io_manager.max_partition_workers == 4
+
+        partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+        @asset(partitions_def=partitions_def)
+        def upstream_asset(context):
+            return context.partition_key
+
+        @asset(ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())})
+        def downstream_asset(upstream_asset):
+            return upstream_asset
+
+        resource_defs = {"io_manager": io_manager_def}
+        for partition_key in partitions_def.get_partition_keys():
+            assert materialize(
+                [upstream_asset], partition_key=partition_key, resources=resource_defs
+            ).success
+
+        # the upstream partitions are loaded concurrently
+        result = materialize(
+            [upstream_asset.to_source_asset(), downstream_asset], resources=resource_defs
+        )
+        assert result.output_for_node("downstream_asset") == {"a": "a", "b": "b", "c": "c"}
+
+    with pytest.raises(CheckError, match="max_partition_workers must be positive"):
+        FilesystemIOManager(base_dir="/tmp", max_partition_workers=0).create_io_manager(
+            build_init_resource_context()
+        )
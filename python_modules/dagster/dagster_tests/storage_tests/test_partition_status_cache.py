@@ -11,6 +11,7 @@
     MultiPartitionKey,
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
+    _check as check,
     asset,
     define_asset_job,
 )
@@ -788,3 +789,42 @@ def my_asset():
             asset_graph.get_partitions_def(asset_key)
         )
         assert failed_subset.get_partition_keys() == set()
+
+
+def test_deserialized_partition_subsets_kept_in_memory():
+    partitions_def = HourlyPartitionsDefinition(start_date="2022-01-01-00:00")
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_job = define_asset_job("asset_job").resolve(asset_graph=AssetGraph.from_assets([asset1]))
+
+    materialized_subsets = []
+    for partition_key in ["2022-02-01-00:00", "2022-02-01-01:00"]:
+        with instance_for_test() as instance:
+            asset_job.execute_in_process(instance=instance, partition_key=partition_key)
+
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert cached_status
+            materialized_subset = cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            )
+            assert list(materialized_subset.get_partition_keys()) == [partition_key]
+
+            # reading the same cache value again doesn't deserialize its subsets again
+            stored_cache_value = check.not_none(
+                next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+            )
+            assert stored_cache_value == cached_status
+            assert (
+                stored_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+                is materialized_subset
+            )
+            materialized_subsets.append(materialized_subset)
+
+    # the cache values of both instances have the same storage ids, but different subsets
+    assert materialized_subsets[0] != materialized_subsets[1]
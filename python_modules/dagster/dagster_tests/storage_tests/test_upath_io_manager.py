@@ -38,6 +38,10 @@
 from dagster._core.definitions import build_assets_job
 from dagster._core.events import HandledOutputData
 from dagster._core.storage.io_manager import IOManagerDefinition
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+)
 from dagster._core.storage.upath_io_manager import UPathIOManager
 from fsspec.asyn import AsyncFileSystem
 from pydantic import (
@@ -675,3 +679,81 @@ def downstream_asset(upstream_asset: Dict[str, str]):
     )
     downstream_asset_data = result.output_for_node("downstream_asset", "result")
     assert len(downstream_asset_data) == 1, "1 partition should be missing"
+
+
+def test_upath_io_manager_threaded_load_multiple_partitions(tmp_path: Path):
+    my_io_manager = PickleIOManager(UPath(tmp_path), max_partition_workers=4)
+
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+
+    @asset(partitions_def=upstream_partitions_def, io_manager_def=my_io_manager)
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())},
+        io_manager_def=my_io_manager,
+    )
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"allow_missing_partitions": True},
+            )
+        },
+        io_manager_def=my_io_manager,
+    )
+    def downstream_asset_allow_missing(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    for partition_key in ["A", "B"]:
+        materialize([upstream_asset], partition_key=partition_key)
+
+    with pytest.raises(FileNotFoundError):
+        materialize([upstream_asset.to_source_asset(), downstream_asset])
+
+    result = materialize([upstream_asset.to_source_asset(), downstream_asset_allow_missing])
+    assert result.output_for_node("downstream_asset_allow_missing", "result") == {
+        "A": "A",
+        "B": "B",
+    }
+
+    materialize([upstream_asset], partition_key="C")
+    result = materialize([upstream_asset.to_source_asset(), downstream_asset])
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert downstream_asset_data == {"A": "A", "B": "B", "C": "C"}
+
+
+@pytest.mark.parametrize("max_partition_workers", [1, 4])
+def test_upath_io_manager_store_multiple_partitions(tmp_path: Path, max_partition_workers: int):
+    my_io_manager = PickleIOManager(UPath(tmp_path), max_partition_workers=max_partition_workers)
+
+    partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+
+    @asset(partitions_def=partitions_def, io_manager_def=my_io_manager)
+    def upstream_asset(context: AssetExecutionContext) -> Dict[str, str]:
+        return {
+            partition_key: partition_key.lower()
+            for partition_key in context.asset_partition_keys_for_output()
+        }
+
+    result = materialize(
+        [upstream_asset],
+        tags={
+            ASSET_PARTITION_RANGE_START_TAG: "A",
+            ASSET_PARTITION_RANGE_END_TAG: "C",
+        },
+    )
+    assert result.success
+
+    for partition_key in ["A", "B", "C"]:
+        with (tmp_path / "upstream_asset" / partition_key).open("rb") as file:
+            assert pickle.load(file) == partition_key.lower()
+
+
+def test_upath_io_manager_invalid_max_partition_workers(tmp_path: Path):
+    with pytest.raises(CheckError):
+        PickleIOManager(UPath(tmp_path), max_partition_workers=0)
@@ -75,6 +75,7 @@
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
+    ASSET_PARTITION_EVENTS_TABLE,
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
@@ -2158,6 +2159,67 @@ def _fetch_counts(storage, after_cursor=None):
                     )
                     assert _fetch_counts(storage, after_cursor=9999999999) == {c: {}, d: {}}
 
+    def test_asset_partition_events_summary(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_secondary_index(
+            ASSET_PARTITION_EVENTS_TABLE
+        ):
+            pytest.skip("storage does not summarize asset partition events")
+
+        a = AssetKey("summarized_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetObservation(a, partition="x")
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(a, partition="x")
+            yield Output(None)
+
+        def _fetch_summary():
+            return (
+                storage.get_materialization_count_by_partition([a]),
+                storage.get_latest_storage_id_by_partition(
+                    a, DagsterEventType.ASSET_MATERIALIZATION
+                ),
+                storage.get_latest_storage_id_by_partition(a, DagsterEventType.ASSET_OBSERVATION),
+                storage.get_materialized_partitions(a),
+            )
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                _store_materialization_events(storage, materialize, created_instance, run_id_1)
+                summary_run_1 = _fetch_summary()
+                assert summary_run_1[0] == {a: {"x": 1, "y": 1}}
+
+                _store_materialization_events(storage, materialize_two, created_instance, run_id_2)
+                summary = _fetch_summary()
+                assert summary[0] == {a: {"x": 2, "y": 1}}
+                assert summary[1]["x"] > summary_run_1[1]["x"]
+                assert summary[1]["y"] == summary_run_1[1]["y"]
+                assert summary[2] == summary_run_1[2]
+
+                # the summary built on write matches the one built from the event log
+                storage.rebuild_asset_partition_events(a)
+                assert _fetch_summary() == summary
+
+                # deleting the events of a run rebuilds the summary of its partitions
+                storage.delete_events(run_id_2)
+                assert _fetch_summary() == summary_run_1
+
+                if self.can_wipe():
+                    storage.wipe_asset(a)
+                    assert _fetch_summary() == ({a: {}}, {}, {}, set())
+
     def test_get_latest_storage_ids_by_partition(self, storage, instance):
         a = AssetKey(["a"])
         b = AssetKey(["b"])
@@ -3,7 +3,7 @@
 import random
 import string
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 import boto3
 import dagster._check as check
@@ -13,6 +13,11 @@
     PipesParams,
 )
 from dagster._core.pipes.utils import PipesBlobStoreMessageReader, PipesBlobStoreStdioReader
+from dagster_pipes import (
+    PIPES_MESSAGE_FORMAT_JSON,
+    PIPES_MESSAGE_FORMAT_MSGPACK,
+    PipesMessageFormat,
+)
 
 if TYPE_CHECKING:
     from dagster_pipes import PipesContextData
@@ -68,6 +73,8 @@ class PipesS3MessageReader(PipesBlobStoreMessageReader):
         client (WorkspaceClient): A boto3 client.
         stdout_reader (Optional[PipesBlobStoreStdioReader]): A reader for reading stdout logs.
         stderr_reader (Optional[PipesBlobStoreStdioReader]): A reader for reading stderr logs.
+        message_format (str): The format that the external process is requested to write message
+            chunks in, `"json"` (the default) or `"msgpack"`.
     """
 
     def __init__(
@@ -78,9 +85,13 @@ def __init__(
         client: boto3.client,
         stdout_reader: Optional[PipesBlobStoreStdioReader] = None,
         stderr_reader: Optional[PipesBlobStoreStdioReader] = None,
+        message_format: PipesMessageFormat = PIPES_MESSAGE_FORMAT_JSON,
     ):
         super().__init__(
-            interval=interval, stdout_reader=stdout_reader, stderr_reader=stderr_reader
+            interval=interval,
+            stdout_reader=stdout_reader,
+            stderr_reader=stderr_reader,
+            message_format=message_format,
         )
         self.bucket = check.str_param(bucket, "bucket")
         self.client = client
@@ -90,11 +101,18 @@ def get_params(self) -> Iterator[PipesParams]:
         key_prefix = "".join(random.choices(string.ascii_letters, k=30))
         yield {"bucket": self.bucket, "key_prefix": key_prefix}
 
-    def download_messages_chunk(self, index: int, params: PipesParams) -> Optional[str]:
+    def download_messages_chunk(
+        self, index: int, params: PipesParams
+    ) -> Optional[Union[str, bytes]]:
         key = f"{params['key_prefix']}/{index}.json"
         try:
             obj = self.client.get_object(Bucket=self.bucket, Key=key)
-            return obj["Body"].read().decode("utf-8")
+            body = obj["Body"].read()
+            return (
+                body
+                if self.message_format == PIPES_MESSAGE_FORMAT_MSGPACK
+                else body.decode("utf-8")
+            )
         except ClientError:
             return None
 
@@ -1,6 +1,6 @@
 import pickle
 from contextlib import contextmanager
-from typing import Any, Iterator, Union
+from typing import Any, Iterator, Optional, Union
 
 from dagster import (
     InputContext,
@@ -32,6 +32,7 @@ def __init__(
         blob_client: Any,
         lease_client_constructor: Any,
         prefix: str = "dagster",
+        max_partition_workers: Optional[int] = None,
     ):
         self.adls2_client = adls2_client
         self.file_system_client = self.adls2_client.get_file_system_client(file_system)
@@ -43,7 +44,7 @@ def __init__(
         self.lease_client_constructor = lease_client_constructor
         self.lease_duration = _LEASE_DURATION
         self.file_system_client.get_file_system_properties()
-        super().__init__(base_path=UPath(self.prefix))
+        super().__init__(base_path=UPath(self.prefix), max_partition_workers=max_partition_workers)
 
     def get_op_output_relative_path(self, context: Union[InputContext, OutputContext]) -> UPath:
         parts = context.get_identifier()
@@ -182,6 +183,13 @@ def my_job():
     adls2_prefix: str = Field(
         default="dagster", description="ADLS Gen2 file system prefix to write to."
     )
+    max_partition_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of threads used to load or store multiple partitions of an asset"
+            " concurrently. Defaults to loading and storing partitions one at a time."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -196,6 +204,7 @@ def _internal_io_manager(self) -> PickledObjectADLS2IOManager:
             self.adls2.blob_client,
             self.adls2.lease_client_constructor,
             self.adls2_prefix,
+            max_partition_workers=self.max_partition_workers,
         )
 
     def load_input(self, context: "InputContext") -> Any:
@@ -294,5 +303,6 @@ def my_job():
         blob_client,
         lease_client,
         init_context.resource_config.get("adls2_prefix"),
+        max_partition_workers=init_context.resource_config.get("max_partition_workers"),
     )
     return pickled_io_manager
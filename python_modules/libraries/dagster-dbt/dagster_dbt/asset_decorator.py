@@ -27,16 +27,10 @@
     MANIFEST_METADATA_KEY,
     default_asset_check_fn,
     default_code_version_fn,
-    get_deps,
 )
 from .dagster_dbt_translator import DagsterDbtTranslator, DbtManifestWrapper, validate_translator
-from .dbt_manifest import DbtManifestParam, validate_manifest
-from .utils import (
-    ASSET_RESOURCE_TYPES,
-    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
-    output_name_fn,
-    select_unique_ids_from_manifest,
-)
+from .dbt_manifest import DbtManifestParam, get_manifest_index
+from .utils import output_name_fn
 
 
 def dbt_assets(
@@ -251,17 +245,11 @@ def partitionshop_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource
 
     """
     dagster_dbt_translator = validate_translator(dagster_dbt_translator)
-    manifest = validate_manifest(manifest)
+    manifest_index = get_manifest_index(manifest)
+    manifest = manifest_index.manifest
 
-    unique_ids = select_unique_ids_from_manifest(
-        select=select, exclude=exclude or "", manifest_json=manifest
-    )
-    node_info_by_dbt_unique_id = get_dbt_resource_props_by_dbt_unique_id_from_manifest(manifest)
-    deps = get_deps(
-        dbt_nodes=node_info_by_dbt_unique_id,
-        selected_unique_ids=unique_ids,
-        asset_resource_types=ASSET_RESOURCE_TYPES,
-    )
+    node_info_by_dbt_unique_id = manifest_index.dbt_nodes
+    deps = manifest_index.get_deps(select=select, exclude=exclude or "")
     (
         non_argument_deps,
         outs,
@@ -8,6 +8,8 @@
 from contextlib import suppress
 from dataclasses import dataclass, field
 from pathlib import Path
+from queue import Full, Queue
+from threading import Event, Thread
 from typing import (
     Any,
     Dict,
@@ -15,6 +17,7 @@
     List,
     Mapping,
     Optional,
+    Sequence,
     Union,
 )
 
@@ -23,6 +26,7 @@
 from dagster import (
     AssetCheckResult,
     AssetCheckSeverity,
+    AssetKey,
     AssetObservation,
     AssetsDefinition,
     ConfigurableResource,
@@ -64,6 +68,15 @@
 DBT_PROFILES_YML_NAME = "profiles.yml"
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
 
+# Maximum number of batches of Dagster events that have been translated from dbt events but not yet
+# consumed from `DbtCliInvocation.stream`. The thread translating dbt events blocks while this many
+# batches are buffered.
+DEFAULT_EVENT_BUFFER_SIZE = 64
+# Maximum number of bytes of dbt logs read at once. All the dbt events in a read are translated as
+# a batch.
+_DBT_LOGS_READ_SIZE = 1024 * 1024
+_EVENT_BUFFER_PUT_TIMEOUT = 0.1
+
 
 def _get_dbt_target_path() -> Path:
     return Path(os.getenv("DBT_TARGET_PATH", "target"))
@@ -115,11 +128,7 @@ def to_default_asset_events(
         """
         dagster_dbt_translator = validate_translator(dagster_dbt_translator)
 
-        if self.raw_event["info"]["level"] == "debug":
-            return
-
-        event_node_info: Dict[str, Any] = self.raw_event["data"].get("node_info")
-        if not event_node_info:
+        if not self._node_info:
             return
 
         manifest = validate_manifest(manifest)
@@ -129,6 +138,29 @@ def to_default_asset_events(
                 "No dbt manifest was provided. Dagster events for dbt tests will not be created."
             )
 
+        yield from self._to_default_asset_events(
+            manifest=manifest,
+            dagster_dbt_translator=dagster_dbt_translator,
+            asset_keys_by_unique_id=_DbtAssetKeysByUniqueId(manifest, dagster_dbt_translator),
+        )
+
+    @property
+    def _node_info(self) -> Optional[Dict[str, Any]]:
+        if self.raw_event["info"]["level"] == "debug":
+            return None
+
+        return self.raw_event["data"].get("node_info")
+
+    def _to_default_asset_events(
+        self,
+        manifest: Mapping[str, Any],
+        dagster_dbt_translator: DagsterDbtTranslator,
+        asset_keys_by_unique_id: Mapping[str, AssetKey],
+    ) -> Iterator[Union[Output, AssetObservation, AssetCheckResult]]:
+        event_node_info = self._node_info
+        if not event_node_info:
+            return
+
         invocation_id: str = self.raw_event["info"]["invocation_id"]
         unique_id: str = event_node_info["unique_id"]
         node_resource_type: str = event_node_info["resource_type"]
@@ -167,35 +199,40 @@ def to_default_asset_events(
                 is_test_successful = node_status == TestStatus.Pass
                 severity = AssetCheckSeverity(test_resource_props["config"]["severity"].upper())
 
-                attached_node_resource_props: Dict[str, Any] = manifest["nodes"].get(
-                    attached_node_unique_id
-                ) or manifest["sources"].get(attached_node_unique_id)
-                attached_node_asset_key = dagster_dbt_translator.get_asset_key(
-                    attached_node_resource_props
-                )
-
                 yield AssetCheckResult(
                     passed=is_test_successful,
-                    asset_key=attached_node_asset_key,
+                    asset_key=asset_keys_by_unique_id[attached_node_unique_id],
                     check_name=event_node_info["node_name"],
                     metadata=metadata,
                     severity=severity,
                 )
             else:
                 for upstream_unique_id in upstream_unique_ids:
-                    upstream_resource_props: Dict[str, Any] = manifest["nodes"].get(
-                        upstream_unique_id
-                    ) or manifest["sources"].get(upstream_unique_id)
-                    upstream_asset_key = dagster_dbt_translator.get_asset_key(
-                        upstream_resource_props
-                    )
-
                     yield AssetObservation(
-                        asset_key=upstream_asset_key,
+                        asset_key=asset_keys_by_unique_id[upstream_unique_id],
                         metadata=metadata,
                     )
 
 
+class _DbtAssetKeysByUniqueId(Dict[str, AssetKey]):
+    """The asset keys of the nodes and sources of a dbt manifest, by unique id. Each asset key is
+    translated on its first lookup, and then reused for the lifetime of the mapping.
+    """
+
+    def __init__(self, manifest: Mapping[str, Any], dagster_dbt_translator: DagsterDbtTranslator):
+        super().__init__()
+        self._manifest = manifest
+        self._dagster_dbt_translator = dagster_dbt_translator
+
+    def __missing__(self, unique_id: str) -> AssetKey:
+        resource_props: Dict[str, Any] = self._manifest["nodes"].get(unique_id) or (
+            self._manifest["sources"].get(unique_id)
+        )
+        asset_key = self._dagster_dbt_translator.get_asset_key(resource_props)
+        self[unique_id] = asset_key
+        return asset_key
+
+
 @dataclass
 class DbtCliInvocation:
     """The representation of an invoked dbt command.
@@ -327,6 +364,10 @@ def is_successful(self) -> bool:
     def stream(self) -> Iterator[Union[Output, AssetObservation, AssetCheckResult]]:
         """Stream the events from the dbt CLI process and convert them to Dagster events.
 
+        The dbt events are parsed and converted on a background thread, so that they can be
+        processed while the Dagster events are handled. At most `DEFAULT_EVENT_BUFFER_SIZE` batches
+        of Dagster events are buffered before the background thread waits for them to be consumed.
+
         Returns:
             Iterator[Union[Output, AssetObservation, AssetCheckResult]]: A set of corresponding Dagster events.
                 - Output for refables (e.g. models, seeds, snapshots.)
@@ -343,10 +384,48 @@ def stream(self) -> Iterator[Union[Output, AssetObservation, AssetCheckResult]]:
                 def my_dbt_assets(context, dbt: DbtCliResource):
                     yield from dbt.cli(["run"], context=context).stream()
         """
-        for event in self.stream_raw_events():
-            yield from event.to_default_asset_events(
-                manifest=self.manifest, dagster_dbt_translator=self.dagster_dbt_translator
-            )
+        event_batches: Queue = Queue(maxsize=DEFAULT_EVENT_BUFFER_SIZE)
+        is_closed = Event()
+        thread = Thread(
+            target=self._translate_events_thread, args=(event_batches, is_closed), daemon=True
+        )
+        thread.start()
+        try:
+            while True:
+                event_batch = event_batches.get()
+                if event_batch is None:
+                    break
+                elif isinstance(event_batch, BaseException):
+                    raise event_batch
+
+                yield from event_batch
+        finally:
+            # unblocks the background thread if the stream is closed before it is exhausted
+            is_closed.set()
+
+    def _translate_events_thread(self, event_batches: Queue, is_closed: Event) -> None:
+        # asset keys are translated once per dbt node rather than once per dbt event
+        asset_keys_by_unique_id = _DbtAssetKeysByUniqueId(
+            self.manifest, self.dagster_dbt_translator
+        )
+        result: Optional[BaseException] = None
+        try:
+            for raw_events in self._stream_raw_event_batches():
+                event_batch = [
+                    asset_event
+                    for raw_event in raw_events
+                    for asset_event in raw_event._to_default_asset_events(  # noqa: SLF001
+                        manifest=self.manifest,
+                        dagster_dbt_translator=self.dagster_dbt_translator,
+                        asset_keys_by_unique_id=asset_keys_by_unique_id,
+                    )
+                ]
+                if event_batch and not _put_event_batch(event_batches, event_batch, is_closed):
+                    return
+        except BaseException as e:
+            result = e
+
+        _put_event_batch(event_batches, result, is_closed)
 
     @public
     def stream_raw_events(self) -> Iterator[DbtCliEventMessage]:
@@ -355,30 +434,56 @@ def stream_raw_events(self) -> Iterator[DbtCliEventMessage]:
         Returns:
             Iterator[DbtCliEventMessage]: An iterator of events from the dbt CLI process.
         """
+        for raw_events in self._stream_raw_event_batches():
+            yield from raw_events
+
+    def _stream_raw_event_batches(self) -> Iterator[Sequence[DbtCliEventMessage]]:
+        """Stream the events from the dbt CLI process, in batches of the events that were available
+        at once.
+        """
+        partial_line = b""
         with self.process.stdout or contextlib.nullcontext():
-            for raw_line in self.process.stdout or []:
-                log: str = raw_line.decode().strip()
-                try:
-                    event = DbtCliEventMessage.from_log(log=log)
-
-                    # Parse the error message from the event, if it exists.
-                    is_error_message = event.raw_event["info"]["level"] == "error"
-                    if is_error_message:
-                        self._error_messages.append(str(event))
-
-                    # Re-emit the logs from dbt CLI process into stdout.
-                    sys.stdout.write(str(event) + "\n")
-                    sys.stdout.flush()
-
-                    yield event
-                except:
-                    # If we can't parse the log, then just emit it as a raw log.
-                    sys.stdout.write(log + "\n")
-                    sys.stdout.flush()
+            while self.process.stdout:
+                data = self.process.stdout.read1(_DBT_LOGS_READ_SIZE)  # type: ignore
+                if not data:
+                    break
+
+                raw_lines = (partial_line + data).split(b"\n")
+                partial_line = raw_lines.pop()
+                yield self._parse_raw_lines(raw_lines)
+
+        if partial_line:
+            yield self._parse_raw_lines([partial_line])
 
         # Ensure that the dbt CLI process has completed.
         self._raise_on_error()
 
+    def _parse_raw_lines(self, raw_lines: Sequence[bytes]) -> Sequence[DbtCliEventMessage]:
+        events: List[DbtCliEventMessage] = []
+        logs: List[str] = []
+        for raw_line in raw_lines:
+            log: str = raw_line.decode().strip()
+            try:
+                event = DbtCliEventMessage.from_log(log=log)
+
+                # Parse the error message from the event, if it exists.
+                is_error_message = event.raw_event["info"]["level"] == "error"
+                if is_error_message:
+                    self._error_messages.append(str(event))
+
+                logs.append(str(event))
+                events.append(event)
+            except:
+                # If we can't parse the log, then just emit it as a raw log.
+                logs.append(log)
+
+        # Re-emit the logs from dbt CLI process into stdout.
+        if logs:
+            sys.stdout.write("\n".join(logs) + "\n")
+            sys.stdout.flush()
+
+        return events
+
     @public
     def get_artifact(
         self,
@@ -445,6 +550,20 @@ def _raise_on_error(self) -> None:
             )
 
 
+def _put_event_batch(event_batches: Queue, event_batch: Any, is_closed: Event) -> bool:
+    """Put a batch on the given queue, waiting for room unless the queue is no longer consumed.
+    Returns whether the batch was put.
+    """
+    while not is_closed.is_set():
+        try:
+            event_batches.put(event_batch, timeout=_EVENT_BUFFER_PUT_TIMEOUT)
+            return True
+        except Full:
+            pass
+
+    return False
+
+
 class DbtCliResource(ConfigurableResource):
     """A resource used to execute dbt CLI commands.
 
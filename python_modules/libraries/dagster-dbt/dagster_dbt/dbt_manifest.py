@@ -1,8 +1,23 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Mapping, Union, cast
+from typing import AbstractSet, Any, Dict, FrozenSet, Mapping, Optional, Tuple, Union, cast
 
 import dagster._check as check
 import orjson
+from dagster import get_dagster_logger
+
+from .asset_utils import get_deps
+from .utils import (
+    ASSET_RESOURCE_TYPES,
+    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
+    select_unique_ids_from_manifest,
+)
+
+logger = get_dagster_logger()
 
 DbtManifestParam = Union[Mapping[str, Any], str, Path]
 
@@ -17,3 +32,187 @@ def validate_manifest(manifest: DbtManifestParam) -> Mapping[str, Any]:
         manifest = cast(Mapping[str, Any], orjson.loads(manifest.read_bytes()))
 
     return manifest
+
+
+# Bump when the contents of persisted manifest indexes change.
+_MANIFEST_INDEX_VERSION = 1
+MANIFEST_INDEX_SUFFIX = ".dagster-index.json"
+# Maximum number of manifests whose indexes are kept in memory.
+_MAX_CACHED_MANIFEST_INDEXES = 16
+
+
+class DbtManifestIndex:
+    """Indexes of a dbt manifest that are expensive to compute: the unique ids selected by dbt
+    selection strings, and the dependencies between the selected dbt assets.
+
+    The indexes of a manifest file are persisted to a file next to it, keyed by the hash of the
+    contents of the manifest, so that they are computed once for all the processes that load the
+    same manifest.
+
+    Use :py:func:`get_manifest_index` to get the index of a manifest.
+    """
+
+    def __init__(
+        self,
+        manifest: Mapping[str, Any],
+        manifest_hash: Optional[str] = None,
+        index_path: Optional[Path] = None,
+    ):
+        self.manifest = manifest
+        self._manifest_hash = manifest_hash
+        self._index_path = index_path
+        self._lock = threading.Lock()
+        self._dbt_nodes: Optional[Mapping[str, Mapping[str, Any]]] = None
+        self._selections: Dict[Tuple[str, str], AbstractSet[str]] = {}
+        self._deps: Dict[Tuple[str, str], Mapping[str, FrozenSet[str]]] = {}
+        self._read_index()
+
+    @property
+    def dbt_nodes(self) -> Mapping[str, Mapping[str, Any]]:
+        """The dbt nodes, sources, exposures and metrics of the manifest, by unique id."""
+        if self._dbt_nodes is None:
+            self._dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(self.manifest)
+        return self._dbt_nodes
+
+    def select_unique_ids(self, select: str, exclude: str) -> AbstractSet[str]:
+        """The unique ids of the dbt resources selected by the given selection strings."""
+        with self._lock:
+            key = (select, exclude)
+            if key not in self._selections:
+                self._selections[key] = frozenset(
+                    select_unique_ids_from_manifest(
+                        select=select, exclude=exclude, manifest_json=self.manifest
+                    )
+                )
+                self._write_index()
+            return self._selections[key]
+
+    def get_deps(self, select: str, exclude: str) -> Mapping[str, FrozenSet[str]]:
+        """The unique ids of the upstream dependencies of the dbt assets selected by the given
+        selection strings, by unique id.
+        """
+        unique_ids = self.select_unique_ids(select, exclude)
+        with self._lock:
+            key = (select, exclude)
+            if key not in self._deps:
+                self._deps[key] = get_deps(
+                    dbt_nodes=self.dbt_nodes,
+                    selected_unique_ids=unique_ids,
+                    asset_resource_types=ASSET_RESOURCE_TYPES,
+                )
+                self._write_index()
+            return self._deps[key]
+
+    def _read_index(self) -> None:
+        if not self._index_path:
+            return
+
+        try:
+            index = orjson.loads(self._index_path.read_bytes())
+        except (OSError, ValueError):
+            return
+
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != _MANIFEST_INDEX_VERSION
+            or index.get("manifest_hash") != self._manifest_hash
+        ):
+            return
+
+        for selection in index["selections"]:
+            key = (selection["select"], selection["exclude"])
+            self._selections[key] = frozenset(selection["unique_ids"])
+            if selection.get("deps") is not None:
+                self._deps[key] = {
+                    unique_id: frozenset(parent_unique_ids)
+                    for unique_id, parent_unique_ids in selection["deps"].items()
+                }
+
+    def _write_index(self) -> None:
+        if not self._index_path:
+            return
+
+        index = {
+            "version": _MANIFEST_INDEX_VERSION,
+            "manifest_hash": self._manifest_hash,
+            "selections": [
+                {
+                    "select": select,
+                    "exclude": exclude,
+                    "unique_ids": sorted(unique_ids),
+                    "deps": (
+                        {
+                            unique_id: sorted(parent_unique_ids)
+                            for unique_id, parent_unique_ids in self._deps[
+                                (select, exclude)
+                            ].items()
+                        }
+                        if (select, exclude) in self._deps
+                        else None
+                    ),
+                }
+                for (select, exclude), unique_ids in self._selections.items()
+            ],
+        }
+
+        # write to a temporary file first, so that concurrent readers never see a partial index
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self._index_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(index))
+                os.replace(temp_path, self._index_path)
+            except:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Unable to write the dbt manifest index to `{self._index_path}`: {e}")
+
+
+_manifest_indexes_lock = threading.Lock()
+_manifest_indexes: "OrderedDict[Any, Tuple[Any, DbtManifestIndex]]" = OrderedDict()
+
+
+def get_manifest_index(manifest: DbtManifestParam) -> DbtManifestIndex:
+    """Get the index of the given manifest, reusing the index of previous calls for the same manifest
+    in the current process.
+
+    The index of a manifest file is persisted next to it and reused across processes. The index
+    of a manifest that is passed as a dictionary is only kept in memory.
+    """
+    check.inst_param(manifest, "manifest", (Path, str, dict))
+
+    if isinstance(manifest, str):
+        manifest = Path(manifest)
+
+    if isinstance(manifest, Path):
+        manifest_path = manifest.resolve()
+        stat = manifest_path.stat()
+        cache_key: Any = (str(manifest_path), stat.st_mtime_ns, stat.st_size)
+    else:
+        # the manifest is kept alive by the cache entry, so that its id is not reused
+        manifest_path = None
+        cache_key = id(manifest)
+
+    with _manifest_indexes_lock:
+        cache_entry = _manifest_indexes.get(cache_key)
+        if cache_entry is not None:
+            _manifest_indexes.move_to_end(cache_key)
+            return cache_entry[1]
+
+    if manifest_path is not None:
+        manifest_bytes = manifest_path.read_bytes()
+        manifest_index = DbtManifestIndex(
+            manifest=orjson.loads(manifest_bytes),
+            manifest_hash=hashlib.sha256(manifest_bytes).hexdigest(),
+            index_path=manifest_path.with_suffix(MANIFEST_INDEX_SUFFIX),
+        )
+    else:
+        manifest_index = DbtManifestIndex(manifest=cast(Mapping[str, Any], manifest))
+
+    with _manifest_indexes_lock:
+        _manifest_indexes[cache_key] = (manifest, manifest_index)
+        while len(_manifest_indexes) > _MAX_CACHED_MANIFEST_INDEXES:
+            _manifest_indexes.popitem(last=False)
+
+    return manifest_index
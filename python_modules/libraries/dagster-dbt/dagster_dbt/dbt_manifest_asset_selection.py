@@ -9,12 +9,8 @@
 
 from .asset_utils import is_non_asset_node
 from .dagster_dbt_translator import DagsterDbtTranslator
-from .dbt_manifest import DbtManifestParam, validate_manifest
-from .utils import (
-    ASSET_RESOURCE_TYPES,
-    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
-    select_unique_ids_from_manifest,
-)
+from .dbt_manifest import DbtManifestParam, get_manifest_index
+from .utils import ASSET_RESOURCE_TYPES
 
 
 class DbtManifestAssetSelection(AssetSelection):
@@ -47,7 +43,8 @@ def __init__(
         dagster_dbt_translator: Optional[DagsterDbtTranslator] = None,
         exclude: Optional[str] = None,
     ) -> None:
-        self.manifest = validate_manifest(manifest)
+        self._manifest_index = get_manifest_index(manifest)
+        self.manifest = self._manifest_index.manifest
         self.select = check.str_param(select, "select")
         self.exclude = check.opt_str_param(exclude, "exclude", default="")
         self.dagster_dbt_translator = check.opt_inst_param(
@@ -56,15 +53,21 @@ def __init__(
             DagsterDbtTranslator,
             DagsterDbtTranslator(),
         )
+        self._asset_keys: Optional[AbstractSet[AssetKey]] = None
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(self.manifest)
+        # the selected keys only depend on the manifest, so they are translated once
+        if self._asset_keys is None:
+            self._asset_keys = self._resolve_asset_keys()
+
+        return self._asset_keys
+
+    def _resolve_asset_keys(self) -> AbstractSet[AssetKey]:
+        dbt_nodes = self._manifest_index.dbt_nodes
 
         keys = set()
-        for unique_id in select_unique_ids_from_manifest(
-            select=self.select,
-            exclude=self.exclude,
-            manifest_json=self.manifest,
+        for unique_id in self._manifest_index.select_unique_ids(
+            select=self.select, exclude=self.exclude
         ):
             dbt_resource_props = dbt_nodes[unique_id]
             is_dbt_asset = dbt_resource_props["resource_type"] in ASSET_RESOURCE_TYPES
@@ -2,12 +2,15 @@
 import json
 import os
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from typing import List, Optional, Union, cast
 
 import pytest
 from dagster import (
     AssetCheckResult,
+    AssetKey,
     AssetObservation,
     FloatMetadataValue,
     Output,
@@ -22,6 +25,7 @@
 from dagster_dbt.core.resources_v2 import (
     PARTIAL_PARSE_FILE_NAME,
     DbtCliEventMessage,
+    DbtCliInvocation,
     DbtCliResource,
 )
 from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator, DagsterDbtTranslatorSettings
@@ -559,3 +563,108 @@ def test_dbt_tests_to_events(is_asset_check: bool) -> None:
 
     assert len(asset_events) == 1
     assert all(isinstance(e, expected_event_type) for e in asset_events)
+
+
+class _CountingDagsterDbtTranslator(DagsterDbtTranslator):
+    def __init__(self):
+        super().__init__()
+        self.translated_unique_ids = []
+
+    def get_asset_key(self, dbt_resource_props):
+        self.translated_unique_ids.append(dbt_resource_props["name"])
+        return super().get_asset_key(dbt_resource_props)
+
+
+def _run_fake_dbt(raw_events: List[dict], exit_code: int) -> subprocess.Popen:
+    # emits the given events as dbt would with `--log-format json`
+    script = "\n".join(
+        [f"print({json.dumps(json.dumps(raw_event))})" for raw_event in raw_events]
+        + ["print('not a json log')", f"raise SystemExit({exit_code})"]
+    )
+    return subprocess.Popen(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+
+
+@pytest.mark.parametrize("exit_code", [0, 1])
+def test_stream_in_background(tmp_path: Path, exit_code: int) -> None:
+    manifest = {
+        "nodes": {
+            "model.a": {"resource_type": "model", "config": {}, "name": "a"},
+            **{
+                f"test.{i}": {"resource_type": "test", "config": {"severity": "ERROR"}}
+                for i in range(10)
+            },
+        },
+        "sources": {},
+        "parent_map": {f"test.{i}": ["model.a"] for i in range(10)},
+    }
+    raw_events = [
+        {
+            "info": {"level": "info", "invocation_id": "1-2-3", "msg": f"test {i}"},
+            "data": {
+                "node_info": {
+                    "unique_id": f"test.{i}",
+                    "resource_type": "test",
+                    "node_name": f"test_{i}",
+                    "node_status": "pass",
+                    "node_finished_at": "2024-01-01T00:00:00Z",
+                },
+            },
+        }
+        for i in range(10)
+    ]
+    dagster_dbt_translator = _CountingDagsterDbtTranslator()
+    dbt_cli_invocation = DbtCliInvocation(
+        process=_run_fake_dbt(raw_events, exit_code),
+        manifest=manifest,
+        dagster_dbt_translator=dagster_dbt_translator,
+        project_dir=tmp_path,
+        target_path=tmp_path,
+        raise_on_error=True,
+    )
+
+    asset_events = []
+    if exit_code:
+        with pytest.raises(DagsterDbtCliRuntimeError):
+            for asset_event in dbt_cli_invocation.stream():
+                asset_events.append(asset_event)
+    else:
+        asset_events = list(dbt_cli_invocation.stream())
+
+    assert len(asset_events) == 10
+    assert all(isinstance(e, AssetObservation) for e in asset_events)
+    assert all(e.asset_key == AssetKey(["a"]) for e in asset_events)
+    # asset keys are translated once per dbt node
+    assert dagster_dbt_translator.translated_unique_ids == ["a"]
+
+
+def test_stream_closed_early(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("dagster_dbt.core.resources_v2.DEFAULT_EVENT_BUFFER_SIZE", 1)
+
+    raw_event = {
+        "info": {"level": "info", "invocation_id": "1-2-3", "msg": "model a"},
+        "data": {
+            "node_info": {
+                "unique_id": "model.a",
+                "resource_type": "model",
+                "node_name": "a",
+                "node_status": "success",
+                "node_started_at": "2024-01-01T00:00:00Z",
+                "node_finished_at": "2024-01-01T00:01:00Z",
+            },
+        },
+    }
+    dbt_cli_invocation = DbtCliInvocation(
+        process=_run_fake_dbt([raw_event] * 10, 0),
+        manifest={"nodes": {}, "sources": {}},
+        dagster_dbt_translator=DagsterDbtTranslator(),
+        project_dir=tmp_path,
+        target_path=tmp_path,
+        raise_on_error=True,
+    )
+
+    stream = dbt_cli_invocation.stream()
+    assert isinstance(next(stream), Output)
+    stream.close()
+    assert dbt_cli_invocation.process.wait() == 0
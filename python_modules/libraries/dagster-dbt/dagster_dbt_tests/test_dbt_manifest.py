@@ -0,0 +1,68 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from dagster_dbt import dbt_manifest
+from dagster_dbt.dbt_manifest import MANIFEST_INDEX_SUFFIX, get_manifest_index
+
+pytest.importorskip("dbt.version", minversion="1.4")
+
+
+manifest_path = Path(__file__).joinpath("..", "sample_manifest.json").resolve()
+
+
+@pytest.fixture
+def temp_manifest_path(tmp_path: Path, monkeypatch) -> Path:
+    # start every test with no indexes in memory
+    monkeypatch.setattr(dbt_manifest, "_manifest_indexes", dbt_manifest.OrderedDict())
+
+    temp_manifest_path = tmp_path.joinpath("manifest.json")
+    shutil.copy(manifest_path, temp_manifest_path)
+    return temp_manifest_path
+
+
+def _fail_selection(**kwargs):
+    raise Exception("dbt selection should not run")
+
+
+def test_manifest_index_is_persisted(temp_manifest_path: Path, monkeypatch) -> None:
+    manifest_index = get_manifest_index(temp_manifest_path)
+    assert get_manifest_index(str(temp_manifest_path)) is manifest_index
+
+    unique_ids = manifest_index.select_unique_ids(select="fqn:*", exclude="")
+    deps = manifest_index.get_deps(select="fqn:*", exclude="")
+    assert unique_ids
+    assert deps
+    assert temp_manifest_path.with_suffix(MANIFEST_INDEX_SUFFIX).exists()
+
+    # another process loads the persisted index
+    monkeypatch.setattr(dbt_manifest, "_manifest_indexes", dbt_manifest.OrderedDict())
+    monkeypatch.setattr(dbt_manifest, "select_unique_ids_from_manifest", _fail_selection)
+    persisted_manifest_index = get_manifest_index(temp_manifest_path)
+    assert persisted_manifest_index is not manifest_index
+    assert persisted_manifest_index.select_unique_ids(select="fqn:*", exclude="") == unique_ids
+    assert persisted_manifest_index.get_deps(select="fqn:*", exclude="") == deps
+
+    with pytest.raises(Exception, match="should not run"):
+        persisted_manifest_index.select_unique_ids(select="tag:foo", exclude="")
+
+
+def test_manifest_index_invalidated_by_manifest_change(
+    temp_manifest_path: Path, monkeypatch
+) -> None:
+    get_manifest_index(temp_manifest_path).select_unique_ids(select="fqn:*", exclude="")
+
+    temp_manifest_path.write_bytes(temp_manifest_path.read_bytes() + b"\n")
+    monkeypatch.setattr(dbt_manifest, "select_unique_ids_from_manifest", _fail_selection)
+    with pytest.raises(Exception, match="should not run"):
+        get_manifest_index(temp_manifest_path).select_unique_ids(select="fqn:*", exclude="")
+
+
+def test_manifest_index_not_persisted_for_dict(temp_manifest_path: Path) -> None:
+    manifest = dbt_manifest.validate_manifest(temp_manifest_path)
+    manifest_index = get_manifest_index(manifest)
+    assert get_manifest_index(manifest) is manifest_index
+    assert manifest_index.manifest is manifest
+
+    assert manifest_index.select_unique_ids(select="fqn:*", exclude="")
+    assert not temp_manifest_path.with_suffix(MANIFEST_INDEX_SUFFIX).exists()
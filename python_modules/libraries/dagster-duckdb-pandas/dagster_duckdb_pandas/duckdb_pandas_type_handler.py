@@ -1,7 +1,9 @@
-from typing import Optional, Sequence, Type
+import uuid
+from typing import Iterator, Mapping, Optional, Sequence, Type
 
 import pandas as pd
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
+from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
 from dagster_duckdb.io_manager import (
     DuckDbClient,
@@ -9,6 +11,63 @@
     build_duckdb_io_manager,
 )
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _to_arrow_if_supported(obj: pd.DataFrame):
+    """Converts the DataFrame to an Arrow table, which DuckDB scans faster than a DataFrame, unless
+    pyarrow is not installed or the DataFrame has columns that would be stored with a different type.
+    """
+    # DuckDB stores pandas categoricals as ENUMs, but Arrow dictionaries as VARCHARs
+    if pa is None or any(isinstance(dtype, pd.CategoricalDtype) for dtype in obj.dtypes):
+        return obj
+
+    try:
+        return pa.Table.from_pandas(obj, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # e.g. object columns with values of mixed types, which DuckDB can still scan
+        return obj
+
+
+# Number of DuckDB vectors of 2048 rows in each chunk of a chunked load.
+_VECTORS_PER_CHUNK = 64
+
+
+def _write_dataframe(table_slice: TableSlice, obj: pd.DataFrame, connection) -> None:
+    # register the data under a unique name rather than relying on a replacement scan of a local
+    # variable, which a table or view with the same name would take precedence over
+    view_name = f"__dagster_{uuid.uuid4().hex}"
+    connection.register(view_name, _to_arrow_if_supported(obj))
+    try:
+        connection.execute(
+            f"create table if not exists {table_slice.schema}.{table_slice.table} as select * from"
+            f" {view_name};"
+        )
+        if not connection.fetchall():
+            # table was not created, therefore already exists. Insert the data
+            connection.execute(
+                f"insert into {table_slice.schema}.{table_slice.table} select * from {view_name}"
+            )
+    finally:
+        connection.unregister(view_name)
+
+
+def _get_dataframe_metadata(obj: pd.DataFrame, row_count: int) -> Mapping[str, RawMetadataValue]:
+    return {
+        "row_count": row_count,
+        "dataframe_columns": MetadataValue.table_schema(
+            TableSchema(
+                columns=[
+                    TableColumn(name=name, type=str(dtype))  # type: ignore  # (bad stubs)
+                    for name, dtype in obj.dtypes.items()
+                ]
+            )
+        ),
+    }
+
 
 class DuckDBPandasTypeHandler(DbTypeHandler[pd.DataFrame]):
     """Stores and loads Pandas DataFrames in DuckDB.
@@ -43,29 +102,24 @@ def handle_output(
         self, context: OutputContext, table_slice: TableSlice, obj: pd.DataFrame, connection
     ):
         """Stores the pandas DataFrame in duckdb."""
-        connection.execute(
-            f"create table if not exists {table_slice.schema}.{table_slice.table} as select * from"
-            " obj;"
-        )
-        if not connection.fetchall():
-            # table was not created, therefore already exists. Insert the data
-            connection.execute(
-                f"insert into {table_slice.schema}.{table_slice.table} select * from obj"
-            )
-
-        context.add_output_metadata(
-            {
-                "row_count": obj.shape[0],
-                "dataframe_columns": MetadataValue.table_schema(
-                    TableSchema(
-                        columns=[
-                            TableColumn(name=name, type=str(dtype))  # type: ignore  # (bad stubs)
-                            for name, dtype in obj.dtypes.items()
-                        ]
-                    )
-                ),
-            }
-        )
+        _write_dataframe(table_slice, obj, connection)
+        context.add_output_metadata(_get_dataframe_metadata(obj, obj.shape[0]))
+
+    def handle_output_chunks(
+        self,
+        context: OutputContext,
+        table_slice: TableSlice,
+        chunks: Iterator[pd.DataFrame],
+        connection,
+    ) -> Mapping[str, RawMetadataValue]:
+        """Appends each pandas DataFrame to the table in duckdb."""
+        row_count = 0
+        chunk = pd.DataFrame()
+        for chunk in chunks:
+            _write_dataframe(table_slice, chunk, connection)
+            row_count += chunk.shape[0]
+
+        return _get_dataframe_metadata(chunk, row_count)
 
     def load_input(
         self, context: InputContext, table_slice: TableSlice, connection
@@ -75,6 +129,20 @@ def load_input(
             return pd.DataFrame()
         return connection.execute(DuckDbClient.get_select_statement(table_slice)).fetchdf()
 
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection
+    ) -> Iterator[pd.DataFrame]:
+        """Lazily loads the input as Pandas DataFrames of a bounded number of rows."""
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            return
+
+        result = connection.execute(DuckDbClient.get_select_statement(table_slice))
+        while True:
+            chunk = result.fetch_df_chunk(_VECTORS_PER_CHUNK)
+            if chunk.empty:
+                return
+            yield chunk
+
     @property
     def supported_types(self):
         return [pd.DataFrame]
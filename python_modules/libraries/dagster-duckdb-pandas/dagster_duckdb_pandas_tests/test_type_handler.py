@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 
 import duckdb
 import pandas as pd
@@ -8,6 +9,7 @@
     AssetKey,
     DailyPartitionsDefinition,
     DynamicPartitionsDefinition,
+    MetadataValue,
     MultiPartitionKey,
     MultiPartitionsDefinition,
     Out,
@@ -20,6 +22,11 @@
     op,
 )
 from dagster._check import CheckError
+from dagster._core.storage.db_io_manager import TableChunks
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+)
 from dagster_duckdb_pandas import DuckDBPandasIOManager, duckdb_pandas_io_manager
 
 
@@ -100,6 +107,68 @@ def test_duckdb_io_manager_with_assets(tmp_path, io_managers):
             duckdb_conn.close()
 
 
+@asset(key_prefix=["my_schema"])
+def mixed_types_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": [1, 2],
+            "b": ["x", None],
+            "c": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            "d": pd.Categorical(["x", "y"]),
+        }
+    )
+
+
+@asset(key_prefix=["my_schema"])
+def mixed_objects_df() -> pd.DataFrame:
+    # can't be converted to Arrow
+    return pd.DataFrame({"a": [1, 2], "b": pd.Series([1, "x"], dtype=object)})
+
+
+def test_duckdb_io_manager_column_types(tmp_path, io_managers):
+    for io_manager in io_managers:
+        res = materialize([mixed_types_df, mixed_objects_df], resources={"io_manager": io_manager})
+        assert res.success
+
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+
+        column_types = {
+            row[0]: row[1]
+            for row in duckdb_conn.execute("DESCRIBE my_schema.mixed_types_df").fetchall()
+        }
+        assert column_types["a"] == "BIGINT"
+        assert column_types["b"] == "VARCHAR"
+        assert column_types["c"].startswith("TIMESTAMP")
+        assert column_types["d"].startswith("ENUM")
+
+        out_df = duckdb_conn.execute("SELECT * FROM my_schema.mixed_objects_df").fetch_df()
+        assert out_df["b"].tolist() == ["1", "x"]
+
+        duckdb_conn.close()
+
+
+def test_duckdb_io_manager_with_conflicting_table_names(tmp_path, io_managers):
+    for io_manager in io_managers:
+        # tables with the names of the local variables of the type handler
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+        for name in ["data", "obj"]:
+            duckdb_conn.execute(f"create or replace table {name} as select 0 as a, 0 as b")
+        duckdb_conn.close()
+
+        res = materialize([b_df, b_plus_one], resources={"io_manager": io_manager})
+        assert res.success
+
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+
+        out_df = duckdb_conn.execute("SELECT * FROM my_schema.b_df").fetch_df()
+        assert out_df["a"].tolist() == [1, 2, 3]
+
+        out_df = duckdb_conn.execute("SELECT * FROM my_schema.b_plus_one").fetch_df()
+        assert out_df["a"].tolist() == [2, 3, 4]
+
+        duckdb_conn.close()
+
+
 def test_duckdb_io_manager_with_schema(tmp_path):
     @asset
     def my_df() -> pd.DataFrame:
@@ -544,3 +613,79 @@ def self_dependent_asset(context, self_dependent_asset: pd.DataFrame) -> pd.Data
         # drop table so we start with an empty db for the next io manager
         duckdb_conn.execute("DELETE FROM my_schema.self_dependent_asset")
         duckdb_conn.close()
+
+
+@asset(key_prefix=["my_schema"])
+def chunked_df() -> TableChunks:
+    return TableChunks(pd.DataFrame({"a": [i, i + 1]}) for i in range(0, 6, 2))
+
+
+@asset(key_prefix=["my_schema"])
+def chunked_df_sizes(chunked_df: TableChunks) -> pd.DataFrame:
+    return pd.DataFrame({"size": [len(chunk) for chunk in chunked_df]})
+
+
+def test_chunked_asset(tmp_path, io_managers):
+    for io_manager in io_managers:
+        resource_defs = {"io_manager": io_manager}
+
+        # materialize asset twice to ensure that tables get properly deleted
+        for _ in range(2):
+            res = materialize([chunked_df, chunked_df_sizes], resources=resource_defs)
+            assert res.success
+            assert res.asset_materializations_for_node("my_schema__chunked_df")[0].metadata[
+                "row_count"
+            ] == MetadataValue.int(6)
+
+            duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+            out_df = duckdb_conn.execute("SELECT * FROM my_schema.chunked_df").fetch_df()
+            assert sorted(out_df["a"].tolist()) == [0, 1, 2, 3, 4, 5]
+
+            # the whole table fits in a single chunk
+            out_df = duckdb_conn.execute("SELECT * FROM my_schema.chunked_df_sizes").fetch_df()
+            assert out_df["size"].tolist() == [6]
+            duckdb_conn.close()
+
+
+@asset(
+    partitions_def=StaticPartitionsDefinition(["red", "yellow", "blue"]),
+    key_prefix=["my_schema"],
+    metadata={"partition_expr": "color"},
+)
+def static_partitioned_by_partition(context) -> Dict[str, pd.DataFrame]:
+    return {
+        partition: pd.DataFrame({"color": [partition, partition], "b": [1, 2]})
+        for partition in context.asset_partition_keys_for_output()
+    }
+
+
+def test_output_by_partition(tmp_path, io_managers):
+    for io_manager in io_managers:
+        resource_defs = {"io_manager": io_manager}
+
+        res = materialize(
+            [static_partitioned_by_partition],
+            resources=resource_defs,
+            tags={
+                ASSET_PARTITION_RANGE_START_TAG: "red",
+                ASSET_PARTITION_RANGE_END_TAG: "blue",
+            },
+        )
+        assert res.success
+
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+        out_df = duckdb_conn.execute(
+            "SELECT * FROM my_schema.static_partitioned_by_partition"
+        ).fetch_df()
+        assert sorted(out_df["color"].tolist()) == [
+            "blue",
+            "blue",
+            "red",
+            "red",
+            "yellow",
+            "yellow",
+        ]
+
+        # drop table so we start with an empty db for the next io manager
+        duckdb_conn.execute("DELETE FROM my_schema.static_partitioned_by_partition")
+        duckdb_conn.close()
@@ -178,6 +178,14 @@ def my_table_a(my_table: pd.DataFrame):
     schema_: Optional[str] = Field(
         default=None, alias="schema", description="Name of the schema to use."
     )  # schema is a reserved word for pydantic
+    max_concurrent_partition_writes: int = Field(
+        default=1,
+        description=(
+            "When an output covers several partitions and is returned as a dictionary of"
+            " partition keys to their contents, the maximum number of partitions written"
+            " concurrently."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -196,6 +204,7 @@ def create_io_manager(self, context) -> DbIOManager:
             type_handlers=self.type_handlers(),
             default_load_type=self.default_load_type(),
             io_manager_name="DuckDBIOManager",
+            max_concurrent_partition_writes=self.max_concurrent_partition_writes,
         )
 
 
@@ -1,7 +1,8 @@
-from typing import Optional, Sequence, Type
+from typing import Iterator, Mapping, Optional, Sequence, Type
 
 import pandas as pd
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
+from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
 from dagster_gcp.bigquery.io_manager import (
     BigQueryClient,
@@ -10,6 +11,45 @@
 )
 
 
+def _write_dataframe(
+    context: OutputContext, table_slice: TableSlice, obj: pd.DataFrame, connection
+) -> None:
+    with_uppercase_cols = obj.rename(str.upper, copy=False, axis="columns")
+
+    # load jobs append to the table by default
+    job = connection.load_table_from_dataframe(
+        dataframe=with_uppercase_cols,
+        destination=f"{table_slice.schema}.{table_slice.table}",
+        project=table_slice.database,
+        location=context.resource_config.get("location") if context.resource_config else None,
+        timeout=context.resource_config.get("timeout") if context.resource_config else None,
+    )
+    job.result()
+
+
+def _get_dataframe_metadata(obj: pd.DataFrame, row_count: int) -> Mapping[str, RawMetadataValue]:
+    return {
+        "row_count": row_count,
+        "dataframe_columns": MetadataValue.table_schema(
+            TableSchema(
+                columns=[
+                    TableColumn(name=name, type=str(dtype))  # type: ignore  # (bad stubs)
+                    for name, dtype in obj.dtypes.items()
+                ]
+            )
+        ),
+    }
+
+
+def _query(context: InputContext, table_slice: TableSlice, connection):
+    return connection.query(
+        query=BigQueryClient.get_select_statement(table_slice),
+        project=table_slice.database,
+        location=context.resource_config.get("location") if context.resource_config else None,
+        timeout=context.resource_config.get("timeout") if context.resource_config else None,
+    )
+
+
 class BigQueryPandasTypeHandler(DbTypeHandler[pd.DataFrame]):
     """Plugin for the BigQuery I/O Manager that can store and load Pandas DataFrames as BigQuery tables.
 
@@ -44,30 +84,24 @@ def handle_output(
         self, context: OutputContext, table_slice: TableSlice, obj: pd.DataFrame, connection
     ):
         """Stores the pandas DataFrame in BigQuery."""
-        with_uppercase_cols = obj.rename(str.upper, copy=False, axis="columns")
-
-        job = connection.load_table_from_dataframe(
-            dataframe=with_uppercase_cols,
-            destination=f"{table_slice.schema}.{table_slice.table}",
-            project=table_slice.database,
-            location=context.resource_config.get("location") if context.resource_config else None,
-            timeout=context.resource_config.get("timeout") if context.resource_config else None,
-        )
-        job.result()
-
-        context.add_output_metadata(
-            {
-                "row_count": obj.shape[0],
-                "dataframe_columns": MetadataValue.table_schema(
-                    TableSchema(
-                        columns=[
-                            TableColumn(name=name, type=str(dtype))  # type: ignore  # (bad stubs)
-                            for name, dtype in obj.dtypes.items()
-                        ]
-                    )
-                ),
-            }
-        )
+        _write_dataframe(context, table_slice, obj, connection)
+        context.add_output_metadata(_get_dataframe_metadata(obj, obj.shape[0]))
+
+    def handle_output_chunks(
+        self,
+        context: OutputContext,
+        table_slice: TableSlice,
+        chunks: Iterator[pd.DataFrame],
+        connection,
+    ) -> Mapping[str, RawMetadataValue]:
+        """Appends each pandas DataFrame to the table in BigQuery, with one load job per chunk."""
+        row_count = 0
+        chunk = pd.DataFrame()
+        for chunk in chunks:
+            _write_dataframe(context, table_slice, chunk, connection)
+            row_count += chunk.shape[0]
+
+        return _get_dataframe_metadata(chunk, row_count)
 
     def load_input(
         self, context: InputContext, table_slice: TableSlice, connection
@@ -75,16 +109,22 @@ def load_input(
         """Loads the input as a Pandas DataFrame."""
         if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
             return pd.DataFrame()
-        result = connection.query(
-            query=BigQueryClient.get_select_statement(table_slice),
-            project=table_slice.database,
-            location=context.resource_config.get("location") if context.resource_config else None,
-            timeout=context.resource_config.get("timeout") if context.resource_config else None,
-        ).to_dataframe()
+        result = _query(context, table_slice, connection).to_dataframe()
 
         result.columns = map(str.lower, result.columns)
         return result
 
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection
+    ) -> Iterator[pd.DataFrame]:
+        """Lazily loads the input as Pandas DataFrames, one per page of the query results."""
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            return
+
+        for chunk in _query(context, table_slice, connection).result().to_dataframe_iterable():
+            chunk.columns = map(str.lower, chunk.columns)
+            yield chunk
+
     @property
     def supported_types(self):
         return [pd.DataFrame]
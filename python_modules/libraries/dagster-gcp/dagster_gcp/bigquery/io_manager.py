@@ -241,6 +241,14 @@ def my_table_a(my_table: pd.DataFrame) -> pd.DataFrame:
             " queries (loading and reading from tables)."
         ),
     )
+    max_concurrent_partition_writes: int = Field(
+        default=1,
+        description=(
+            "When an output covers several partitions and is returned as a dictionary of"
+            " partition keys to their contents, the maximum number of partitions written"
+            " concurrently."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -259,6 +267,7 @@ def create_io_manager(self, context) -> Generator:
             schema=self.dataset,
             type_handlers=self.type_handlers(),
             default_load_type=self.default_load_type(),
+            max_concurrent_partition_writes=self.max_concurrent_partition_writes,
         )
         if self.gcp_credentials:
             with setup_gcp_creds(self.gcp_credentials):
@@ -26,13 +26,19 @@
 
 
 class PickledObjectGCSIOManager(UPathIOManager):
-    def __init__(self, bucket: str, client: Optional[Any] = None, prefix: str = "dagster"):
+    def __init__(
+        self,
+        bucket: str,
+        client: Optional[Any] = None,
+        prefix: str = "dagster",
+        max_partition_workers: Optional[int] = None,
+    ):
         self.bucket = check.str_param(bucket, "bucket")
         self.client = client or storage.Client()
         self.bucket_obj = self.client.bucket(bucket)
         check.invariant(self.bucket_obj.exists())
         self.prefix = check.str_param(prefix, "prefix")
-        super().__init__(base_path=UPath(self.prefix))
+        super().__init__(base_path=UPath(self.prefix), max_partition_workers=max_partition_workers)
 
     def unlink(self, path: UPath) -> None:
         key = str(path)
@@ -150,6 +156,13 @@ def my_job():
     gcs: ResourceDependency[GCSResource]
     gcs_bucket: str = Field(description="GCS bucket to store files")
     gcs_prefix: str = Field(default="dagster", description="Prefix to add to all file paths")
+    max_partition_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of threads used to load or store multiple partitions of an asset"
+            " concurrently. Defaults to loading and storing partitions one at a time."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -159,7 +172,10 @@ def _is_dagster_maintained(cls) -> bool:
     @cached_method
     def _internal_io_manager(self) -> PickledObjectGCSIOManager:
         return PickledObjectGCSIOManager(
-            bucket=self.gcs_bucket, client=self.gcs.get_client(), prefix=self.gcs_prefix
+            bucket=self.gcs_bucket,
+            client=self.gcs.get_client(),
+            prefix=self.gcs_prefix,
+            max_partition_workers=self.max_partition_workers,
         )
 
     def load_input(self, context: InputContext) -> Any:
@@ -252,5 +268,6 @@ def my_job():
         bucket=init_context.resource_config["gcs_bucket"],
         client=client,
         prefix=init_context.resource_config["gcs_prefix"],
+        max_partition_workers=init_context.resource_config.get("max_partition_workers"),
     )
     return pickled_io_manager
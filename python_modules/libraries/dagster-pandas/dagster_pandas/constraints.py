@@ -3,6 +3,7 @@
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from dagster import (
     DagsterType,
@@ -469,10 +470,11 @@ def validate(self, data, *columns, **kwargs):
         offending = {}
         offending_values = {}
         # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
+            results = relevant_data[
+                _get_invalid_values_mask(self.validation_fn, relevant_data[column])
+            ]
+            if len(results.index) > 0:
                 offending[column] = ["row " + str(i) for i in (results.index.tolist())]
                 offending_values[column] = results[column].tolist()
         if len(offending) == 0:
@@ -613,6 +615,60 @@ def __init__(
         )
 
 
+def _get_invalid_values_mask(validation_fn, column):
+    """Applies a value validation function to each value of the column, and returns the mask of the
+    values that fail the validation.
+
+    Validation functions can have a ``vectorized_validation_fn`` attribute: a function that takes the
+    column and returns the mask of the values that pass the validation at once, or None if it can't
+    validate the values of this column, in which case they are validated one by one.
+    """
+    vectorized_validation_fn = getattr(validation_fn, "vectorized_validation_fn", None)
+    if vectorized_validation_fn is not None:
+        try:
+            valid = vectorized_validation_fn(column)
+        except (TypeError, ValueError):
+            # e.g. values that can't be compared as a whole, which fail the same way one by one
+            valid = None
+        if valid is not None:
+            return ~valid
+
+    return column.apply(lambda x: not validation_fn(x)[0])
+
+
+def _has_single_type_values(column):
+    """Whether all the non-null values of the column are of the same python type, and all its nulls
+    are too.
+    """
+    return (
+        isinstance(column.dtype, (np.dtype, pd.DatetimeTZDtype)) and column.dtype.kind in "biufcmM"
+    )
+
+
+def _isinstance_mask(column, types):
+    """Vectorized ``isinstance(value, types)`` over the values of the column, or None for columns
+    of extension dtypes that don't pass their nulls to validation functions.
+    """
+    if _has_single_type_values(column):
+        # a single non-null value and a single null value are enough to check all of them
+        isnull = column.isna().to_numpy()
+        mask = np.empty(len(column), dtype=bool)
+        for null_values in (False, True):
+            positions = np.flatnonzero(isnull == null_values)
+            if len(positions) > 0:
+                mask[positions] = isinstance(
+                    column.iloc[positions[:1]].astype(object).iloc[0], types
+                )
+        return pd.Series(mask, index=column.index)
+    elif column.dtype.kind != "O":
+        return None
+
+    value_types = pd.Series(column.to_numpy(dtype=object), index=column.index).map(type)
+    return value_types.map(
+        {value_type: issubclass(value_type, types) for value_type in value_types.unique()}
+    ).astype(bool)
+
+
 def non_null_validation(x):
     """Validates that a particular value in a column is not null.
 
@@ -626,6 +682,9 @@ def non_null_validation(x):
     return not pd.isnull(x), {}
 
 
+non_null_validation.vectorized_validation_fn = lambda column: column.notna()  # type: ignore
+
+
 def all_unique_validator(column, ignore_missing_vals=False):
     """Validates that all values in an iterable are unique.
 
@@ -684,6 +743,15 @@ def nvalidator(val):
 
     nvalidator.__doc__ += " and ensures no values are null"
 
+    vectorized_validation_fn = getattr(func, "vectorized_validation_fn", None)
+
+    def vectorized_nvalidator(column):
+        valid = vectorized_validation_fn(column) if vectorized_validation_fn else None
+        return None if valid is None else valid & column.notna()
+
+    # overrides the attribute of `func` copied by `wraps`
+    nvalidator.vectorized_validation_fn = vectorized_nvalidator  # type: ignore
+
     return nvalidator
 
 
@@ -740,6 +808,19 @@ def in_range_validation_fn(x):
             return True, {}
         return (isinstance(x, (type(minim), type(maxim)))) and (x <= maxim) and (x >= minim), {}
 
+    def vectorized_in_range_validation_fn(column):
+        if not _has_single_type_values(column):
+            return None
+        valid = (
+            _isinstance_mask(column, (type(minim), type(maxim)))
+            & (column <= maxim)
+            & (column >= minim)
+        )
+        if ignore_missing_vals:
+            valid |= column.isna()
+        return valid
+
+    in_range_validation_fn.vectorized_validation_fn = vectorized_in_range_validation_fn  # type: ignore
     in_range_validation_fn.__doc__ = f"checks whether values are between {minim} and {maxim}"
     if ignore_missing_vals:
         in_range_validation_fn.__doc__ += ", ignoring nulls"
@@ -792,6 +873,22 @@ def categorical_validation_fn(x):
             return True, {}
         return (x in categories), {}
 
+    def vectorized_categorical_validation_fn(column):
+        # `isin` compares numbers and python objects the same way as `in` does, except for nulls,
+        # but would e.g. parse strings compared to datetimes
+        if column.dtype.kind not in "biufO":
+            return None
+        isnull = column.isna()
+        valid = column.isin(list(categories)) & ~isnull
+        if isnull.any():
+            valid[isnull] = (
+                True
+                if ignore_missing_vals
+                else [x in categories for x in column[isnull].to_numpy(dtype=object)]
+            )
+        return valid
+
+    categorical_validation_fn.vectorized_validation_fn = vectorized_categorical_validation_fn  # type: ignore
     categorical_validation_fn.__doc__ = (
         f"checks whether values are within this set of values: {categories}"
     )
@@ -845,6 +942,13 @@ def dtype_in_set_validation_fn(x):
             return True, {}
         return isinstance(x, datatypes), {}
 
+    def vectorized_dtype_in_set_validation_fn(column):
+        valid = _isinstance_mask(column, datatypes)
+        if valid is not None and ignore_missing_vals:
+            valid |= column.isna()
+        return valid
+
+    dtype_in_set_validation_fn.vectorized_validation_fn = vectorized_dtype_in_set_validation_fn  # type: ignore
     dtype_in_set_validation_fn.__doc__ = f"checks whether values are this type/types: {datatypes}"
     if ignore_missing_vals:
         dtype_in_set_validation_fn.__doc__ += ", ignoring nulls"
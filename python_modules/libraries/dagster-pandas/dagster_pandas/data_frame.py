@@ -143,6 +143,8 @@ def create_dagster_pandas_dataframe_type(
     metadata_fn=None,
     dataframe_constraints=None,
     loader=None,
+    validation_sample_size=None,
+    validate_sample_only=False,
 ):
     """Constructs a custom pandas dataframe dagster type.
 
@@ -159,12 +161,20 @@ def create_dagster_pandas_dataframe_type(
         loader (Optional[DagsterTypeLoader]): An instance of a class that
             inherits from :py:class:`~dagster.DagsterTypeLoader`. If None, we will default
             to using `dataframe_loader`.
+        validation_sample_size (Optional[int]): If set, the column constraints are first validated
+            against a random sample of this many rows, so that violations in large dataframes are
+            reported early.
+        validate_sample_only (Optional[bool]): If true, the column constraints are only validated
+            against the sample of ``validation_sample_size`` rows. Dataframe constraints are always
+            validated against the whole dataframe.
     """
     # We allow for the plugging in of a dagster_type_loader so that users can load their custom
     # dataframes via configuration their own way if the default configs don't suffice. This is
     # purely optional.
     check.str_param(name, "name")
     metadata_fn = check.opt_callable_param(metadata_fn, "metadata_fn")
+    validation_sample_size = check.opt_int_param(validation_sample_size, "validation_sample_size")
+    validate_sample_only = check.bool_param(validate_sample_only, "validate_sample_only")
     description = create_dagster_pandas_dataframe_description(
         check.opt_str_param(description, "description", default=""),
         check.opt_list_param(columns, "columns", of_type=PandasColumn),
@@ -184,6 +194,8 @@ def _dagster_type_check(_, value):
                 value,
                 pandas_columns=columns,
                 dataframe_constraints=dataframe_constraints,
+                sample_size=validation_sample_size,
+                sample_only=validate_sample_only,
             )
         except ConstraintViolationException as e:
             return TypeCheck(success=False, description=str(e))
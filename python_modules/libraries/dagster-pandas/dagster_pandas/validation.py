@@ -1,3 +1,4 @@
+import numpy as np
 from dagster import (
     DagsterInvariantViolationError,
     _check as check,
@@ -368,7 +369,26 @@ def categorical_column(
         )
 
 
-def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=None):
+def validate_constraints(
+    dataframe,
+    pandas_columns=None,
+    dataframe_constraints=None,
+    sample_size=None,
+    sample_only=False,
+):
+    """Validates the column and dataframe constraints of a dataframe.
+
+    Args:
+        dataframe (DataFrame): The dataframe to validate.
+        pandas_columns (Optional[List[PandasColumn]]): The columns to validate.
+        dataframe_constraints (Optional[List[DataFrameConstraint]]): The dataframe-level constraints
+            to validate.
+        sample_size (Optional[int]): If set, the column constraints are first validated against a
+            random sample of this many rows, so that violations in large dataframes are reported
+            without validating every row.
+        sample_only (bool): If true, the column constraints are only validated against the sample.
+            Dataframe-level constraints are always validated against the whole dataframe.
+    """
     dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
     pandas_columns = check.opt_list_param(
         pandas_columns, "column_constraints", of_type=PandasColumn
@@ -376,10 +396,33 @@ def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=N
     dataframe_constraints = check.opt_list_param(
         dataframe_constraints, "dataframe_constraints", of_type=DataFrameConstraint
     )
+    sample_size = check.opt_int_param(sample_size, "sample_size")
+    sample_only = check.bool_param(sample_only, "sample_only")
+    check.param_invariant(
+        sample_size is None or sample_size > 0, "sample_size", "sample_size must be positive"
+    )
+    check.param_invariant(
+        sample_size is not None or not sample_only,
+        "sample_only",
+        "sample_only requires a sample_size",
+    )
 
     if pandas_columns:
-        for column in pandas_columns:
-            column.validate(dataframe)
+        if sample_size is not None and sample_size < len(dataframe.index):
+            # column constraints that fail on a subset of the rows fail on all of them
+            sample = dataframe.take(
+                np.sort(
+                    np.random.default_rng().choice(len(dataframe.index), sample_size, replace=False)
+                )
+            )
+            for column in pandas_columns:
+                column.validate(sample)
+        else:
+            sample_only = False
+
+        if not sample_only:
+            for column in pandas_columns:
+                column.validate(dataframe)
 
     if dataframe_constraints:
         for dataframe_constraint in dataframe_constraints:
@@ -60,6 +60,28 @@ def test_validate_constraints_throw_error(column_constraints, dataframe):
         validate_constraints(dataframe, pandas_columns=column_constraints)
 
 
+def test_validate_constraints_sample():
+    column_constraints = [
+        PandasColumn(name="foo", constraints=[InRangeColumnConstraint(0, 10, False)]),
+    ]
+    dataframe = DataFrame({"foo": [1] * 100 + [20]})
+    assert (
+        validate_constraints(
+            dataframe, pandas_columns=column_constraints, sample_size=10, sample_only=True
+        )
+        is None
+    )
+    with pytest.raises(ConstraintViolationException):
+        validate_constraints(dataframe, pandas_columns=column_constraints, sample_size=10)
+
+    # violations found in the sample are reported without validating the whole dataframe
+    dataframe = DataFrame({"foo": [20] * 100})
+    with pytest.raises(ConstraintViolationException):
+        validate_constraints(
+            dataframe, pandas_columns=column_constraints, sample_size=10, sample_only=True
+        )
+
+
 def test_shape_validation_ok():
     assert (
         validate_constraints(
@@ -1,4 +1,7 @@
+import pandas as pd
+import pytest
 from dagster_pandas.constraints import (
+    _get_invalid_values_mask,
     all_unique_validator,
     categorical_column_validator_factory,
     column_range_validation_factory,
@@ -52,3 +55,35 @@ def test_categorical():
     assert testfunc("b")[0]
     assert testfunc(NaN)[0]
     assert not testfunc("c")[0]
+
+
+@pytest.mark.parametrize(
+    "validation_fn",
+    [
+        non_null_validation,
+        column_range_validation_factory(minim=0, maxim=10),
+        column_range_validation_factory(minim=0, maxim=10, ignore_missing_vals=True),
+        nonnull(column_range_validation_factory(minim=0, maxim=10, ignore_missing_vals=True)),
+        dtype_in_set_validation_factory((int, float)),
+        dtype_in_set_validation_factory(str, ignore_missing_vals=True),
+        categorical_column_validator_factory(["a", 1]),
+        categorical_column_validator_factory(["a", 1], ignore_missing_vals=True),
+    ],
+)
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series([1, 5, 20]),
+        pd.Series([1.0, NaN, 20.5]),
+        pd.Series([1, "a", None, 2.5], dtype=object),
+        pd.Series(["a", None, "b"], dtype="category"),
+        pd.Series([1, None, 20], dtype="Int64"),
+        pd.Series(pd.to_datetime(["2020-01-01", None])),
+        pd.Series([], dtype=float),
+    ],
+)
+def test_vectorized_validation(validation_fn, column):
+    expected = column.apply(lambda x: not validation_fn(x)[0]).astype(bool)
+    assert _get_invalid_values_mask(validation_fn, column).astype(bool).tolist() == (
+        expected.tolist()
+    )
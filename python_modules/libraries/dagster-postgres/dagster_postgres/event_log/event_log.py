@@ -202,6 +202,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags(event, event_id)
+            self.store_asset_partition_event(event, event_id)
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
@@ -1,4 +1,4 @@
-from typing import Mapping, Optional, Sequence, Type
+from typing import Iterator, Mapping, Optional, Sequence, Type
 
 import pandas as pd
 import pandas.core.dtypes.common as pd_core_dtypes_common
@@ -81,6 +81,90 @@ def _add_missing_timezone(
     return s
 
 
+def _convert_time_columns(df: pd.DataFrame, convert_fn) -> pd.DataFrame:
+    """Applies the given conversion to the time columns of the DataFrame only, leaving the other
+    columns untouched rather than copying them.
+    """
+    for column_name, dtype in df.dtypes.items():
+        if pd_core_dtypes_common.is_datetime_or_timedelta_dtype(dtype):  # type: ignore  # (bad stubs)
+            df[column_name] = convert_fn(df[column_name])
+    return df
+
+
+def _widen_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Snowflake returns integer columns with the narrowest dtype that fits the values of each
+    result batch, so they are widened to int64 to keep dtypes consistent across loads.
+    """
+    for column_name, dtype in df.dtypes.items():
+        if pd_core_dtypes_common.is_signed_integer_dtype(dtype) and dtype != "int64":
+            df[column_name] = df[column_name].astype("int64")
+    return df
+
+
+def _write_dataframe(
+    context: OutputContext,
+    table_slice: TableSlice,
+    obj: pd.DataFrame,
+    column_types: Optional[Mapping[str, str]],
+    connection,
+) -> None:
+    from snowflake import connector
+
+    connector.paramstyle = "pyformat"
+    # the renamed DataFrame shares the data of `obj`, and only its time columns are replaced
+    with_uppercase_cols = obj.rename(str.upper, copy=False, axis="columns")
+    if context.resource_config and context.resource_config.get(
+        "store_timestamps_as_strings", False
+    ):
+        with_uppercase_cols = _convert_time_columns(
+            with_uppercase_cols,
+            lambda x: _convert_timestamp_to_string(x, column_types, table_slice.table),
+        )
+    else:
+        with_uppercase_cols = _convert_time_columns(
+            with_uppercase_cols,
+            lambda x: _add_missing_timezone(x, column_types, table_slice.table),
+        )
+
+    # pd_writer bulk loads the DataFrame as Parquet files through a temporary stage
+    with_uppercase_cols.to_sql(
+        table_slice.table,
+        con=connection.engine,
+        if_exists="append",
+        index=False,
+        method=pd_writer,
+    )
+
+
+def _get_dataframe_metadata(obj: pd.DataFrame, row_count: int) -> Mapping[str, RawMetadataValue]:
+    return {
+        "row_count": row_count,
+        "dataframe_columns": MetadataValue.table_schema(
+            TableSchema(
+                columns=[
+                    TableColumn(name=str(name), type=str(dtype))
+                    for name, dtype in obj.dtypes.items()
+                ]
+            )
+        ),
+    }
+
+
+def _convert_loaded_dataframe(context: InputContext, result: pd.DataFrame) -> pd.DataFrame:
+    """Undoes the conversions applied to the DataFrame when it was stored."""
+    result = _widen_integer_columns(result)
+    if (
+        context.resource_config
+        and context.resource_config.get("store_timestamps_as_strings", False)
+        and len(result) > 0
+    ):
+        for column_name, dtype in result.dtypes.items():
+            if dtype == object:
+                result[column_name] = _convert_string_to_timestamp(result[column_name])
+    result.columns = map(str.lower, result.columns)  # type: ignore  # (bad stubs)
+    return result
+
+
 class SnowflakePandasTypeHandler(DbTypeHandler[pd.DataFrame]):
     """Plugin for the Snowflake I/O Manager that can store and load Pandas DataFrames as Snowflake tables.
 
@@ -114,56 +198,60 @@ def my_table() -> pd.DataFrame:  # the name of the asset will be the table name
     def handle_output(
         self, context: OutputContext, table_slice: TableSlice, obj: pd.DataFrame, connection
     ) -> Mapping[str, RawMetadataValue]:
-        from snowflake import connector
-
-        connector.paramstyle = "pyformat"
-        with_uppercase_cols = obj.rename(str.upper, copy=False, axis="columns")
-        column_types = _get_table_column_types(table_slice, connection)
-        if context.resource_config and context.resource_config.get(
-            "store_timestamps_as_strings", False
-        ):
-            with_uppercase_cols = with_uppercase_cols.apply(
-                lambda x: _convert_timestamp_to_string(x, column_types, table_slice.table),
-                axis="index",
-            )
-        else:
-            with_uppercase_cols = with_uppercase_cols.apply(
-                lambda x: _add_missing_timezone(x, column_types, table_slice.table), axis="index"
-            )
-        with_uppercase_cols.to_sql(
-            table_slice.table,
-            con=connection.engine,
-            if_exists="append",
-            index=False,
-            method=pd_writer,
+        _write_dataframe(
+            context, table_slice, obj, _get_table_column_types(table_slice, connection), connection
         )
+        return _get_dataframe_metadata(obj, obj.shape[0])
+
+    def handle_output_chunks(
+        self,
+        context: OutputContext,
+        table_slice: TableSlice,
+        chunks: Iterator[pd.DataFrame],
+        connection,
+    ) -> Mapping[str, RawMetadataValue]:
+        column_types = _get_table_column_types(table_slice, connection)
+        row_count = 0
+        chunk = pd.DataFrame()
+        for chunk in chunks:
+            _write_dataframe(context, table_slice, chunk, column_types, connection)
+            row_count += chunk.shape[0]
+            if column_types is None:
+                # the table was created by the first chunk
+                column_types = _get_table_column_types(table_slice, connection)
 
-        return {
-            "row_count": obj.shape[0],
-            "dataframe_columns": MetadataValue.table_schema(
-                TableSchema(
-                    columns=[
-                        TableColumn(name=str(name), type=str(dtype))
-                        for name, dtype in obj.dtypes.items()
-                    ]
-                )
-            ),
-        }
+        return _get_dataframe_metadata(chunk, row_count)
 
     def load_input(
         self, context: InputContext, table_slice: TableSlice, connection
     ) -> pd.DataFrame:
         if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
             return pd.DataFrame()
-        result = pd.read_sql(
-            sql=SnowflakeDbClient.get_select_statement(table_slice), con=connection
-        )
-        if context.resource_config and context.resource_config.get(
-            "store_timestamps_as_strings", False
-        ):
-            result = result.apply(_convert_string_to_timestamp, axis="index")
-        result.columns = map(str.lower, result.columns)  # type: ignore  # (bad stubs)
-        return result
+        # fetch the result as Arrow batches using the Snowflake connection underlying the
+        # SQLAlchemy connection, rather than row by row through SQLAlchemy
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(SnowflakeDbClient.get_select_statement(table_slice))
+            result = cursor.fetch_pandas_all()
+        finally:
+            cursor.close()
+
+        return _convert_loaded_dataframe(context, result)
+
+    def load_input_chunks(
+        self, context: InputContext, table_slice: TableSlice, connection
+    ) -> Iterator[pd.DataFrame]:
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            return
+
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(SnowflakeDbClient.get_select_statement(table_slice))
+            # one DataFrame per result batch of Snowflake, which are downloaded as they are read
+            for batch in cursor.fetch_pandas_batches():
+                yield _convert_loaded_dataframe(context, batch)
+        finally:
+            cursor.close()
 
     @property
     def supported_types(self):
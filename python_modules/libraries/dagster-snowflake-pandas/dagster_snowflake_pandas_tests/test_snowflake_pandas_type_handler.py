@@ -2,7 +2,7 @@
 import uuid
 from contextlib import contextmanager
 from typing import Any, Iterator, Mapping
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pandas
 import pytest
@@ -41,6 +41,7 @@
 from dagster_snowflake_pandas.snowflake_pandas_type_handler import (
     _add_missing_timezone,
     _convert_string_to_timestamp,
+    _convert_time_columns,
     _convert_timestamp_to_string,
 )
 from pandas import DataFrame, Timestamp
@@ -115,29 +116,30 @@ def test_handle_output():
 
 
 def test_load_input():
-    with patch(
-        "dagster_snowflake_pandas.snowflake_pandas_type_handler.pd.read_sql"
-    ) as mock_read_sql:
-        connection = MagicMock()
-        mock_read_sql.return_value = DataFrame([{"COL1": "a", "COL2": 1}])
-
-        handler = SnowflakePandasTypeHandler()
-        input_context = build_input_context(
-            resource_config={**resource_config, "time_data_to_string": False}
-        )
-        df = handler.load_input(
-            input_context,
-            TableSlice(
-                table="my_table",
-                schema="my_schema",
-                database="my_db",
-                columns=None,
-                partition_dimensions=[],
-            ),
-            connection,
-        )
-        assert mock_read_sql.call_args_list[0][1]["sql"] == "SELECT * FROM my_db.my_schema.my_table"
-        assert df.equals(DataFrame([{"col1": "a", "col2": 1}]))
+    connection = MagicMock()
+    cursor = connection.connection.cursor.return_value
+    cursor.fetch_pandas_all.return_value = DataFrame(
+        {"COL1": ["a"], "COL2": pandas.Series([1], dtype="int8")}
+    )
+
+    handler = SnowflakePandasTypeHandler()
+    input_context = build_input_context(
+        resource_config={**resource_config, "time_data_to_string": False}
+    )
+    df = handler.load_input(
+        input_context,
+        TableSlice(
+            table="my_table",
+            schema="my_schema",
+            database="my_db",
+            columns=None,
+            partition_dimensions=[],
+        ),
+        connection,
+    )
+    assert cursor.execute.call_args_list[0][0][0] == "SELECT * FROM my_db.my_schema.my_table"
+    assert cursor.close.called
+    assert df.equals(DataFrame([{"col1": "a", "col2": 1}]))
 
 
 def test_type_conversions():
@@ -185,6 +187,25 @@ def test_timezone_conversions():
     assert (with_time.dt.tz_localize("UTC") == time_converted).all()
 
 
+def test_convert_time_columns():
+    df = DataFrame(
+        {
+            "a": [1, 2],
+            "b": [
+                pandas.Timestamp("2017-01-01T12:30:45.35"),
+                pandas.Timestamp("2017-02-01T12:30:45.35"),
+            ],
+        }
+    )
+    renamed = df.rename(str.upper, copy=False, axis="columns")
+    converted = _convert_time_columns(renamed, lambda x: _add_missing_timezone(x, None, "foo"))
+
+    assert str(converted["B"].dtype) == "datetime64[ns, UTC]"
+    assert converted["A"].tolist() == [1, 2]
+    # the original DataFrame is untouched
+    assert str(df["b"].dtype) == "datetime64[ns]"
+
+
 def test_build_snowflake_pandas_io_manager():
     assert isinstance(
         build_snowflake_io_manager([SnowflakePandasTypeHandler()]), IOManagerDefinition
@@ -220,6 +220,14 @@ def my_table_a(my_table: pd.DataFrame) -> pd.DataFrame:
         default=None,
         description="Optional parameter to specify the authentication mechanism to use.",
     )
+    max_concurrent_partition_writes: int = Field(
+        default=1,
+        description=(
+            "When an output covers several partitions and is returned as a dictionary of"
+            " partition keys to their contents, the maximum number of partitions written"
+            " concurrently."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -276,6 +284,7 @@ def create_io_manager(self, context) -> DbIOManager:
             schema=self.schema_,
             type_handlers=self.type_handlers(),
             default_load_type=self.default_load_type(),
+            max_concurrent_partition_writes=self.max_concurrent_partition_writes,
         )
 
 